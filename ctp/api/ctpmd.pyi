@@ -1,21 +1,202 @@
 from __future__ import annotations
 import typing
-__all__: list[str] = ['MdApi']
+__all__: list[str] = ['BAR_TYPE_TIME', 'BAR_TYPE_VOLUME', 'DATA_MODE_BYTES', 'DATA_MODE_DICT', 'DATA_MODE_OBJECT', 'DepthMarketData', 'MdApi']
+class DepthMarketData:
+    @property
+    def ActionDay(self) -> str:
+        ...
+    @property
+    def AskPrice1(self) -> float:
+        ...
+    @property
+    def AskPrice2(self) -> float:
+        ...
+    @property
+    def AskPrice3(self) -> float:
+        ...
+    @property
+    def AskPrice4(self) -> float:
+        ...
+    @property
+    def AskPrice5(self) -> float:
+        ...
+    @property
+    def AskVolume1(self) -> int:
+        ...
+    @property
+    def AskVolume2(self) -> int:
+        ...
+    @property
+    def AskVolume3(self) -> int:
+        ...
+    @property
+    def AskVolume4(self) -> int:
+        ...
+    @property
+    def AskVolume5(self) -> int:
+        ...
+    @property
+    def AveragePrice(self) -> float:
+        ...
+    @property
+    def BandingLowerPrice(self) -> float:
+        ...
+    @property
+    def BandingUpperPrice(self) -> float:
+        ...
+    @property
+    def BidPrice1(self) -> float:
+        ...
+    @property
+    def BidPrice2(self) -> float:
+        ...
+    @property
+    def BidPrice3(self) -> float:
+        ...
+    @property
+    def BidPrice4(self) -> float:
+        ...
+    @property
+    def BidPrice5(self) -> float:
+        ...
+    @property
+    def BidVolume1(self) -> int:
+        ...
+    @property
+    def BidVolume2(self) -> int:
+        ...
+    @property
+    def BidVolume3(self) -> int:
+        ...
+    @property
+    def BidVolume4(self) -> int:
+        ...
+    @property
+    def BidVolume5(self) -> int:
+        ...
+    @property
+    def ClosePrice(self) -> float:
+        ...
+    @property
+    def CurrDelta(self) -> float:
+        ...
+    @property
+    def ExchangeID(self) -> str:
+        ...
+    @property
+    def ExchangeInstID(self) -> str:
+        ...
+    @property
+    def HighestPrice(self) -> float:
+        ...
+    @property
+    def InstrumentID(self) -> str:
+        ...
+    @property
+    def LastPrice(self) -> float:
+        ...
+    @property
+    def LowerLimitPrice(self) -> float:
+        ...
+    @property
+    def LowestPrice(self) -> float:
+        ...
+    @property
+    def OpenInterest(self) -> float:
+        ...
+    @property
+    def OpenPrice(self) -> float:
+        ...
+    @property
+    def PreClosePrice(self) -> float:
+        ...
+    @property
+    def PreDelta(self) -> float:
+        ...
+    @property
+    def PreOpenInterest(self) -> float:
+        ...
+    @property
+    def PreSettlementPrice(self) -> float:
+        ...
+    @property
+    def SettlementPrice(self) -> float:
+        ...
+    @property
+    def TradingDay(self) -> str:
+        ...
+    @property
+    def Turnover(self) -> float:
+        ...
+    @property
+    def UpdateMillisec(self) -> int:
+        ...
+    @property
+    def UpdateTime(self) -> str:
+        ...
+    @property
+    def UpperLimitPrice(self) -> float:
+        ...
+    @property
+    def Volume(self) -> int:
+        ...
+    @property
+    def _dispatch_mono_ns(self) -> int:
+        ...
+    @property
+    def _exchange_ns(self) -> int:
+        ...
+    @property
+    def _recv_mono_ns(self) -> int:
+        ...
+    @property
+    def _recv_ns(self) -> int:
+        ...
+    @property
+    def reserve1(self) -> str:
+        ...
+    @property
+    def reserve2(self) -> str:
+        ...
 class MdApi:
     def __init__(self) -> None:
         ...
+    def addBarBuilder(self, arg0: typing.SupportsInt, arg1: typing.SupportsInt) -> None:
+        ...
+    def clearBarBuilders(self) -> None:
+        ...
     def createFtdcMdApi(self, arg0: str, arg1: bool, arg2: bool, arg3: bool) -> None:
         ...
+    def enableLatestTicks(self) -> None:
+        ...
+    def enableSnapshotMatrix(self, arg0: typing.SupportsInt) -> dict:
+        ...
+    def enableTickBuffer(self, arg0: typing.SupportsInt) -> typing.Any:
+        ...
     def exit(self) -> int:
         ...
+    def flushBars(self) -> None:
+        ...
     def getApiVersion(self) -> str:
         ...
+    def getLatestTick(self, arg0: str) -> typing.Any:
+        ...
+    def getLatestTicks(self, arg0: list) -> list:
+        ...
+    def getQueueStats(self) -> dict:
+        ...
+    def getTickCursor(self) -> int:
+        ...
+    def getTickSymbols(self) -> list:
+        ...
     def getTradingDay(self) -> str:
         ...
     def init(self) -> None:
         ...
     def join(self) -> int:
         ...
+    def onBar(self, arg0: dict) -> None:
+        ...
     def onFrontConnected(self) -> None:
         ...
     def onFrontDisconnected(self, arg0: typing.SupportsInt) -> None:
@@ -38,7 +219,9 @@ class MdApi:
         ...
     def onRspUserLogout(self, arg0: dict, arg1: dict, arg2: typing.SupportsInt, arg3: bool) -> None:
         ...
-    def onRtnDepthMarketData(self, arg0: dict) -> None:
+    def onRtnDepthMarketData(self, arg0: typing.Any) -> None:
+        ...
+    def onRtnDepthMarketDataBatch(self, arg0: list) -> None:
         ...
     def onRtnForQuoteRsp(self, arg0: dict) -> None:
         ...
@@ -48,6 +231,8 @@ class MdApi:
         ...
     def registerNameServer(self, arg0: str) -> None:
         ...
+    def registerTickHandler(self, arg0: str, arg1: typing.Any) -> None:
+        ...
     def release(self) -> None:
         ...
     def reqQryMulticastInstrument(self, arg0: dict, arg1: typing.SupportsInt) -> int:
@@ -56,11 +241,50 @@ class MdApi:
         ...
     def reqUserLogout(self, arg0: dict, arg1: typing.SupportsInt) -> int:
         ...
+    def setConflation(self, arg0: bool) -> None:
+        ...
+    def setDataMode(self, arg0: typing.SupportsInt) -> None:
+        ...
+    def setFieldSelection(self, arg0: str, arg1: list) -> None:
+        ...
+    def setInvalidAsNan(self, arg0: bool) -> None:
+        ...
+    def setRingQueue(self, arg0: typing.SupportsInt) -> int:
+        ...
+    def setTickBatchSize(self, arg0: typing.SupportsInt) -> None:
+        ...
+    def setTickCallback(self, arg0: bool) -> None:
+        ...
+    def setTradingSessions(self, arg0: str, arg1: list) -> None:
+        ...
+    @typing.overload
     def subscribeForQuoteRsp(self, arg0: str) -> int:
         ...
+    @typing.overload
+    def subscribeForQuoteRsp(self, arg0: list) -> int:
+        ...
+    @typing.overload
     def subscribeMarketData(self, arg0: str) -> int:
         ...
+    @typing.overload
+    def subscribeMarketData(self, arg0: list) -> int:
+        ...
+    @typing.overload
     def unSubscribeForQuoteRsp(self, arg0: str) -> int:
         ...
+    @typing.overload
+    def unSubscribeForQuoteRsp(self, arg0: list) -> int:
+        ...
+    @typing.overload
     def unSubscribeMarketData(self, arg0: str) -> int:
         ...
+    @typing.overload
+    def unSubscribeMarketData(self, arg0: list) -> int:
+        ...
+    def unregisterTickHandler(self, arg0: str) -> None:
+        ...
+BAR_TYPE_TIME: int = 0
+BAR_TYPE_VOLUME: int = 1
+DATA_MODE_BYTES: int = 2
+DATA_MODE_DICT: int = 0
+DATA_MODE_OBJECT: int = 1
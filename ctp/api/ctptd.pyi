@@ -1,9 +1,118 @@
 from __future__ import annotations
 import typing
-__all__: list[str] = ['TdApi']
+__all__: list[str] = ['OrderTemplate', 'TdApi']
+class OrderTemplate:
+    def __init__(self, arg0: dict) -> None:
+        ...
+    @property
+    def AccountID(self) -> str:
+        ...
+    @property
+    def BrokerID(self) -> str:
+        ...
+    @property
+    def BusinessUnit(self) -> str:
+        ...
+    @property
+    def ClientID(self) -> str:
+        ...
+    @property
+    def CombHedgeFlag(self) -> str:
+        ...
+    @property
+    def CombOffsetFlag(self) -> str:
+        ...
+    @property
+    def ContingentCondition(self) -> str:
+        ...
+    @property
+    def CurrencyID(self) -> str:
+        ...
+    @property
+    def Direction(self) -> str:
+        ...
+    @property
+    def ExchangeID(self) -> str:
+        ...
+    @property
+    def ForceCloseReason(self) -> str:
+        ...
+    @property
+    def GTDDate(self) -> str:
+        ...
+    @property
+    def IPAddress(self) -> str:
+        ...
+    @property
+    def InstrumentID(self) -> str:
+        ...
+    @property
+    def InvestUnitID(self) -> str:
+        ...
+    @property
+    def InvestorID(self) -> str:
+        ...
+    @property
+    def IsAutoSuspend(self) -> int:
+        ...
+    @property
+    def IsSwapOrder(self) -> int:
+        ...
+    @property
+    def LimitPrice(self) -> float:
+        ...
+    @property
+    def MacAddress(self) -> str:
+        ...
+    @property
+    def MinVolume(self) -> int:
+        ...
+    @property
+    def OrderMemo(self) -> str:
+        ...
+    @property
+    def OrderPriceType(self) -> str:
+        ...
+    @property
+    def OrderRef(self) -> str:
+        ...
+    @property
+    def RequestID(self) -> int:
+        ...
+    @property
+    def SessionReqSeq(self) -> int:
+        ...
+    @property
+    def StopPrice(self) -> float:
+        ...
+    @property
+    def TimeCondition(self) -> str:
+        ...
+    @property
+    def UserForceClose(self) -> int:
+        ...
+    @property
+    def UserID(self) -> str:
+        ...
+    @property
+    def VolumeCondition(self) -> str:
+        ...
+    @property
+    def VolumeTotalOriginal(self) -> int:
+        ...
+    @property
+    def reserve1(self) -> str:
+        ...
+    @property
+    def reserve2(self) -> str:
+        ...
 class TdApi:
     def __init__(self) -> None:
         ...
+    def cancelAll(self, arg0: dict, arg1: typing.SupportsInt) -> list:
+        ...
+    def clearOrders(self) -> None:
+        ...
     def createFtdcTraderApi(self, arg0: str, arg1: bool) -> None:
         ...
     def exit(self) -> int:
@@ -12,6 +121,16 @@ class TdApi:
         ...
     def getFrontInfo(self, arg0: dict) -> None:
         ...
+    def getOrder(self, arg0: typing.SupportsInt, arg1: typing.SupportsInt, arg2: str) -> typing.Any:
+        ...
+    def getOrderBySysId(self, arg0: str, arg1: str) -> typing.Any:
+        ...
+    def getOrders(self, arg0: str, arg1: bool) -> list:
+        ...
+    def getQueueStats(self) -> dict:
+        ...
+    def getTradeSummary(self, arg0: str) -> dict:
+        ...
     def getTradingDay(self) -> str:
         ...
     def init(self) -> None:
@@ -390,6 +509,10 @@ class TdApi:
         ...
     def reqOrderInsert(self, arg0: dict, arg1: typing.SupportsInt) -> int:
         ...
+    def reqOrderInsertBatch(self, arg0: list, arg1: typing.SupportsInt) -> list:
+        ...
+    def reqOrderInsertFast(self, arg0: OrderTemplate, arg1: str, arg2: str, arg3: str, arg4: typing.SupportsFloat, arg5: typing.SupportsInt, arg6: str, arg7: typing.SupportsInt) -> int:
+        ...
     def reqParkedOrderAction(self, arg0: dict, arg1: typing.SupportsInt) -> int:
         ...
     def reqParkedOrderInsert(self, arg0: dict, arg1: typing.SupportsInt) -> int:
@@ -594,6 +717,12 @@ class TdApi:
         ...
     def reqUserPasswordUpdate(self, arg0: dict, arg1: typing.SupportsInt) -> int:
         ...
+    def setFieldSelection(self, arg0: str, arg1: list) -> None:
+        ...
+    def setInvalidAsNan(self, arg0: bool) -> None:
+        ...
+    def setRingQueue(self, arg0: typing.SupportsInt) -> int:
+        ...
     def submitUserSystemInfo(self, arg0: dict) -> int:
         ...
     def submitWechatUserSystemInfo(self, arg0: dict) -> int:
@@ -23,6 +23,98 @@ from ctp.api.generator.ctp_function_const import CtpFunctionConst  # noqa
 from ctp.api.generator.generate_helper import replace_function_name, process_func_type, format_pointer_arg, \
     format_equal_arg
 
+# 支持以结构体对象或原始字节推送的回调数据结构体，对象类名为去掉CThostFtdc前缀和Field后缀的结构体名
+OBJECT_STRUCTS: dict[str, list[str]] = {
+    "md": ["CThostFtdcDepthMarketDataField"],
+    "td": [],
+}
+
+# 使用字符串驻留缓存的推送回调，只对其中的低基数字符串字段生效
+INTERN_CALLBACKS: dict[str, list[str]] = {
+    "md": ["OnRtnDepthMarketData"],
+    "td": ["OnRtnOrder", "OnRtnTrade"],
+}
+
+# 在回调线程中直接更新缓存的回调，由store函数处理，参数为回调的参数加上接收时间，store函数返回false时不再放入任务队列
+STORE_CALLBACKS: dict[str, list[str]] = {
+    "md": ["OnRtnDepthMarketData"],
+    "td": ["OnRspUserLogin", "OnRspOrderInsert", "OnErrRtnOrderInsert", "OnRtnOrder", "OnRtnTrade"],
+}
+
+# 字典转换单独生成convert函数的回调，供扩展函数将缓存中的结构体转换为与推送相同的字典
+CONVERT_CALLBACKS: dict[str, list[str]] = {
+    "md": [],
+    "td": ["OnRtnOrder"],
+}
+
+# 支持合并推送的回调，开启后由conflate函数只保留每个合约最新的一条数据
+CONFLATE_CALLBACKS: dict[str, list[str]] = {
+    "md": ["OnRtnDepthMarketData"],
+    "td": [],
+}
+
+# 非CTP原生回调的扩展任务，常量编号接在原生回调之后，由扩展函数负责入队和推送
+EXTEND_TASKS: dict[str, list[str]] = {
+    "md": ["OnBar"],
+    "td": [],
+}
+
+# 调用CTP接口前释放GIL的语句，请求参数从python对象转换完成后再释放，网络发送和阻塞等待期间不占用GIL
+GIL_RELEASE = "\tgil_scoped_release release;\n"
+
+# 合约代码数组参数的订阅函数，同时生成单个合约和合约列表两个重载
+SUBSCRIBE_FUNCTIONS: set[str] = {
+    CtpFunctionConst.SUBSCRIBE_MARKET_DATA,
+    CtpFunctionConst.UN_SUBSCRIBE_MARKET_DATA,
+    CtpFunctionConst.SUBSCRIBE_FOR_QUOTE_RSP,
+    CtpFunctionConst.UN_SUBSCRIBE_FOR_QUOTE_RSP,
+}
+
+# 推送数据中附加的时间戳字段 {字段名: 取值表达式}，结构体对象的成员名为去掉前缀下划线的字段名
+# 接收时间在回调线程中记录，推送时间在工作线程转换时记录，mono为steady_clock时间，其余为系统时间
+TIMESTAMP_FIELDS: dict[str, str] = {
+    "_recv_ns": "task->task_wall_time",
+    "_recv_mono_ns": "task->task_time",
+    "_dispatch_mono_ns": "steadyNs()",
+}
+
+# 预先填写的请求模板，{结构体名: 模板类名}，模板从字典创建一次，请求时只覆盖变化的字段
+TEMPLATE_STRUCTS: dict[str, dict[str, str]] = {
+    "md": {},
+    "td": {"CThostFtdcInputOrderField": "OrderTemplate"},
+}
+
+# 支持字段选择的结构体，setFieldSelection按去掉CThostFtdc前缀和Field后缀的名称设置需要转换的字段
+SELECTABLE_STRUCTS: dict[str, list[str]] = {
+    "md": ["CThostFtdcDepthMarketDataField"],
+    "td": ["CThostFtdcOrderField", "CThostFtdcTradeField"],
+}
+
+# 转换时预先计算的交易所时间字段，{结构体: (日期字段, 时间字段, 毫秒字段)}，结果为北京时间的epoch纳秒
+# 日期字段有值时优先使用，为空时才由TradingDay按上一个工作日推算夜盘的自然日，节假日后的夜盘推算结果不可靠
+EPOCH_FIELDS: dict[str, tuple[str, str, str]] = {
+    "CThostFtdcDepthMarketDataField": ("ActionDay", "UpdateTime", "UpdateMillisec"),
+    "CThostFtdcOrderField": ("InsertDate", "InsertTime", ""),
+    "CThostFtdcTradeField": ("TradeDate", "TradeTime", ""),
+}
+
+# 交易所时间在数据字典中的键名
+EPOCH_FIELD_NAME = "_exchange_ns"
+
+# 低基数字符串字段，推送时每次返回同一个python字符串对象
+INTERN_FIELDS: list[str] = [
+    "InstrumentID",
+    "ExchangeID",
+    "ExchangeInstID",
+    "TradingDay",
+    "ActionDay",
+    "BrokerID",
+    "InvestorID",
+    "UserID",
+    "InsertDate",
+    "TradeDate",
+]
+
 
 class GenerateApiFunc:
     """API生成器"""
@@ -39,7 +131,9 @@ class GenerateApiFunc:
         self.lines: dict[str, str] = {}
         self.structs: dict[str, dict[str, str]] = {}
         self.function_names: list = []
+        self.object_structs: dict[str, str] = {}  # 结构体对象 {结构体名: 对象类名}
         self.load_struct()
+        self.load_object_struct()
 
     def load_struct(self) -> None:
         """加载Struct"""
@@ -50,6 +144,17 @@ class GenerateApiFunc:
             if "__" not in name:
                 self.structs[name] = getattr(module, name)
 
+    def load_object_struct(self) -> None:
+        """加载以结构体对象推送的结构体"""
+        for struct_name in OBJECT_STRUCTS.get(self.name, []):
+            class_name = self.get_short_struct_name(struct_name)
+            self.object_structs[struct_name] = class_name
+
+    @staticmethod
+    def get_short_struct_name(struct_name: str) -> str:
+        """去掉结构体名称的CThostFtdc前缀和Field后缀"""
+        return struct_name.replace("CThostFtdc", "").replace("Field", "")
+
     def run(self) -> None:
         """运行"""
         print("5. 第五步：生成API函数文件")
@@ -64,6 +169,7 @@ class GenerateApiFunc:
         self.generate_header_process()  # callbacks
         self.generate_header_on()  # callbacks
         self.generate_header_function()  # functions
+        self.generate_header_struct()  # object_structs
 
         self.generate_source_task()  # callbacks
         self.generate_source_switch()  # callbacks
@@ -71,6 +177,7 @@ class GenerateApiFunc:
         self.generate_source_function()  # source_functions
         self.generate_source_on()  # callbacks
         self.generate_source_module()  # functions and callbacks
+        self.generate_source_struct()  # object_structs
 
         print(f"{self.prefix} {self.name} API生成成功")
 
@@ -248,16 +355,50 @@ class GenerateApiFunc:
             None: 无返回值，直接写入文件
         """
         filename = f"{self.prefix}_{self.name}_header_define.h"
+        names = list(self.callbacks.keys()) + EXTEND_TASKS.get(self.name, [])
         with open(filename, "w") as f:
-            for n, name in enumerate(self.callbacks.keys()):
+            for n, name in enumerate(names):
                 line = f"#define {name.upper()} {n}\n"
                 f.write(line)
 
+            # 常量对应的python回调函数名，用于队列统计
+            f.write(f"\n#define TASK_NAME_COUNT {len(names)}\n\n")
+            f.write("static const char *TASK_NAMES[TASK_NAME_COUNT] = {\n")
+            for name in names:
+                f.write(f"\t\"on{name[2:]}\",\n")
+            f.write("};\n")
+
+            # 支持字段选择的结构体编号和字段名表
+            selectable = SELECTABLE_STRUCTS.get(self.name, [])
+            f.write(f"\n#define SELECTABLE_STRUCT_COUNT {len(selectable)}\n")
+            for n, struct_name in enumerate(selectable):
+                f.write(f"#define FIELDS_{self.get_short_struct_name(struct_name).upper()} {n}\n")
+
+            for struct_name in selectable:
+                short_name = self.get_short_struct_name(struct_name)
+                f.write(f"\nstatic const char *const {short_name.upper()}_FIELD_NAMES[] = {{\n")
+                for struct_field in self.structs[struct_name]:
+                    f.write(f"\t\"{struct_field}\",\n")
+                f.write("};\n")
+
+            f.write("\nstatic const FieldTable SELECTABLE_STRUCTS[SELECTABLE_STRUCT_COUNT] = {\n")
+            for struct_name in selectable:
+                short_name = self.get_short_struct_name(struct_name)
+                count = len(self.structs[struct_name])
+                f.write(f"\t{{\"{short_name}\", {short_name.upper()}_FIELD_NAMES, {count}}},\n")
+            f.write("};\n")
+
     def generate_header_process(self) -> None:
         """"""
         filename = f"{self.prefix}_{self.name}_header_process.h"
         with open(filename, "w") as f:
-            for name in self.callbacks.keys():
+            for name, d in self.callbacks.items():
+                # 结构体对象推送的回调额外声明convert函数
+                if any(type_ in self.object_structs for type_ in d.values()):
+                    f.write(f"object convert{name[2:]}(Task *task);\n\n")
+                elif name in CONVERT_CALLBACKS.get(self.name, []):
+                    f.write(f"dict convert{name[2:]}(Task *task);\n\n")
+
                 # 更精确的字符串替换，只替换开头的"On"为"process"
                 if name.startswith("On"):
                     name = "process" + name[2:]
@@ -304,6 +445,8 @@ class GenerateApiFunc:
                     for type_ in d.values():
                         if type_ in type_mapping:
                             args_list.append(type_mapping[type_])
+                        elif type_ in self.object_structs:
+                            args_list.append("const object &data")
                         else:
                             args_list.append("const dict &data")
 
@@ -412,6 +555,10 @@ class GenerateApiFunc:
                         header_line = f"{pre_header_line}{arg_line});\n\n"
 
                     f.write(header_line)
+
+                    # 订阅函数的合约列表重载
+                    if func_name in SUBSCRIBE_FUNCTIONS:
+                        f.write(f"{new_func_type} {new_func_name}(const list &instrumentIDs);\n\n")
         except IOError as e:
             print(f"写入头文件失败: {e}")
 
@@ -427,8 +574,34 @@ class GenerateApiFunc:
 
                 # 函数体开始
                 body = "{\n"
+
+                # 所有回调函数都在开头读取一次接收时间，更新缓存、合并推送和任务共用
+                store = name in STORE_CALLBACKS.get(self.name, [])
+                conflate = name in CONFLATE_CALLBACKS.get(self.name, [])
+                body += "\tint64_t recv_time = steadyNs();\n"
+                body += "\tint64_t recv_wall_time = wallNs();\n\n"
+
+                if store:
+                    field = next(f for f, t in d.items() if t in self.structs)
+                    store_args = ", ".join([*d.keys(), "recv_time", "recv_wall_time"])
+                    body += f"\tif ({field} && !this->store{name[2:]}({store_args}))\n"
+                    body += "\t{\n"
+                    body += "\t\treturn;\n"
+                    body += "\t}\n\n"
+
+                # 合并推送模式下交由conflate函数处理
+                if conflate:
+                    field = next(f for f, t in d.items() if t in self.structs)
+                    body += f"\tif (this->conflation && {field})\n"
+                    body += "\t{\n"
+                    body += f"\t\tthis->conflate{name[2:]}({field}, recv_time, recv_wall_time);\n"
+                    body += "\t\treturn;\n"
+                    body += "\t}\n\n"
+
                 body += "\tTask task = Task();\n"
                 body += f"\ttask.task_name = {name.upper()};\n"
+                body += "\ttask.task_time = recv_time;\n"
+                body += "\ttask.task_wall_time = recv_wall_time;\n"
 
                 # 处理字段
                 for field, type_ in d.items():
@@ -451,7 +624,7 @@ class GenerateApiFunc:
         """生成字段赋值代码块"""
         code = f"\tif ({field})\n"
         code += "\t{\n"
-        code += f"\t\t{type_} *{task_field} = new {type_}();\n"
+        code += f"\t\t{type_} *{task_field} = TaskPool<{type_}>::allocate();\n"
         code += f"\t\t*{task_field} = *{field};\n"
         code += f"\t\ttask.{task_field} = {task_field};\n"
         code += "\t}\n"
@@ -499,6 +672,29 @@ class GenerateApiFunc:
             else:
                 on_name = "on" + name[2:]
 
+            # 结构体对象推送的回调，先生成convert函数，再由process函数推送
+            object_type = next((t for t in callback_fields.values() if t in self.object_structs), None)
+            intern = name in INTERN_CALLBACKS.get(self.name, [])
+            push = name.startswith("OnRtn")
+            if object_type:
+                lines.extend(self._generate_object_process(name, object_type, intern, push))
+                continue
+
+            # 单独生成convert函数的回调，process函数只负责推送
+            if name in CONVERT_CALLBACKS.get(self.name, []):
+                field_type = next(t for t in callback_fields.values() if t in self.structs)
+                lines.append(f"dict {self.class_name}::convert{name[2:]}(Task *task)\n{{")
+                lines.extend(self._generate_struct_dict("data", field_type, "task_data", intern, push, False))
+                lines.append("\treturn data;")
+                lines.append("};\n")
+                lines.append(f"void {self.class_name}::{process_name}(Task *task)\n{{")
+                lines.append("\tgil_scoped_acquire acquire;")
+                lines.append(f"\tdict data = this->convert{name[2:]}(task);")
+                lines.extend(self._generate_task_release(field_type))
+                lines.append(f"\tthis->{on_name}(data);")
+                lines.append("};\n")
+                continue
+
             lines.append(f"void {self.class_name}::{process_name}(Task *task)\n{{")
             lines.append("\tgil_scoped_acquire acquire;")
 
@@ -512,35 +708,11 @@ class GenerateApiFunc:
                     args.append("task->task_last")
                 elif field_type == "CThostFtdcRspInfoField":
                     args.append("error")
-                    lines.append("\tdict error;")
-                    lines.append("\tif (task->task_error)\n\t{")
-                    lines.append(f"\t\t{field_type} *task_error = ({field_type}*)task->task_error;")
-
-                    struct_fields = self.structs[field_type]
-                    for struct_field, struct_type in struct_fields.items():
-                        if struct_type == "string":
-                            lines.append(f"\t\terror[\"{struct_field}\"] = toUtf(task_error->{struct_field});")
-                        else:
-                            lines.append(f"\t\terror[\"{struct_field}\"] = task_error->{struct_field};")
-
-                    lines.append("\t\tdelete task_error;")
-                    lines.append("\t}")
+                    lines.extend(self._generate_struct_dict("error", field_type, "task_error"))
                 else:
                     # 其他结构体
                     args.append("data")
-                    lines.append("\tdict data;")
-                    lines.append("\tif (task->task_data)\n\t{")
-                    lines.append(f"\t\t{field_type} *task_data = ({field_type}*)task->task_data;")
-
-                    struct_fields = self.structs[field_type]
-                    for struct_field, struct_type in struct_fields.items():
-                        if struct_type == "string":
-                            lines.append(f"\t\tdata[\"{struct_field}\"] = toUtf(task_data->{struct_field});")
-                        else:
-                            lines.append(f"\t\tdata[\"{struct_field}\"] = task_data->{struct_field};")
-
-                    lines.append("\t\tdelete task_data;")
-                    lines.append("\t}")
+                    lines.extend(self._generate_struct_dict("data", field_type, "task_data", intern, push))
 
             args_str = ", ".join(args)
             lines.append(f"\tthis->{on_name}({args_str});")
@@ -549,6 +721,124 @@ class GenerateApiFunc:
         with open(filename, "w") as f:
             f.write("\n".join(lines))
 
+    @staticmethod
+    def _generate_epoch_value(field_type: str, task_field: str, push: bool) -> str:
+        """生成计算交易所时间的表达式，主动推送的数据以接收时间修正日期字段的偏差，查询结果只使用日期字段"""
+        date_field, time_field, millisec_field = EPOCH_FIELDS[field_type]
+        date = f"parseDate({task_field}->{date_field})" if date_field else "0"
+        millisec = f"{task_field}->{millisec_field}" if millisec_field else "0"
+        recv = "task->task_wall_time" if push and date_field else "0"
+        return (
+            f"exchangeEpochNs({date}, parseDate({task_field}->TradingDay), "
+            f"parseTimeMs({task_field}->{time_field}, {millisec}), {recv})"
+        )
+
+    @staticmethod
+    def _generate_field_value(var_name: str, struct_field: str, struct_type: str, task_field: str, intern: bool) -> str:
+        """生成将单个结构体字段写入字典的语句"""
+        if struct_type == "string" and intern and struct_field in INTERN_FIELDS:
+            return f"{var_name}[\"{struct_field}\"] = this->string_cache.get({task_field}->{struct_field});"
+        elif struct_type == "string":
+            return f"{var_name}[\"{struct_field}\"] = toUtf({task_field}->{struct_field});"
+        elif struct_type == "double":
+            return f"{var_name}[\"{struct_field}\"] = validDouble({task_field}->{struct_field}, this->invalid_as_nan);"
+        else:
+            return f"{var_name}[\"{struct_field}\"] = {task_field}->{struct_field};"
+
+    @staticmethod
+    def _generate_task_release(field_type: str) -> list[str]:
+        """生成将任务中的结构体归还对象池的代码"""
+        return [
+            "\tif (task->task_data)\n\t{",
+            f"\t\tTaskPool<{field_type}>::release(({field_type}*)task->task_data);",
+            "\t}",
+        ]
+
+    def _generate_struct_dict(
+        self, var_name: str, field_type: str, task_field: str, intern: bool = False, push: bool = False,
+        release: bool = True
+    ) -> list[str]:
+        """生成将任务中的结构体转换为字典的代码，intern为True时低基数字符串字段使用驻留缓存，release为False时由调用方归还对象池"""
+        lines = [
+            f"\tdict {var_name};",
+            f"\tif (task->{task_field})\n\t{{",
+            f"\t\t{field_type} *{task_field} = ({field_type}*)task->{task_field};",
+        ]
+
+        struct_fields = self.structs[field_type]
+        field_lines = [
+            self._generate_field_value(var_name, struct_field, struct_type, task_field, intern)
+            for struct_field, struct_type in struct_fields.items()
+        ]
+
+        # 支持字段选择的结构体，设置了字段时只转换选中的字段，按设置的顺序写入
+        if field_type in SELECTABLE_STRUCTS.get(self.name, []):
+            short_name = self.get_short_struct_name(field_type).upper()
+            lines.append(f"\t\tconst vector<int> *fields = this->field_selection.get(FIELDS_{short_name});")
+            lines.append("\t\tif (fields)\n\t\t{")
+            lines.append("\t\t\tfor (int field : *fields)\n\t\t\t{")
+            lines.append("\t\t\t\tswitch (field)\n\t\t\t\t{")
+            for n, line in enumerate(field_lines):
+                lines.append(f"\t\t\t\tcase {n}: {line} break;")
+            lines.append("\t\t\t\t}")
+            lines.append("\t\t\t}")
+            lines.append("\t\t}")
+            lines.append("\t\telse\n\t\t{")
+            lines.extend(f"\t\t\t{line}" for line in field_lines)
+            lines.append("\t\t}")
+        else:
+            lines.extend(f"\t\t{line}" for line in field_lines)
+
+        if field_type in EPOCH_FIELDS:
+            epoch_value = self._generate_epoch_value(field_type, task_field, push)
+            lines.append(f"\t\t{var_name}[\"{EPOCH_FIELD_NAME}\"] = {epoch_value};")
+
+        if release:
+            lines.append(f"\t\tTaskPool<{field_type}>::release({task_field});")
+        lines.append("\t}")
+
+        # 数据字典附加接收和推送时间戳
+        if task_field == "task_data":
+            for field, value in TIMESTAMP_FIELDS.items():
+                lines.append(f"\t{var_name}[\"{field}\"] = {value};")
+        return lines
+
+    def _generate_object_process(self, name: str, field_type: str, intern: bool, push: bool) -> list[str]:
+        """生成结构体对象回调的convert和process函数，convert函数根据推送模式返回对象或字典，不归还对象池"""
+        convert_name = "convert" + name[2:]
+        process_name = "process" + name[2:]
+        on_name = "on" + name[2:]
+
+        lines = [
+            f"object {self.class_name}::{convert_name}(Task *task)\n{{",
+            "\tif (this->data_mode == DATA_MODE_OBJECT && task->task_data)\n\t{",
+            f"\t\t{field_type} *task_data = ({field_type}*)task->task_data;",
+            f"\t\t{self.object_structs[field_type]} item(*task_data);",
+        ]
+        lines.append("\t\titem.invalid_as_nan = this->invalid_as_nan;")
+        lines.extend(f"\t\titem.{field[1:]} = {value};" for field, value in TIMESTAMP_FIELDS.items())
+        if field_type in EPOCH_FIELDS:
+            epoch_value = self._generate_epoch_value(field_type, "task_data", push)
+            lines.append(f"\t\titem.{EPOCH_FIELD_NAME[1:]} = {epoch_value};")
+        lines += [
+            "\t\treturn cast(item);",
+            "\t}",
+            "\tif (this->data_mode == DATA_MODE_BYTES && task->task_data)\n\t{",
+            f"\t\treturn bytes((const char*)task->task_data, sizeof({field_type}));",
+            "\t}",
+        ]
+        lines.extend(self._generate_struct_dict("data", field_type, "task_data", intern, push, False))
+        lines.append("\treturn data;")
+        lines.append("};\n")
+
+        lines.append(f"void {self.class_name}::{process_name}(Task *task)\n{{")
+        lines.append("\tgil_scoped_acquire acquire;")
+        lines.append(f"\tobject data = this->{convert_name}(task);")
+        lines.extend(self._generate_task_release(field_type))
+        lines.append(f"\tthis->{on_name}(data);")
+        lines.append("};\n")
+        return lines
+
     def generate_source_function(self) -> None:
         """"""
         filename = f"{self.prefix}_{self.name}_source_function.cpp"
@@ -642,21 +932,26 @@ class GenerateApiFunc:
                                     f.write("};\n\n")
 
                     elif func_name == CtpFunctionConst.RELEASE:
+                        f.write(GIL_RELEASE)
                         f.write(f"\tthis->api->{func_name}();\n")
                         f.write("};\n\n")
 
                     elif func_name == CtpFunctionConst.INIT:
                         f.write("\tthis->active = true;\n")
                         f.write(f"\tthis->task_thread = thread(&{self.class_name}::processTask, this);\n\n")
+                        f.write(GIL_RELEASE)
                         f.write(f"\tthis->api->{func_name}();\n")
                         f.write("};\n\n")
 
                     elif func_name == CtpFunctionConst.JOIN:
+                        f.write(GIL_RELEASE)
                         f.write(f"\tint i = this->api->{func_name}();\n")
                         f.write("\treturn i;\n")
                         f.write("};\n\n")
 
                     elif func_name == CtpFunctionConst.EXIT:
+                        # 工作线程可能正在等待GIL，等待其退出前必须释放
+                        f.write(GIL_RELEASE)
                         f.write("\tthis->active = false;\n")
                         f.write("\tthis->task_queue.terminate();\n")
                         f.write("\tthis->task_thread.join();\n\n")
@@ -675,39 +970,40 @@ class GenerateApiFunc:
                     elif func_name in {CtpFunctionConst.REGISTER_FRONT, CtpFunctionConst.REGISTER_NAME_SERVER}:
                         if ' ' in args_str:
                             arg_name = args_str.split(' ')[1]
+                            f.write(GIL_RELEASE)
                             f.write(f"\tthis->api->{func_name}((char*){arg_name}.c_str());\n")
                             f.write("};\n\n")
 
                     elif func_name in {CtpFunctionConst.REGISTER_FENS_USER_INFO, CtpFunctionConst.GET_FRONT_INFO}:
                         if "func_field" in func_info and func_info["func_field"] in self.structs:
                             self._write_struct_fields(f, func_info["func_field"])
+                            f.write(GIL_RELEASE)
                             f.write(f"\tthis->api->{func_name}(&myreq);\n")
                             f.write("};\n\n")
 
-                    elif func_name in {
-                        CtpFunctionConst.SUBSCRIBE_MARKET_DATA,
-                        CtpFunctionConst.UN_SUBSCRIBE_MARKET_DATA,
-                        CtpFunctionConst.SUBSCRIBE_FOR_QUOTE_RSP,
-                        CtpFunctionConst.UN_SUBSCRIBE_FOR_QUOTE_RSP
-                    }:
+                    elif func_name in SUBSCRIBE_FUNCTIONS:
                         if ' ' in args_str:
                             arg_name = args_str.split(' ')[1]
                             f.write(f"\tchar* buffer = (char*){arg_name}.c_str();\n")
                             f.write("\tchar* myreq[1] = { buffer };\n")
+                            f.write(GIL_RELEASE)
                             f.write(f"\tint i = this->api->{func_name}(myreq, 1);\n")
                             f.write("\treturn i;\n")
                             f.write("};\n\n")
+                            self._write_subscribe_list(f, func_name, new_func_type, lowercase_func_name)
 
                     elif func_name in {CtpFunctionConst.SUBSCRIBE_PRIVATE_TOPIC,
                                        CtpFunctionConst.SUBSCRIBE_PUBLIC_TOPIC}:
                         if ' ' in args_str:
                             arg_type = args_str.split(' ')[0]
+                            f.write(GIL_RELEASE)
                             f.write(f"\tthis->api->{func_name}(({arg_type})nType);\n")
                             f.write("};\n\n")
 
                     elif new_func_type == "int" and not ',' in args_str and "func_field" in func_info:
                         if func_info["func_field"] in self.structs:
                             self._write_struct_fields(f, func_info["func_field"])
+                            f.write(GIL_RELEASE)
                             f.write(f"\tint i = this->api->{func_name}(&myreq);\n")
                             f.write("\treturn i;\n")
                             f.write("};\n\n")
@@ -715,6 +1011,7 @@ class GenerateApiFunc:
                     elif func_name.startswith("Req") and "func_field" in func_info:
                         if func_info["func_field"] in self.structs:
                             self._write_struct_fields(f, func_info["func_field"])
+                            f.write(GIL_RELEASE)
                             f.write(f"\tint i = this->api->{func_name}(&myreq, reqid);\n")
                             f.write("\treturn i;\n")
                             f.write("};\n\n")
@@ -723,6 +1020,30 @@ class GenerateApiFunc:
         except Exception as e:
             print(f"写入文件 {filename} 时发生错误: {e}")
 
+    def _write_subscribe_list(self, f, func_name: str, func_type: str, lowercase_func_name: str) -> None:
+        """生成订阅函数的合约列表重载，按SUBSCRIBE_CHUNK_SIZE分批请求，请求期间释放GIL"""
+        f.write(f"{func_type} {self.class_name}::{lowercase_func_name}(const list &instrumentIDs)\n")
+        f.write("{\n")
+        f.write("\tvector<string> ids;\n")
+        f.write("\tfor (const handle &item : instrumentIDs)\n")
+        f.write("\t{\n")
+        f.write("\t\tids.push_back(item.cast<string>());\n")
+        f.write("\t}\n\n")
+        f.write(GIL_RELEASE)
+        f.write("\tvector<char*> myreq;\n")
+        f.write("\tfor (string &id : ids)\n")
+        f.write("\t{\n")
+        f.write("\t\tmyreq.push_back((char*)id.c_str());\n")
+        f.write("\t}\n\n")
+        f.write("\tint i = 0;\n")
+        f.write("\tfor (size_t start = 0; start < myreq.size() && i == 0; start += SUBSCRIBE_CHUNK_SIZE)\n")
+        f.write("\t{\n")
+        f.write("\t\tint count = (int)min(myreq.size() - start, (size_t)SUBSCRIBE_CHUNK_SIZE);\n")
+        f.write(f"\t\ti = this->api->{func_name}(myreq.data() + start, count);\n")
+        f.write("\t}\n")
+        f.write("\treturn i;\n")
+        f.write("};\n\n")
+
     def _write_struct_fields(self, f, func_field):
         """提取结构体字段写入逻辑"""
         f.write(f"\t{func_field} myreq = {func_field}();\n")
@@ -756,7 +1077,10 @@ class GenerateApiFunc:
                     }
 
                     for _, type_ in d.items():
-                        cpp_arg, bind_arg = type_mapping.get(type_, ("const dict &data", "data"))
+                        if type_ in self.object_structs:
+                            cpp_arg, bind_arg = ("const object &data", "data")
+                        else:
+                            cpp_arg, bind_arg = type_mapping.get(type_, ("const dict &data", "data"))
                         args.append(cpp_arg)
                         bind_args.append(bind_arg)
 
@@ -792,6 +1116,11 @@ class GenerateApiFunc:
 
                 for name in self.functions.keys():
                     processed_name = replace_function_name(name)
+                    if name in SUBSCRIBE_FUNCTIONS:
+                        for arg_type in ("string", "const list &"):
+                            lines.append(f".def(\"{processed_name}\", "
+                                         f"overload_cast<{arg_type}>(&{self.class_name}::{processed_name}))\n")
+                        continue
                     lines.append(f".def(\"{processed_name}\", &{self.class_name}::{processed_name})\n")
 
                 lines.append("\n")
@@ -810,6 +1139,97 @@ class GenerateApiFunc:
             # 处理文件操作异常
             raise IOError(f"无法写入文件 {filename}: {e}")
 
+    def generate_header_struct(self) -> None:
+        """生成结构体对象和请求模板类定义"""
+        filename = f"{self.prefix}_{self.name}_header_struct.h"
+        lines = []
+
+        for struct_name, class_name in self.object_structs.items():
+            lines.append(f"//{class_name}：{struct_name}的结构体对象，持有结构体副本，字段在读取时才转换为python对象")
+            lines.append(f"class {class_name}")
+            lines.append("{")
+            lines.append("public:")
+            lines.append(f"\t{struct_name} data;")
+            lines.append("\tbool invalid_as_nan = false;")
+            for field in TIMESTAMP_FIELDS:
+                lines.append(f"\tint64_t {field[1:]} = 0;")
+            if struct_name in EPOCH_FIELDS:
+                lines.append(f"\tint64_t {EPOCH_FIELD_NAME[1:]} = 0;")
+            lines.append("")
+            lines.append(f"\t{class_name}(const {struct_name} &field) : data(field) {{}};")
+            lines.append("};\n")
+
+        # 请求模板从字典读取字段，字典中没有的字段为0
+        for struct_name, class_name in TEMPLATE_STRUCTS.get(self.name, {}).items():
+            lines.append(f"//{class_name}：{struct_name}的请求模板，创建时从字典读取全部字段，请求时复制后只覆盖变化的字段")
+            lines.append(f"class {class_name}")
+            lines.append("{")
+            lines.append("public:")
+            lines.append(f"\t{struct_name} data;")
+            lines.append("")
+            lines.append(f"\t{class_name}(const dict &req)")
+            lines.append("\t{")
+            lines.append("\t\tmemset(&this->data, 0, sizeof(this->data));")
+            for struct_field, struct_type in self.structs[struct_name].items():
+                if struct_type == "string":
+                    lines.append(f"\t\tgetString(req, \"{struct_field}\", this->data.{struct_field});")
+                else:
+                    lines.append(
+                        f"\t\tget{struct_type.capitalize()}(req, \"{struct_field}\", &this->data.{struct_field});"
+                    )
+            lines.append("\t};")
+            lines.append("};\n")
+
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+
+    def generate_source_struct(self) -> None:
+        """生成结构体对象和请求模板的pybind11绑定代码，每个字段对应一个只读属性"""
+        filename = f"{self.prefix}_{self.name}_source_struct.cpp"
+        lines = []
+
+        for struct_name, class_name in self.object_structs.items():
+            lines.append(f"class_<{class_name}>(m, \"{class_name}\", module_local())")
+
+            struct_fields = self.structs[struct_name]
+            for struct_field, struct_type in struct_fields.items():
+                if struct_type == "string":
+                    getter = f"return toUtf(self.data.{struct_field});"
+                elif struct_type == "double":
+                    getter = f"return validDouble(self.data.{struct_field}, self.invalid_as_nan);"
+                else:
+                    getter = f"return self.data.{struct_field};"
+                lines.append(
+                    f".def_property_readonly(\"{struct_field}\", "
+                    f"[](const {class_name} &self) {{ {getter} }})"
+                )
+
+            for field in TIMESTAMP_FIELDS:
+                lines.append(f".def_readonly(\"{field}\", &{class_name}::{field[1:]})")
+            if struct_name in EPOCH_FIELDS:
+                lines.append(f".def_readonly(\"{EPOCH_FIELD_NAME}\", &{class_name}::{EPOCH_FIELD_NAME[1:]})")
+
+            lines.append(";\n")
+
+        for struct_name, class_name in TEMPLATE_STRUCTS.get(self.name, {}).items():
+            lines.append(f"class_<{class_name}>(m, \"{class_name}\", module_local())")
+            lines.append(".def(init<const dict &>())")
+
+            for struct_field, struct_type in self.structs[struct_name].items():
+                if struct_type == "string":
+                    getter = f"return toUtf(self.data.{struct_field});"
+                else:
+                    getter = f"return self.data.{struct_field};"
+                lines.append(
+                    f".def_property_readonly(\"{struct_field}\", "
+                    f"[](const {class_name} &self) {{ {getter} }})"
+                )
+
+            lines.append(";\n")
+
+        with open(filename, "w") as f:
+            f.write("\n".join(lines))
+
 
 if __name__ == "__main__":
     md_generator = GenerateApiFunc("../include/ThostFtdcMdApi.h", "ctp", "md", "MdApi")
@@ -43,7 +43,8 @@ class GenerateCpp:
             'define': f'{self.prefix}_{self.name}_header_define.h',
             'function': f'{self.prefix}_{self.name}_header_function.h',
             'on': f'{self.prefix}_{self.name}_header_on.h',
-            'process': f'{self.prefix}_{self.name}_header_process.h'
+            'process': f'{self.prefix}_{self.name}_header_process.h',
+            'struct': f'{self.prefix}_{self.name}_header_struct.h'
         }
 
         self.source_files = {
@@ -52,10 +53,209 @@ class GenerateCpp:
             'process': f'{self.prefix}_{self.name}_source_process.cpp',
             'function': f'{self.prefix}_{self.name}_source_function.cpp',
             'on': f'{self.prefix}_{self.name}_source_on.cpp',
-            'module': f'{self.prefix}_{self.name}_source_module.cpp'
+            'module': f'{self.prefix}_{self.name}_source_module.cpp',
+            'struct': f'{self.prefix}_{self.name}_source_struct.cpp'
         }
         # md cpp 头文件内容
         self.md_header_content = """
+//行情缓冲区的记录，只包含数值字段，合约以编号表示
+struct TickRecord
+{
+\tint64_t recv_ns;\t\t\t//接收时间，系统时间纳秒
+\tint32_t symbol_id;\t\t\t//合约编号，对应getTickSymbols返回列表中的序号
+\tint32_t trading_day;\t\t//交易日，YYYYMMDD
+\tint32_t update_ms;\t\t\t//最后修改时间，当日毫秒数
+\tint32_t volume;\t\t\t\t//数量
+\tint32_t bid_volume1;\t\t//申买量一
+\tint32_t ask_volume1;\t\t//申卖量一
+\tdouble last_price;\t\t\t//最新价
+\tdouble turnover;\t\t\t//成交金额
+\tdouble open_interest;\t\t//持仓量
+\tdouble bid_price1;\t\t\t//申买价一
+\tdouble ask_price1;\t\t\t//申卖价一
+};
+
+
+//行情快照矩阵的数值列
+enum SnapshotColumn
+{
+\tSNAPSHOT_LAST_PRICE,\t\t\t//最新价
+\tSNAPSHOT_VOLUME,\t\t\t\t//数量
+\tSNAPSHOT_TURNOVER,\t\t\t//成交金额
+\tSNAPSHOT_OPEN_INTEREST,\t\t//持仓量
+\tSNAPSHOT_UPPER_LIMIT_PRICE,\t//涨停板价
+\tSNAPSHOT_LOWER_LIMIT_PRICE,\t//跌停板价
+\tSNAPSHOT_COLUMN_COUNT
+};
+
+#define SNAPSHOT_LEVELS 5\t\t\t//盘口档位数
+#define SNAPSHOT_BOOK_WIDTH 4\t\t//每档的申买价、申买量、申卖价、申卖量
+
+
+//行情快照矩阵，行号为合约编号，数据按列连续存放，便于对全部合约做向量化计算
+struct SnapshotMatrix
+{
+\tsize_t rows;\t\t\t\t//最大合约数量
+\tvector<double> book;\t\t//五档盘口，下标为(档位*4+项)*rows+行号
+\tvector<double> columns;\t\t//数值列，下标为列*rows+行号
+\tvector<int64_t> recv_ns;\t//最后更新的接收时间，系统时间纳秒
+
+\texplicit SnapshotMatrix(size_t rows) :
+\t\trows(rows),
+\t\tbook(rows * SNAPSHOT_LEVELS * SNAPSHOT_BOOK_WIDTH, numeric_limits<double>::quiet_NaN()),
+\t\tcolumns(rows * SNAPSHOT_COLUMN_COUNT, numeric_limits<double>::quiet_NaN()),
+\t\trecv_ns(rows, 0)
+\t{
+\t}
+};
+
+
+#define BAR_TYPE_TIME 0\t\t\t\t//按时间切分K线，周期单位为秒
+#define BAR_TYPE_VOLUME 1\t\t\t//按成交量切分K线，周期单位为手
+
+
+//K线，由回调线程中的行情合成，成交量和成交金额为区间增量
+struct BarData
+{
+\tTThostFtdcInstrumentIDType instrument_id;\t//合约代码
+\tTThostFtdcDateType trading_day;\t\t\t\t//交易日
+\tint bar_type;\t\t\t//K线类型
+\tint bar_size;\t\t\t//K线周期
+\tint64_t start_ns;\t\t//开始时间，epoch纳秒，时间K线为周期起点，成交量K线为第一笔行情时间
+\tint64_t end_ns;\t\t\t//最后一笔行情的时间，epoch纳秒
+\tdouble open_price;\t\t//开盘价
+\tdouble high_price;\t\t//最高价
+\tdouble low_price;\t\t//最低价
+\tdouble close_price;\t\t//收盘价
+\tint volume;\t\t\t\t//成交量
+\tdouble turnover;\t\t//成交金额
+\tdouble open_interest;\t//持仓量
+\tint tick_count;\t\t\t//行情笔数
+};
+
+
+//单个合约在一种K线规格下的合成状态
+struct BarState
+{
+\tBarData bar;
+\tbool active = false;\t\t//是否有未完成的K线
+\tint session = 0;\t\t\t//当前K线所属的交易时段
+\tint64_t bucket = 0;\t\t//时间K线的周期序号
+\tint last_volume = -1;\t\t//上一笔行情的累计成交量，-1为尚未收到行情
+\tdouble last_turnover = 0;\t//上一笔行情的累计成交金额
+};
+
+
+//K线合成器，每种K线规格一个，只在持有锁时访问
+class BarBuilder
+{
+private:
+\tunordered_map<string, BarState> states;\t//每个合约的合成状态
+
+public:
+\tint bar_type;
+\tint bar_size;
+
+\tBarBuilder(int type, int size) : bar_type(type), bar_size(size) {}
+
+\t//用一笔行情更新K线，session和tick_ms为交易时段和移入时段内的epoch毫秒，有K线完成时写入completed并返回true
+\tbool update(const CThostFtdcDepthMarketDataField &tick, int session, int64_t tick_ms, BarData &completed)
+\t{
+\t\tBarState &state = this->states[string(tick.InstrumentID, strnlen(tick.InstrumentID, sizeof(tick.InstrumentID)))];
+
+\t\t//CTP的成交量和成交金额为当日累计值，取与上一笔的差值，累计值变小时视为新交易日重新开始
+\t\tint volume = 0;
+\t\tdouble turnover = 0;
+\t\tif (state.last_volume >= 0)
+\t\t{
+\t\t\tvolume = tick.Volume - state.last_volume;
+\t\t\tturnover = tick.Turnover - state.last_turnover;
+\t\t\tif (volume < 0)
+\t\t\t{
+\t\t\t\tvolume = tick.Volume;
+\t\t\t\tturnover = tick.Turnover;
+\t\t\t}
+\t\t}
+\t\tstate.last_volume = tick.Volume;
+\t\tstate.last_turnover = tick.Turnover;
+
+\t\t//不属于任何交易时段的行情只更新累计值
+\t\tif (session < 0 || tick.LastPrice <= 0 || tick.LastPrice >= numeric_limits<double>::max())
+\t\t{
+\t\t\treturn false;
+\t\t}
+
+\t\t//时间K线按北京时间的整周期切分，交易时段或交易日变化时K线也结束
+\t\tbool done = false;
+\t\tBarData &bar = state.bar;
+\t\tint64_t bucket = (tick_ms + CHINA_UTC_OFFSET_MS) / (this->bar_size * 1000LL);
+\t\tif (state.active
+\t\t\t&& ((this->bar_type == BAR_TYPE_TIME && bucket != state.bucket)
+\t\t\t\t|| session != state.session
+\t\t\t\t|| strncmp(bar.trading_day, tick.TradingDay, sizeof(bar.trading_day)) != 0))
+\t\t{
+\t\t\tcompleted = bar;
+\t\t\tstate.active = false;
+\t\t\tdone = true;
+\t\t}
+
+\t\tif (!state.active)
+\t\t{
+\t\t\tmemcpy(bar.instrument_id, tick.InstrumentID, sizeof(bar.instrument_id));
+\t\t\tmemcpy(bar.trading_day, tick.TradingDay, sizeof(bar.trading_day));
+\t\t\tbar.bar_type = this->bar_type;
+\t\t\tbar.bar_size = this->bar_size;
+\t\t\tif (this->bar_type == BAR_TYPE_TIME)
+\t\t\t{
+\t\t\t\tbar.start_ns = (bucket * this->bar_size * 1000 - CHINA_UTC_OFFSET_MS) * 1000000;
+\t\t\t}
+\t\t\telse
+\t\t\t{
+\t\t\t\tbar.start_ns = tick_ms * 1000000;
+\t\t\t}
+\t\t\tbar.open_price = bar.high_price = bar.low_price = tick.LastPrice;
+\t\t\tbar.volume = 0;
+\t\t\tbar.turnover = 0;
+\t\t\tbar.tick_count = 0;
+\t\t\tstate.session = session;
+\t\t\tstate.bucket = bucket;
+\t\t\tstate.active = true;
+\t\t}
+
+\t\tbar.end_ns = tick_ms * 1000000;
+\t\tbar.high_price = max(bar.high_price, tick.LastPrice);
+\t\tbar.low_price = min(bar.low_price, tick.LastPrice);
+\t\tbar.close_price = tick.LastPrice;
+\t\tbar.volume += volume;
+\t\tbar.turnover += turnover;
+\t\tbar.open_interest = tick.OpenInterest;
+\t\tbar.tick_count += 1;
+
+\t\t//成交量K线在达到周期后立即完成，一笔行情最多完成一根K线
+\t\tif (!done && this->bar_type == BAR_TYPE_VOLUME && bar.volume >= this->bar_size)
+\t\t{
+\t\t\tcompleted = bar;
+\t\t\tstate.active = false;
+\t\t\tdone = true;
+\t\t}
+\t\treturn done;
+\t}
+
+\t//取出全部未完成的K线
+\tvoid flush(vector<BarData> &bars)
+\t{
+\t\tfor (auto &item : this->states)
+\t\t{
+\t\t\tif (item.second.active)
+\t\t\t{
+\t\t\t\tbars.push_back(item.second.bar);
+\t\t\t\titem.second.active = false;
+\t\t\t}
+\t\t}
+\t}
+};
+
+
 ///-------------------------------------------------------------------------------------
 ///C++ SPI的回调函数的继承实现
 ///-------------------------------------------------------------------------------------
@@ -68,6 +268,26 @@ private:
 \tthread task_thread;\t\t\t\t\t//工作线程指针（向python推送数据）
 \tTaskQueue task_queue;\t\t\t//任务队列
 \tbool active = false;\t\t\t\t//活动状态
+\tint data_mode = DATA_MODE_DICT;\t\t//推送模式
+\tint batch_size = 0;\t\t\t\t\t//行情批量推送的最大数量，0为逐笔推送
+\tStringCache string_cache;\t\t\t//低基数字符串字段的驻留缓存
+\tbool invalid_as_nan = false;\t\t//是否将无效的极大值转换为NaN
+\tFieldSelection field_selection;\t\t//按结构体设置的需要转换的字段
+\tbool conflation = false;\t\t\t//是否合并推送行情
+\tConflationTable<CThostFtdcDepthMarketDataField> conflation_table;\t//行情合并表
+\tHandlerTable tick_handlers;\t\t\t//按合约分发的行情回调函数
+\tSymbolTable symbols;\t\t\t\t//合约编号表
+\tshared_ptr<SnapshotTable<CThostFtdcDepthMarketDataField>> latest_ticks;\t\t\t\t//每个合约的最新行情
+\tatomic<SnapshotTable<CThostFtdcDepthMarketDataField>*> latest_ticks_ptr{nullptr};\t//回调线程读取的最新行情表指针
+\tbool tick_callback = true;\t\t\t//是否将行情放入任务队列推送到python
+\tshared_ptr<RecordBuffer<TickRecord>> tick_buffer;\t\t\t\t//行情环形缓冲区
+\tatomic<RecordBuffer<TickRecord>*> tick_buffer_ptr{nullptr};\t//回调线程读取的行情环形缓冲区指针
+\tshared_ptr<SnapshotMatrix> snapshot;\t\t\t\t\t\t\t//行情快照矩阵
+\tatomic<SnapshotMatrix*> snapshot_ptr{nullptr};\t\t\t\t//回调线程读取的行情快照矩阵指针
+\tmutex bar_mutex;\t\t\t\t\t//K线合成器锁
+\tvector<BarBuilder> bar_builders;\t//K线合成器，每种规格一个
+\tSessionCalendar sessions;\t\t\t//按品种配置的交易时段
+\tatomic<bool> bar_enabled{false};\t//是否有K线合成器，为false时回调线程不获取锁
 
 public:
 \tMdApi()
@@ -82,97 +302,1103 @@ public:
 \t\t}
 \t};
 
-\t//-------------------------------------------------------------------------------------
-\t//从CThostFtdcMdSpi继承的C++回调函数
-\t//-------------------------------------------------------------------------------------
+\t//-------------------------------------------------------------------------------------
+\t//从CThostFtdcMdSpi继承的C++回调函数
+\t//-------------------------------------------------------------------------------------
+
+"""
+        # td cpp 头文件内容
+        self.td_header_content = """
+//委托表中的一笔委托，成交数量和金额由成交回报累计
+struct OrderEntry
+{
+\tCThostFtdcOrderField order;\t\t//最新的委托回报，报单录入被拒绝时由录入请求填充
+\tint64_t time = 0;\t\t\t\t//最后更新时间，steady_clock纳秒
+\tint64_t wall_time = 0;\t\t\t//最后更新时间，系统时间纳秒
+\tint traded_volume = 0;\t\t\t//成交回报累计的成交数量
+\tdouble traded_turnover = 0;\t\t//成交回报累计的成交价格*数量
+\tint error_id = 0;\t\t\t\t//报单录入的错误代码
+};
+
+
+//单个合约的成交汇总
+struct TradeSummary
+{
+\tint buy_volume = 0;\t\t\t\t//买成交数量
+\tdouble buy_turnover = 0;\t\t//买成交价格*数量
+\tint sell_volume = 0;\t\t\t//卖成交数量
+\tdouble sell_turnover = 0;\t\t//卖成交价格*数量
+\tint trade_count = 0;\t\t\t//成交笔数
+};
+
+
+//委托表，在回调线程中由委托、成交和报单录入错误回报更新，可按会话或交易所编号查询
+class OrderBook
+{
+private:
+\tmutex mutex_;
+\tdeque<OrderEntry> entries_;\t\t\t\t\t\t\t\t//委托存储
+\tunordered_map<string, size_t> session_index_;\t\t\t//FrontID|SessionID|OrderRef到委托位置的映射
+\tunordered_map<string, size_t> exchange_index_;\t\t\t//ExchangeID|OrderSysID到委托位置的映射
+\tunordered_map<string, pair<int, double>> pending_trades_;\t//先于委托回报到达的成交数量和金额，按交易所编号暂存
+\tunordered_set<string> trade_ids_;\t\t\t\t\t\t//已累计的成交，重连后重复推送时跳过
+\tunordered_map<string, TradeSummary> summaries_;\t\t\t//按合约的成交汇总
+
+\t//去掉首尾空格，OrderRef和OrderSysID通常为右对齐的定长字符串
+\tstatic string_view trim(string_view view)
+\t{
+\t\tsize_t begin = view.find_first_not_of(' ');
+\t\tif (begin == string_view::npos)
+\t\t\treturn string_view();
+\t\tsize_t end = view.find_last_not_of(' ');
+\t\treturn view.substr(begin, end - begin + 1);
+\t}
+
+\ttemplate <size_t size>
+\tstatic string_view trim(const char (&value)[size])
+\t{
+\t\treturn trim(string_view(value, strnlen(value, size)));
+\t}
+
+\tstatic string sessionKey(int front_id, int session_id, string_view order_ref)
+\t{
+\t\treturn to_string(front_id) + "|" + to_string(session_id) + "|" + string(order_ref);
+\t}
+
+\tstatic string exchangeKey(string_view exchange_id, string_view order_sys_id)
+\t{
+\t\treturn string(exchange_id) + "|" + string(order_sys_id);
+\t}
+
+\t//按会话编号查找委托，不存在时新建
+\tOrderEntry &entry(const string &key)
+\t{
+\t\tauto it = session_index_.find(key);
+\t\tif (it != session_index_.end())
+\t\t{
+\t\t\treturn entries_[it->second];
+\t\t}
+\t\tentries_.emplace_back();
+\t\tmemset(&entries_.back().order, 0, sizeof(CThostFtdcOrderField));
+\t\tsession_index_.emplace(key, entries_.size() - 1);
+\t\treturn entries_.back();
+\t}
+
+\tstatic bool isActive(const CThostFtdcOrderField &order)
+\t{
+\t\tswitch (order.OrderStatus)
+\t\t{
+\t\tcase THOST_FTDC_OST_PartTradedQueueing:
+\t\tcase THOST_FTDC_OST_NoTradeQueueing:
+\t\tcase THOST_FTDC_OST_Unknown:
+\t\tcase THOST_FTDC_OST_NotTouched:
+\t\tcase THOST_FTDC_OST_Touched:
+\t\t\treturn true;
+\t\tdefault:
+\t\t\treturn false;
+\t\t}
+\t}
+
+public:
+\t//委托回报，有交易所编号后建立索引并合并暂存的成交
+\tvoid updateOrder(const CThostFtdcOrderField &order, int64_t time, int64_t wall_time)
+\t{
+\t\tstring key = sessionKey(order.FrontID, order.SessionID, trim(order.OrderRef));
+\t\tstring_view order_sys_id = trim(order.OrderSysID);
+
+\t\tlock_guard<mutex> mlock(mutex_);
+\t\tOrderEntry &item = this->entry(key);
+\t\titem.order = order;
+\t\titem.time = time;
+\t\titem.wall_time = wall_time;
+
+\t\tif (!order_sys_id.empty())
+\t\t{
+\t\t\tstring exchange_key = exchangeKey(trim(order.ExchangeID), order_sys_id);
+\t\t\texchange_index_[exchange_key] = session_index_[key];
+
+\t\t\tauto it = pending_trades_.find(exchange_key);
+\t\t\tif (it != pending_trades_.end())
+\t\t\t{
+\t\t\t\titem.traded_volume += it->second.first;
+\t\t\t\titem.traded_turnover += it->second.second;
+\t\t\t\tpending_trades_.erase(it);
+\t\t\t}
+\t\t}
+\t}
+
+\t//成交回报，累计到所属委托和合约汇总
+\tvoid updateTrade(const CThostFtdcTradeField &trade)
+\t{
+\t\tstring exchange_key = exchangeKey(trim(trade.ExchangeID), trim(trade.OrderSysID));
+\t\tstring trade_key = exchange_key + "|" + string(trim(trade.TradeID)) + "|" + trade.Direction;
+\t\tdouble turnover = trade.Price * trade.Volume;
+
+\t\tlock_guard<mutex> mlock(mutex_);
+\t\tif (!trade_ids_.insert(trade_key).second)
+\t\t{
+\t\t\treturn;
+\t\t}
+
+\t\tTradeSummary &summary = summaries_[string(trim(trade.InstrumentID))];
+\t\tif (trade.Direction == THOST_FTDC_D_Buy)
+\t\t{
+\t\t\tsummary.buy_volume += trade.Volume;
+\t\t\tsummary.buy_turnover += turnover;
+\t\t}
+\t\telse
+\t\t{
+\t\t\tsummary.sell_volume += trade.Volume;
+\t\t\tsummary.sell_turnover += turnover;
+\t\t}
+\t\tsummary.trade_count += 1;
+
+\t\tauto it = exchange_index_.find(exchange_key);
+\t\tif (it != exchange_index_.end())
+\t\t{
+\t\t\tOrderEntry &item = entries_[it->second];
+\t\t\titem.traded_volume += trade.Volume;
+\t\t\titem.traded_turnover += turnover;
+\t\t}
+\t\telse
+\t\t{
+\t\t\tpair<int, double> &pending = pending_trades_[exchange_key];
+\t\t\tpending.first += trade.Volume;
+\t\t\tpending.second += turnover;
+\t\t}
+\t}
+
+\t//报单录入被拒绝，委托未到达交易所，不会再收到委托回报，以录入请求的字段记录为已撤单
+\t//录入请求中没有前置编号和会话编号，create为False时只更新本会话已有的委托，不新建记录
+\tvoid updateInputError(const CThostFtdcInputOrderField &req, int front_id, int session_id, const CThostFtdcRspInfoField &error, int64_t time, int64_t wall_time, bool create)
+\t{
+\t\tstring key = sessionKey(front_id, session_id, trim(req.OrderRef));
+
+\t\tlock_guard<mutex> mlock(mutex_);
+\t\tif (!create && session_index_.find(key) == session_index_.end())
+\t\t{
+\t\t\treturn;
+\t\t}
+\t\tOrderEntry &item = this->entry(key);
+\t\tCThostFtdcOrderField &order = item.order;
+\t\tif (!item.time)
+\t\t{
+\t\t\tmemcpy(order.BrokerID, req.BrokerID, sizeof(order.BrokerID));
+\t\t\tmemcpy(order.InvestorID, req.InvestorID, sizeof(order.InvestorID));
+\t\t\tmemcpy(order.InstrumentID, req.InstrumentID, sizeof(order.InstrumentID));
+\t\t\tmemcpy(order.ExchangeID, req.ExchangeID, sizeof(order.ExchangeID));
+\t\t\tmemcpy(order.OrderRef, req.OrderRef, sizeof(order.OrderRef));
+\t\t\tmemcpy(order.UserID, req.UserID, sizeof(order.UserID));
+\t\t\tmemcpy(order.CombOffsetFlag, req.CombOffsetFlag, sizeof(order.CombOffsetFlag));
+\t\t\tmemcpy(order.CombHedgeFlag, req.CombHedgeFlag, sizeof(order.CombHedgeFlag));
+\t\t\tmemcpy(order.InvestUnitID, req.InvestUnitID, sizeof(order.InvestUnitID));
+\t\t\torder.OrderPriceType = req.OrderPriceType;
+\t\t\torder.Direction = req.Direction;
+\t\t\torder.LimitPrice = req.LimitPrice;
+\t\t\torder.VolumeTotalOriginal = req.VolumeTotalOriginal;
+\t\t\torder.TimeCondition = req.TimeCondition;
+\t\t\torder.VolumeCondition = req.VolumeCondition;
+\t\t\torder.RequestID = req.RequestID;
+\t\t\torder.FrontID = front_id;
+\t\t\torder.SessionID = session_id;
+\t\t\torder.OrderSubmitStatus = THOST_FTDC_OSS_InsertRejected;
+\t\t\torder.OrderStatus = THOST_FTDC_OST_Canceled;
+\t\t}
+\t\tmemcpy(order.StatusMsg, error.ErrorMsg, sizeof(order.StatusMsg));
+\t\titem.error_id = error.ErrorID;
+\t\titem.time = time;
+\t\titem.wall_time = wall_time;
+\t}
+
+\tbool findSession(int front_id, int session_id, const string &order_ref, OrderEntry &item)
+\t{
+\t\tstring key = sessionKey(front_id, session_id, trim(order_ref));
+\t\tlock_guard<mutex> mlock(mutex_);
+\t\tauto it = session_index_.find(key);
+\t\tif (it == session_index_.end())
+\t\t\treturn false;
+\t\titem = entries_[it->second];
+\t\treturn true;
+\t}
+
+\tbool findExchange(const string &exchange_id, const string &order_sys_id, OrderEntry &item)
+\t{
+\t\tstring key = exchangeKey(trim(exchange_id), trim(order_sys_id));
+\t\tlock_guard<mutex> mlock(mutex_);
+\t\tauto it = exchange_index_.find(key);
+\t\tif (it == exchange_index_.end())
+\t\t\treturn false;
+\t\titem = entries_[it->second];
+\t\treturn true;
+\t}
+
+\t//按合约筛选委托，合约为空时不筛选，active_only为true时只返回可撤的委托
+\tvoid select(const string &instrument_id, bool active_only, vector<OrderEntry> &items)
+\t{
+\t\tlock_guard<mutex> mlock(mutex_);
+\t\tfor (const OrderEntry &item : entries_)
+\t\t{
+\t\t\tif (active_only && !isActive(item.order))
+\t\t\t\tcontinue;
+\t\t\tif (!instrument_id.empty() && instrument_id != trim(item.order.InstrumentID))
+\t\t\t\tcontinue;
+\t\t\titems.push_back(item);
+\t\t}
+\t}
+
+\t//合约的成交汇总，合约为空时汇总全部合约
+\tTradeSummary summary(const string &instrument_id)
+\t{
+\t\tlock_guard<mutex> mlock(mutex_);
+\t\tif (!instrument_id.empty())
+\t\t{
+\t\t\tauto it = summaries_.find(instrument_id);
+\t\t\treturn it != summaries_.end() ? it->second : TradeSummary();
+\t\t}
+
+\t\tTradeSummary total;
+\t\tfor (const auto &item : summaries_)
+\t\t{
+\t\t\ttotal.buy_volume += item.second.buy_volume;
+\t\t\ttotal.buy_turnover += item.second.buy_turnover;
+\t\t\ttotal.sell_volume += item.second.sell_volume;
+\t\t\ttotal.sell_turnover += item.second.sell_turnover;
+\t\t\ttotal.trade_count += item.second.trade_count;
+\t\t}
+\t\treturn total;
+\t}
+
+\tvoid clear()
+\t{
+\t\tlock_guard<mutex> mlock(mutex_);
+\t\tentries_.clear();
+\t\tsession_index_.clear();
+\t\texchange_index_.clear();
+\t\tpending_trades_.clear();
+\t\ttrade_ids_.clear();
+\t\tsummaries_.clear();
+\t}
+};
+
+
+///-------------------------------------------------------------------------------------
+///C++ SPI的回调函数的继承实现
+///-------------------------------------------------------------------------------------
+
+//API的继承实现
+class TdApi : public CThostFtdcTraderSpi
+{
+private:
+\tCThostFtdcTraderApi* api;\t\t\t\t//API对象
+\tthread task_thread;\t\t\t\t\t//工作线程指针（向python推送数据）
+\tTaskQueue task_queue;\t\t\t\t//任务队列
+\tbool active = false;\t\t\t\t//活动状态
+\tStringCache string_cache;\t\t\t//低基数字符串字段的驻留缓存
+\tbool invalid_as_nan = false;\t\t//是否将无效的极大值转换为NaN
+\tFieldSelection field_selection;\t\t//按结构体设置的需要转换的字段
+\tOrderBook order_book;\t\t\t\t//委托表
+\tint front_id = 0;\t\t\t\t\t//登录成功后的前置编号
+\tint session_id = 0;\t\t\t\t\t//登录成功后的会话编号
+
+public:
+\tTdApi()
+\t{
+\t};
+
+\tvirtual ~TdApi()
+\t{
+\t\tif (this->active)
+\t\t{
+\t\t\tthis->exit();
+\t\t}
+\t};
+
+\t//-------------------------------------------------------------------------------------
+\t//从CThostFtdcTraderSpi继承的C++回调函数
+\t//-------------------------------------------------------------------------------------
+
+"""
+        # md cpp 文件内容
+        self.md_cpp_content = """
+///-------------------------------------------------------------------------------------
+///工作线程从队列中取出数据，转化为python对象后，进行推送
+///-------------------------------------------------------------------------------------
+
+void MdApi::processTask()
+{
+\tvector<Task> tasks;
+
+\ttry
+\t{
+\t\twhile (this->active)
+\t\t{
+\t\t\tif (this->batch_size > 0)
+\t\t\t{
+\t\t\t\tthis->task_queue.pop_batch(tasks, this->batch_size);
+\t\t\t\tthis->processTaskBatch(tasks);
+\t\t\t}
+\t\t\telse
+\t\t\t{
+\t\t\t\tTask task = this->task_queue.pop();
+\t\t\t\tthis->dispatchTask(task);
+\t\t\t}
+\t\t}
+\t}
+\tcatch (const TerminatedError&)
+\t{
+\t}
+};
+
+void MdApi::processTaskBatch(vector<Task> &tasks)
+{
+\tgil_scoped_acquire acquire;
+\tlist ticks;
+\tfor (Task &task : tasks)
+\t{
+\t\tif (task.task_name == ONRTNDEPTHMARKETDATA)
+\t\t{
+\t\t\tthis->takeConflatedTask(task);
+\t\t\tif (!this->tick_handlers.empty())
+\t\t\t{
+\t\t\t\tthis->routeTick(task);
+\t\t\t\tcontinue;
+\t\t\t}
+\t\t\tticks.append(this->convertRtnDepthMarketData(&task));
+\t\t\tif (task.task_data)
+\t\t\t{
+\t\t\t\tTaskPool<CThostFtdcDepthMarketDataField>::release((CThostFtdcDepthMarketDataField*)task.task_data);
+\t\t\t}
+\t\t\tcontinue;
+\t\t}
+
+\t\t//先推送已积累的行情，保证回调顺序与到达顺序一致
+\t\tif (ticks.size() > 0)
+\t\t{
+\t\t\tthis->onRtnDepthMarketDataBatch(ticks);
+\t\t\tticks = list();
+\t\t}
+\t\tthis->dispatchTask(task);
+\t}
+
+\tif (ticks.size() > 0)
+\t{
+\t\tthis->onRtnDepthMarketDataBatch(ticks);
+\t}
+};
+
+void MdApi::dispatchTask(Task &task)
+{
+\tthis->takeConflatedTask(task);
+
+\t//注册了按合约分发的回调函数后，行情不再推送到onRtnDepthMarketData
+\tif (task.task_name == ONRTNDEPTHMARKETDATA && !this->tick_handlers.empty())
+\t{
+\t\tthis->routeTick(task);
+\t\treturn;
+\t}
+
+\tif (task.task_name == ONBAR)
+\t{
+\t\tthis->processBar(&task);
+\t\treturn;
+\t}
+
+\tswitch (task.task_name)
+\t{
+"""
+        self.md_cpp_content_end = """\t};
+};
+
+"""
+        # td cpp 文件内容
+        self.td_cpp_content = """
+///-------------------------------------------------------------------------------------
+///工作线程从队列中取出数据，转化为python对象后，进行推送
+///-------------------------------------------------------------------------------------
+
+void TdApi::processTask()
+{
+\ttry
+\t{
+\t\twhile (this->active)
+\t\t{
+\t\t\tTask task = this->task_queue.pop();
+
+\t\t\tswitch (task.task_name)
+\t\t\t{
+"""
+        self.td_cpp_content_end = """\t\t\t};
+\t\t}
+\t}
+\tcatch (const TerminatedError&)
+\t{
+\t}
+};
+
+"""
+        self.md_pybind_header = """
+///-------------------------------------------------------------------------------------
+///pybind11封装
+///-------------------------------------------------------------------------------------
+
+class PyMdApi: public MdApi
+{
+public:
+\tusing MdApi::MdApi;
+
+"""
+        self.md_pybind_content = """};
+
+
+PYBIND11_MODULE(ctpmd, m)
+{
+\tclass_<MdApi, PyMdApi> mdapi(m, "MdApi", module_local());
+\tmdapi
+\t\t.def(init<>())
+"""
+
+        # md和td共用的扩展函数（非CTP原生接口）声明、实现和绑定，{class_name}替换为MdApi或TdApi
+        self.common_extend_header = """\tint setRingQueue(int capacity);
+
+\tvoid setInvalidAsNan(bool enabled);
+
+\tvoid setFieldSelection(string structName, const list &fields);
+
+\tdict getQueueStats();
+"""
+        self.common_extend_source = """int {class_name}::setRingQueue(int capacity)
+{
+\tif (capacity < 0 || capacity > RING_QUEUE_MAX_CAPACITY)
+\t{
+\t\tthrow value_error("capacity must be between 0 and " + to_string(RING_QUEUE_MAX_CAPACITY));
+\t}
+\tif (this->active)
+\t{
+\t\treturn -1;
+\t}
+\tthis->task_queue.set_ring(capacity);
+\treturn 0;
+};
+
+void {class_name}::setInvalidAsNan(bool enabled)
+{
+\tthis->invalid_as_nan = enabled;
+};
+
+void {class_name}::setFieldSelection(string structName, const list &fields)
+{
+\t//字段名在设置时转换为序号，推送时按序号只转换选中的字段，字段为空时恢复转换全部字段
+\tfor (int n = 0; n < SELECTABLE_STRUCT_COUNT; n++)
+\t{
+\t\tconst FieldTable &table = SELECTABLE_STRUCTS[n];
+\t\tif (structName != table.name)
+\t\t{
+\t\t\tcontinue;
+\t\t}
+
+\t\tvector<int> selected;
+\t\tfor (const handle &item : fields)
+\t\t{
+\t\t\tstring field = item.cast<string>();
+\t\t\tint index = 0;
+\t\t\twhile (index < table.count && field != table.fields[index])
+\t\t\t{
+\t\t\t\tindex++;
+\t\t\t}
+\t\t\tif (index == table.count)
+\t\t\t{
+\t\t\t\tthrow value_error("unknown field: " + field);
+\t\t\t}
+\t\t\tselected.push_back(index);
+\t\t}
+\t\tthis->field_selection.set(n, selected);
+\t\treturn;
+\t}
+\tthrow value_error("unsupported struct: " + structName);
+};
+
+dict {class_name}::getQueueStats()
+{
+\tconst QueueStats &stats = this->task_queue.stats();
+\tuint64_t pushed = stats.pushed.load(memory_order_relaxed);
+\tuint64_t popped = stats.popped.load(memory_order_relaxed);
+
+\t//按回调函数名统计，只包含非零项
+\tdict enqueued;
+\tdict dispatched;
+\tdict dropped;
+\tfor (int n = 0; n < TASK_NAME_COUNT && n < QUEUE_STATS_TYPES; n++)
+\t{
+\t\tif (uint64_t count = stats.enqueued[n].load(memory_order_relaxed))
+\t\t\tenqueued[TASK_NAMES[n]] = count;
+\t\tif (uint64_t count = stats.dispatched[n].load(memory_order_relaxed))
+\t\t\tdispatched[TASK_NAMES[n]] = count;
+\t\tif (uint64_t count = stats.dropped[n].load(memory_order_relaxed))
+\t\t\tdropped[TASK_NAMES[n]] = count;
+\t}
+
+\t//停留时间直方图，第0项为小于1微秒，第i项为[2^(i-1), 2^i)微秒
+\tlist dwell;
+\tfor (int n = 0; n < QUEUE_STATS_BUCKETS; n++)
+\t{
+\t\tdwell.append(stats.dwell[n].load(memory_order_relaxed));
+\t}
+
+\tdict data;
+\tdata["depth"] = pushed > popped ? pushed - popped : 0;
+\tdata["high_water"] = stats.high_water.load(memory_order_relaxed);
+\tdata["enqueued"] = enqueued;
+\tdata["dispatched"] = dispatched;
+\tdata["dropped"] = dropped;
+\tdata["dwell_us"] = dwell;
+\treturn data;
+};
+
+"""
+        self.common_extend_module = """.def("setRingQueue", &{class_name}::setRingQueue)
+.def("setInvalidAsNan", &{class_name}::setInvalidAsNan)
+.def("setFieldSelection", &{class_name}::setFieldSelection)
+.def("getQueueStats", &{class_name}::getQueueStats)
+"""
+
+        # md 扩展函数（非CTP原生接口）声明、实现和绑定
+        self.md_extend_header = """\tvoid setDataMode(int mode);
+
+\tvoid setTickBatchSize(int size);
+
+\tvoid setConflation(bool enabled);
+
+\tvoid conflateRtnDepthMarketData(CThostFtdcDepthMarketDataField *pDepthMarketData, int64_t recv_time, int64_t recv_wall_time);
+
+\tvoid takeConflatedTask(Task &task);
+
+\tvoid registerTickHandler(string instrumentId, object handler);
+
+\tvoid unregisterTickHandler(string instrumentId);
+
+\tvoid routeTick(Task &task);
+
+\tbool storeRtnDepthMarketData(CThostFtdcDepthMarketDataField *pDepthMarketData, int64_t recv_time, int64_t recv_wall_time);
+
+\tvoid setTickCallback(bool enabled);
+
+\tvoid enableLatestTicks();
+
+\tobject getLatestTick(string instrumentId);
+
+\tlist getLatestTicks(const list &instrumentIds);
+
+\tobject enableTickBuffer(int capacity);
+
+\tuint64_t getTickCursor();
+
+\tlist getTickSymbols();
+
+\tdict enableSnapshotMatrix(int maxInstruments);
+
+\tvoid addBarBuilder(int barType, int barSize);
+
+\tvoid clearBarBuilders();
+
+\tvoid setTradingSessions(string product, const list &sessions);
+
+\tvoid flushBars();
+
+\tTask createBarTask(const BarData &bar);
+
+\tvoid processBar(Task *task);
+
+\tvirtual void onBar(const dict &data) {};
+
+\tvoid processTaskBatch(vector<Task> &tasks);
+
+\tvoid dispatchTask(Task &task);
+
+\tvirtual void onRtnDepthMarketDataBatch(const list &data) {};
+"""
+        self.md_extend_source = """void MdApi::setDataMode(int mode)
+{
+\tif (mode != DATA_MODE_DICT && mode != DATA_MODE_OBJECT && mode != DATA_MODE_BYTES)
+\t{
+\t\tthrow value_error("mode must be DATA_MODE_DICT, DATA_MODE_OBJECT or DATA_MODE_BYTES");
+\t}
+\tthis->data_mode = mode;
+};
+
+void MdApi::setTickBatchSize(int size)
+{
+\tthis->batch_size = size;
+};
+
+void MdApi::setConflation(bool enabled)
+{
+\tthis->conflation = enabled;
+};
+
+void MdApi::conflateRtnDepthMarketData(CThostFtdcDepthMarketDataField *pDepthMarketData, int64_t recv_time, int64_t recv_wall_time)
+{
+\t//同一合约已有待推送的行情时只覆盖数据，不再入队，接收时间使用回调函数中记录的时间
+\tint slot = this->conflation_table.update(pDepthMarketData->InstrumentID, *pDepthMarketData, recv_time, recv_wall_time);
+\tif (slot < 0)
+\t{
+\t\tthis->task_queue.record_drop(ONRTNDEPTHMARKETDATA);
+\t\treturn;
+\t}
+
+\tTask task = Task();
+\ttask.task_name = ONRTNDEPTHMARKETDATA;
+\ttask.task_id = slot;
+\ttask.task_time = recv_time;
+\ttask.task_wall_time = recv_wall_time;
+\ttask.task_conflated = true;
+\tthis->task_queue.push(task);
+};
+
+void MdApi::takeConflatedTask(Task &task)
+{
+\t//占位任务在推送时才从合并表中取出该合约的最新行情
+\tif (task.task_conflated)
+\t{
+\t\tthis->conflation_table.take(task);
+\t\ttask.task_conflated = false;
+\t}
+};
+
+void MdApi::registerTickHandler(string instrumentId, object handler)
+{
+\tthis->tick_handlers.set(instrumentId, handler);
+};
+
+void MdApi::unregisterTickHandler(string instrumentId)
+{
+\tthis->tick_handlers.remove(instrumentId);
+};
+
+bool MdApi::storeRtnDepthMarketData(CThostFtdcDepthMarketDataField *pDepthMarketData, int64_t recv_time, int64_t recv_wall_time)
+{
+\t//在回调线程中更新已开启的最新行情表和行情环形缓冲区，不获取GIL，使用回调中记录的接收时间
+\tSnapshotTable<CThostFtdcDepthMarketDataField> *latest = this->latest_ticks_ptr.load(memory_order_acquire);
+\tif (latest)
+\t{
+\t\tlatest->update(pDepthMarketData->InstrumentID, *pDepthMarketData, recv_time, recv_wall_time);
+\t}
+
+\tif (this->bar_enabled.load(memory_order_acquire))
+\t{
+\t\t//行情时间只计算一次，所有K线合成器共用
+\t\tint ms = parseTimeMs(pDepthMarketData->UpdateTime, pDepthMarketData->UpdateMillisec);
+\t\tint adjust_ms = 0;
+\t\tint session = ms < 0 ? -1 : this->sessions.find(pDepthMarketData->InstrumentID, ms, adjust_ms);
+\t\tint64_t tick_ms = exchangeEpochNs(parseDate(pDepthMarketData->ActionDay), parseDate(pDepthMarketData->TradingDay), ms, recv_wall_time) / 1000000 + adjust_ms;
+
+\t\tlock_guard<mutex> mlock(this->bar_mutex);
+\t\tBarData bar;
+\t\tfor (BarBuilder &builder : this->bar_builders)
+\t\t{
+\t\t\tif (builder.update(*pDepthMarketData, session, tick_ms, bar))
+\t\t\t{
+\t\t\t\tthis->task_queue.push(this->createBarTask(bar));
+\t\t\t}
+\t\t}
+\t}
+
+\tRecordBuffer<TickRecord> *buffer = this->tick_buffer_ptr.load(memory_order_acquire);
+\tSnapshotMatrix *matrix = this->snapshot_ptr.load(memory_order_acquire);
+\tif (!buffer && !matrix)
+\t{
+\t\treturn this->tick_callback;
+\t}
+
+\tint symbol_id = this->symbols.get_or_add(pDepthMarketData->InstrumentID);
+\tif (buffer)
+\t{
+\t\tTickRecord &record = buffer->next();
+\t\trecord.recv_ns = recv_wall_time;
+\t\trecord.symbol_id = symbol_id;
+\t\trecord.trading_day = parseDate(pDepthMarketData->TradingDay);
+\t\trecord.update_ms = parseTimeMs(pDepthMarketData->UpdateTime, pDepthMarketData->UpdateMillisec);
+\t\trecord.volume = pDepthMarketData->Volume;
+\t\trecord.bid_volume1 = pDepthMarketData->BidVolume1;
+\t\trecord.ask_volume1 = pDepthMarketData->AskVolume1;
+\t\trecord.last_price = validDouble(pDepthMarketData->LastPrice, this->invalid_as_nan);
+\t\trecord.turnover = validDouble(pDepthMarketData->Turnover, this->invalid_as_nan);
+\t\trecord.open_interest = validDouble(pDepthMarketData->OpenInterest, this->invalid_as_nan);
+\t\trecord.bid_price1 = validDouble(pDepthMarketData->BidPrice1, this->invalid_as_nan);
+\t\trecord.ask_price1 = validDouble(pDepthMarketData->AskPrice1, this->invalid_as_nan);
+\t\tbuffer->commit();
+\t}
+
+\t//超出矩阵行数的合约不写入快照
+\tif (matrix && (size_t)symbol_id < matrix->rows)
+\t{
+\t\tsize_t rows = matrix->rows;
+\t\tbool invalid_as_nan = this->invalid_as_nan;
+\t\tdouble *book = matrix->book.data() + symbol_id;
+#define SNAPSHOT_BOOK_LEVEL(level) \\
+\t\tbook[((level - 1) * SNAPSHOT_BOOK_WIDTH + 0) * rows] = validDouble(pDepthMarketData->BidPrice##level, invalid_as_nan); \\
+\t\tbook[((level - 1) * SNAPSHOT_BOOK_WIDTH + 1) * rows] = pDepthMarketData->BidVolume##level; \\
+\t\tbook[((level - 1) * SNAPSHOT_BOOK_WIDTH + 2) * rows] = validDouble(pDepthMarketData->AskPrice##level, invalid_as_nan); \\
+\t\tbook[((level - 1) * SNAPSHOT_BOOK_WIDTH + 3) * rows] = pDepthMarketData->AskVolume##level;
+\t\tSNAPSHOT_BOOK_LEVEL(1)
+\t\tSNAPSHOT_BOOK_LEVEL(2)
+\t\tSNAPSHOT_BOOK_LEVEL(3)
+\t\tSNAPSHOT_BOOK_LEVEL(4)
+\t\tSNAPSHOT_BOOK_LEVEL(5)
+#undef SNAPSHOT_BOOK_LEVEL
+
+\t\tdouble *columns = matrix->columns.data() + symbol_id;
+\t\tcolumns[SNAPSHOT_LAST_PRICE * rows] = validDouble(pDepthMarketData->LastPrice, invalid_as_nan);
+\t\tcolumns[SNAPSHOT_VOLUME * rows] = pDepthMarketData->Volume;
+\t\tcolumns[SNAPSHOT_TURNOVER * rows] = validDouble(pDepthMarketData->Turnover, invalid_as_nan);
+\t\tcolumns[SNAPSHOT_OPEN_INTEREST * rows] = validDouble(pDepthMarketData->OpenInterest, invalid_as_nan);
+\t\tcolumns[SNAPSHOT_UPPER_LIMIT_PRICE * rows] = validDouble(pDepthMarketData->UpperLimitPrice, invalid_as_nan);
+\t\tcolumns[SNAPSHOT_LOWER_LIMIT_PRICE * rows] = validDouble(pDepthMarketData->LowerLimitPrice, invalid_as_nan);
+\t\tmatrix->recv_ns[symbol_id] = recv_wall_time;
+\t}
+
+\treturn this->tick_callback;
+};
+
+void MdApi::setTickCallback(bool enabled)
+{
+\tthis->tick_callback = enabled;
+};
+
+void MdApi::enableLatestTicks()
+{
+\t//最新行情表只创建一次，开启后才在回调线程中记录每个合约的最新行情
+\tif (!this->latest_ticks)
+\t{
+\t\tthis->latest_ticks = make_shared<SnapshotTable<CThostFtdcDepthMarketDataField>>();
+\t\tthis->latest_ticks_ptr.store(this->latest_ticks.get(), memory_order_release);
+\t}
+};
+
+object MdApi::getLatestTick(string instrumentId)
+{
+\t//按当前推送模式转换，未开启最新行情表或未收到过该合约的行情时返回None，副本在栈上，不使用对象池
+\tCThostFtdcDepthMarketDataField tick;
+\tTask task = Task();
+\ttask.task_name = ONRTNDEPTHMARKETDATA;
+\tif (!this->latest_ticks || !this->latest_ticks->get(instrumentId, tick, task.task_time, task.task_wall_time))
+\t{
+\t\treturn none();
+\t}
+\ttask.task_data = &tick;
+\treturn this->convertRtnDepthMarketData(&task);
+};
+
+list MdApi::getLatestTicks(const list &instrumentIds)
+{
+\tlist data;
+\tfor (const handle &item : instrumentIds)
+\t{
+\t\tdata.append(this->getLatestTick(item.cast<string>()));
+\t}
+\treturn data;
+};
+
+object MdApi::enableTickBuffer(int capacity)
+{
+\t//缓冲区只创建一次，再次调用时返回同一块内存的数组，容量与已创建的缓冲区不同时抛出ValueError
+\tif (capacity <= 0)
+\t{
+\t\tthrow value_error("capacity must be positive");
+\t}
+\tif (!this->tick_buffer)
+\t{
+\t\tthis->tick_buffer = make_shared<RecordBuffer<TickRecord>>(capacity);
+\t\tthis->tick_buffer_ptr.store(this->tick_buffer.get(), memory_order_release);
+\t}
+\telse if (this->tick_buffer->capacity() != (size_t)capacity)
+\t{
+\t\tthrow value_error("tick buffer already enabled with capacity " + to_string(this->tick_buffer->capacity()));
+\t}
+
+\tlist names;
+\tlist formats;
+\tlist offsets;
+#define TICK_RECORD_FIELD(field, format) names.append(#field); formats.append(format); offsets.append(offsetof(TickRecord, field));
+\tTICK_RECORD_FIELD(recv_ns, "i8")
+\tTICK_RECORD_FIELD(symbol_id, "i4")
+\tTICK_RECORD_FIELD(trading_day, "i4")
+\tTICK_RECORD_FIELD(update_ms, "i4")
+\tTICK_RECORD_FIELD(volume, "i4")
+\tTICK_RECORD_FIELD(bid_volume1, "i4")
+\tTICK_RECORD_FIELD(ask_volume1, "i4")
+\tTICK_RECORD_FIELD(last_price, "f8")
+\tTICK_RECORD_FIELD(turnover, "f8")
+\tTICK_RECORD_FIELD(open_interest, "f8")
+\tTICK_RECORD_FIELD(bid_price1, "f8")
+\tTICK_RECORD_FIELD(ask_price1, "f8")
+#undef TICK_RECORD_FIELD
+
+\tpybind11::dtype dt(names, formats, offsets, sizeof(TickRecord));
+\treturn makeRecordArray(this->tick_buffer, dt);
+};
+
+uint64_t MdApi::getTickCursor()
+{
+\tRecordBuffer<TickRecord> *buffer = this->tick_buffer_ptr.load(memory_order_acquire);
+\tif (!buffer)
+\t{
+\t\treturn 0;
+\t}
+\treturn buffer->cursor();
+};
+
+list MdApi::getTickSymbols()
+{
+\tlist data;
+\tfor (const string &name : this->symbols.names())
+\t{
+\t\tdata.append(str(name));
+\t}
+\treturn data;
+};
+
+dict MdApi::enableSnapshotMatrix(int maxInstruments)
+{
+\t//矩阵只创建一次，再次调用时返回同一块内存的数组，合约数与已创建的矩阵不同时抛出ValueError，行号与getTickSymbols返回列表中的序号一致
+\tif (maxInstruments <= 0)
+\t{
+\t\tthrow value_error("maxInstruments must be positive");
+\t}
+\tif (!this->snapshot)
+\t{
+\t\tthis->snapshot = make_shared<SnapshotMatrix>(maxInstruments);
+\t\tthis->snapshot_ptr.store(this->snapshot.get(), memory_order_release);
+\t}
+\telse if (this->snapshot->rows != (size_t)maxInstruments)
+\t{
+\t\tthrow value_error("snapshot matrix already enabled with maxInstruments " + to_string(this->snapshot->rows));
+\t}
+
+\tSnapshotMatrix *matrix = this->snapshot.get();
+\tssize_t rows = (ssize_t)matrix->rows;
+\tssize_t item = sizeof(double);
+\tpybind11::dtype f8 = pybind11::dtype::of<double>();
 
-"""
-        # td cpp 头文件内容
-        self.td_header_content = """
-///-------------------------------------------------------------------------------------
-///C++ SPI的回调函数的继承实现
-///-------------------------------------------------------------------------------------
+\tdict data;
+\tdata["book"] = makeArrayView(this->snapshot, f8, matrix->book.data(),
+\t\t{rows, SNAPSHOT_LEVELS, SNAPSHOT_BOOK_WIDTH},
+\t\t{item, SNAPSHOT_BOOK_WIDTH * rows * item, rows * item});
+#define SNAPSHOT_COLUMN_VIEW(key, column) \\
+\tdata[key] = makeArrayView(this->snapshot, f8, matrix->columns.data() + column * rows, {rows}, {item});
+\tSNAPSHOT_COLUMN_VIEW("last_price", SNAPSHOT_LAST_PRICE)
+\tSNAPSHOT_COLUMN_VIEW("volume", SNAPSHOT_VOLUME)
+\tSNAPSHOT_COLUMN_VIEW("turnover", SNAPSHOT_TURNOVER)
+\tSNAPSHOT_COLUMN_VIEW("open_interest", SNAPSHOT_OPEN_INTEREST)
+\tSNAPSHOT_COLUMN_VIEW("upper_limit_price", SNAPSHOT_UPPER_LIMIT_PRICE)
+\tSNAPSHOT_COLUMN_VIEW("lower_limit_price", SNAPSHOT_LOWER_LIMIT_PRICE)
+#undef SNAPSHOT_COLUMN_VIEW
+\tdata["recv_ns"] = makeArrayView(this->snapshot, pybind11::dtype::of<int64_t>(), matrix->recv_ns.data(),
+\t\t{rows}, {(ssize_t)sizeof(int64_t)});
+\treturn data;
+};
 
-//API的继承实现
-class TdApi : public CThostFtdcTraderSpi
+void MdApi::addBarBuilder(int barType, int barSize)
 {
-private:
-\tCThostFtdcTraderApi* api;\t\t\t\t//API对象
-\tthread task_thread;\t\t\t\t\t//工作线程指针（向python推送数据）
-\tTaskQueue task_queue;\t\t\t\t//任务队列
-\tbool active = false;\t\t\t\t//活动状态
-
-public:
-\tTdApi()
+\tif (barType != BAR_TYPE_TIME && barType != BAR_TYPE_VOLUME)
 \t{
-\t};
+\t\tthrow value_error("invalid barType");
+\t}
+\tif (barSize <= 0)
+\t{
+\t\tthrow value_error("barSize must be positive");
+\t}
 
-\tvirtual ~TdApi()
+\t//相同规格只保留一个合成器
+\tlock_guard<mutex> mlock(this->bar_mutex);
+\tfor (BarBuilder &builder : this->bar_builders)
 \t{
-\t\tif (this->active)
+\t\tif (builder.bar_type == barType && builder.bar_size == barSize)
 \t\t{
-\t\t\tthis->exit();
+\t\t\treturn;
 \t\t}
-\t};
-
-\t//-------------------------------------------------------------------------------------
-\t//从CThostFtdcTraderSpi继承的C++回调函数
-\t//-------------------------------------------------------------------------------------
+\t}
+\tthis->bar_builders.emplace_back(barType, barSize);
+\tthis->bar_enabled.store(true, memory_order_release);
+};
 
-"""
-        # md cpp 文件内容
-        self.md_cpp_content = """
-///-------------------------------------------------------------------------------------
-///工作线程从队列中取出数据，转化为python对象后，进行推送
-///-------------------------------------------------------------------------------------
+void MdApi::clearBarBuilders()
+{
+\tlock_guard<mutex> mlock(this->bar_mutex);
+\tthis->bar_builders.clear();
+\tthis->bar_enabled.store(false, memory_order_release);
+};
 
-void MdApi::processTask()
+void MdApi::setTradingSessions(string product, const list &sessions)
 {
-\ttry
+\t//时段为(开始时间, 结束时间)，格式为HH:MM或HH:MM:SS，product为空字符串时设置默认时段
+\tvector<pair<int, int>> ranges;
+\tfor (const handle &item : sessions)
 \t{
-\t\twhile (this->active)
+\t\tsequence session = item.cast<sequence>();
+\t\tif (session.size() != 2)
 \t\t{
-\t\t\tTask task = this->task_queue.pop();
+\t\t\tthrow value_error("session must be a (start, end) pair");
+\t\t}
 
-\t\t\tswitch (task.task_name)
-\t\t\t{
-"""
-        # td cpp 文件内容
-        self.td_cpp_content = """
-///-------------------------------------------------------------------------------------
-///工作线程从队列中取出数据，转化为python对象后，进行推送
-///-------------------------------------------------------------------------------------
+\t\tint start = parseClockMs(session[0].cast<string>());
+\t\tint end = parseClockMs(session[1].cast<string>());
+\t\tif (start < 0 || end < 0 || start == end)
+\t\t{
+\t\t\tthrow value_error("invalid session time");
+\t\t}
+\t\tranges.emplace_back(start, end);
+\t}
+\tthis->sessions.set(product, ranges);
+};
 
-void TdApi::processTask()
+void MdApi::flushBars()
 {
-\ttry
+\t//将未完成的K线作为已完成推送，通常在收盘后调用
+\t//回调线程可能在持有K线锁时等待工作线程取出任务，必须先释放GIL再获取锁
+\tgil_scoped_release release;
+\tvector<BarData> bars;
 \t{
-\t\twhile (this->active)
+\t\tlock_guard<mutex> mlock(this->bar_mutex);
+\t\tfor (BarBuilder &builder : this->bar_builders)
 \t\t{
-\t\t\tTask task = this->task_queue.pop();
+\t\t\tbuilder.flush(bars);
+\t\t}
+\t}
 
-\t\t\tswitch (task.task_name)
-\t\t\t{
-"""
-        self.md_pybind_header = """
-///-------------------------------------------------------------------------------------
-///pybind11封装
-///-------------------------------------------------------------------------------------
+\t//环形队列只允许回调线程写入，这里经加锁的转交队列推送
+\tfor (const BarData &bar : bars)
+\t{
+\t\tthis->task_queue.post(this->createBarTask(bar));
+\t}
+};
 
-class PyMdApi: public MdApi
+Task MdApi::createBarTask(const BarData &bar)
 {
-public:
-\tusing MdApi::MdApi;
+\tTask task = Task();
+\ttask.task_name = ONBAR;
+\ttask.task_time = steadyNs();
+\ttask.task_wall_time = wallNs();
+\tBarData *task_data = TaskPool<BarData>::allocate();
+\t*task_data = bar;
+\ttask.task_data = task_data;
+\treturn task;
+};
 
-"""
-        self.md_pybind_content = """};
+void MdApi::processBar(Task *task)
+{
+\tgil_scoped_acquire acquire;
+\tdict data;
+\tif (task->task_data)
+\t{
+\t\tBarData *task_data = (BarData*)task->task_data;
+\t\tdata["InstrumentID"] = this->string_cache.get(task_data->instrument_id);
+\t\tdata["TradingDay"] = this->string_cache.get(task_data->trading_day);
+\t\tdata["BarType"] = task_data->bar_type;
+\t\tdata["BarSize"] = task_data->bar_size;
+\t\tdata["StartNs"] = task_data->start_ns;
+\t\tdata["EndNs"] = task_data->end_ns;
+\t\tdata["OpenPrice"] = task_data->open_price;
+\t\tdata["HighPrice"] = task_data->high_price;
+\t\tdata["LowPrice"] = task_data->low_price;
+\t\tdata["ClosePrice"] = task_data->close_price;
+\t\tdata["Volume"] = task_data->volume;
+\t\tdata["Turnover"] = task_data->turnover;
+\t\tdata["OpenInterest"] = task_data->open_interest;
+\t\tdata["TickCount"] = task_data->tick_count;
+\t\tTaskPool<BarData>::release(task_data);
+\t}
+\tdata["_recv_ns"] = task->task_wall_time;
+\tdata["_recv_mono_ns"] = task->task_time;
+\tdata["_dispatch_mono_ns"] = steadyNs();
+\tthis->onBar(data);
+};
+
+void MdApi::routeTick(Task &task)
+{
+\tCThostFtdcDepthMarketDataField *task_data = (CThostFtdcDepthMarketDataField*)task.task_data;
+\tif (!task_data)
+\t{
+\t\treturn;
+\t}
 
+\t//未注册回调函数的合约直接丢弃，不获取GIL，也不创建python对象
+\tif (!this->tick_handlers.contains(task_data->InstrumentID))
+\t{
+\t\tthis->task_queue.record_drop(ONRTNDEPTHMARKETDATA);
+\t\tTaskPool<CThostFtdcDepthMarketDataField>::release(task_data);
+\t\treturn;
+\t}
 
-PYBIND11_MODULE(ctpmd, m)
+\tgil_scoped_acquire acquire;
+\tobject handler = this->tick_handlers.get(task_data->InstrumentID);
+\tobject data = this->convertRtnDepthMarketData(&task);
+\tTaskPool<CThostFtdcDepthMarketDataField>::release(task_data);
+\tif (handler.is_none())
+\t{
+\t\treturn;
+\t}
+
+\ttry
+\t{
+\t\thandler(data);
+\t}
+\tcatch (const error_already_set &e)
+\t{
+\t\tcout << e.what() << endl;
+\t}
+};
+
+"""
+        self.md_extend_on = """void onRtnDepthMarketDataBatch(const list &data) override
 {
-\tclass_<MdApi, PyMdApi> mdapi(m, "MdApi", module_local());
-\tmdapi
-\t\t.def(init<>())
+\ttry
+\t{
+\t\tPYBIND11_OVERLOAD(void, MdApi, onRtnDepthMarketDataBatch, data);
+\t}
+\tcatch (const error_already_set &e)
+\t{
+\t\tcout << e.what() << endl;
+\t}
+};
+"""
+        self.md_extend_on += """
+void onBar(const dict &data) override
+{
+\ttry
+\t{
+\t\tPYBIND11_OVERLOAD(void, MdApi, onBar, data);
+\t}
+\tcatch (const error_already_set &e)
+\t{
+\t\tcout << e.what() << endl;
+\t}
+};
+"""
+        self.md_extend_module = """.def("setDataMode", &MdApi::setDataMode)
+.def("setTickBatchSize", &MdApi::setTickBatchSize)
+.def("setConflation", &MdApi::setConflation)
+.def("registerTickHandler", &MdApi::registerTickHandler)
+.def("unregisterTickHandler", &MdApi::unregisterTickHandler)
+.def("enableTickBuffer", &MdApi::enableTickBuffer)
+.def("getTickCursor", &MdApi::getTickCursor)
+.def("getTickSymbols", &MdApi::getTickSymbols)
+.def("enableSnapshotMatrix", &MdApi::enableSnapshotMatrix)
+.def("addBarBuilder", &MdApi::addBarBuilder)
+.def("clearBarBuilders", &MdApi::clearBarBuilders)
+.def("setTradingSessions", &MdApi::setTradingSessions)
+.def("flushBars", &MdApi::flushBars)
+.def("onBar", &MdApi::onBar)
+.def("setTickCallback", &MdApi::setTickCallback)
+.def("enableLatestTicks", &MdApi::enableLatestTicks)
+.def("getLatestTick", &MdApi::getLatestTick)
+.def("getLatestTicks", &MdApi::getLatestTicks)
+.def("onRtnDepthMarketDataBatch", &MdApi::onRtnDepthMarketDataBatch)
+"""
+        self.md_extend_attr = """m.attr("DATA_MODE_DICT") = DATA_MODE_DICT;
+m.attr("DATA_MODE_OBJECT") = DATA_MODE_OBJECT;
+m.attr("DATA_MODE_BYTES") = DATA_MODE_BYTES;
+m.attr("BAR_TYPE_TIME") = BAR_TYPE_TIME;
+m.attr("BAR_TYPE_VOLUME") = BAR_TYPE_VOLUME;
 """
 
         self.td_pybind_header = """
@@ -196,6 +1422,277 @@ PYBIND11_MODULE(ctptd, m)
 \t\t.def(init<>())
 """
 
+        # td 扩展函数（非CTP原生接口）声明、实现和绑定
+        self.td_extend_header = """\tint reqOrderInsertFast(const OrderTemplate &order, const string &instrumentId, char direction, char offset, double price, int volume, const string &orderRef, int reqid);
+
+\tlist reqOrderInsertBatch(const list &orders, int start_reqid);
+
+\tbool storeRspUserLogin(CThostFtdcRspUserLoginField *pRspUserLogin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast, int64_t recv_time, int64_t recv_wall_time);
+
+\tbool storeRspOrderInsert(CThostFtdcInputOrderField *pInputOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast, int64_t recv_time, int64_t recv_wall_time);
+
+\tbool storeErrRtnOrderInsert(CThostFtdcInputOrderField *pInputOrder, CThostFtdcRspInfoField *pRspInfo, int64_t recv_time, int64_t recv_wall_time);
+
+\tbool storeRtnOrder(CThostFtdcOrderField *pOrder, int64_t recv_time, int64_t recv_wall_time);
+
+\tbool storeRtnTrade(CThostFtdcTradeField *pTrade, int64_t recv_time, int64_t recv_wall_time);
+
+\tdict convertOrderEntry(const OrderEntry &item);
+
+\tobject getOrder(int frontId, int sessionId, string orderRef);
+
+\tobject getOrderBySysId(string exchangeId, string orderSysId);
+
+\tlist getOrders(string instrumentId, bool activeOnly);
+
+\tdict getTradeSummary(string instrumentId);
+
+\tvoid clearOrders();
+
+\tlist cancelAll(const dict &filter, int start_reqid);
+"""
+        self.td_extend_source = """int TdApi::reqOrderInsertFast(const OrderTemplate &order, const string &instrumentId, char direction, char offset, double price, int volume, const string &orderRef, int reqid)
+{
+\t//以模板为基础只覆盖变化的字段，不再逐个读取字典，调用时已释放GIL
+\tCThostFtdcInputOrderField myreq = order.data;
+\tcopyString(myreq.InstrumentID, instrumentId);
+\tmyreq.Direction = direction;
+\tmyreq.CombOffsetFlag[0] = offset;
+\tmyreq.CombOffsetFlag[1] = '\\0';
+\tmyreq.LimitPrice = price;
+\tmyreq.VolumeTotalOriginal = volume;
+\tcopyString(myreq.OrderRef, orderRef);
+\tint i = this->api->ReqOrderInsert(&myreq, reqid);
+\treturn i;
+};
+
+list TdApi::reqOrderInsertBatch(const list &orders, int start_reqid)
+{
+\t//持有GIL时先转换全部委托，支持字典和OrderTemplate，转换失败则整批都不发送
+\tvector<CThostFtdcInputOrderField> reqs;
+\treqs.reserve(orders.size());
+\tfor (const auto &item : orders)
+\t{
+\t\tif (isinstance<OrderTemplate>(item))
+\t\t{
+\t\t\treqs.push_back(item.cast<const OrderTemplate &>().data);
+\t\t}
+\t\telse
+\t\t{
+\t\t\treqs.push_back(OrderTemplate(item.cast<dict>()).data);
+\t\t}
+\t}
+
+\t//释放GIL后连续发送，请求编号从start_reqid开始依次递增，返回每笔委托的返回值
+\tvector<int> codes(reqs.size());
+\t{
+\t\tgil_scoped_release release;
+\t\tfor (size_t n = 0; n < reqs.size(); n++)
+\t\t{
+\t\t\tcodes[n] = this->api->ReqOrderInsert(&reqs[n], start_reqid + (int)n);
+\t\t}
+\t}
+
+\tlist result;
+\tfor (int code : codes)
+\t{
+\t\tresult.append(code);
+\t}
+\treturn result;
+};
+
+bool TdApi::storeRspUserLogin(CThostFtdcRspUserLoginField *pRspUserLogin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast, int64_t recv_time, int64_t recv_wall_time)
+{
+\t//记录本会话的前置编号和会话编号，被拒绝的报单录入以此登记到委托表
+\tif (!pRspInfo || pRspInfo->ErrorID == 0)
+\t{
+\t\tthis->front_id = pRspUserLogin->FrontID;
+\t\tthis->session_id = pRspUserLogin->SessionID;
+\t}
+\treturn true;
+};
+
+bool TdApi::storeRspOrderInsert(CThostFtdcInputOrderField *pInputOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast, int64_t recv_time, int64_t recv_wall_time)
+{
+\t//请求响应只发给发出请求的会话，可以按本会话记录
+\tif (pRspInfo && pRspInfo->ErrorID != 0)
+\t{
+\t\tthis->order_book.updateInputError(*pInputOrder, this->front_id, this->session_id, *pRspInfo, recv_time, recv_wall_time, true);
+\t}
+\treturn true;
+};
+
+bool TdApi::storeErrRtnOrderInsert(CThostFtdcInputOrderField *pInputOrder, CThostFtdcRspInfoField *pRspInfo, int64_t recv_time, int64_t recv_wall_time)
+{
+\t//私有流重传时可能收到之前会话的错误回报，无法确定所属会话，只更新本会话已记录的委托
+\tif (pRspInfo && pRspInfo->ErrorID != 0)
+\t{
+\t\tthis->order_book.updateInputError(*pInputOrder, this->front_id, this->session_id, *pRspInfo, recv_time, recv_wall_time, false);
+\t}
+\treturn true;
+};
+
+bool TdApi::storeRtnOrder(CThostFtdcOrderField *pOrder, int64_t recv_time, int64_t recv_wall_time)
+{
+\tthis->order_book.updateOrder(*pOrder, recv_time, recv_wall_time);
+\treturn true;
+};
+
+bool TdApi::storeRtnTrade(CThostFtdcTradeField *pTrade, int64_t recv_time, int64_t recv_wall_time)
+{
+\tthis->order_book.updateTrade(*pTrade);
+\treturn true;
+};
+
+dict TdApi::convertOrderEntry(const OrderEntry &item)
+{
+\t//按委托推送的格式转换，附加成交回报累计的数量、金额和报单录入的错误代码
+\tTask task = Task();
+\ttask.task_name = ONRTNORDER;
+\ttask.task_time = item.time;
+\ttask.task_wall_time = item.wall_time;
+\tCThostFtdcOrderField order = item.order;
+\ttask.task_data = &order;
+
+\tdict data = this->convertRtnOrder(&task);
+\tdata["_traded_volume"] = item.traded_volume;
+\tdata["_traded_turnover"] = item.traded_turnover;
+\tdata["_error_id"] = item.error_id;
+\treturn data;
+};
+
+object TdApi::getOrder(int frontId, int sessionId, string orderRef)
+{
+\tOrderEntry item;
+\tif (!this->order_book.findSession(frontId, sessionId, orderRef, item))
+\t{
+\t\treturn none();
+\t}
+\treturn this->convertOrderEntry(item);
+};
+
+object TdApi::getOrderBySysId(string exchangeId, string orderSysId)
+{
+\tOrderEntry item;
+\tif (!this->order_book.findExchange(exchangeId, orderSysId, item))
+\t{
+\t\treturn none();
+\t}
+\treturn this->convertOrderEntry(item);
+};
+
+list TdApi::getOrders(string instrumentId, bool activeOnly)
+{
+\tvector<OrderEntry> items;
+\tthis->order_book.select(instrumentId, activeOnly, items);
+
+\tlist data;
+\tfor (const OrderEntry &item : items)
+\t{
+\t\tdata.append(this->convertOrderEntry(item));
+\t}
+\treturn data;
+};
+
+dict TdApi::getTradeSummary(string instrumentId)
+{
+\tTradeSummary summary = this->order_book.summary(instrumentId);
+
+\tdict data;
+\tdata["BuyVolume"] = summary.buy_volume;
+\tdata["BuyTurnover"] = summary.buy_turnover;
+\tdata["SellVolume"] = summary.sell_volume;
+\tdata["SellTurnover"] = summary.sell_turnover;
+\tdata["TradeCount"] = summary.trade_count;
+\treturn data;
+};
+
+void TdApi::clearOrders()
+{
+\tthis->order_book.clear();
+};
+
+list TdApi::cancelAll(const dict &filter, int start_reqid)
+{
+\t//持有GIL时读取筛选条件，键为委托字段名，未给出的字段不参与筛选
+\tstring instrument_id;
+\tstring exchange_id;
+\tstring business_unit;
+\tchar direction = 0;
+\tfor (const auto &item : filter)
+\t{
+\t\tstring key = item.first.cast<string>();
+\t\tstring value = item.second.cast<string>();
+\t\tif (key == "InstrumentID")
+\t\t\tinstrument_id = value;
+\t\telse if (key == "ExchangeID")
+\t\t\texchange_id = value;
+\t\telse if (key == "BusinessUnit")
+\t\t\tbusiness_unit = value;
+\t\telse if (key == "Direction")
+\t\t\tdirection = value.empty() ? 0 : value[0];
+\t\telse
+\t\t\tthrow value_error("unsupported filter: " + key);
+\t}
+
+\t//释放GIL后从委托表取出可撤的委托，直接填写撤单请求连续发送，请求编号从start_reqid开始依次递增
+\tvector<OrderEntry> items;
+\tvector<pair<const CThostFtdcOrderField*, int>> results;
+\t{
+\t\tgil_scoped_release release;
+\t\tthis->order_book.select(instrument_id, true, items);
+
+\t\tint reqid = start_reqid;
+\t\tfor (const OrderEntry &item : items)
+\t\t{
+\t\t\tconst CThostFtdcOrderField &order = item.order;
+\t\t\tif (!exchange_id.empty() && exchange_id != string_view(order.ExchangeID, strnlen(order.ExchangeID, sizeof(order.ExchangeID))))
+\t\t\t\tcontinue;
+\t\t\tif (!business_unit.empty() && business_unit != string_view(order.BusinessUnit, strnlen(order.BusinessUnit, sizeof(order.BusinessUnit))))
+\t\t\t\tcontinue;
+\t\t\tif (direction && direction != order.Direction)
+\t\t\t\tcontinue;
+
+\t\t\tCThostFtdcInputOrderActionField myreq = CThostFtdcInputOrderActionField();
+\t\t\tmemset(&myreq, 0, sizeof(myreq));
+\t\t\tmemcpy(myreq.BrokerID, order.BrokerID, sizeof(myreq.BrokerID));
+\t\t\tmemcpy(myreq.InvestorID, order.InvestorID, sizeof(myreq.InvestorID));
+\t\t\tmemcpy(myreq.UserID, order.UserID, sizeof(myreq.UserID));
+\t\t\tmemcpy(myreq.InvestUnitID, order.InvestUnitID, sizeof(myreq.InvestUnitID));
+\t\t\tmemcpy(myreq.InstrumentID, order.InstrumentID, sizeof(myreq.InstrumentID));
+\t\t\tmemcpy(myreq.ExchangeID, order.ExchangeID, sizeof(myreq.ExchangeID));
+\t\t\tmemcpy(myreq.OrderSysID, order.OrderSysID, sizeof(myreq.OrderSysID));
+\t\t\tmemcpy(myreq.OrderRef, order.OrderRef, sizeof(myreq.OrderRef));
+\t\t\tmyreq.FrontID = order.FrontID;
+\t\t\tmyreq.SessionID = order.SessionID;
+\t\t\tmyreq.ActionFlag = THOST_FTDC_AF_Delete;
+\t\t\tresults.emplace_back(&order, this->api->ReqOrderAction(&myreq, reqid++));
+\t\t}
+\t}
+
+\t//按发送顺序返回(FrontID, SessionID, OrderRef, 返回值)，返回值不为0的撤单可重新发送
+\tlist data;
+\tfor (const auto &result : results)
+\t{
+\t\tconst CThostFtdcOrderField &order = *result.first;
+\t\tdata.append(pybind11::make_tuple(order.FrontID, order.SessionID, toUtf(order.OrderRef), result.second));
+\t}
+\treturn data;
+};
+
+"""
+        self.td_extend_module = """.def("reqOrderInsertFast", &TdApi::reqOrderInsertFast, call_guard<gil_scoped_release>())
+.def("reqOrderInsertBatch", &TdApi::reqOrderInsertBatch)
+.def("getOrder", &TdApi::getOrder)
+.def("getOrderBySysId", &TdApi::getOrderBySysId)
+.def("getOrders", &TdApi::getOrders)
+.def("getTradeSummary", &TdApi::getTradeSummary)
+.def("clearOrders", &TdApi::clearOrders)
+.def("cancelAll", &TdApi::cancelAll)
+"""
+        self.td_extend_on = ""
+        self.td_extend_attr = ""
+
     @staticmethod
     def read_file_content(filename: str) -> str:
         """读取文件内容"""
@@ -302,9 +1799,13 @@ PYBIND11_MODULE(ctptd, m)
             print(f"解析头文件 {header_file_path} 时出错: {e}")
             return ""
 
+    def format_common(self, content: str) -> str:
+        """将md和td共用模板中的{class_name}替换为当前类名"""
+        return content.replace("{class_name}", self.class_name)
+
     @staticmethod
-    def format_switch_case(case_content: str) -> str:
-        """格式化switch case语句，确保对齐正确"""
+    def format_switch_case(case_content: str, indent: str = '\t\t\t') -> str:
+        """格式化switch case语句，确保对齐正确，indent为case语句的缩进"""
         lines = case_content.split('\n')
         formatted_lines = []
         
@@ -312,26 +1813,26 @@ PYBIND11_MODULE(ctptd, m)
             line = line.rstrip()
             if line.startswith('case '):
                 # case语句前加制表符缩进
-                formatted_lines.append('\t\t\t' + line)
+                formatted_lines.append(indent + line)
             elif line.startswith('{'):
                 # 左大括号缩进
-                formatted_lines.append('\t\t\t' + line)
+                formatted_lines.append(indent + line)
             elif line.startswith('}'):
                 # 右大括号缩进
-                formatted_lines.append('\t\t\t' + line)
+                formatted_lines.append(indent + line)
             elif line.strip() == 'break;':
                 # break语句缩进
-                formatted_lines.append('\t\t\t\t' + 'break;')
+                formatted_lines.append(indent + '\tbreak;')
             elif line.strip().startswith('this->'):
                 # 函数调用缩进
-                formatted_lines.append('\t\t\t\t' + line.strip())
+                formatted_lines.append(indent + '\t' + line.strip())
             elif line.strip() == '':
                 # 保持空行
                 formatted_lines.append('')
             else:
                 # 其他内容适当缩进
                 if line.strip():
-                    formatted_lines.append('\t\t\t\t' + line.strip())
+                    formatted_lines.append(indent + '\t' + line.strip())
                 else:
                     formatted_lines.append('')
                 
@@ -357,6 +1858,11 @@ using namespace pybind11;
         defines = self.read_file_content(self.header_files['define'])
         header_content += defines + "\n\n"
 
+        # 添加结构体对象类定义
+        structs = self.read_file_content(self.header_files['struct'])
+        if structs:
+            header_content += structs + "\n\n"
+
         if self.name == "md":
             header_content += self.md_header_content
         else:
@@ -430,7 +1936,20 @@ using namespace pybind11;
             else:
                 formatted_func.append('')
         header_content += '\n'.join(formatted_func) + "\n"
-        
+
+        # 添加扩展函数声明
+        header_content += """
+\t//-------------------------------------------------------------------------------------
+\t//扩展函数
+\t//-------------------------------------------------------------------------------------
+
+"""
+        header_content += self.format_common(self.common_extend_header)
+        if self.name == "md":
+            header_content += "\n" + self.md_extend_header
+        elif self.td_extend_header:
+            header_content += "\n" + self.td_extend_header
+
         header_content += "};\n"
         
         return header_content
@@ -460,18 +1979,14 @@ using namespace pybind11;
         
         # 添加switch语句内容并格式化
         switch_content = self.read_file_content(self.source_files['switch'])
-        formatted_switch = self.format_switch_case(switch_content)
-        cpp_content += formatted_switch + "\n"
-        
-        cpp_content += """\t\t\t};
-\t\t}
-\t}
-\tcatch (const TerminatedError&)
-\t{
-\t}
-};
-
-"""
+        if self.name == "md":
+            formatted_switch = self.format_switch_case(switch_content, '\t')
+            cpp_content += formatted_switch + "\n"
+            cpp_content += self.md_cpp_content_end
+        else:
+            formatted_switch = self.format_switch_case(switch_content)
+            cpp_content += formatted_switch + "\n"
+            cpp_content += self.td_cpp_content_end
         
         # 添加处理函数实现
         process_content = self.read_file_content(self.source_files['process'])
@@ -488,6 +2003,18 @@ using namespace pybind11;
         # # 修复函数实现中的void::CreateFtdcMdApi错误
         # function_content = function_content.replace("void::CreateFtdcMdApi", "CThostFtdcMdApi::CreateFtdcMdApi")
         cpp_content += function_content + "\n\n"
+
+        # 添加扩展函数实现
+        cpp_content += """///-------------------------------------------------------------------------------------
+///扩展函数
+///-------------------------------------------------------------------------------------
+
+"""
+        cpp_content += self.format_common(self.common_extend_source)
+        if self.name == "md":
+            cpp_content += self.md_extend_source
+        else:
+            cpp_content += self.td_extend_source
         
         # 添加pybind11封装部分
         if self.name == "md":
@@ -497,6 +2024,9 @@ using namespace pybind11;
 
         # 添加on函数重载实现
         on_content = self.read_file_content(self.source_files['on'])
+        extend_on = self.md_extend_on if self.name == "md" else self.td_extend_on
+        if extend_on:
+            on_content += "\n\n" + extend_on.strip()
 
         # 为on函数添加正确的缩进
         on_lines = on_content.split('\n')
@@ -513,8 +2043,12 @@ using namespace pybind11;
         else:
             cpp_content += self.td_pybind_content
 
-        # 添加模块绑定
+        # 添加模块绑定，扩展函数绑定放在回调函数绑定之前
         module_content = self.read_file_content(self.source_files['module'])
+        extend_module = self.format_common(self.common_extend_module)
+        extend_module += self.md_extend_module if self.name == "md" else self.td_extend_module
+        function_part, callback_part = module_content.split("\n\n", 1)
+        module_content = f"{function_part}\n{extend_module}\n{callback_part}"
         # 为模块绑定添加适当的缩进
         module_lines = module_content.split('\n')
         formatted_module = []
@@ -530,7 +2064,25 @@ using namespace pybind11;
                 formatted_module.append('')
         
         cpp_content += '\n'.join(formatted_module) + "\n"
-        
+
+        # 添加结构体对象绑定
+        struct_content = self.read_file_content(self.source_files['struct'])
+        if struct_content:
+            formatted_struct = []
+            for line in struct_content.split('\n'):
+                if line.startswith('.def') or line.strip() == ';':
+                    formatted_struct.append('\t\t' + line.strip())
+                elif line.strip():
+                    formatted_struct.append('\t' + line.strip())
+                else:
+                    formatted_struct.append('')
+            cpp_content += '\n' + '\n'.join(formatted_struct) + "\n"
+
+        # 添加模块常量
+        extend_attr = self.md_extend_attr if self.name == "md" else self.td_extend_attr
+        if extend_attr:
+            cpp_content += '\n' + ''.join(f'\t{line}\n' for line in extend_attr.split('\n') if line.strip())
+
         cpp_content += "}\n"
         
         return cpp_content
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+@ProjectName: homalos-ctp
+@FileName   : generate_dtype.py
+@Date       : 2025/10/18 15:40
+@Author     : Donny
+@Email      : donnymoving@gmail.com
+@Software   : PyCharm
+@Description: 生成结构体numpy dtype文件
+功能：
+1. 读取CTP的头文件 `ThostFtdcUserApiDataType.h`，获取每个类型的C++基础类型和数组长度
+2. 读取CTP的头文件 `ThostFtdcUserApiStruct.h`，解析结构体成员
+3. 生成与C++结构体内存布局一致的numpy dtype定义文件 `ctp_dtype.py`，配合DATA_MODE_BYTES推送的bytes数据使用
+"""
+from pathlib import Path
+
+# C++基础类型对应的numpy类型
+TYPE_CPP2NUMPY: dict[str, str] = {
+    "char": "S1",
+    "int": "i4",
+    "short": "i2",
+    "double": "f8",
+}
+
+
+class DtypeGenerator:
+    """结构体dtype生成器"""
+
+    def __init__(self, data_type_filename: str, struct_filename: str, prefix: str) -> None:
+        self.data_type_filename: str = data_type_filename  # "../include/ThostFtdcUserApiDataType.h"
+        self.struct_filename: str = struct_filename  # "../include/ThostFtdcUserApiStruct.h"
+        self.prefix: str = prefix  # "ctp"或"tts"
+        self.typedefs: dict[str, str] = {}  # {类型名: numpy类型}
+        self.f_dtype = None
+
+    def load_typedef(self) -> None:
+        """解析类型定义，字符数组转换为定长字节串"""
+        with open(self.data_type_filename, encoding="gbk") as f:
+            for line in f:
+                if not line.startswith("typedef"):
+                    continue
+
+                words = line.replace(";", "").split()
+                if len(words) < 3 or words[1] not in TYPE_CPP2NUMPY:
+                    continue
+
+                name = words[2]
+                dtype = TYPE_CPP2NUMPY[words[1]]
+                if "[" in name:
+                    length = name[name.index("[") + 1:name.index("]")]
+                    name = name[:name.index("[")]
+                    dtype = f"S{length}"
+
+                self.typedefs[name] = dtype
+
+    def run(self) -> None:
+        """运行生成"""
+        print("生成API结构体dtype文件")
+        self.load_typedef()
+
+        # 获取当前文件所在的目录父目录 /ctp/api
+        parent_path: Path = Path(__file__).resolve().parent.parent
+        self.f_dtype = open(f"{str(parent_path)}/{self.prefix}_dtype.py", "w", encoding="utf-8")
+        self.f_dtype.write(
+            '"""\n'
+            "CTP结构体对应的numpy dtype，由generate_dtype.py生成，请勿手动修改\n\n"
+            "内存布局与C++结构体一致，可直接解析DATA_MODE_BYTES推送的数据，例如：\n"
+            "np.frombuffer(b\"\".join(ticks), dtype=CThostFtdcDepthMarketDataField)\n"
+            '"""\n'
+            "import numpy as np\n\n"
+        )
+
+        with open(self.struct_filename, encoding="gbk") as f:
+            for line in f:
+                self.process_line(line)
+
+        self.f_dtype.close()
+        print("dtype生成成功")
+
+    def process_line(self, line: str) -> None:
+        """处理每行"""
+        line = line.replace(";", "").replace("\n", "")
+
+        if line.startswith("struct"):
+            name = line.split()[1]
+            self.f_dtype.write(f"\n{name} = np.dtype([\n")
+        elif line.startswith("}"):
+            self.f_dtype.write("], align=True)\n")
+        elif "\t" in line and "///" not in line:
+            self.process_member(line)
+
+    def process_member(self, line: str) -> None:
+        """处理成员"""
+        words = line.split()
+        if len(words) < 2:
+            return
+
+        type_name = words[0]
+        field_name = words[-1]
+
+        if type_name not in self.typedefs:
+            print(f"Warning: Unknown type '{type_name}' in line: {line.strip()}")
+            return
+
+        self.f_dtype.write(f"    (\"{field_name}\", \"{self.typedefs[type_name]}\"),\n")
+
+
+if __name__ == "__main__":
+    generator = DtypeGenerator(
+        "../include/ThostFtdcUserApiDataType.h",
+        "../include/ThostFtdcUserApiStruct.h",
+        "ctp"
+    )
+    generator.run()
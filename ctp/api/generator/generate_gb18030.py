@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+@ProjectName: homalos-ctp
+@FileName   : generate_gb18030.py
+@Date       : 2025/10/18 10:20
+@Author     : Donny
+@Email      : donnymoving@gmail.com
+@Software   : PyCharm
+@Description: 生成GB18030解码表头文件src/gb18030.h，供ctp.h中的toUtf使用
+
+解码表由python内置的gb18030编解码器导出，与CTP版本无关，只需在升级python后重新生成
+python generate_gb18030.py
+"""
+from pathlib import Path
+
+# 双字节编码：首字节0x81-0xFE，尾字节0x40-0xFE（0x7F无效）
+TWO_BYTE_LEAD_COUNT = 0xFE - 0x81 + 1
+TWO_BYTE_TRAIL_COUNT = 0xFE - 0x40 + 1
+
+# 四字节编码中映射到BMP的部分，线性序号范围0-39419
+FOUR_BYTE_BMP_COUNT = 39420
+
+# 无法解码时使用的替换字符
+REPLACEMENT_CHAR = 0xFFFD
+
+
+class Gb18030TableGenerator:
+    """GB18030解码表生成器"""
+
+    def __init__(self, filename: str) -> None:
+        self.filename: str = filename
+
+    @staticmethod
+    def _decode(data: bytes) -> int:
+        """解码单个字符，失败时返回替换字符"""
+        try:
+            text = data.decode("gb18030")
+        except UnicodeDecodeError:
+            return REPLACEMENT_CHAR
+        if len(text) != 1:
+            return REPLACEMENT_CHAR
+        return ord(text)
+
+    def generate_two_byte_table(self) -> list[int]:
+        """生成双字节编码表，按(首字节-0x81)*191+(尾字节-0x40)索引"""
+        table = []
+        for lead in range(0x81, 0xFF):
+            for trail in range(0x40, 0xFF):
+                table.append(self._decode(bytes([lead, trail])))
+        return table
+
+    def generate_four_byte_ranges(self) -> list[tuple[int, int]]:
+        """生成四字节编码区间表，每个区间内线性序号与码点的差值相同"""
+        ranges = []
+        last_offset = None
+        for index in range(FOUR_BYTE_BMP_COUNT):
+            b1, rest = divmod(index, 12600)
+            b2, rest = divmod(rest, 1260)
+            b3, b4 = divmod(rest, 10)
+            code = self._decode(bytes([0x81 + b1, 0x30 + b2, 0x81 + b3, 0x30 + b4]))
+
+            offset = code - index
+            if offset != last_offset:
+                ranges.append((index, code))
+                last_offset = offset
+        return ranges
+
+    def run(self) -> None:
+        """生成头文件"""
+        two_byte_table = self.generate_two_byte_table()
+        four_byte_ranges = self.generate_four_byte_ranges()
+
+        lines = [
+            "//GB18030解码表，由generate_gb18030.py生成，请勿手动修改",
+            "#pragma once",
+            "",
+            "#include <cstdint>",
+            "",
+            "",
+            f"#define GB18030_TWO_BYTE_TRAIL_COUNT {TWO_BYTE_TRAIL_COUNT}",
+            f"#define GB18030_FOUR_BYTE_BMP_COUNT {FOUR_BYTE_BMP_COUNT}",
+            f"#define GB18030_FOUR_BYTE_RANGE_COUNT {len(four_byte_ranges)}",
+            "",
+            "",
+            "//双字节编码表，按(首字节-0x81)*191+(尾字节-0x40)索引",
+            f"static const uint16_t GB18030_TWO_BYTE[{TWO_BYTE_LEAD_COUNT * TWO_BYTE_TRAIL_COUNT}] = {{",
+        ]
+        for i in range(0, len(two_byte_table), 16):
+            row = ", ".join(f"0x{code:04X}" for code in two_byte_table[i:i + 16])
+            lines.append(f"\t{row},")
+        lines.append("};")
+        lines.append("")
+        lines.append("")
+
+        lines.append("//四字节编码区间表，{区间起始线性序号, 区间起始码点}")
+        lines.append(f"static const uint16_t GB18030_FOUR_BYTE_RANGES[{len(four_byte_ranges)}][2] = {{")
+        for index, code in four_byte_ranges:
+            lines.append(f"\t{{{index}, 0x{code:04X}}},")
+        lines.append("};")
+        lines.append("")
+
+        with open(self.filename, "w", encoding="gb2312") as f:
+            f.write("\n".join(lines))
+        print(f"成功生成解码表: {self.filename}")
+
+
+if __name__ == "__main__":
+    output = Path(__file__).resolve().parent.parent / "src" / "gb18030.h"
+    generator = Gb18030TableGenerator(str(output))
+    generator.run()
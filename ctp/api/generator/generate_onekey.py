@@ -71,6 +71,7 @@ def run():
         ('generate_dll_entry.py', "生成DLL入口文件失败"),
         ('generate_data_type.py', "生成API DataType文件失败"),
         ('generate_struct.py', "生成API结构体文件失败"),
+        ('generate_dtype.py', "生成API结构体dtype文件失败"),
         ('generate_api_functions.py', "生成API函数文件失败"),
         ('generate_cpp.py', "生成API cpp、h文件失败")
     ]
@@ -1,23 +1,40 @@
 #include <string>
 #include <queue>
+#include <vector>
+#include <deque>
+#include <unordered_map>
+#include <unordered_set>
+#include <string_view>
 #include <thread>
+#include <chrono>
 #include <mutex>
 #include <iostream>
-#include <codecvt>
+#include <cstring>
 #include <condition_variable>
-#include <locale>
-
-#ifdef __APPLE__
-#include <iconv.h>
-#endif
+#include <atomic>
+#include <memory>
+#include <new>
+#include <limits>
 
 #include "pybind11/pybind11.h"
+#include "pybind11/numpy.h"
+#include "gb18030.h"
 
 
 using namespace std;
 using namespace pybind11;
 
 
+//ģʽ
+#define DATA_MODE_DICT 0			//ֵ
+#define DATA_MODE_OBJECT 1			//ṹ
+#define DATA_MODE_BYTES 2			//ṹԭʼֽڣctp_dtypeеnumpy dtype
+
+
+//ʱÿԼ
+#define SUBSCRIBE_CHUNK_SIZE 100
+
+
 //ṹ
 struct Task
 {
@@ -26,34 +43,348 @@ struct Task
     void *task_error;	//ָ
     int task_id;		//id
     bool task_last;		//ǷΪ󷵻
+    bool task_conflated;	//ǷΪϲ͵ռλtask_idΪϲλȡʱŸ
+    int64_t task_time;		//ʱ䣬steady_clock룬ڻص߳м¼Ҳͳͣʱ
+    int64_t task_wall_time;	//ʱ䣬ϵͳʱ
 };
 
+
+//ǰsteady_clockʱ䣬
+inline int64_t steadyNs()
+{
+    return chrono::duration_cast<chrono::nanoseconds>(chrono::steady_clock::now().time_since_epoch()).count();
+}
+
+
+//ǰϵͳʱ䣬1970-01-01 UTC
+inline int64_t wallNs()
+{
+    return chrono::duration_cast<chrono::nanoseconds>(chrono::system_clock::now().time_since_epoch()).count();
+}
+
 class TerminatedError : std::exception
 {};
 
+
+#define RING_QUEUE_MAX_CAPACITY (1 << 24)	//ζе
+
+
+//ߵζУΪCTPص̣߳Ϊ߳
+class SpscRing
+{
+private:
+    vector<Task> buffer_;					//񻺳Ϊ2
+    size_t mask_;							//±
+    alignas(64) atomic<size_t> head_{0};	//߶ȡλ
+    alignas(64) atomic<size_t> tail_{0};	//дλ
+
+public:
+    explicit SpscRing(size_t capacity)
+    {
+        size_t size = 2;
+        while (size < capacity && size < RING_QUEUE_MAX_CAPACITY)
+            size <<= 1;
+        buffer_.resize(size);
+        mask_ = size - 1;
+    }
+
+    //񣬶ʱfalse
+    bool try_push(const Task &task)
+    {
+        size_t tail = tail_.load(memory_order_relaxed);
+        if (tail - head_.load(memory_order_acquire) > mask_)
+            return false;
+        buffer_[tail & mask_] = task;
+        tail_.store(tail + 1, memory_order_release);
+        return true;
+    }
+
+    //ȡ񣬶Ϊʱfalse
+    bool try_pop(Task &task)
+    {
+        size_t head = head_.load(memory_order_relaxed);
+        if (head == tail_.load(memory_order_acquire))
+            return false;
+        task = buffer_[head & mask_];
+        head_.store(head + 1, memory_order_release);
+        return true;
+    }
+
+    bool empty() const
+    {
+        return head_.load(memory_order_acquire) == tail_.load(memory_order_acquire);
+    }
+
+    size_t capacity() const
+    {
+        return mask_ + 1;
+    }
+};
+
+
+//ÿϵͳĽڵ
+#define POOL_BLOCK_SIZE 256
+
+
+//أеĽṹݣص߳ȡ̹߳黹̵߳malloc/free
+template <typename T>
+class TaskPool
+{
+private:
+    union Node
+    {
+        Node *next;								//ָ
+        alignas(T) char storage[sizeof(T)];		//ṹ洢ռ
+    };
+
+    //̹߳黹Ľڵ㣬ջ
+    static atomic<Node*> &shared()
+    {
+        static atomic<Node*> head{nullptr};
+        return head;
+    }
+
+    //ǰֱ߳̿ȡõĽڵ㣬߳˳ʱ黹ջڵ̴߽߳ڵ
+    struct LocalList
+    {
+        Node *head = nullptr;
+
+        ~LocalList()
+        {
+            if (head)
+                pushChain(head);
+        }
+    };
+
+    static Node *&local()
+    {
+        static thread_local LocalList list;
+        return list.head;
+    }
+
+    //firstͷѹ빲ջ
+    static void pushChain(Node *first)
+    {
+        Node *last = first;
+        while (last->next)
+            last = last->next;
+
+        Node *old = shared().load(memory_order_relaxed);
+        do
+        {
+            last->next = old;
+        } while (!shared().compare_exchange_weak(old, first, memory_order_release, memory_order_relaxed));
+    }
+
+public:
+    //ȡһڵ㣬̻߳Ϊʱһȡȫ黹Ľڵ㣬Ϊʱ
+    static T *allocate()
+    {
+        Node *&head = local();
+        if (!head)
+            head = shared().exchange(nullptr, memory_order_acquire);
+        if (!head)
+        {
+            Node *block = new Node[POOL_BLOCK_SIZE];		//פڴ棬ͷ
+            for (size_t i = 0; i < POOL_BLOCK_SIZE - 1; i++)
+                block[i].next = &block[i + 1];
+            block[POOL_BLOCK_SIZE - 1].next = nullptr;
+            head = block;
+        }
+        Node *node = head;
+        head = node->next;
+        return new (node->storage) T;
+    }
+
+    //黹ڵ㣬ֻջ
+    static void release(T *data)
+    {
+        Node *node = reinterpret_cast<Node*>(data);
+        node->next = nullptr;
+        pushChain(node);
+    }
+};
+
+
+//ͳƵ
+#define QUEUE_STATS_TYPES 256
+
+//ͣʱֱͼͰ0ͰͳС1΢룬iͰͳ[2^(i-1), 2^i)΢룬һͰʱ
+#define QUEUE_STATS_BUCKETS 32
+
+
+//ͳƼߺд벻ͬĻУֻʹrelaxedԭӲɳפ
+struct QueueStats
+{
+    alignas(64) atomic<uint64_t> pushed{0};								//ۼߣ
+    atomic<uint64_t> high_water{0};										//ʷ
+    atomic<uint64_t> enqueued[QUEUE_STATS_TYPES] = {};					//͵
+    atomic<uint64_t> dropped[QUEUE_STATS_TYPES] = {};					//͵Ķϲδעصȣ
+
+    alignas(64) atomic<uint64_t> popped{0};								//ۼƳߣ
+    atomic<uint64_t> dispatched[QUEUE_STATS_TYPES] = {};				//͵ĳ
+    atomic<uint64_t> dwell[QUEUE_STATS_BUCKETS] = {};					//ӵӵͣʱֱͼ
+
+    //ӳɹãʱĳӼͺmax_depthΪԴΪ
+    void on_push(const Task &task, uint64_t max_depth = UINT64_MAX)
+    {
+        uint64_t pushed_count = pushed.fetch_add(1, memory_order_relaxed) + 1;
+        uint64_t depth = pushed_count - popped.load(memory_order_relaxed);
+        if (depth > max_depth && depth <= pushed_count)
+            depth = max_depth;
+        if (depth > high_water.load(memory_order_relaxed) && depth <= pushed_count)
+            high_water.store(depth, memory_order_relaxed);
+        if (task.task_name >= 0 && task.task_name < QUEUE_STATS_TYPES)
+            enqueued[task.task_name].fetch_add(1, memory_order_relaxed);
+    }
+
+    void on_pop(const Task &task, int64_t now)
+    {
+        popped.fetch_add(1, memory_order_relaxed);
+        if (task.task_name >= 0 && task.task_name < QUEUE_STATS_TYPES)
+            dispatched[task.task_name].fetch_add(1, memory_order_relaxed);
+
+        int64_t us = (now - task.task_time) / 1000;
+        int bucket = 0;
+        while (us > 0 && bucket < QUEUE_STATS_BUCKETS - 1)
+        {
+            us >>= 1;
+            bucket++;
+        }
+        dwell[bucket].fetch_add(1, memory_order_relaxed);
+    }
+
+    void on_drop(int task_name)
+    {
+        if (task_name >= 0 && task_name < QUEUE_STATS_TYPES)
+            dropped[task_name].fetch_add(1, memory_order_relaxed);
+    }
+};
+
+
 class TaskQueue
 {
 private:
-    queue<Task> queue_;						//׼
+    queue<Task> queue_;						//׼Уûζкֻŷǻص̴߳
     mutex mutex_;							//
     condition_variable cond_;				//
 
-    bool _terminate = false;
+    unique_ptr<SpscRing> ring_;				//ζУú׼
+    atomic<bool> waiting_{false};			//߳Ƿ
+    atomic<bool> posted_{false};			//׼Ƿзǻص̴߳
+    atomic<bool> _terminate{false};
+    QueueStats stats_;						//ͳƼ
+
+    //ȴζȶΪʱ
+    void wait_ring()
+    {
+        for (int i = 0; i < 64; i++)
+        {
+            if (!ring_->empty() || posted_.load(memory_order_acquire))
+                return;
+            if (_terminate)
+                throw TerminatedError();
+            this_thread::yield();
+        }
+
+        unique_lock<mutex> mlock(mutex_);
+        waiting_.store(true);
+        atomic_thread_fence(memory_order_seq_cst);
+        cond_.wait(mlock, [&]() {
+            return !ring_->empty() || posted_.load(memory_order_relaxed) || _terminate;
+        });
+        waiting_.store(false);
+        if (_terminate)
+            throw TerminatedError();
+    }
 
 public:
 
+    //ΪcapacityζУڹ߳ǰ
+    void set_ring(size_t capacity)
+    {
+        if (capacity > 0)
+            ring_.reset(new SpscRing(capacity));
+        else
+            ring_.reset();
+    }
+
     //µ
-    void push(const Task &task)
+    void push(Task task)
     {
+        if (!task.task_time)
+            task.task_time = steadyNs();	//صδ¼ʱʱʱ
+
+        if (ring_)
+        {
+            while (!ring_->try_push(task))
+                this_thread::yield();		//ʱóCPUȴ߳ȡ
+            stats_.on_push(task, ring_->capacity());
+            atomic_thread_fence(memory_order_seq_cst);
+            if (waiting_.load(memory_order_relaxed))
+            {
+                lock_guard<mutex> mlock(mutex_);	//ڹ߳ʱż
+                cond_.notify_one();
+            }
+            return;
+        }
+
         unique_lock<mutex > mlock(mutex_);
         queue_.push(task);					//д
+        stats_.on_push(task);
         mlock.unlock();						//ͷ
         cond_.notify_one();					//֪ͨȴ߳
     }
 
+    //ǻص̴߳ûζʱı׼ת֤ζֻлص߳һߣҲ
+    void post(Task task)
+    {
+        if (!ring_)
+        {
+            this->push(task);
+            return;
+        }
+
+        if (!task.task_time)
+            task.task_time = steadyNs();
+        {
+            lock_guard<mutex> mlock(mutex_);
+            queue_.push(task);
+            stats_.on_push(task);
+            posted_.store(true, memory_order_release);
+        }
+        cond_.notify_one();
+    }
+
+    //ȡǻص̴ֻ߳ûζʱʹ
+    bool try_pop_posted(Task &task)
+    {
+        if (!posted_.load(memory_order_acquire))
+            return false;
+
+        lock_guard<mutex> mlock(mutex_);
+        if (queue_.empty())
+            return false;
+        task = queue_.front();
+        queue_.pop();
+        if (queue_.empty())
+            posted_.store(false, memory_order_relaxed);
+        return true;
+    }
+
     //ȡϵ
     Task pop()
     {
+        if (ring_)
+        {
+            Task task;
+            this->wait_ring();
+            if (!ring_->try_pop(task))
+                this->try_pop_posted(task);
+            stats_.on_pop(task, steadyNs());
+            return task;
+        }
+
         unique_lock<mutex> mlock(mutex_);
         cond_.wait(mlock, [&]() {
             return !queue_.empty() || _terminate;
@@ -62,12 +393,68 @@ public:
             throw TerminatedError();
         Task task = queue_.front();			//ȡеһ
         queue_.pop();						//ɾ
+        mlock.unlock();
+        stats_.on_pop(task, steadyNs());
         return task;						//ظ
     }
 
+    //ȡеĶmax_sizeֻһμ
+    void pop_batch(vector<Task> &tasks, size_t max_size)
+    {
+        if (ring_)
+        {
+            Task task;
+            this->wait_ring();
+            tasks.clear();
+            while (tasks.size() < max_size && ring_->try_pop(task))
+                tasks.push_back(task);
+            while (tasks.size() < max_size && this->try_pop_posted(task))
+                tasks.push_back(task);
+            this->record_pop(tasks);
+            return;
+        }
+
+        unique_lock<mutex> mlock(mutex_);
+        cond_.wait(mlock, [&]() {
+            return !queue_.empty() || _terminate;
+        });				//ȴ֪ͨ
+        if (_terminate)
+            throw TerminatedError();
+        tasks.clear();
+        while (!queue_.empty() && tasks.size() < max_size)
+        {
+            tasks.push_back(queue_.front());
+            queue_.pop();
+        }
+        mlock.unlock();
+        this->record_pop(tasks);
+    }
+
+    //ͳȡֻȡһʱ
+    void record_pop(const vector<Task> &tasks)
+    {
+        int64_t now = steadyNs();
+        for (const Task &task : tasks)
+            stats_.on_pop(task, now);
+    }
+
+    //¼δӻȡ
+    void record_drop(int task_name)
+    {
+        stats_.on_drop(task_name);
+    }
+
+    const QueueStats &stats() const
+    {
+        return stats_;
+    }
+
     void terminate()
     {
-        _terminate = true;
+        {
+            lock_guard<mutex> mlock(mutex_);
+            _terminate = true;
+        }
         cond_.notify_all();					//֪ͨȴ߳
     }
 };
@@ -123,67 +510,745 @@ void getString(const pybind11::dict &d, const char *key, string_literal<size> &v
 };
 
 
-//GBKַתΪUTF8
-#ifndef __APPLE__
-inline string toUtf(const string &gb2312)
+//ַַ飬ʱض
+template <size_t size>
+void copyString(char (&value)[size], const string &s)
+{
+    size_t length = s.size() < size - 1 ? s.size() : size - 1;
+    memcpy(value, s.data(), length);
+    value[length] = '\0';
+};
+
+
+//һGB18030ַ㲢positionƵһַ޷ʱ滻ַ
+inline Py_UCS4 decodeGb18030Char(const unsigned char *data, size_t length, size_t &position)
 {
+    unsigned char b1 = data[position];
+    if (b1 < 0x80)
+    {
+        position += 1;
+        return b1;
+    }
 
-    #ifdef _MSC_VER
-        const static locale loc("zh-CN");
-    #else
-        const static locale loc("zh_CN.GB18030");
-    #endif
+    if (b1 >= 0x81 && b1 <= 0xFE && position + 1 < length)
+    {
+        unsigned char b2 = data[position + 1];
 
-        vector<wchar_t> wstr(gb2312.size());
-        wchar_t* wstrEnd = nullptr;
-        const char* gbEnd = nullptr;
-        mbstate_t state = {};
-        int res = use_facet<codecvt<wchar_t, char, mbstate_t> >
-            (loc).in(state,
-                gb2312.data(), gb2312.data() + gb2312.size(), gbEnd,
-                wstr.data(), wstr.data() + wstr.size(), wstrEnd);
+        //˫ֽڱ
+        if (b2 >= 0x40 && b2 <= 0xFE && b2 != 0x7F)
+        {
+            position += 2;
+            return GB18030_TWO_BYTE[(b1 - 0x81) * GB18030_TWO_BYTE_TRAIL_COUNT + (b2 - 0x40)];
+        }
 
-        if (codecvt_base::ok == res)
+        //ֽڱ룬ĩβʱ滻
+        if (b2 >= 0x30 && b2 <= 0x39)
         {
-            wstring_convert<codecvt_utf8<wchar_t>> cutf8;
-            return cutf8.to_bytes(wstring(wstr.data(), wstrEnd));
+            if (position + 3 >= length)
+            {
+                position = length;
+                return 0xFFFD;
+            }
+            unsigned char b3 = data[position + 2];
+            unsigned char b4 = data[position + 3];
+            if (b3 >= 0x81 && b3 <= 0xFE && b4 >= 0x30 && b4 <= 0x39)
+            {
+                position += 4;
+                uint32_t offset = (b2 - 0x30) * 1260 + (b3 - 0x81) * 10 + (b4 - 0x30);
+
+                //BMP䣬ֲ
+                if (b1 <= 0x84)
+                {
+                    uint32_t index = (b1 - 0x81) * 12600 + offset;
+                    if (index >= GB18030_FOUR_BYTE_BMP_COUNT)
+                        return 0xFFFD;
+                    size_t low = 0;
+                    size_t high = GB18030_FOUR_BYTE_RANGE_COUNT - 1;
+                    while (low < high)
+                    {
+                        size_t mid = (low + high + 1) / 2;
+                        if (GB18030_FOUR_BYTE_RANGES[mid][0] <= index)
+                            low = mid;
+                        else
+                            high = mid - 1;
+                    }
+                    return GB18030_FOUR_BYTE_RANGES[low][1] + (index - GB18030_FOUR_BYTE_RANGES[low][0]);
+                }
+
+                //ƽ棬ӳ
+                if (b1 >= 0x90 && b1 <= 0xE3)
+                {
+                    uint32_t code = 0x10000 + (b1 - 0x90) * 12600 + offset;
+                    if (code <= 0x10FFFF)
+                        return code;
+                }
+                return 0xFFFD;
+            }
         }
+    }
+
+    position += 1;
+    return 0xFFFD;
+}
+
+
+//GB18030ֱַתΪpythonַASCIIʱֱӸƣмַ
+template <size_t size>
+inline str toUtf(const char (&data)[size])
+{
+    const unsigned char *bytes = reinterpret_cast<const unsigned char*>(data);
+    size_t length = strnlen(data, size);
+
+    size_t position = 0;
+    while (position < length && bytes[position] < 0x80)
+        position++;
+
+    //ASCII·
+    if (position == length)
+    {
+        PyObject *result = PyUnicode_New(length, 127);
+        if (!result)
+            throw error_already_set();
+        memcpy(PyUnicode_1BYTE_DATA(result), data, length);
+        return reinterpret_steal<str>(result);
+    }
+
+    //ASCIIַʱַ뵽ջϻַᳬֽ
+    Py_UCS4 buffer[size];
+    size_t count = 0;
+    for (size_t i = 0; i < position; i++)
+        buffer[count++] = bytes[i];
+    while (position < length)
+        buffer[count++] = decodeGb18030Char(bytes, length, position);
 
-        return string();
+    PyObject *result = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, buffer, count);
+    if (!result)
+        throw error_already_set();
+    return reinterpret_steal<str>(result);
 }
-#else
-iconv_t cd = iconv_open("UTF-8", "GB2312");
 
-int code_convert(char *inbuf, size_t inlen, char *outbuf, size_t outlen) 
+
+//פĿֵٻ
+#define STRING_CACHE_SIZE 65536
+
+
+//ַפ棬ͻֶΣԼ롢롢ڵȣÿηͬһpythonַ󣬵ʱGIL
+class StringCache
+{
+private:
+    deque<string> keys_;							//ԭʼֽڣΪϣļṩȶ洢
+    unordered_map<string_view, PyObject*> cache_;	//ԭʼֽڵpythonַӳ䣬
+
+public:
+    ~StringCache()
+    {
+        for (auto &item : cache_)
+            Py_DECREF(item.second);
+    }
+
+    template <size_t size>
+    str get(const char (&data)[size])
+    {
+        string_view key(data, strnlen(data, size));
+        auto it = cache_.find(key);
+        if (it != cache_.end())
+            return reinterpret_borrow<str>(it->second);
+
+        str value = toUtf(data);
+        if (cache_.size() < STRING_CACHE_SIZE)
+        {
+            PyObject *ptr = value.release().ptr();
+            PyUnicode_InternInPlace(&ptr);				//pythonеͬ
+            value = reinterpret_steal<str>(ptr);
+
+            keys_.emplace_back(key);
+            cache_.emplace(string_view(keys_.back()), value.inc_ref().ptr());
+        }
+        return value;
+    }
+};
+
+
+//ϲÿֻһݣߴʱʱ
+template <typename T>
+class ConflationTable
 {
-    char **pin = &inbuf;
-    char **pout = &outbuf;
+private:
+    struct Slot
+    {
+        string key;					//Ϊϣļṩȶ洢
+        T data;						//
+        int64_t time = 0;			//ݵĽʱ䣬steady_clock
+        int64_t wall_time = 0;		//ݵĽʱ䣬ϵͳʱ
+        bool dirty = false;			//Ƿд͵
+    };
 
-    memset(outbuf, 0, outlen);
+    mutex mutex_;
+    unordered_map<string_view, int> index_;		//λӳ
+    deque<Slot> slots_;							//λ
 
-    if ((int)iconv(cd, pin, &inlen, pout, &outlen) == -1)
+public:
+    //дݣλɿбΪʱزλţҪռλ񣬷򷵻-1
+    template <size_t size>
+    int update(const char (&key)[size], const T &data, int64_t time, int64_t wall_time)
     {
+        string_view view(key, strnlen(key, size));
+        lock_guard<mutex> mlock(mutex_);
+
+        int slot;
+        auto it = index_.find(view);
+        if (it != index_.end())
+        {
+            slot = it->second;
+        }
+        else
+        {
+            slot = (int)slots_.size();
+            slots_.emplace_back();
+            slots_.back().key = string(view);
+            index_.emplace(string_view(slots_.back().key), slot);
+        }
+
+        Slot &s = slots_[slot];
+        s.data = data;
+        s.time = time;
+        s.wall_time = wall_time;
+        if (s.dirty)
+            return -1;
+        s.dirty = true;
+        return slot;
+    }
+
+    //ȡλеݣеĸͽʱдռλ
+    void take(Task &task)
+    {
+        T *data = TaskPool<T>::allocate();
+        lock_guard<mutex> mlock(mutex_);
+        Slot &s = slots_[task.task_id];
+        *data = s.data;
+        s.dirty = false;
+        task.task_data = data;
+        task.task_time = s.time;
+        task.task_wall_time = s.wall_time;
+    }
+};
+
+
+//ѡתֶεĽṹ壬ֶΪֶڽṹе˳
+struct FieldTable
+{
+    const char *name;				//ȥǰ׺ͺ׺ĽṹƣDepthMarketData
+    const char *const *fields;		//ֶ
+    int count;						//ֶ
+};
+
+
+//ֶѡṹűҪתֶţֻڳGILʱд
+class FieldSelection
+{
+private:
+    vector<vector<int>> fields_;
+    vector<bool> enabled_;
+
+public:
+    //ҪתֶΣֶΪʱָתȫֶ
+    void set(int id, const vector<int> &fields)
+    {
+        if ((size_t)id >= fields_.size())
+        {
+            fields_.resize(id + 1);
+            enabled_.resize(id + 1, false);
+        }
+        fields_[id] = fields;
+        enabled_[id] = !fields.empty();
+    }
+
+    //δʱnullptr
+    const vector<int> *get(int id) const
+    {
+        if ((size_t)id < enabled_.size() && enabled_[id])
+            return &fields_[id];
+        return nullptr;
+    }
+};
+
+
+//ݱÿһݼʱ䣬ص߳д룬python̶߳ȡ
+template <typename T>
+class SnapshotTable
+{
+private:
+    struct Slot
+    {
+        string key;					//Ϊϣļṩȶ洢
+        T data;						//
+        int64_t time = 0;			//ʱ䣬steady_clock
+        int64_t wall_time = 0;		//ʱ䣬ϵͳʱ
+    };
+
+    mutex mutex_;
+    unordered_map<string_view, size_t> index_;	//λӳ
+    deque<Slot> slots_;							//λ
+
+public:
+    template <size_t size>
+    void update(const char (&key)[size], const T &data, int64_t time, int64_t wall_time)
+    {
+        string_view view(key, strnlen(key, size));
+        lock_guard<mutex> mlock(mutex_);
+
+        Slot *slot;
+        auto it = index_.find(view);
+        if (it != index_.end())
+        {
+            slot = &slots_[it->second];
+        }
+        else
+        {
+            slots_.emplace_back();
+            slot = &slots_.back();
+            slot->key = string(view);
+            index_.emplace(string_view(slot->key), slots_.size() - 1);
+        }
+
+        slot->data = data;
+        slot->time = time;
+        slot->wall_time = wall_time;
+    }
+
+    //ȡݣڸƵ÷ṩĽṹ岢дʱ䣬ʱfalse
+    bool get(const string &key, T &data, int64_t &time, int64_t &wall_time)
+    {
+        lock_guard<mutex> mlock(mutex_);
+        auto it = index_.find(string_view(key));
+        if (it == index_.end())
+            return false;
+
+        Slot &slot = slots_[it->second];
+        data = slot.data;
+        time = slot.time;
+        wall_time = slot.wall_time;
+        return true;
+    }
+};
+
+
+//ַĻص޸ĺȡصʱGILжϼǷʱҪGIL
+class HandlerTable
+{
+private:
+    struct Slot
+    {
+        unique_ptr<string> key;		//Ĵ洢Ϊϣļṩȶĵַ
+        PyObject *handler;			//pythonص
+    };
+
+    mutex mutex_;
+    unordered_map<string_view, Slot> handlers_;	//صӳ䣬ʱҪַ
+    atomic<size_t> count_{0};					//صΪ0ʱҪ
+
+public:
+    ~HandlerTable()
+    {
+        for (auto &item : handlers_)
+            Py_DECREF(item.second.handler);
+    }
+
+    //עصѴʱ滻
+    void set(const string &key, const object &handler)
+    {
+        PyObject *old = nullptr;
+        {
+            lock_guard<mutex> mlock(mutex_);
+            auto it = handlers_.find(string_view(key));
+            if (it != handlers_.end())
+            {
+                old = it->second.handler;
+                it->second.handler = handler.inc_ref().ptr();
+            }
+            else
+            {
+                unique_ptr<string> owned(new string(key));
+                string_view view(*owned);
+                handlers_.emplace(view, Slot{move(owned), handler.inc_ref().ptr()});
+                count_.store(handlers_.size(), memory_order_release);
+            }
+        }
+        Py_XDECREF(old);
+    }
+
+    //עص
+    void remove(const string &key)
+    {
+        PyObject *old = nullptr;
+        {
+            lock_guard<mutex> mlock(mutex_);
+            auto it = handlers_.find(string_view(key));
+            if (it == handlers_.end())
+                return;
+            old = it->second.handler;
+            handlers_.erase(it);
+            count_.store(handlers_.size(), memory_order_release);
+        }
+        Py_DECREF(old);
+    }
+
+    bool empty() const
+    {
+        return count_.load(memory_order_acquire) == 0;
+    }
+
+    template <size_t size>
+    bool contains(const char (&key)[size])
+    {
+        string_view view(key, strnlen(key, size));
+        lock_guard<mutex> mlock(mutex_);
+        return handlers_.find(view) != handlers_.end();
+    }
+
+    //ȡصʱNone
+    template <size_t size>
+    object get(const char (&key)[size])
+    {
+        string_view view(key, strnlen(key, size));
+        lock_guard<mutex> mlock(mutex_);
+        auto it = handlers_.find(view);
+        if (it == handlers_.end())
+            return none();
+        return reinterpret_borrow<object>(it->second.handler);
+    }
+};
+
+
+//Լű״γֵĺԼ˳ţŲı
+class SymbolTable
+{
+private:
+    mutex mutex_;
+    unordered_map<string, int> index_;		//Լ뵽ŵӳ
+    vector<string> names_;					//еĺԼ
+
+public:
+    template <size_t size>
+    int get_or_add(const char (&symbol)[size])
+    {
+        string key(symbol, strnlen(symbol, size));
+        lock_guard<mutex> mlock(mutex_);
+        auto it = index_.find(key);
+        if (it != index_.end())
+            return it->second;
+
+        int id = (int)names_.size();
+        index_.emplace(key, id);
+        names_.push_back(key);
+        return id;
+    }
+
+    //ҺԼţʱ-1
+    int find(const string &symbol)
+    {
+        lock_guard<mutex> mlock(mutex_);
+        auto it = index_.find(symbol);
+        if (it == index_.end())
+            return -1;
+        return it->second;
+    }
+
+    vector<string> names()
+    {
+        lock_guard<mutex> mlock(mutex_);
+        return names_;
+    }
+};
+
+
+//дĶ¼λдλֻ¼±Ϊдλöȡ
+template <typename T>
+class RecordBuffer
+{
+private:
+    vector<T> records_;
+    atomic<uint64_t> cursor_{0};			//дļ¼
+
+public:
+    explicit RecordBuffer(size_t capacity) : records_(capacity) {}
+
+    //ȡһдļ¼дcommit
+    T &next()
+    {
+        return records_[cursor_.load(memory_order_relaxed) % records_.size()];
+    }
+
+    void commit()
+    {
+        cursor_.store(cursor_.load(memory_order_relaxed) + 1, memory_order_release);
+    }
+
+    uint64_t cursor() const
+    {
+        return cursor_.load(memory_order_acquire);
+    }
+
+    T *data()
+    {
+        return records_.data();
+    }
+
+    size_t capacity() const
+    {
+        return records_.size();
+    }
+};
+
+
+//ָC++ڴֻnumpy飬ownerãnumpy״εʱŵ
+template <typename Owner>
+object makeArrayView(const shared_ptr<Owner> &owner, const pybind11::dtype &dt, void *data,
+    vector<ssize_t> shape, vector<ssize_t> strides)
+{
+    capsule base(new shared_ptr<Owner>(owner), [](void *p) {
+        delete (shared_ptr<Owner>*)p;
+    });
+    pybind11::array view(dt, shape, strides, data, base);
+    view.attr("setflags")(pybind11::arg("write") = false);
+    return view;
+}
+
+
+//ָ¼ֻnumpy
+template <typename T>
+object makeRecordArray(const shared_ptr<RecordBuffer<T>> &buffer, const pybind11::dtype &dt)
+{
+    return makeArrayView(buffer, dt, buffer->data(), {(ssize_t)buffer->capacity()}, {(ssize_t)sizeof(T)});
+}
+
+
+//ֵֵĸΪЧCTPDBL_MAXʾûݵļ۸
+#define INVALID_DOUBLE_LIMIT 1e300
+
+
+//תʱCTPʾЧļֵתΪNaN
+inline double validDouble(double value, bool invalid_as_nan)
+{
+    if (invalid_as_nan && (value > INVALID_DOUBLE_LIMIT || value < -INVALID_DOUBLE_LIMIT))
+        return numeric_limits<double>::quiet_NaN();
+    return value;
+}
+
+
+//һĺ
+#define MS_PER_DAY (24 * 3600 * 1000)
+
+//ʱUTCʱ
+#define CHINA_UTC_OFFSET_MS (8 * 3600 * 1000LL)
+
+
+//YYYYMMDDʽΪʽȷʱ0
+template <size_t size>
+int parseDate(const char (&data)[size])
+{
+    int value = 0;
+    for (size_t i = 0; i < 8; i++)
+    {
+        if (i >= size || data[i] < '0' || data[i] > '9')
+            return 0;
+        value = value * 10 + (data[i] - '0');
+    }
+    return value;
+}
+
+
+//HH:MM:SSʽʱΪպʽȷʱ-1
+template <size_t size>
+int parseTimeMs(const char (&data)[size], int millisec)
+{
+    if (size < 8 || data[2] != ':' || data[5] != ':')
         return -1;
+    int parts[3];
+    for (int n = 0; n < 3; n++)
+    {
+        char high = data[n * 3];
+        char low = data[n * 3 + 1];
+        if (high < '0' || high > '9' || low < '0' || low > '9')
+            return -1;
+        parts[n] = (high - '0') * 10 + (low - '0');
     }
-    *pout = "\0";
+    return ((parts[0] * 60 + parts[1]) * 60 + parts[2]) * 1000 + millisec;
+}
 
-    return 0;
+
+//HH:MMHH:MM:SSʽʱΪպʽȷʱ-1
+inline int parseClockMs(const string &data)
+{
+    if (data.size() != 5 && data.size() != 8)
+        return -1;
+    char buffer[9] = "00:00:00";
+    memcpy(buffer, data.data(), data.size());
+    int ms = parseTimeMs(buffer, 0);
+    if (ms < 0 || ms >= MS_PER_DAY || buffer[3] > '5' || buffer[6] > '5')
+        return -1;
+    return ms;
 }
 
-inline string toUtf(const string &gb2312)
+
+//YYYYMMDD1970-01-01
+inline int64_t daysFromCivil(int date)
 {
-    int length = gb2312.size() * 2 + 1;
-    char temp[length];
+    int y = date / 10000;
+    int m = date / 100 % 100;
+    int d = date % 100;
+    y -= m <= 2;
+    int era = (y >= 0 ? y : y - 399) / 400;
+    int yoe = y - era * 400;
+    int doy = (153 * (m > 2 ? m - 3 : m + 9) + 2) / 5 + d - 1;
+    int doe = yoe * 365 + yoe / 4 - yoe / 100 + doy;
+    return (int64_t)era * 146097 + doe - 719468;
+}
 
-    int n = code_convert((char*)gb2312.c_str(), gb2312.size(), temp, length);
 
-    if(n == 0)
+//ɽ㽻ʱȻվ1970-01-01
+//18ҹڽյһգҹҹټһ죬ڽڼǰҹ
+inline int64_t tradingCalendarDays(int trading_day, int ms)
+{
+    int64_t days = daysFromCivil(trading_day);
+    if (ms >= 18 * 3600 * 1000 || ms < 6 * 3600 * 1000)
     {
-        return temp;
+        int weekday = (int)((days + 3) % 7);		//0Ϊһ1970-01-01Ϊ
+        days -= weekday == 0 ? 3 : 1;
+        if (ms < 6 * 3600 * 1000)
+            days += 1;
     }
+    return days;
+}
+
+
+//ʱǰؽʱֵǱʱ뽻ʱӵƫ
+#define EXCHANGE_CLOCK_TOLERANCE_MS (10 * 60 * 1000)
+
+
+//㽻ʱӦepoch룬ʱΪʱ䣬ʱ䲻ȷʱ0
+//ʹaction_dayaction_dayΪ0ʱɽ㣬Ϊ0ʱʹýʱ
+//нʱʱֻڣҹ̵ActionDay岻һ£ǰʱĽˣ
+//ҹʱʱһǰһڽǰ6Сʱʱǰһ죬ǰյʷձԭ
+inline int64_t exchangeEpochNs(int action_day, int trading_day, int ms, int64_t recv_ns)
+{
+    if (ms < 0)
+        return 0;
+
+    int64_t recv_ms = recv_ns > 0 ? recv_ns / 1000000 : 0;
+    int64_t days;
+    if (action_day > 0)
+        days = daysFromCivil(action_day);
+    else if (trading_day > 0)
+        days = tradingCalendarDays(trading_day, ms);
+    else if (recv_ms > 0)
+        days = (recv_ms + CHINA_UTC_OFFSET_MS) / MS_PER_DAY;
     else
+        return 0;
+
+    int64_t time_ms = days * MS_PER_DAY + ms - CHINA_UTC_OFFSET_MS;
+    if (recv_ms > 0)
     {
-        return "";
+        int64_t ahead = time_ms - recv_ms - EXCHANGE_CLOCK_TOLERANCE_MS;
+        if (ahead > 0)
+        {
+            time_ms -= (ahead + MS_PER_DAY - 1) / MS_PER_DAY * MS_PER_DAY;
+        }
+        else if (ms < 6 * 3600 * 1000)
+        {
+            int64_t next_ms = time_ms + MS_PER_DAY;
+            if (next_ms <= recv_ms + EXCHANGE_CLOCK_TOLERANCE_MS && recv_ms - next_ms < 6 * 3600 * 1000)
+                time_ms = next_ms;
+        }
     }
+    return time_ms * 1000000;
 }
-#endif
+
+
+//ǰһʱεʱ䣬ǼϾ
+#define SESSION_PRE_OPEN_MS (5 * 60 * 1000)
+
+//̺һʱεʱ
+#define SESSION_POST_CLOSE_MS (3 * 60 * 1000)
+
+
+//ƷõĽʱαƷΪԼ뿪ͷĸַΪĬʱ
+//ʱεĽʱСڿʼʱʱʾԽҹҹ21:00-02:30
+class SessionCalendar
+{
+private:
+    struct Session
+    {
+        int start_ms;		//ʼʱ䣬պ
+        int length_ms;		//ʱγ
+    };
+
+    mutex mutex_;
+    unordered_map<string, vector<Session>> sessions_;
+
+public:
+    //ƷֵĽʱΣʱΪʱɾƷֵ
+    void set(const string &product, const vector<pair<int, int>> &ranges)
+    {
+        vector<Session> sessions;
+        for (const auto &range : ranges)
+        {
+            Session session;
+            session.start_ms = range.first;
+            session.length_ms = (range.second - range.first + MS_PER_DAY) % MS_PER_DAY;
+            sessions.push_back(session);
+        }
+
+        lock_guard<mutex> mlock(mutex_);
+        if (sessions.empty())
+            sessions_.erase(product);
+        else
+            sessions_[product] = sessions;
+    }
+
+    //ʱĽʱţadjust_msΪʱʱڵĵ
+    //Ͼۺ̺ʱΣκʱʱ-1δʱʱȫΪͬһʱ
+    template <size_t size>
+    int find(const char (&instrument)[size], int ms, int &adjust_ms)
+    {
+        adjust_ms = 0;
+        size_t length = 0;
+        while (length < size && ((instrument[length] >= 'a' && instrument[length] <= 'z')
+            || (instrument[length] >= 'A' && instrument[length] <= 'Z')))
+            length++;
+
+        lock_guard<mutex> mlock(mutex_);
+        if (sessions_.empty())
+            return 0;
+
+        auto it = sessions_.find(string(instrument, length));
+        if (it == sessions_.end())
+            it = sessions_.find(string());
+        if (it == sessions_.end())
+            return 0;
+
+        const vector<Session> &sessions = it->second;
+        for (size_t i = 0; i < sessions.size(); i++)
+        {
+            int offset = (ms - sessions[i].start_ms + MS_PER_DAY) % MS_PER_DAY;
+            if (offset < sessions[i].length_ms)
+                return (int)i;
+        }
+
+        for (size_t i = 0; i < sessions.size(); i++)
+        {
+            int offset = (ms - sessions[i].start_ms + MS_PER_DAY) % MS_PER_DAY;
+            if (offset >= MS_PER_DAY - SESSION_PRE_OPEN_MS)
+            {
+                adjust_ms = MS_PER_DAY - offset;
+                return (int)i;
+            }
+            if (offset - sessions[i].length_ms < SESSION_POST_CLOSE_MS)
+            {
+                adjust_ms = sessions[i].length_ms - 1 - offset;
+                return (int)i;
+            }
+        }
+        return -1;
+    }
+};
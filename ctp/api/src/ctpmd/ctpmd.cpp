@@ -8,40 +8,60 @@
 
 void MdApi::OnFrontConnected()
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONFRONTCONNECTED;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	this->task_queue.push(task);
 };
 
 void MdApi::OnFrontDisconnected(int nReason)
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONFRONTDISCONNECTED;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	task.task_id = nReason;
 	this->task_queue.push(task);
 };
 
 void MdApi::OnHeartBeatWarning(int nTimeLapse)
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONHEARTBEATWARNING;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	task.task_id = nTimeLapse;
 	this->task_queue.push(task);
 };
 
 void MdApi::OnRspUserLogin(CThostFtdcRspUserLoginField *pRspUserLogin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPUSERLOGIN;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspUserLogin)
 	{
-		CThostFtdcRspUserLoginField *task_data = new CThostFtdcRspUserLoginField();
+		CThostFtdcRspUserLoginField *task_data = TaskPool<CThostFtdcRspUserLoginField>::allocate();
 		*task_data = *pRspUserLogin;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -52,17 +72,22 @@ void MdApi::OnRspUserLogin(CThostFtdcRspUserLoginField *pRspUserLogin, CThostFtd
 
 void MdApi::OnRspUserLogout(CThostFtdcUserLogoutField *pUserLogout, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPUSERLOGOUT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pUserLogout)
 	{
-		CThostFtdcUserLogoutField *task_data = new CThostFtdcUserLogoutField();
+		CThostFtdcUserLogoutField *task_data = TaskPool<CThostFtdcUserLogoutField>::allocate();
 		*task_data = *pUserLogout;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -73,17 +98,22 @@ void MdApi::OnRspUserLogout(CThostFtdcUserLogoutField *pUserLogout, CThostFtdcRs
 
 void MdApi::OnRspQryMulticastInstrument(CThostFtdcMulticastInstrumentField *pMulticastInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYMULTICASTINSTRUMENT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pMulticastInstrument)
 	{
-		CThostFtdcMulticastInstrumentField *task_data = new CThostFtdcMulticastInstrumentField();
+		CThostFtdcMulticastInstrumentField *task_data = TaskPool<CThostFtdcMulticastInstrumentField>::allocate();
 		*task_data = *pMulticastInstrument;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -94,11 +124,16 @@ void MdApi::OnRspQryMulticastInstrument(CThostFtdcMulticastInstrumentField *pMul
 
 void MdApi::OnRspError(CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPERROR;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -109,17 +144,22 @@ void MdApi::OnRspError(CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bI
 
 void MdApi::OnRspSubMarketData(CThostFtdcSpecificInstrumentField *pSpecificInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPSUBMARKETDATA;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSpecificInstrument)
 	{
-		CThostFtdcSpecificInstrumentField *task_data = new CThostFtdcSpecificInstrumentField();
+		CThostFtdcSpecificInstrumentField *task_data = TaskPool<CThostFtdcSpecificInstrumentField>::allocate();
 		*task_data = *pSpecificInstrument;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -130,17 +170,22 @@ void MdApi::OnRspSubMarketData(CThostFtdcSpecificInstrumentField *pSpecificInstr
 
 void MdApi::OnRspUnSubMarketData(CThostFtdcSpecificInstrumentField *pSpecificInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPUNSUBMARKETDATA;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSpecificInstrument)
 	{
-		CThostFtdcSpecificInstrumentField *task_data = new CThostFtdcSpecificInstrumentField();
+		CThostFtdcSpecificInstrumentField *task_data = TaskPool<CThostFtdcSpecificInstrumentField>::allocate();
 		*task_data = *pSpecificInstrument;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -151,17 +196,22 @@ void MdApi::OnRspUnSubMarketData(CThostFtdcSpecificInstrumentField *pSpecificIns
 
 void MdApi::OnRspSubForQuoteRsp(CThostFtdcSpecificInstrumentField *pSpecificInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPSUBFORQUOTERSP;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSpecificInstrument)
 	{
-		CThostFtdcSpecificInstrumentField *task_data = new CThostFtdcSpecificInstrumentField();
+		CThostFtdcSpecificInstrumentField *task_data = TaskPool<CThostFtdcSpecificInstrumentField>::allocate();
 		*task_data = *pSpecificInstrument;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -172,17 +222,22 @@ void MdApi::OnRspSubForQuoteRsp(CThostFtdcSpecificInstrumentField *pSpecificInst
 
 void MdApi::OnRspUnSubForQuoteRsp(CThostFtdcSpecificInstrumentField *pSpecificInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPUNSUBFORQUOTERSP;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSpecificInstrument)
 	{
-		CThostFtdcSpecificInstrumentField *task_data = new CThostFtdcSpecificInstrumentField();
+		CThostFtdcSpecificInstrumentField *task_data = TaskPool<CThostFtdcSpecificInstrumentField>::allocate();
 		*task_data = *pSpecificInstrument;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -193,11 +248,27 @@ void MdApi::OnRspUnSubForQuoteRsp(CThostFtdcSpecificInstrumentField *pSpecificIn
 
 void MdApi::OnRtnDepthMarketData(CThostFtdcDepthMarketDataField *pDepthMarketData) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
+	if (pDepthMarketData && !this->storeRtnDepthMarketData(pDepthMarketData, recv_time, recv_wall_time))
+	{
+		return;
+	}
+
+	if (this->conflation && pDepthMarketData)
+	{
+		this->conflateRtnDepthMarketData(pDepthMarketData, recv_time, recv_wall_time);
+		return;
+	}
+
 	Task task = Task();
 	task.task_name = ONRTNDEPTHMARKETDATA;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pDepthMarketData)
 	{
-		CThostFtdcDepthMarketDataField *task_data = new CThostFtdcDepthMarketDataField();
+		CThostFtdcDepthMarketDataField *task_data = TaskPool<CThostFtdcDepthMarketDataField>::allocate();
 		*task_data = *pDepthMarketData;
 		task.task_data = task_data;
 	}
@@ -206,11 +277,16 @@ void MdApi::OnRtnDepthMarketData(CThostFtdcDepthMarketDataField *pDepthMarketDat
 
 void MdApi::OnRtnForQuoteRsp(CThostFtdcForQuoteRspField *pForQuoteRsp) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNFORQUOTERSP;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pForQuoteRsp)
 	{
-		CThostFtdcForQuoteRspField *task_data = new CThostFtdcForQuoteRspField();
+		CThostFtdcForQuoteRspField *task_data = TaskPool<CThostFtdcForQuoteRspField>::allocate();
 		*task_data = *pForQuoteRsp;
 		task.task_data = task_data;
 	}
@@ -224,97 +300,163 @@ void MdApi::OnRtnForQuoteRsp(CThostFtdcForQuoteRspField *pForQuoteRsp)
 
 void MdApi::processTask()
 {
+	vector<Task> tasks;
+
 	try
 	{
 		while (this->active)
 		{
-			Task task = this->task_queue.pop();
-
-			switch (task.task_name)
-			{
-			case ONFRONTCONNECTED:
+			if (this->batch_size > 0)
 			{
-				this->processFrontConnected(&task);
-				break;
+				this->task_queue.pop_batch(tasks, this->batch_size);
+				this->processTaskBatch(tasks);
 			}
-
-			case ONFRONTDISCONNECTED:
+			else
 			{
-				this->processFrontDisconnected(&task);
-				break;
+				Task task = this->task_queue.pop();
+				this->dispatchTask(task);
 			}
+		}
+	}
+	catch (const TerminatedError&)
+	{
+	}
+};
 
-			case ONHEARTBEATWARNING:
+void MdApi::processTaskBatch(vector<Task> &tasks)
+{
+	gil_scoped_acquire acquire;
+	list ticks;
+	for (Task &task : tasks)
+	{
+		if (task.task_name == ONRTNDEPTHMARKETDATA)
+		{
+			this->takeConflatedTask(task);
+			if (!this->tick_handlers.empty())
 			{
-				this->processHeartBeatWarning(&task);
-				break;
+				this->routeTick(task);
+				continue;
 			}
-
-			case ONRSPUSERLOGIN:
+			ticks.append(this->convertRtnDepthMarketData(&task));
+			if (task.task_data)
 			{
-				this->processRspUserLogin(&task);
-				break;
+				TaskPool<CThostFtdcDepthMarketDataField>::release((CThostFtdcDepthMarketDataField*)task.task_data);
 			}
+			continue;
+		}
 
-			case ONRSPUSERLOGOUT:
-			{
-				this->processRspUserLogout(&task);
-				break;
-			}
+		//ѻ۵飬֤ص˳뵽˳һ
+		if (ticks.size() > 0)
+		{
+			this->onRtnDepthMarketDataBatch(ticks);
+			ticks = list();
+		}
+		this->dispatchTask(task);
+	}
 
-			case ONRSPQRYMULTICASTINSTRUMENT:
-			{
-				this->processRspQryMulticastInstrument(&task);
-				break;
-			}
+	if (ticks.size() > 0)
+	{
+		this->onRtnDepthMarketDataBatch(ticks);
+	}
+};
 
-			case ONRSPERROR:
-			{
-				this->processRspError(&task);
-				break;
-			}
+void MdApi::dispatchTask(Task &task)
+{
+	this->takeConflatedTask(task);
 
-			case ONRSPSUBMARKETDATA:
-			{
-				this->processRspSubMarketData(&task);
-				break;
-			}
+	//ע˰ԼַĻص鲻͵onRtnDepthMarketData
+	if (task.task_name == ONRTNDEPTHMARKETDATA && !this->tick_handlers.empty())
+	{
+		this->routeTick(task);
+		return;
+	}
 
-			case ONRSPUNSUBMARKETDATA:
-			{
-				this->processRspUnSubMarketData(&task);
-				break;
-			}
+	if (task.task_name == ONBAR)
+	{
+		this->processBar(&task);
+		return;
+	}
 
-			case ONRSPSUBFORQUOTERSP:
-			{
-				this->processRspSubForQuoteRsp(&task);
-				break;
-			}
+	switch (task.task_name)
+	{
+	case ONFRONTCONNECTED:
+	{
+		this->processFrontConnected(&task);
+		break;
+	}
 
-			case ONRSPUNSUBFORQUOTERSP:
-			{
-				this->processRspUnSubForQuoteRsp(&task);
-				break;
-			}
+	case ONFRONTDISCONNECTED:
+	{
+		this->processFrontDisconnected(&task);
+		break;
+	}
 
-			case ONRTNDEPTHMARKETDATA:
-			{
-				this->processRtnDepthMarketData(&task);
-				break;
-			}
+	case ONHEARTBEATWARNING:
+	{
+		this->processHeartBeatWarning(&task);
+		break;
+	}
 
-			case ONRTNFORQUOTERSP:
-			{
-				this->processRtnForQuoteRsp(&task);
-				break;
-			}
-			};
-		}
+	case ONRSPUSERLOGIN:
+	{
+		this->processRspUserLogin(&task);
+		break;
 	}
-	catch (const TerminatedError&)
+
+	case ONRSPUSERLOGOUT:
+	{
+		this->processRspUserLogout(&task);
+		break;
+	}
+
+	case ONRSPQRYMULTICASTINSTRUMENT:
 	{
+		this->processRspQryMulticastInstrument(&task);
+		break;
 	}
+
+	case ONRSPERROR:
+	{
+		this->processRspError(&task);
+		break;
+	}
+
+	case ONRSPSUBMARKETDATA:
+	{
+		this->processRspSubMarketData(&task);
+		break;
+	}
+
+	case ONRSPUNSUBMARKETDATA:
+	{
+		this->processRspUnSubMarketData(&task);
+		break;
+	}
+
+	case ONRSPSUBFORQUOTERSP:
+	{
+		this->processRspSubForQuoteRsp(&task);
+		break;
+	}
+
+	case ONRSPUNSUBFORQUOTERSP:
+	{
+		this->processRspUnSubForQuoteRsp(&task);
+		break;
+	}
+
+	case ONRTNDEPTHMARKETDATA:
+	{
+		this->processRtnDepthMarketData(&task);
+		break;
+	}
+
+	case ONRTNFORQUOTERSP:
+	{
+		this->processRtnForQuoteRsp(&task);
+		break;
+	}
+	};
 };
 
 void MdApi::processFrontConnected(Task *task)
@@ -361,15 +503,18 @@ void MdApi::processRspUserLogin(Task *task)
 		data["UserDRIdentityID"] = task_data->UserDRIdentityID;
 		data["LastLoginTime"] = toUtf(task_data->LastLoginTime);
 		data["ReserveInfo"] = toUtf(task_data->ReserveInfo);
-		delete task_data;
+		TaskPool<CThostFtdcRspUserLoginField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspUserLogin(data, error, task->task_id, task->task_last);
 };
@@ -383,15 +528,18 @@ void MdApi::processRspUserLogout(Task *task)
 		CThostFtdcUserLogoutField *task_data = (CThostFtdcUserLogoutField*)task->task_data;
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["UserID"] = toUtf(task_data->UserID);
-		delete task_data;
+		TaskPool<CThostFtdcUserLogoutField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspUserLogout(data, error, task->task_id, task->task_last);
 };
@@ -406,19 +554,22 @@ void MdApi::processRspQryMulticastInstrument(Task *task)
 		data["TopicID"] = task_data->TopicID;
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["InstrumentNo"] = task_data->InstrumentNo;
-		data["CodePrice"] = task_data->CodePrice;
+		data["CodePrice"] = validDouble(task_data->CodePrice, this->invalid_as_nan);
 		data["VolumeMultiple"] = task_data->VolumeMultiple;
-		data["PriceTick"] = task_data->PriceTick;
+		data["PriceTick"] = validDouble(task_data->PriceTick, this->invalid_as_nan);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcMulticastInstrumentField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryMulticastInstrument(data, error, task->task_id, task->task_last);
 };
@@ -432,7 +583,7 @@ void MdApi::processRspError(Task *task)
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspError(error, task->task_id, task->task_last);
 };
@@ -446,15 +597,18 @@ void MdApi::processRspSubMarketData(Task *task)
 		CThostFtdcSpecificInstrumentField *task_data = (CThostFtdcSpecificInstrumentField*)task->task_data;
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcSpecificInstrumentField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspSubMarketData(data, error, task->task_id, task->task_last);
 };
@@ -468,15 +622,18 @@ void MdApi::processRspUnSubMarketData(Task *task)
 		CThostFtdcSpecificInstrumentField *task_data = (CThostFtdcSpecificInstrumentField*)task->task_data;
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcSpecificInstrumentField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspUnSubMarketData(data, error, task->task_id, task->task_last);
 };
@@ -490,15 +647,18 @@ void MdApi::processRspSubForQuoteRsp(Task *task)
 		CThostFtdcSpecificInstrumentField *task_data = (CThostFtdcSpecificInstrumentField*)task->task_data;
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcSpecificInstrumentField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspSubForQuoteRsp(data, error, task->task_id, task->task_last);
 };
@@ -512,75 +672,167 @@ void MdApi::processRspUnSubForQuoteRsp(Task *task)
 		CThostFtdcSpecificInstrumentField *task_data = (CThostFtdcSpecificInstrumentField*)task->task_data;
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcSpecificInstrumentField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspUnSubForQuoteRsp(data, error, task->task_id, task->task_last);
 };
 
-void MdApi::processRtnDepthMarketData(Task *task)
+object MdApi::convertRtnDepthMarketData(Task *task)
 {
-	gil_scoped_acquire acquire;
+	if (this->data_mode == DATA_MODE_OBJECT && task->task_data)
+	{
+		CThostFtdcDepthMarketDataField *task_data = (CThostFtdcDepthMarketDataField*)task->task_data;
+		DepthMarketData item(*task_data);
+		item.invalid_as_nan = this->invalid_as_nan;
+		item.recv_ns = task->task_wall_time;
+		item.recv_mono_ns = task->task_time;
+		item.dispatch_mono_ns = steadyNs();
+		item.exchange_ns = exchangeEpochNs(parseDate(task_data->ActionDay), parseDate(task_data->TradingDay), parseTimeMs(task_data->UpdateTime, task_data->UpdateMillisec), task->task_wall_time);
+		return cast(item);
+	}
+	if (this->data_mode == DATA_MODE_BYTES && task->task_data)
+	{
+		return bytes((const char*)task->task_data, sizeof(CThostFtdcDepthMarketDataField));
+	}
 	dict data;
 	if (task->task_data)
 	{
 		CThostFtdcDepthMarketDataField *task_data = (CThostFtdcDepthMarketDataField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["reserve2"] = toUtf(task_data->reserve2);
-		data["LastPrice"] = task_data->LastPrice;
-		data["PreSettlementPrice"] = task_data->PreSettlementPrice;
-		data["PreClosePrice"] = task_data->PreClosePrice;
-		data["PreOpenInterest"] = task_data->PreOpenInterest;
-		data["OpenPrice"] = task_data->OpenPrice;
-		data["HighestPrice"] = task_data->HighestPrice;
-		data["LowestPrice"] = task_data->LowestPrice;
-		data["Volume"] = task_data->Volume;
-		data["Turnover"] = task_data->Turnover;
-		data["OpenInterest"] = task_data->OpenInterest;
-		data["ClosePrice"] = task_data->ClosePrice;
-		data["SettlementPrice"] = task_data->SettlementPrice;
-		data["UpperLimitPrice"] = task_data->UpperLimitPrice;
-		data["LowerLimitPrice"] = task_data->LowerLimitPrice;
-		data["PreDelta"] = task_data->PreDelta;
-		data["CurrDelta"] = task_data->CurrDelta;
-		data["UpdateTime"] = toUtf(task_data->UpdateTime);
-		data["UpdateMillisec"] = task_data->UpdateMillisec;
-		data["BidPrice1"] = task_data->BidPrice1;
-		data["BidVolume1"] = task_data->BidVolume1;
-		data["AskPrice1"] = task_data->AskPrice1;
-		data["AskVolume1"] = task_data->AskVolume1;
-		data["BidPrice2"] = task_data->BidPrice2;
-		data["BidVolume2"] = task_data->BidVolume2;
-		data["AskPrice2"] = task_data->AskPrice2;
-		data["AskVolume2"] = task_data->AskVolume2;
-		data["BidPrice3"] = task_data->BidPrice3;
-		data["BidVolume3"] = task_data->BidVolume3;
-		data["AskPrice3"] = task_data->AskPrice3;
-		data["AskVolume3"] = task_data->AskVolume3;
-		data["BidPrice4"] = task_data->BidPrice4;
-		data["BidVolume4"] = task_data->BidVolume4;
-		data["AskPrice4"] = task_data->AskPrice4;
-		data["AskVolume4"] = task_data->AskVolume4;
-		data["BidPrice5"] = task_data->BidPrice5;
-		data["BidVolume5"] = task_data->BidVolume5;
-		data["AskPrice5"] = task_data->AskPrice5;
-		data["AskVolume5"] = task_data->AskVolume5;
-		data["AveragePrice"] = task_data->AveragePrice;
-		data["ActionDay"] = toUtf(task_data->ActionDay);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["BandingUpperPrice"] = task_data->BandingUpperPrice;
-		data["BandingLowerPrice"] = task_data->BandingLowerPrice;
-		delete task_data;
+		const vector<int> *fields = this->field_selection.get(FIELDS_DEPTHMARKETDATA);
+		if (fields)
+		{
+			for (int field : *fields)
+			{
+				switch (field)
+				{
+				case 0: data["TradingDay"] = this->string_cache.get(task_data->TradingDay); break;
+				case 1: data["reserve1"] = toUtf(task_data->reserve1); break;
+				case 2: data["ExchangeID"] = this->string_cache.get(task_data->ExchangeID); break;
+				case 3: data["reserve2"] = toUtf(task_data->reserve2); break;
+				case 4: data["LastPrice"] = validDouble(task_data->LastPrice, this->invalid_as_nan); break;
+				case 5: data["PreSettlementPrice"] = validDouble(task_data->PreSettlementPrice, this->invalid_as_nan); break;
+				case 6: data["PreClosePrice"] = validDouble(task_data->PreClosePrice, this->invalid_as_nan); break;
+				case 7: data["PreOpenInterest"] = validDouble(task_data->PreOpenInterest, this->invalid_as_nan); break;
+				case 8: data["OpenPrice"] = validDouble(task_data->OpenPrice, this->invalid_as_nan); break;
+				case 9: data["HighestPrice"] = validDouble(task_data->HighestPrice, this->invalid_as_nan); break;
+				case 10: data["LowestPrice"] = validDouble(task_data->LowestPrice, this->invalid_as_nan); break;
+				case 11: data["Volume"] = task_data->Volume; break;
+				case 12: data["Turnover"] = validDouble(task_data->Turnover, this->invalid_as_nan); break;
+				case 13: data["OpenInterest"] = validDouble(task_data->OpenInterest, this->invalid_as_nan); break;
+				case 14: data["ClosePrice"] = validDouble(task_data->ClosePrice, this->invalid_as_nan); break;
+				case 15: data["SettlementPrice"] = validDouble(task_data->SettlementPrice, this->invalid_as_nan); break;
+				case 16: data["UpperLimitPrice"] = validDouble(task_data->UpperLimitPrice, this->invalid_as_nan); break;
+				case 17: data["LowerLimitPrice"] = validDouble(task_data->LowerLimitPrice, this->invalid_as_nan); break;
+				case 18: data["PreDelta"] = validDouble(task_data->PreDelta, this->invalid_as_nan); break;
+				case 19: data["CurrDelta"] = validDouble(task_data->CurrDelta, this->invalid_as_nan); break;
+				case 20: data["UpdateTime"] = toUtf(task_data->UpdateTime); break;
+				case 21: data["UpdateMillisec"] = task_data->UpdateMillisec; break;
+				case 22: data["BidPrice1"] = validDouble(task_data->BidPrice1, this->invalid_as_nan); break;
+				case 23: data["BidVolume1"] = task_data->BidVolume1; break;
+				case 24: data["AskPrice1"] = validDouble(task_data->AskPrice1, this->invalid_as_nan); break;
+				case 25: data["AskVolume1"] = task_data->AskVolume1; break;
+				case 26: data["BidPrice2"] = validDouble(task_data->BidPrice2, this->invalid_as_nan); break;
+				case 27: data["BidVolume2"] = task_data->BidVolume2; break;
+				case 28: data["AskPrice2"] = validDouble(task_data->AskPrice2, this->invalid_as_nan); break;
+				case 29: data["AskVolume2"] = task_data->AskVolume2; break;
+				case 30: data["BidPrice3"] = validDouble(task_data->BidPrice3, this->invalid_as_nan); break;
+				case 31: data["BidVolume3"] = task_data->BidVolume3; break;
+				case 32: data["AskPrice3"] = validDouble(task_data->AskPrice3, this->invalid_as_nan); break;
+				case 33: data["AskVolume3"] = task_data->AskVolume3; break;
+				case 34: data["BidPrice4"] = validDouble(task_data->BidPrice4, this->invalid_as_nan); break;
+				case 35: data["BidVolume4"] = task_data->BidVolume4; break;
+				case 36: data["AskPrice4"] = validDouble(task_data->AskPrice4, this->invalid_as_nan); break;
+				case 37: data["AskVolume4"] = task_data->AskVolume4; break;
+				case 38: data["BidPrice5"] = validDouble(task_data->BidPrice5, this->invalid_as_nan); break;
+				case 39: data["BidVolume5"] = task_data->BidVolume5; break;
+				case 40: data["AskPrice5"] = validDouble(task_data->AskPrice5, this->invalid_as_nan); break;
+				case 41: data["AskVolume5"] = task_data->AskVolume5; break;
+				case 42: data["AveragePrice"] = validDouble(task_data->AveragePrice, this->invalid_as_nan); break;
+				case 43: data["ActionDay"] = this->string_cache.get(task_data->ActionDay); break;
+				case 44: data["InstrumentID"] = this->string_cache.get(task_data->InstrumentID); break;
+				case 45: data["ExchangeInstID"] = this->string_cache.get(task_data->ExchangeInstID); break;
+				case 46: data["BandingUpperPrice"] = validDouble(task_data->BandingUpperPrice, this->invalid_as_nan); break;
+				case 47: data["BandingLowerPrice"] = validDouble(task_data->BandingLowerPrice, this->invalid_as_nan); break;
+				}
+			}
+		}
+		else
+		{
+			data["TradingDay"] = this->string_cache.get(task_data->TradingDay);
+			data["reserve1"] = toUtf(task_data->reserve1);
+			data["ExchangeID"] = this->string_cache.get(task_data->ExchangeID);
+			data["reserve2"] = toUtf(task_data->reserve2);
+			data["LastPrice"] = validDouble(task_data->LastPrice, this->invalid_as_nan);
+			data["PreSettlementPrice"] = validDouble(task_data->PreSettlementPrice, this->invalid_as_nan);
+			data["PreClosePrice"] = validDouble(task_data->PreClosePrice, this->invalid_as_nan);
+			data["PreOpenInterest"] = validDouble(task_data->PreOpenInterest, this->invalid_as_nan);
+			data["OpenPrice"] = validDouble(task_data->OpenPrice, this->invalid_as_nan);
+			data["HighestPrice"] = validDouble(task_data->HighestPrice, this->invalid_as_nan);
+			data["LowestPrice"] = validDouble(task_data->LowestPrice, this->invalid_as_nan);
+			data["Volume"] = task_data->Volume;
+			data["Turnover"] = validDouble(task_data->Turnover, this->invalid_as_nan);
+			data["OpenInterest"] = validDouble(task_data->OpenInterest, this->invalid_as_nan);
+			data["ClosePrice"] = validDouble(task_data->ClosePrice, this->invalid_as_nan);
+			data["SettlementPrice"] = validDouble(task_data->SettlementPrice, this->invalid_as_nan);
+			data["UpperLimitPrice"] = validDouble(task_data->UpperLimitPrice, this->invalid_as_nan);
+			data["LowerLimitPrice"] = validDouble(task_data->LowerLimitPrice, this->invalid_as_nan);
+			data["PreDelta"] = validDouble(task_data->PreDelta, this->invalid_as_nan);
+			data["CurrDelta"] = validDouble(task_data->CurrDelta, this->invalid_as_nan);
+			data["UpdateTime"] = toUtf(task_data->UpdateTime);
+			data["UpdateMillisec"] = task_data->UpdateMillisec;
+			data["BidPrice1"] = validDouble(task_data->BidPrice1, this->invalid_as_nan);
+			data["BidVolume1"] = task_data->BidVolume1;
+			data["AskPrice1"] = validDouble(task_data->AskPrice1, this->invalid_as_nan);
+			data["AskVolume1"] = task_data->AskVolume1;
+			data["BidPrice2"] = validDouble(task_data->BidPrice2, this->invalid_as_nan);
+			data["BidVolume2"] = task_data->BidVolume2;
+			data["AskPrice2"] = validDouble(task_data->AskPrice2, this->invalid_as_nan);
+			data["AskVolume2"] = task_data->AskVolume2;
+			data["BidPrice3"] = validDouble(task_data->BidPrice3, this->invalid_as_nan);
+			data["BidVolume3"] = task_data->BidVolume3;
+			data["AskPrice3"] = validDouble(task_data->AskPrice3, this->invalid_as_nan);
+			data["AskVolume3"] = task_data->AskVolume3;
+			data["BidPrice4"] = validDouble(task_data->BidPrice4, this->invalid_as_nan);
+			data["BidVolume4"] = task_data->BidVolume4;
+			data["AskPrice4"] = validDouble(task_data->AskPrice4, this->invalid_as_nan);
+			data["AskVolume4"] = task_data->AskVolume4;
+			data["BidPrice5"] = validDouble(task_data->BidPrice5, this->invalid_as_nan);
+			data["BidVolume5"] = task_data->BidVolume5;
+			data["AskPrice5"] = validDouble(task_data->AskPrice5, this->invalid_as_nan);
+			data["AskVolume5"] = task_data->AskVolume5;
+			data["AveragePrice"] = validDouble(task_data->AveragePrice, this->invalid_as_nan);
+			data["ActionDay"] = this->string_cache.get(task_data->ActionDay);
+			data["InstrumentID"] = this->string_cache.get(task_data->InstrumentID);
+			data["ExchangeInstID"] = this->string_cache.get(task_data->ExchangeInstID);
+			data["BandingUpperPrice"] = validDouble(task_data->BandingUpperPrice, this->invalid_as_nan);
+			data["BandingLowerPrice"] = validDouble(task_data->BandingLowerPrice, this->invalid_as_nan);
+		}
+		data["_exchange_ns"] = exchangeEpochNs(parseDate(task_data->ActionDay), parseDate(task_data->TradingDay), parseTimeMs(task_data->UpdateTime, task_data->UpdateMillisec), task->task_wall_time);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
+	return data;
+};
+
+void MdApi::processRtnDepthMarketData(Task *task)
+{
+	gil_scoped_acquire acquire;
+	object data = this->convertRtnDepthMarketData(task);
+	if (task->task_data)
+	{
+		TaskPool<CThostFtdcDepthMarketDataField>::release((CThostFtdcDepthMarketDataField*)task->task_data);
 	}
 	this->onRtnDepthMarketData(data);
 };
@@ -599,8 +851,11 @@ void MdApi::processRtnForQuoteRsp(Task *task)
 		data["ActionDay"] = toUtf(task_data->ActionDay);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcForQuoteRspField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnForQuoteRsp(data);
 };
 
@@ -622,6 +877,7 @@ string MdApi::getApiVersion()
 
 void MdApi::release()
 {
+	gil_scoped_release release;
 	this->api->Release();
 };
 
@@ -630,11 +886,13 @@ void MdApi::init()
 	this->active = true;
 	this->task_thread = thread(&MdApi::processTask, this);
 
+	gil_scoped_release release;
 	this->api->Init();
 };
 
 int MdApi::join()
 {
+	gil_scoped_release release;
 	int i = this->api->Join();
 	return i;
 };
@@ -647,11 +905,13 @@ string MdApi::getTradingDay()
 
 void MdApi::registerFront(string pszFrontAddress)
 {
+	gil_scoped_release release;
 	this->api->RegisterFront((char*)pszFrontAddress.c_str());
 };
 
 void MdApi::registerNameServer(string pszNsAddress)
 {
+	gil_scoped_release release;
 	this->api->RegisterNameServer((char*)pszNsAddress.c_str());
 };
 
@@ -662,11 +922,13 @@ void MdApi::registerFensUserInfo(const dict &req)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "UserID", myreq.UserID);
 	getChar(req, "LoginMode", &myreq.LoginMode);
+	gil_scoped_release release;
 	this->api->RegisterFensUserInfo(&myreq);
 };
 
 int MdApi::exit()
 {
+	gil_scoped_release release;
 	this->active = false;
 	this->task_queue.terminate();
 	this->task_thread.join();
@@ -681,34 +943,134 @@ int MdApi::subscribeMarketData(string instrumentID)
 {
 	char* buffer = (char*)instrumentID.c_str();
 	char* myreq[1] = { buffer };
+	gil_scoped_release release;
 	int i = this->api->SubscribeMarketData(myreq, 1);
 	return i;
 };
 
+int MdApi::subscribeMarketData(const list &instrumentIDs)
+{
+	vector<string> ids;
+	for (const handle &item : instrumentIDs)
+	{
+		ids.push_back(item.cast<string>());
+	}
+
+	gil_scoped_release release;
+	vector<char*> myreq;
+	for (string &id : ids)
+	{
+		myreq.push_back((char*)id.c_str());
+	}
+
+	int i = 0;
+	for (size_t start = 0; start < myreq.size() && i == 0; start += SUBSCRIBE_CHUNK_SIZE)
+	{
+		int count = (int)min(myreq.size() - start, (size_t)SUBSCRIBE_CHUNK_SIZE);
+		i = this->api->SubscribeMarketData(myreq.data() + start, count);
+	}
+	return i;
+};
+
 int MdApi::unSubscribeMarketData(string instrumentID)
 {
 	char* buffer = (char*)instrumentID.c_str();
 	char* myreq[1] = { buffer };
+	gil_scoped_release release;
 	int i = this->api->UnSubscribeMarketData(myreq, 1);
 	return i;
 };
 
+int MdApi::unSubscribeMarketData(const list &instrumentIDs)
+{
+	vector<string> ids;
+	for (const handle &item : instrumentIDs)
+	{
+		ids.push_back(item.cast<string>());
+	}
+
+	gil_scoped_release release;
+	vector<char*> myreq;
+	for (string &id : ids)
+	{
+		myreq.push_back((char*)id.c_str());
+	}
+
+	int i = 0;
+	for (size_t start = 0; start < myreq.size() && i == 0; start += SUBSCRIBE_CHUNK_SIZE)
+	{
+		int count = (int)min(myreq.size() - start, (size_t)SUBSCRIBE_CHUNK_SIZE);
+		i = this->api->UnSubscribeMarketData(myreq.data() + start, count);
+	}
+	return i;
+};
+
 int MdApi::subscribeForQuoteRsp(string instrumentID)
 {
 	char* buffer = (char*)instrumentID.c_str();
 	char* myreq[1] = { buffer };
+	gil_scoped_release release;
 	int i = this->api->SubscribeForQuoteRsp(myreq, 1);
 	return i;
 };
 
+int MdApi::subscribeForQuoteRsp(const list &instrumentIDs)
+{
+	vector<string> ids;
+	for (const handle &item : instrumentIDs)
+	{
+		ids.push_back(item.cast<string>());
+	}
+
+	gil_scoped_release release;
+	vector<char*> myreq;
+	for (string &id : ids)
+	{
+		myreq.push_back((char*)id.c_str());
+	}
+
+	int i = 0;
+	for (size_t start = 0; start < myreq.size() && i == 0; start += SUBSCRIBE_CHUNK_SIZE)
+	{
+		int count = (int)min(myreq.size() - start, (size_t)SUBSCRIBE_CHUNK_SIZE);
+		i = this->api->SubscribeForQuoteRsp(myreq.data() + start, count);
+	}
+	return i;
+};
+
 int MdApi::unSubscribeForQuoteRsp(string instrumentID)
 {
 	char* buffer = (char*)instrumentID.c_str();
 	char* myreq[1] = { buffer };
+	gil_scoped_release release;
 	int i = this->api->UnSubscribeForQuoteRsp(myreq, 1);
 	return i;
 };
 
+int MdApi::unSubscribeForQuoteRsp(const list &instrumentIDs)
+{
+	vector<string> ids;
+	for (const handle &item : instrumentIDs)
+	{
+		ids.push_back(item.cast<string>());
+	}
+
+	gil_scoped_release release;
+	vector<char*> myreq;
+	for (string &id : ids)
+	{
+		myreq.push_back((char*)id.c_str());
+	}
+
+	int i = 0;
+	for (size_t start = 0; start < myreq.size() && i == 0; start += SUBSCRIBE_CHUNK_SIZE)
+	{
+		int count = (int)min(myreq.size() - start, (size_t)SUBSCRIBE_CHUNK_SIZE);
+		i = this->api->UnSubscribeForQuoteRsp(myreq.data() + start, count);
+	}
+	return i;
+};
+
 int MdApi::reqUserLogin(const dict &req, int reqid)
 {
 	CThostFtdcReqUserLoginField myreq = CThostFtdcReqUserLoginField();
@@ -726,6 +1088,7 @@ int MdApi::reqUserLogin(const dict &req, int reqid)
 	getString(req, "LoginRemark", myreq.LoginRemark);
 	getInt(req, "ClientIPPort", &myreq.ClientIPPort);
 	getString(req, "ClientIPAddress", myreq.ClientIPAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLogin(&myreq, reqid);
 	return i;
 };
@@ -736,6 +1099,7 @@ int MdApi::reqUserLogout(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "UserID", myreq.UserID);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLogout(&myreq, reqid);
 	return i;
 };
@@ -747,10 +1111,535 @@ int MdApi::reqQryMulticastInstrument(const dict &req, int reqid)
 	getInt(req, "TopicID", &myreq.TopicID);
 	getString(req, "reserve1", myreq.reserve1);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryMulticastInstrument(&myreq, reqid);
 	return i;
 };
 
+///-------------------------------------------------------------------------------------
+///չ
+///-------------------------------------------------------------------------------------
+
+int MdApi::setRingQueue(int capacity)
+{
+	if (capacity < 0 || capacity > RING_QUEUE_MAX_CAPACITY)
+	{
+		throw value_error("capacity must be between 0 and " + to_string(RING_QUEUE_MAX_CAPACITY));
+	}
+	if (this->active)
+	{
+		return -1;
+	}
+	this->task_queue.set_ring(capacity);
+	return 0;
+};
+
+void MdApi::setInvalidAsNan(bool enabled)
+{
+	this->invalid_as_nan = enabled;
+};
+
+void MdApi::setFieldSelection(string structName, const list &fields)
+{
+	//ֶʱתΪţʱֻתѡеֶΣֶΪʱָתȫֶ
+	for (int n = 0; n < SELECTABLE_STRUCT_COUNT; n++)
+	{
+		const FieldTable &table = SELECTABLE_STRUCTS[n];
+		if (structName != table.name)
+		{
+			continue;
+		}
+
+		vector<int> selected;
+		for (const handle &item : fields)
+		{
+			string field = item.cast<string>();
+			int index = 0;
+			while (index < table.count && field != table.fields[index])
+			{
+				index++;
+			}
+			if (index == table.count)
+			{
+				throw value_error("unknown field: " + field);
+			}
+			selected.push_back(index);
+		}
+		this->field_selection.set(n, selected);
+		return;
+	}
+	throw value_error("unsupported struct: " + structName);
+};
+
+dict MdApi::getQueueStats()
+{
+	const QueueStats &stats = this->task_queue.stats();
+	uint64_t pushed = stats.pushed.load(memory_order_relaxed);
+	uint64_t popped = stats.popped.load(memory_order_relaxed);
+
+	//صͳƣֻ
+	dict enqueued;
+	dict dispatched;
+	dict dropped;
+	for (int n = 0; n < TASK_NAME_COUNT && n < QUEUE_STATS_TYPES; n++)
+	{
+		if (uint64_t count = stats.enqueued[n].load(memory_order_relaxed))
+			enqueued[TASK_NAMES[n]] = count;
+		if (uint64_t count = stats.dispatched[n].load(memory_order_relaxed))
+			dispatched[TASK_NAMES[n]] = count;
+		if (uint64_t count = stats.dropped[n].load(memory_order_relaxed))
+			dropped[TASK_NAMES[n]] = count;
+	}
+
+	//ͣʱֱͼ0ΪС1΢룬iΪ[2^(i-1), 2^i)΢
+	list dwell;
+	for (int n = 0; n < QUEUE_STATS_BUCKETS; n++)
+	{
+		dwell.append(stats.dwell[n].load(memory_order_relaxed));
+	}
+
+	dict data;
+	data["depth"] = pushed > popped ? pushed - popped : 0;
+	data["high_water"] = stats.high_water.load(memory_order_relaxed);
+	data["enqueued"] = enqueued;
+	data["dispatched"] = dispatched;
+	data["dropped"] = dropped;
+	data["dwell_us"] = dwell;
+	return data;
+};
+
+void MdApi::setDataMode(int mode)
+{
+	if (mode != DATA_MODE_DICT && mode != DATA_MODE_OBJECT && mode != DATA_MODE_BYTES)
+	{
+		throw value_error("mode must be DATA_MODE_DICT, DATA_MODE_OBJECT or DATA_MODE_BYTES");
+	}
+	this->data_mode = mode;
+};
+
+void MdApi::setTickBatchSize(int size)
+{
+	this->batch_size = size;
+};
+
+void MdApi::setConflation(bool enabled)
+{
+	this->conflation = enabled;
+};
+
+void MdApi::conflateRtnDepthMarketData(CThostFtdcDepthMarketDataField *pDepthMarketData, int64_t recv_time, int64_t recv_wall_time)
+{
+	//ͬһԼд͵ʱֻݣӣʱʹûصм¼ʱ
+	int slot = this->conflation_table.update(pDepthMarketData->InstrumentID, *pDepthMarketData, recv_time, recv_wall_time);
+	if (slot < 0)
+	{
+		this->task_queue.record_drop(ONRTNDEPTHMARKETDATA);
+		return;
+	}
+
+	Task task = Task();
+	task.task_name = ONRTNDEPTHMARKETDATA;
+	task.task_id = slot;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
+	task.task_conflated = true;
+	this->task_queue.push(task);
+};
+
+void MdApi::takeConflatedTask(Task &task)
+{
+	//ռλʱŴӺϲȡúԼ
+	if (task.task_conflated)
+	{
+		this->conflation_table.take(task);
+		task.task_conflated = false;
+	}
+};
+
+void MdApi::registerTickHandler(string instrumentId, object handler)
+{
+	this->tick_handlers.set(instrumentId, handler);
+};
+
+void MdApi::unregisterTickHandler(string instrumentId)
+{
+	this->tick_handlers.remove(instrumentId);
+};
+
+bool MdApi::storeRtnDepthMarketData(CThostFtdcDepthMarketDataField *pDepthMarketData, int64_t recv_time, int64_t recv_wall_time)
+{
+	//ڻص߳иѿ黷λȡGILʹûصм¼Ľʱ
+	SnapshotTable<CThostFtdcDepthMarketDataField> *latest = this->latest_ticks_ptr.load(memory_order_acquire);
+	if (latest)
+	{
+		latest->update(pDepthMarketData->InstrumentID, *pDepthMarketData, recv_time, recv_wall_time);
+	}
+
+	if (this->bar_enabled.load(memory_order_acquire))
+	{
+		//ʱֻһΣKߺϳ
+		int ms = parseTimeMs(pDepthMarketData->UpdateTime, pDepthMarketData->UpdateMillisec);
+		int adjust_ms = 0;
+		int session = ms < 0 ? -1 : this->sessions.find(pDepthMarketData->InstrumentID, ms, adjust_ms);
+		int64_t tick_ms = exchangeEpochNs(parseDate(pDepthMarketData->ActionDay), parseDate(pDepthMarketData->TradingDay), ms, recv_wall_time) / 1000000 + adjust_ms;
+
+		lock_guard<mutex> mlock(this->bar_mutex);
+		BarData bar;
+		for (BarBuilder &builder : this->bar_builders)
+		{
+			if (builder.update(*pDepthMarketData, session, tick_ms, bar))
+			{
+				this->task_queue.push(this->createBarTask(bar));
+			}
+		}
+	}
+
+	RecordBuffer<TickRecord> *buffer = this->tick_buffer_ptr.load(memory_order_acquire);
+	SnapshotMatrix *matrix = this->snapshot_ptr.load(memory_order_acquire);
+	if (!buffer && !matrix)
+	{
+		return this->tick_callback;
+	}
+
+	int symbol_id = this->symbols.get_or_add(pDepthMarketData->InstrumentID);
+	if (buffer)
+	{
+		TickRecord &record = buffer->next();
+		record.recv_ns = recv_wall_time;
+		record.symbol_id = symbol_id;
+		record.trading_day = parseDate(pDepthMarketData->TradingDay);
+		record.update_ms = parseTimeMs(pDepthMarketData->UpdateTime, pDepthMarketData->UpdateMillisec);
+		record.volume = pDepthMarketData->Volume;
+		record.bid_volume1 = pDepthMarketData->BidVolume1;
+		record.ask_volume1 = pDepthMarketData->AskVolume1;
+		record.last_price = validDouble(pDepthMarketData->LastPrice, this->invalid_as_nan);
+		record.turnover = validDouble(pDepthMarketData->Turnover, this->invalid_as_nan);
+		record.open_interest = validDouble(pDepthMarketData->OpenInterest, this->invalid_as_nan);
+		record.bid_price1 = validDouble(pDepthMarketData->BidPrice1, this->invalid_as_nan);
+		record.ask_price1 = validDouble(pDepthMarketData->AskPrice1, this->invalid_as_nan);
+		buffer->commit();
+	}
+
+	//ĺԼд
+	if (matrix && (size_t)symbol_id < matrix->rows)
+	{
+		size_t rows = matrix->rows;
+		bool invalid_as_nan = this->invalid_as_nan;
+		double *book = matrix->book.data() + symbol_id;
+#define SNAPSHOT_BOOK_LEVEL(level) \
+		book[((level - 1) * SNAPSHOT_BOOK_WIDTH + 0) * rows] = validDouble(pDepthMarketData->BidPrice##level, invalid_as_nan); \
+		book[((level - 1) * SNAPSHOT_BOOK_WIDTH + 1) * rows] = pDepthMarketData->BidVolume##level; \
+		book[((level - 1) * SNAPSHOT_BOOK_WIDTH + 2) * rows] = validDouble(pDepthMarketData->AskPrice##level, invalid_as_nan); \
+		book[((level - 1) * SNAPSHOT_BOOK_WIDTH + 3) * rows] = pDepthMarketData->AskVolume##level;
+		SNAPSHOT_BOOK_LEVEL(1)
+		SNAPSHOT_BOOK_LEVEL(2)
+		SNAPSHOT_BOOK_LEVEL(3)
+		SNAPSHOT_BOOK_LEVEL(4)
+		SNAPSHOT_BOOK_LEVEL(5)
+#undef SNAPSHOT_BOOK_LEVEL
+
+		double *columns = matrix->columns.data() + symbol_id;
+		columns[SNAPSHOT_LAST_PRICE * rows] = validDouble(pDepthMarketData->LastPrice, invalid_as_nan);
+		columns[SNAPSHOT_VOLUME * rows] = pDepthMarketData->Volume;
+		columns[SNAPSHOT_TURNOVER * rows] = validDouble(pDepthMarketData->Turnover, invalid_as_nan);
+		columns[SNAPSHOT_OPEN_INTEREST * rows] = validDouble(pDepthMarketData->OpenInterest, invalid_as_nan);
+		columns[SNAPSHOT_UPPER_LIMIT_PRICE * rows] = validDouble(pDepthMarketData->UpperLimitPrice, invalid_as_nan);
+		columns[SNAPSHOT_LOWER_LIMIT_PRICE * rows] = validDouble(pDepthMarketData->LowerLimitPrice, invalid_as_nan);
+		matrix->recv_ns[symbol_id] = recv_wall_time;
+	}
+
+	return this->tick_callback;
+};
+
+void MdApi::setTickCallback(bool enabled)
+{
+	this->tick_callback = enabled;
+};
+
+void MdApi::enableLatestTicks()
+{
+	//ֻһΣڻص߳м¼ÿԼ
+	if (!this->latest_ticks)
+	{
+		this->latest_ticks = make_shared<SnapshotTable<CThostFtdcDepthMarketDataField>>();
+		this->latest_ticks_ptr.store(this->latest_ticks.get(), memory_order_release);
+	}
+};
+
+object MdApi::getLatestTick(string instrumentId)
+{
+	//ǰģʽתδδյúԼʱNoneջϣʹö
+	CThostFtdcDepthMarketDataField tick;
+	Task task = Task();
+	task.task_name = ONRTNDEPTHMARKETDATA;
+	if (!this->latest_ticks || !this->latest_ticks->get(instrumentId, tick, task.task_time, task.task_wall_time))
+	{
+		return none();
+	}
+	task.task_data = &tick;
+	return this->convertRtnDepthMarketData(&task);
+};
+
+list MdApi::getLatestTicks(const list &instrumentIds)
+{
+	list data;
+	for (const handle &item : instrumentIds)
+	{
+		data.append(this->getLatestTick(item.cast<string>()));
+	}
+	return data;
+};
+
+object MdApi::enableTickBuffer(int capacity)
+{
+	//ֻһΣٴεʱͬһڴ飬ѴĻͬʱ׳ValueError
+	if (capacity <= 0)
+	{
+		throw value_error("capacity must be positive");
+	}
+	if (!this->tick_buffer)
+	{
+		this->tick_buffer = make_shared<RecordBuffer<TickRecord>>(capacity);
+		this->tick_buffer_ptr.store(this->tick_buffer.get(), memory_order_release);
+	}
+	else if (this->tick_buffer->capacity() != (size_t)capacity)
+	{
+		throw value_error("tick buffer already enabled with capacity " + to_string(this->tick_buffer->capacity()));
+	}
+
+	list names;
+	list formats;
+	list offsets;
+#define TICK_RECORD_FIELD(field, format) names.append(#field); formats.append(format); offsets.append(offsetof(TickRecord, field));
+	TICK_RECORD_FIELD(recv_ns, "i8")
+	TICK_RECORD_FIELD(symbol_id, "i4")
+	TICK_RECORD_FIELD(trading_day, "i4")
+	TICK_RECORD_FIELD(update_ms, "i4")
+	TICK_RECORD_FIELD(volume, "i4")
+	TICK_RECORD_FIELD(bid_volume1, "i4")
+	TICK_RECORD_FIELD(ask_volume1, "i4")
+	TICK_RECORD_FIELD(last_price, "f8")
+	TICK_RECORD_FIELD(turnover, "f8")
+	TICK_RECORD_FIELD(open_interest, "f8")
+	TICK_RECORD_FIELD(bid_price1, "f8")
+	TICK_RECORD_FIELD(ask_price1, "f8")
+#undef TICK_RECORD_FIELD
+
+	pybind11::dtype dt(names, formats, offsets, sizeof(TickRecord));
+	return makeRecordArray(this->tick_buffer, dt);
+};
+
+uint64_t MdApi::getTickCursor()
+{
+	RecordBuffer<TickRecord> *buffer = this->tick_buffer_ptr.load(memory_order_acquire);
+	if (!buffer)
+	{
+		return 0;
+	}
+	return buffer->cursor();
+};
+
+list MdApi::getTickSymbols()
+{
+	list data;
+	for (const string &name : this->symbols.names())
+	{
+		data.append(str(name));
+	}
+	return data;
+};
+
+dict MdApi::enableSnapshotMatrix(int maxInstruments)
+{
+	//ֻһΣٴεʱͬһڴ飬ԼѴľͬʱ׳ValueErrorкgetTickSymbolsбеһ
+	if (maxInstruments <= 0)
+	{
+		throw value_error("maxInstruments must be positive");
+	}
+	if (!this->snapshot)
+	{
+		this->snapshot = make_shared<SnapshotMatrix>(maxInstruments);
+		this->snapshot_ptr.store(this->snapshot.get(), memory_order_release);
+	}
+	else if (this->snapshot->rows != (size_t)maxInstruments)
+	{
+		throw value_error("snapshot matrix already enabled with maxInstruments " + to_string(this->snapshot->rows));
+	}
+
+	SnapshotMatrix *matrix = this->snapshot.get();
+	ssize_t rows = (ssize_t)matrix->rows;
+	ssize_t item = sizeof(double);
+	pybind11::dtype f8 = pybind11::dtype::of<double>();
+
+	dict data;
+	data["book"] = makeArrayView(this->snapshot, f8, matrix->book.data(),
+		{rows, SNAPSHOT_LEVELS, SNAPSHOT_BOOK_WIDTH},
+		{item, SNAPSHOT_BOOK_WIDTH * rows * item, rows * item});
+#define SNAPSHOT_COLUMN_VIEW(key, column) \
+	data[key] = makeArrayView(this->snapshot, f8, matrix->columns.data() + column * rows, {rows}, {item});
+	SNAPSHOT_COLUMN_VIEW("last_price", SNAPSHOT_LAST_PRICE)
+	SNAPSHOT_COLUMN_VIEW("volume", SNAPSHOT_VOLUME)
+	SNAPSHOT_COLUMN_VIEW("turnover", SNAPSHOT_TURNOVER)
+	SNAPSHOT_COLUMN_VIEW("open_interest", SNAPSHOT_OPEN_INTEREST)
+	SNAPSHOT_COLUMN_VIEW("upper_limit_price", SNAPSHOT_UPPER_LIMIT_PRICE)
+	SNAPSHOT_COLUMN_VIEW("lower_limit_price", SNAPSHOT_LOWER_LIMIT_PRICE)
+#undef SNAPSHOT_COLUMN_VIEW
+	data["recv_ns"] = makeArrayView(this->snapshot, pybind11::dtype::of<int64_t>(), matrix->recv_ns.data(),
+		{rows}, {(ssize_t)sizeof(int64_t)});
+	return data;
+};
+
+void MdApi::addBarBuilder(int barType, int barSize)
+{
+	if (barType != BAR_TYPE_TIME && barType != BAR_TYPE_VOLUME)
+	{
+		throw value_error("invalid barType");
+	}
+	if (barSize <= 0)
+	{
+		throw value_error("barSize must be positive");
+	}
+
+	//ֻͬһϳ
+	lock_guard<mutex> mlock(this->bar_mutex);
+	for (BarBuilder &builder : this->bar_builders)
+	{
+		if (builder.bar_type == barType && builder.bar_size == barSize)
+		{
+			return;
+		}
+	}
+	this->bar_builders.emplace_back(barType, barSize);
+	this->bar_enabled.store(true, memory_order_release);
+};
+
+void MdApi::clearBarBuilders()
+{
+	lock_guard<mutex> mlock(this->bar_mutex);
+	this->bar_builders.clear();
+	this->bar_enabled.store(false, memory_order_release);
+};
+
+void MdApi::setTradingSessions(string product, const list &sessions)
+{
+	//ʱΪ(ʼʱ, ʱ)ʽΪHH:MMHH:MM:SSproductΪַʱĬʱ
+	vector<pair<int, int>> ranges;
+	for (const handle &item : sessions)
+	{
+		sequence session = item.cast<sequence>();
+		if (session.size() != 2)
+		{
+			throw value_error("session must be a (start, end) pair");
+		}
+
+		int start = parseClockMs(session[0].cast<string>());
+		int end = parseClockMs(session[1].cast<string>());
+		if (start < 0 || end < 0 || start == end)
+		{
+			throw value_error("invalid session time");
+		}
+		ranges.emplace_back(start, end);
+	}
+	this->sessions.set(product, ranges);
+};
+
+void MdApi::flushBars()
+{
+	//δɵKΪ̺ͣͨ
+	//ص߳̿ڳKʱȴ߳ȡ񣬱ͷGILٻȡ
+	gil_scoped_release release;
+	vector<BarData> bars;
+	{
+		lock_guard<mutex> mlock(this->bar_mutex);
+		for (BarBuilder &builder : this->bar_builders)
+		{
+			builder.flush(bars);
+		}
+	}
+
+	//ζֻص߳д룬ﾭת
+	for (const BarData &bar : bars)
+	{
+		this->task_queue.post(this->createBarTask(bar));
+	}
+};
+
+Task MdApi::createBarTask(const BarData &bar)
+{
+	Task task = Task();
+	task.task_name = ONBAR;
+	task.task_time = steadyNs();
+	task.task_wall_time = wallNs();
+	BarData *task_data = TaskPool<BarData>::allocate();
+	*task_data = bar;
+	task.task_data = task_data;
+	return task;
+};
+
+void MdApi::processBar(Task *task)
+{
+	gil_scoped_acquire acquire;
+	dict data;
+	if (task->task_data)
+	{
+		BarData *task_data = (BarData*)task->task_data;
+		data["InstrumentID"] = this->string_cache.get(task_data->instrument_id);
+		data["TradingDay"] = this->string_cache.get(task_data->trading_day);
+		data["BarType"] = task_data->bar_type;
+		data["BarSize"] = task_data->bar_size;
+		data["StartNs"] = task_data->start_ns;
+		data["EndNs"] = task_data->end_ns;
+		data["OpenPrice"] = task_data->open_price;
+		data["HighPrice"] = task_data->high_price;
+		data["LowPrice"] = task_data->low_price;
+		data["ClosePrice"] = task_data->close_price;
+		data["Volume"] = task_data->volume;
+		data["Turnover"] = task_data->turnover;
+		data["OpenInterest"] = task_data->open_interest;
+		data["TickCount"] = task_data->tick_count;
+		TaskPool<BarData>::release(task_data);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
+	this->onBar(data);
+};
+
+void MdApi::routeTick(Task &task)
+{
+	CThostFtdcDepthMarketDataField *task_data = (CThostFtdcDepthMarketDataField*)task.task_data;
+	if (!task_data)
+	{
+		return;
+	}
+
+	//δעصĺԼֱӶȡGILҲpython
+	if (!this->tick_handlers.contains(task_data->InstrumentID))
+	{
+		this->task_queue.record_drop(ONRTNDEPTHMARKETDATA);
+		TaskPool<CThostFtdcDepthMarketDataField>::release(task_data);
+		return;
+	}
+
+	gil_scoped_acquire acquire;
+	object handler = this->tick_handlers.get(task_data->InstrumentID);
+	object data = this->convertRtnDepthMarketData(&task);
+	TaskPool<CThostFtdcDepthMarketDataField>::release(task_data);
+	if (handler.is_none())
+	{
+		return;
+	}
+
+	try
+	{
+		handler(data);
+	}
+	catch (const error_already_set &e)
+	{
+		cout << e.what() << endl;
+	}
+};
+
 
 ///-------------------------------------------------------------------------------------
 ///pybind11װ
@@ -893,7 +1782,7 @@ public:
 		}
 	};
 
-	void onRtnDepthMarketData(const dict &data) override
+	void onRtnDepthMarketData(const object &data) override
 	{
 		try
 		{
@@ -916,6 +1805,30 @@ public:
 			cout << e.what() << endl;
 		}
 	};
+
+	void onRtnDepthMarketDataBatch(const list &data) override
+	{
+		try
+		{
+			PYBIND11_OVERLOAD(void, MdApi, onRtnDepthMarketDataBatch, data);
+		}
+		catch (const error_already_set &e)
+		{
+			cout << e.what() << endl;
+		}
+	};
+
+	void onBar(const dict &data) override
+	{
+		try
+		{
+			PYBIND11_OVERLOAD(void, MdApi, onBar, data);
+		}
+		catch (const error_already_set &e)
+		{
+			cout << e.what() << endl;
+		}
+	};
 };
 
 
@@ -934,13 +1847,40 @@ PYBIND11_MODULE(ctpmd, m)
 		.def("registerNameServer", &MdApi::registerNameServer)
 		.def("registerFensUserInfo", &MdApi::registerFensUserInfo)
 		.def("exit", &MdApi::exit)
-		.def("subscribeMarketData", &MdApi::subscribeMarketData)
-		.def("unSubscribeMarketData", &MdApi::unSubscribeMarketData)
-		.def("subscribeForQuoteRsp", &MdApi::subscribeForQuoteRsp)
-		.def("unSubscribeForQuoteRsp", &MdApi::unSubscribeForQuoteRsp)
+		.def("subscribeMarketData", overload_cast<string>(&MdApi::subscribeMarketData))
+		.def("subscribeMarketData", overload_cast<const list &>(&MdApi::subscribeMarketData))
+		.def("unSubscribeMarketData", overload_cast<string>(&MdApi::unSubscribeMarketData))
+		.def("unSubscribeMarketData", overload_cast<const list &>(&MdApi::unSubscribeMarketData))
+		.def("subscribeForQuoteRsp", overload_cast<string>(&MdApi::subscribeForQuoteRsp))
+		.def("subscribeForQuoteRsp", overload_cast<const list &>(&MdApi::subscribeForQuoteRsp))
+		.def("unSubscribeForQuoteRsp", overload_cast<string>(&MdApi::unSubscribeForQuoteRsp))
+		.def("unSubscribeForQuoteRsp", overload_cast<const list &>(&MdApi::unSubscribeForQuoteRsp))
 		.def("reqUserLogin", &MdApi::reqUserLogin)
 		.def("reqUserLogout", &MdApi::reqUserLogout)
 		.def("reqQryMulticastInstrument", &MdApi::reqQryMulticastInstrument)
+		.def("setRingQueue", &MdApi::setRingQueue)
+		.def("setInvalidAsNan", &MdApi::setInvalidAsNan)
+		.def("setFieldSelection", &MdApi::setFieldSelection)
+		.def("getQueueStats", &MdApi::getQueueStats)
+		.def("setDataMode", &MdApi::setDataMode)
+		.def("setTickBatchSize", &MdApi::setTickBatchSize)
+		.def("setConflation", &MdApi::setConflation)
+		.def("registerTickHandler", &MdApi::registerTickHandler)
+		.def("unregisterTickHandler", &MdApi::unregisterTickHandler)
+		.def("enableTickBuffer", &MdApi::enableTickBuffer)
+		.def("getTickCursor", &MdApi::getTickCursor)
+		.def("getTickSymbols", &MdApi::getTickSymbols)
+		.def("enableSnapshotMatrix", &MdApi::enableSnapshotMatrix)
+		.def("addBarBuilder", &MdApi::addBarBuilder)
+		.def("clearBarBuilders", &MdApi::clearBarBuilders)
+		.def("setTradingSessions", &MdApi::setTradingSessions)
+		.def("flushBars", &MdApi::flushBars)
+		.def("onBar", &MdApi::onBar)
+		.def("setTickCallback", &MdApi::setTickCallback)
+		.def("enableLatestTicks", &MdApi::enableLatestTicks)
+		.def("getLatestTick", &MdApi::getLatestTick)
+		.def("getLatestTicks", &MdApi::getLatestTicks)
+		.def("onRtnDepthMarketDataBatch", &MdApi::onRtnDepthMarketDataBatch)
 
 		.def("onFrontConnected", &MdApi::onFrontConnected)
 		.def("onFrontDisconnected", &MdApi::onFrontDisconnected)
@@ -956,4 +1896,65 @@ PYBIND11_MODULE(ctpmd, m)
 		.def("onRtnDepthMarketData", &MdApi::onRtnDepthMarketData)
 		.def("onRtnForQuoteRsp", &MdApi::onRtnForQuoteRsp)
 		;
+
+	class_<DepthMarketData>(m, "DepthMarketData", module_local())
+		.def_property_readonly("TradingDay", [](const DepthMarketData &self) { return toUtf(self.data.TradingDay); })
+		.def_property_readonly("reserve1", [](const DepthMarketData &self) { return toUtf(self.data.reserve1); })
+		.def_property_readonly("ExchangeID", [](const DepthMarketData &self) { return toUtf(self.data.ExchangeID); })
+		.def_property_readonly("reserve2", [](const DepthMarketData &self) { return toUtf(self.data.reserve2); })
+		.def_property_readonly("LastPrice", [](const DepthMarketData &self) { return validDouble(self.data.LastPrice, self.invalid_as_nan); })
+		.def_property_readonly("PreSettlementPrice", [](const DepthMarketData &self) { return validDouble(self.data.PreSettlementPrice, self.invalid_as_nan); })
+		.def_property_readonly("PreClosePrice", [](const DepthMarketData &self) { return validDouble(self.data.PreClosePrice, self.invalid_as_nan); })
+		.def_property_readonly("PreOpenInterest", [](const DepthMarketData &self) { return validDouble(self.data.PreOpenInterest, self.invalid_as_nan); })
+		.def_property_readonly("OpenPrice", [](const DepthMarketData &self) { return validDouble(self.data.OpenPrice, self.invalid_as_nan); })
+		.def_property_readonly("HighestPrice", [](const DepthMarketData &self) { return validDouble(self.data.HighestPrice, self.invalid_as_nan); })
+		.def_property_readonly("LowestPrice", [](const DepthMarketData &self) { return validDouble(self.data.LowestPrice, self.invalid_as_nan); })
+		.def_property_readonly("Volume", [](const DepthMarketData &self) { return self.data.Volume; })
+		.def_property_readonly("Turnover", [](const DepthMarketData &self) { return validDouble(self.data.Turnover, self.invalid_as_nan); })
+		.def_property_readonly("OpenInterest", [](const DepthMarketData &self) { return validDouble(self.data.OpenInterest, self.invalid_as_nan); })
+		.def_property_readonly("ClosePrice", [](const DepthMarketData &self) { return validDouble(self.data.ClosePrice, self.invalid_as_nan); })
+		.def_property_readonly("SettlementPrice", [](const DepthMarketData &self) { return validDouble(self.data.SettlementPrice, self.invalid_as_nan); })
+		.def_property_readonly("UpperLimitPrice", [](const DepthMarketData &self) { return validDouble(self.data.UpperLimitPrice, self.invalid_as_nan); })
+		.def_property_readonly("LowerLimitPrice", [](const DepthMarketData &self) { return validDouble(self.data.LowerLimitPrice, self.invalid_as_nan); })
+		.def_property_readonly("PreDelta", [](const DepthMarketData &self) { return validDouble(self.data.PreDelta, self.invalid_as_nan); })
+		.def_property_readonly("CurrDelta", [](const DepthMarketData &self) { return validDouble(self.data.CurrDelta, self.invalid_as_nan); })
+		.def_property_readonly("UpdateTime", [](const DepthMarketData &self) { return toUtf(self.data.UpdateTime); })
+		.def_property_readonly("UpdateMillisec", [](const DepthMarketData &self) { return self.data.UpdateMillisec; })
+		.def_property_readonly("BidPrice1", [](const DepthMarketData &self) { return validDouble(self.data.BidPrice1, self.invalid_as_nan); })
+		.def_property_readonly("BidVolume1", [](const DepthMarketData &self) { return self.data.BidVolume1; })
+		.def_property_readonly("AskPrice1", [](const DepthMarketData &self) { return validDouble(self.data.AskPrice1, self.invalid_as_nan); })
+		.def_property_readonly("AskVolume1", [](const DepthMarketData &self) { return self.data.AskVolume1; })
+		.def_property_readonly("BidPrice2", [](const DepthMarketData &self) { return validDouble(self.data.BidPrice2, self.invalid_as_nan); })
+		.def_property_readonly("BidVolume2", [](const DepthMarketData &self) { return self.data.BidVolume2; })
+		.def_property_readonly("AskPrice2", [](const DepthMarketData &self) { return validDouble(self.data.AskPrice2, self.invalid_as_nan); })
+		.def_property_readonly("AskVolume2", [](const DepthMarketData &self) { return self.data.AskVolume2; })
+		.def_property_readonly("BidPrice3", [](const DepthMarketData &self) { return validDouble(self.data.BidPrice3, self.invalid_as_nan); })
+		.def_property_readonly("BidVolume3", [](const DepthMarketData &self) { return self.data.BidVolume3; })
+		.def_property_readonly("AskPrice3", [](const DepthMarketData &self) { return validDouble(self.data.AskPrice3, self.invalid_as_nan); })
+		.def_property_readonly("AskVolume3", [](const DepthMarketData &self) { return self.data.AskVolume3; })
+		.def_property_readonly("BidPrice4", [](const DepthMarketData &self) { return validDouble(self.data.BidPrice4, self.invalid_as_nan); })
+		.def_property_readonly("BidVolume4", [](const DepthMarketData &self) { return self.data.BidVolume4; })
+		.def_property_readonly("AskPrice4", [](const DepthMarketData &self) { return validDouble(self.data.AskPrice4, self.invalid_as_nan); })
+		.def_property_readonly("AskVolume4", [](const DepthMarketData &self) { return self.data.AskVolume4; })
+		.def_property_readonly("BidPrice5", [](const DepthMarketData &self) { return validDouble(self.data.BidPrice5, self.invalid_as_nan); })
+		.def_property_readonly("BidVolume5", [](const DepthMarketData &self) { return self.data.BidVolume5; })
+		.def_property_readonly("AskPrice5", [](const DepthMarketData &self) { return validDouble(self.data.AskPrice5, self.invalid_as_nan); })
+		.def_property_readonly("AskVolume5", [](const DepthMarketData &self) { return self.data.AskVolume5; })
+		.def_property_readonly("AveragePrice", [](const DepthMarketData &self) { return validDouble(self.data.AveragePrice, self.invalid_as_nan); })
+		.def_property_readonly("ActionDay", [](const DepthMarketData &self) { return toUtf(self.data.ActionDay); })
+		.def_property_readonly("InstrumentID", [](const DepthMarketData &self) { return toUtf(self.data.InstrumentID); })
+		.def_property_readonly("ExchangeInstID", [](const DepthMarketData &self) { return toUtf(self.data.ExchangeInstID); })
+		.def_property_readonly("BandingUpperPrice", [](const DepthMarketData &self) { return validDouble(self.data.BandingUpperPrice, self.invalid_as_nan); })
+		.def_property_readonly("BandingLowerPrice", [](const DepthMarketData &self) { return validDouble(self.data.BandingLowerPrice, self.invalid_as_nan); })
+		.def_readonly("_recv_ns", &DepthMarketData::recv_ns)
+		.def_readonly("_recv_mono_ns", &DepthMarketData::recv_mono_ns)
+		.def_readonly("_dispatch_mono_ns", &DepthMarketData::dispatch_mono_ns)
+		.def_readonly("_exchange_ns", &DepthMarketData::exchange_ns)
+		;
+
+	m.attr("DATA_MODE_DICT") = DATA_MODE_DICT;
+	m.attr("DATA_MODE_OBJECT") = DATA_MODE_OBJECT;
+	m.attr("DATA_MODE_BYTES") = DATA_MODE_BYTES;
+	m.attr("BAR_TYPE_TIME") = BAR_TYPE_TIME;
+	m.attr("BAR_TYPE_VOLUME") = BAR_TYPE_VOLUME;
 }
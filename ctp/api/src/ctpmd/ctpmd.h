@@ -23,6 +23,296 @@ using namespace pybind11;
 #define ONRSPUNSUBFORQUOTERSP 10
 #define ONRTNDEPTHMARKETDATA 11
 #define ONRTNFORQUOTERSP 12
+#define ONBAR 13
+
+#define TASK_NAME_COUNT 14
+
+static const char *TASK_NAMES[TASK_NAME_COUNT] = {
+	"onFrontConnected",
+	"onFrontDisconnected",
+	"onHeartBeatWarning",
+	"onRspUserLogin",
+	"onRspUserLogout",
+	"onRspQryMulticastInstrument",
+	"onRspError",
+	"onRspSubMarketData",
+	"onRspUnSubMarketData",
+	"onRspSubForQuoteRsp",
+	"onRspUnSubForQuoteRsp",
+	"onRtnDepthMarketData",
+	"onRtnForQuoteRsp",
+	"onBar",
+};
+
+#define SELECTABLE_STRUCT_COUNT 1
+#define FIELDS_DEPTHMARKETDATA 0
+
+static const char *const DEPTHMARKETDATA_FIELD_NAMES[] = {
+	"TradingDay",
+	"reserve1",
+	"ExchangeID",
+	"reserve2",
+	"LastPrice",
+	"PreSettlementPrice",
+	"PreClosePrice",
+	"PreOpenInterest",
+	"OpenPrice",
+	"HighestPrice",
+	"LowestPrice",
+	"Volume",
+	"Turnover",
+	"OpenInterest",
+	"ClosePrice",
+	"SettlementPrice",
+	"UpperLimitPrice",
+	"LowerLimitPrice",
+	"PreDelta",
+	"CurrDelta",
+	"UpdateTime",
+	"UpdateMillisec",
+	"BidPrice1",
+	"BidVolume1",
+	"AskPrice1",
+	"AskVolume1",
+	"BidPrice2",
+	"BidVolume2",
+	"AskPrice2",
+	"AskVolume2",
+	"BidPrice3",
+	"BidVolume3",
+	"AskPrice3",
+	"AskVolume3",
+	"BidPrice4",
+	"BidVolume4",
+	"AskPrice4",
+	"AskVolume4",
+	"BidPrice5",
+	"BidVolume5",
+	"AskPrice5",
+	"AskVolume5",
+	"AveragePrice",
+	"ActionDay",
+	"InstrumentID",
+	"ExchangeInstID",
+	"BandingUpperPrice",
+	"BandingLowerPrice",
+};
+
+static const FieldTable SELECTABLE_STRUCTS[SELECTABLE_STRUCT_COUNT] = {
+	{"DepthMarketData", DEPTHMARKETDATA_FIELD_NAMES, 48},
+};
+
+//DepthMarketDataCThostFtdcDepthMarketDataFieldĽṹ󣬳нṹ帱ֶڶȡʱתΪpython
+class DepthMarketData
+{
+public:
+	CThostFtdcDepthMarketDataField data;
+	bool invalid_as_nan = false;
+	int64_t recv_ns = 0;
+	int64_t recv_mono_ns = 0;
+	int64_t dispatch_mono_ns = 0;
+	int64_t exchange_ns = 0;
+
+	DepthMarketData(const CThostFtdcDepthMarketDataField &field) : data(field) {};
+};
+
+
+//黺ļ¼ֵֶֻΣԼԱűʾ
+struct TickRecord
+{
+	int64_t recv_ns;			//ʱ䣬ϵͳʱ
+	int32_t symbol_id;			//ԼţӦgetTickSymbolsбе
+	int32_t trading_day;		//գYYYYMMDD
+	int32_t update_ms;			//޸ʱ䣬պ
+	int32_t volume;				//
+	int32_t bid_volume1;		//һ
+	int32_t ask_volume1;		//һ
+	double last_price;			//¼
+	double turnover;			//ɽ
+	double open_interest;		//ֲ
+	double bid_price1;			//һ
+	double ask_price1;			//һ
+};
+
+
+//վֵ
+enum SnapshotColumn
+{
+	SNAPSHOT_LAST_PRICE,			//¼
+	SNAPSHOT_VOLUME,				//
+	SNAPSHOT_TURNOVER,			//ɽ
+	SNAPSHOT_OPEN_INTEREST,		//ֲ
+	SNAPSHOT_UPPER_LIMIT_PRICE,	//ͣ
+	SNAPSHOT_LOWER_LIMIT_PRICE,	//ͣ
+	SNAPSHOT_COLUMN_COUNT
+};
+
+#define SNAPSHOT_LEVELS 5			//̿ڵλ
+#define SNAPSHOT_BOOK_WIDTH 4		//ÿۡۡ
+
+
+//վкΪԼţݰţڶȫԼ
+struct SnapshotMatrix
+{
+	size_t rows;				//Լ
+	vector<double> book;		//嵵̿ڣ±Ϊ(λ*4+)*rows+к
+	vector<double> columns;		//ֵУ±Ϊ*rows+к
+	vector<int64_t> recv_ns;	//µĽʱ䣬ϵͳʱ
+
+	explicit SnapshotMatrix(size_t rows) :
+		rows(rows),
+		book(rows * SNAPSHOT_LEVELS * SNAPSHOT_BOOK_WIDTH, numeric_limits<double>::quiet_NaN()),
+		columns(rows * SNAPSHOT_COLUMN_COUNT, numeric_limits<double>::quiet_NaN()),
+		recv_ns(rows, 0)
+	{
+	}
+};
+
+
+#define BAR_TYPE_TIME 0				//ʱзKߣڵλΪ
+#define BAR_TYPE_VOLUME 1			//ɽзKߣڵλΪ
+
+
+//Kߣɻص߳еϳɣɽͳɽΪ
+struct BarData
+{
+	TThostFtdcInstrumentIDType instrument_id;	//Լ
+	TThostFtdcDateType trading_day;				//
+	int bar_type;			//K
+	int bar_size;			//K
+	int64_t start_ns;		//ʼʱ䣬epoch룬ʱKΪ㣬ɽKΪһʱ
+	int64_t end_ns;			//һʱ䣬epoch
+	double open_price;		//̼
+	double high_price;		//߼
+	double low_price;		//ͼ
+	double close_price;		//̼
+	int volume;				//ɽ
+	double turnover;		//ɽ
+	double open_interest;	//ֲ
+	int tick_count;			//
+};
+
+
+//ԼһK߹µĺϳ״̬
+struct BarState
+{
+	BarData bar;
+	bool active = false;		//ǷδɵK
+	int session = 0;			//ǰKĽʱ
+	int64_t bucket = 0;		//ʱKߵ
+	int last_volume = -1;		//һۼƳɽ-1Ϊδյ
+	double last_turnover = 0;	//һۼƳɽ
+};
+
+
+//KߺϳÿK߹һֻڳʱ
+class BarBuilder
+{
+private:
+	unordered_map<string, BarState> states;	//ÿԼĺϳ״̬
+
+public:
+	int bar_type;
+	int bar_size;
+
+	BarBuilder(int type, int size) : bar_type(type), bar_size(size) {}
+
+	//һKߣsessiontick_msΪʱκʱڵepoch룬Kʱдcompletedtrue
+	bool update(const CThostFtdcDepthMarketDataField &tick, int session, int64_t tick_ms, BarData &completed)
+	{
+		BarState &state = this->states[string(tick.InstrumentID, strnlen(tick.InstrumentID, sizeof(tick.InstrumentID)))];
+
+		//CTPĳɽͳɽΪۼֵȡһʵĲֵۼֵСʱΪ½¿ʼ
+		int volume = 0;
+		double turnover = 0;
+		if (state.last_volume >= 0)
+		{
+			volume = tick.Volume - state.last_volume;
+			turnover = tick.Turnover - state.last_turnover;
+			if (volume < 0)
+			{
+				volume = tick.Volume;
+				turnover = tick.Turnover;
+			}
+		}
+		state.last_volume = tick.Volume;
+		state.last_turnover = tick.Turnover;
+
+		//κνʱεֻۼֵ
+		if (session < 0 || tick.LastPrice <= 0 || tick.LastPrice >= numeric_limits<double>::max())
+		{
+			return false;
+		}
+
+		//ʱK߰ʱз֣ʱλձ仯ʱKҲ
+		bool done = false;
+		BarData &bar = state.bar;
+		int64_t bucket = (tick_ms + CHINA_UTC_OFFSET_MS) / (this->bar_size * 1000LL);
+		if (state.active
+			&& ((this->bar_type == BAR_TYPE_TIME && bucket != state.bucket)
+				|| session != state.session
+				|| strncmp(bar.trading_day, tick.TradingDay, sizeof(bar.trading_day)) != 0))
+		{
+			completed = bar;
+			state.active = false;
+			done = true;
+		}
+
+		if (!state.active)
+		{
+			memcpy(bar.instrument_id, tick.InstrumentID, sizeof(bar.instrument_id));
+			memcpy(bar.trading_day, tick.TradingDay, sizeof(bar.trading_day));
+			bar.bar_type = this->bar_type;
+			bar.bar_size = this->bar_size;
+			if (this->bar_type == BAR_TYPE_TIME)
+			{
+				bar.start_ns = (bucket * this->bar_size * 1000 - CHINA_UTC_OFFSET_MS) * 1000000;
+			}
+			else
+			{
+				bar.start_ns = tick_ms * 1000000;
+			}
+			bar.open_price = bar.high_price = bar.low_price = tick.LastPrice;
+			bar.volume = 0;
+			bar.turnover = 0;
+			bar.tick_count = 0;
+			state.session = session;
+			state.bucket = bucket;
+			state.active = true;
+		}
+
+		bar.end_ns = tick_ms * 1000000;
+		bar.high_price = max(bar.high_price, tick.LastPrice);
+		bar.low_price = min(bar.low_price, tick.LastPrice);
+		bar.close_price = tick.LastPrice;
+		bar.volume += volume;
+		bar.turnover += turnover;
+		bar.open_interest = tick.OpenInterest;
+		bar.tick_count += 1;
+
+		//ɽKڴﵽںɣһһK
+		if (!done && this->bar_type == BAR_TYPE_VOLUME && bar.volume >= this->bar_size)
+		{
+			completed = bar;
+			state.active = false;
+			done = true;
+		}
+		return done;
+	}
+
+	//ȡȫδɵK
+	void flush(vector<BarData> &bars)
+	{
+		for (auto &item : this->states)
+		{
+			if (item.second.active)
+			{
+				bars.push_back(item.second.bar);
+				item.second.active = false;
+			}
+		}
+	}
+};
 
 
 ///-------------------------------------------------------------------------------------
@@ -37,6 +327,26 @@ private:
 	thread task_thread;					//ָ߳루pythonݣ
 	TaskQueue task_queue;			//
 	bool active = false;				//״̬
+	int data_mode = DATA_MODE_DICT;		//ģʽ
+	int batch_size = 0;					//͵0Ϊ
+	StringCache string_cache;			//ͻֶַεפ
+	bool invalid_as_nan = false;		//ǷЧļֵתΪNaN
+	FieldSelection field_selection;		//ṹõҪתֶ
+	bool conflation = false;			//Ƿϲ
+	ConflationTable<CThostFtdcDepthMarketDataField> conflation_table;	//ϲ
+	HandlerTable tick_handlers;			//Լַص
+	SymbolTable symbols;				//Լű
+	shared_ptr<SnapshotTable<CThostFtdcDepthMarketDataField>> latest_ticks;				//ÿԼ
+	atomic<SnapshotTable<CThostFtdcDepthMarketDataField>*> latest_ticks_ptr{nullptr};	//ص̶߳ȡָ
+	bool tick_callback = true;			//Ƿ͵python
+	shared_ptr<RecordBuffer<TickRecord>> tick_buffer;				//黷λ
+	atomic<RecordBuffer<TickRecord>*> tick_buffer_ptr{nullptr};	//ص̶߳ȡ黷λָ
+	shared_ptr<SnapshotMatrix> snapshot;							//վ
+	atomic<SnapshotMatrix*> snapshot_ptr{nullptr};				//ص̶߳ȡվָ
+	mutex bar_mutex;					//Kߺϳ
+	vector<BarBuilder> bar_builders;	//Kߺϳÿֹһ
+	SessionCalendar sessions;			//ƷõĽʱ
+	atomic<bool> bar_enabled{false};	//ǷKߺϳΪfalseʱص̲߳ȡ
 
 public:
 	MdApi()
@@ -110,6 +420,8 @@ public:
 
 	void processRspUnSubForQuoteRsp(Task *task);
 
+	object convertRtnDepthMarketData(Task *task);
+
 	void processRtnDepthMarketData(Task *task);
 
 	void processRtnForQuoteRsp(Task *task);
@@ -146,7 +458,7 @@ public:
 
 	virtual void onRspUnSubForQuoteRsp(const dict &data, const dict &error, int reqid, bool last) {};
 
-	virtual void onRtnDepthMarketData(const dict &data) {};
+	virtual void onRtnDepthMarketData(const object &data) {};
 
 	virtual void onRtnForQuoteRsp(const dict &data) {};
 
@@ -176,15 +488,89 @@ public:
 
 	int subscribeMarketData(string instrumentID);
 
+	int subscribeMarketData(const list &instrumentIDs);
+
 	int unSubscribeMarketData(string instrumentID);
 
+	int unSubscribeMarketData(const list &instrumentIDs);
+
 	int subscribeForQuoteRsp(string instrumentID);
 
+	int subscribeForQuoteRsp(const list &instrumentIDs);
+
 	int unSubscribeForQuoteRsp(string instrumentID);
 
+	int unSubscribeForQuoteRsp(const list &instrumentIDs);
+
 	int reqUserLogin(const dict &req, int reqid);
 
 	int reqUserLogout(const dict &req, int reqid);
 
 	int reqQryMulticastInstrument(const dict &req, int reqid);
+
+	//-------------------------------------------------------------------------------------
+	//չ
+	//-------------------------------------------------------------------------------------
+
+	int setRingQueue(int capacity);
+
+	void setInvalidAsNan(bool enabled);
+
+	void setFieldSelection(string structName, const list &fields);
+
+	dict getQueueStats();
+
+	void setDataMode(int mode);
+
+	void setTickBatchSize(int size);
+
+	void setConflation(bool enabled);
+
+	void conflateRtnDepthMarketData(CThostFtdcDepthMarketDataField *pDepthMarketData, int64_t recv_time, int64_t recv_wall_time);
+
+	void takeConflatedTask(Task &task);
+
+	void registerTickHandler(string instrumentId, object handler);
+
+	void unregisterTickHandler(string instrumentId);
+
+	void routeTick(Task &task);
+
+	bool storeRtnDepthMarketData(CThostFtdcDepthMarketDataField *pDepthMarketData, int64_t recv_time, int64_t recv_wall_time);
+
+	void setTickCallback(bool enabled);
+
+	void enableLatestTicks();
+
+	object getLatestTick(string instrumentId);
+
+	list getLatestTicks(const list &instrumentIds);
+
+	object enableTickBuffer(int capacity);
+
+	uint64_t getTickCursor();
+
+	list getTickSymbols();
+
+	dict enableSnapshotMatrix(int maxInstruments);
+
+	void addBarBuilder(int barType, int barSize);
+
+	void clearBarBuilders();
+
+	void setTradingSessions(string product, const list &sessions);
+
+	void flushBars();
+
+	Task createBarTask(const BarData &bar);
+
+	void processBar(Task *task);
+
+	virtual void onBar(const dict &data) {};
+
+	void processTaskBatch(vector<Task> &tasks);
+
+	void dispatchTask(Task &task);
+
+	virtual void onRtnDepthMarketDataBatch(const list &data) {};
 };
@@ -8,40 +8,60 @@
 
 void TdApi::OnFrontConnected()
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONFRONTCONNECTED;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	this->task_queue.push(task);
 };
 
 void TdApi::OnFrontDisconnected(int nReason)
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONFRONTDISCONNECTED;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	task.task_id = nReason;
 	this->task_queue.push(task);
 };
 
 void TdApi::OnHeartBeatWarning(int nTimeLapse)
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONHEARTBEATWARNING;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	task.task_id = nTimeLapse;
 	this->task_queue.push(task);
 };
 
 void TdApi::OnRspAuthenticate(CThostFtdcRspAuthenticateField *pRspAuthenticateField, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPAUTHENTICATE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspAuthenticateField)
 	{
-		CThostFtdcRspAuthenticateField *task_data = new CThostFtdcRspAuthenticateField();
+		CThostFtdcRspAuthenticateField *task_data = TaskPool<CThostFtdcRspAuthenticateField>::allocate();
 		*task_data = *pRspAuthenticateField;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -52,17 +72,27 @@ void TdApi::OnRspAuthenticate(CThostFtdcRspAuthenticateField *pRspAuthenticateFi
 
 void TdApi::OnRspUserLogin(CThostFtdcRspUserLoginField *pRspUserLogin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
+	if (pRspUserLogin && !this->storeRspUserLogin(pRspUserLogin, pRspInfo, nRequestID, bIsLast, recv_time, recv_wall_time))
+	{
+		return;
+	}
+
 	Task task = Task();
 	task.task_name = ONRSPUSERLOGIN;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspUserLogin)
 	{
-		CThostFtdcRspUserLoginField *task_data = new CThostFtdcRspUserLoginField();
+		CThostFtdcRspUserLoginField *task_data = TaskPool<CThostFtdcRspUserLoginField>::allocate();
 		*task_data = *pRspUserLogin;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -73,17 +103,22 @@ void TdApi::OnRspUserLogin(CThostFtdcRspUserLoginField *pRspUserLogin, CThostFtd
 
 void TdApi::OnRspUserLogout(CThostFtdcUserLogoutField *pUserLogout, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPUSERLOGOUT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pUserLogout)
 	{
-		CThostFtdcUserLogoutField *task_data = new CThostFtdcUserLogoutField();
+		CThostFtdcUserLogoutField *task_data = TaskPool<CThostFtdcUserLogoutField>::allocate();
 		*task_data = *pUserLogout;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -94,17 +129,22 @@ void TdApi::OnRspUserLogout(CThostFtdcUserLogoutField *pUserLogout, CThostFtdcRs
 
 void TdApi::OnRspUserPasswordUpdate(CThostFtdcUserPasswordUpdateField *pUserPasswordUpdate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPUSERPASSWORDUPDATE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pUserPasswordUpdate)
 	{
-		CThostFtdcUserPasswordUpdateField *task_data = new CThostFtdcUserPasswordUpdateField();
+		CThostFtdcUserPasswordUpdateField *task_data = TaskPool<CThostFtdcUserPasswordUpdateField>::allocate();
 		*task_data = *pUserPasswordUpdate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -115,17 +155,22 @@ void TdApi::OnRspUserPasswordUpdate(CThostFtdcUserPasswordUpdateField *pUserPass
 
 void TdApi::OnRspTradingAccountPasswordUpdate(CThostFtdcTradingAccountPasswordUpdateField *pTradingAccountPasswordUpdate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPTRADINGACCOUNTPASSWORDUPDATE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pTradingAccountPasswordUpdate)
 	{
-		CThostFtdcTradingAccountPasswordUpdateField *task_data = new CThostFtdcTradingAccountPasswordUpdateField();
+		CThostFtdcTradingAccountPasswordUpdateField *task_data = TaskPool<CThostFtdcTradingAccountPasswordUpdateField>::allocate();
 		*task_data = *pTradingAccountPasswordUpdate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -136,17 +181,22 @@ void TdApi::OnRspTradingAccountPasswordUpdate(CThostFtdcTradingAccountPasswordUp
 
 void TdApi::OnRspUserAuthMethod(CThostFtdcRspUserAuthMethodField *pRspUserAuthMethod, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPUSERAUTHMETHOD;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspUserAuthMethod)
 	{
-		CThostFtdcRspUserAuthMethodField *task_data = new CThostFtdcRspUserAuthMethodField();
+		CThostFtdcRspUserAuthMethodField *task_data = TaskPool<CThostFtdcRspUserAuthMethodField>::allocate();
 		*task_data = *pRspUserAuthMethod;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -157,17 +207,22 @@ void TdApi::OnRspUserAuthMethod(CThostFtdcRspUserAuthMethodField *pRspUserAuthMe
 
 void TdApi::OnRspGenUserCaptcha(CThostFtdcRspGenUserCaptchaField *pRspGenUserCaptcha, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPGENUSERCAPTCHA;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspGenUserCaptcha)
 	{
-		CThostFtdcRspGenUserCaptchaField *task_data = new CThostFtdcRspGenUserCaptchaField();
+		CThostFtdcRspGenUserCaptchaField *task_data = TaskPool<CThostFtdcRspGenUserCaptchaField>::allocate();
 		*task_data = *pRspGenUserCaptcha;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -178,17 +233,22 @@ void TdApi::OnRspGenUserCaptcha(CThostFtdcRspGenUserCaptchaField *pRspGenUserCap
 
 void TdApi::OnRspGenUserText(CThostFtdcRspGenUserTextField *pRspGenUserText, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPGENUSERTEXT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspGenUserText)
 	{
-		CThostFtdcRspGenUserTextField *task_data = new CThostFtdcRspGenUserTextField();
+		CThostFtdcRspGenUserTextField *task_data = TaskPool<CThostFtdcRspGenUserTextField>::allocate();
 		*task_data = *pRspGenUserText;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -199,17 +259,27 @@ void TdApi::OnRspGenUserText(CThostFtdcRspGenUserTextField *pRspGenUserText, CTh
 
 void TdApi::OnRspOrderInsert(CThostFtdcInputOrderField *pInputOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
+	if (pInputOrder && !this->storeRspOrderInsert(pInputOrder, pRspInfo, nRequestID, bIsLast, recv_time, recv_wall_time))
+	{
+		return;
+	}
+
 	Task task = Task();
 	task.task_name = ONRSPORDERINSERT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputOrder)
 	{
-		CThostFtdcInputOrderField *task_data = new CThostFtdcInputOrderField();
+		CThostFtdcInputOrderField *task_data = TaskPool<CThostFtdcInputOrderField>::allocate();
 		*task_data = *pInputOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -220,17 +290,22 @@ void TdApi::OnRspOrderInsert(CThostFtdcInputOrderField *pInputOrder, CThostFtdcR
 
 void TdApi::OnRspParkedOrderInsert(CThostFtdcParkedOrderField *pParkedOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPPARKEDORDERINSERT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pParkedOrder)
 	{
-		CThostFtdcParkedOrderField *task_data = new CThostFtdcParkedOrderField();
+		CThostFtdcParkedOrderField *task_data = TaskPool<CThostFtdcParkedOrderField>::allocate();
 		*task_data = *pParkedOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -241,17 +316,22 @@ void TdApi::OnRspParkedOrderInsert(CThostFtdcParkedOrderField *pParkedOrder, CTh
 
 void TdApi::OnRspParkedOrderAction(CThostFtdcParkedOrderActionField *pParkedOrderAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPPARKEDORDERACTION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pParkedOrderAction)
 	{
-		CThostFtdcParkedOrderActionField *task_data = new CThostFtdcParkedOrderActionField();
+		CThostFtdcParkedOrderActionField *task_data = TaskPool<CThostFtdcParkedOrderActionField>::allocate();
 		*task_data = *pParkedOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -262,17 +342,22 @@ void TdApi::OnRspParkedOrderAction(CThostFtdcParkedOrderActionField *pParkedOrde
 
 void TdApi::OnRspOrderAction(CThostFtdcInputOrderActionField *pInputOrderAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPORDERACTION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputOrderAction)
 	{
-		CThostFtdcInputOrderActionField *task_data = new CThostFtdcInputOrderActionField();
+		CThostFtdcInputOrderActionField *task_data = TaskPool<CThostFtdcInputOrderActionField>::allocate();
 		*task_data = *pInputOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -283,17 +368,22 @@ void TdApi::OnRspOrderAction(CThostFtdcInputOrderActionField *pInputOrderAction,
 
 void TdApi::OnRspQryMaxOrderVolume(CThostFtdcQryMaxOrderVolumeField *pQryMaxOrderVolume, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYMAXORDERVOLUME;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pQryMaxOrderVolume)
 	{
-		CThostFtdcQryMaxOrderVolumeField *task_data = new CThostFtdcQryMaxOrderVolumeField();
+		CThostFtdcQryMaxOrderVolumeField *task_data = TaskPool<CThostFtdcQryMaxOrderVolumeField>::allocate();
 		*task_data = *pQryMaxOrderVolume;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -304,17 +394,22 @@ void TdApi::OnRspQryMaxOrderVolume(CThostFtdcQryMaxOrderVolumeField *pQryMaxOrde
 
 void TdApi::OnRspSettlementInfoConfirm(CThostFtdcSettlementInfoConfirmField *pSettlementInfoConfirm, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPSETTLEMENTINFOCONFIRM;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSettlementInfoConfirm)
 	{
-		CThostFtdcSettlementInfoConfirmField *task_data = new CThostFtdcSettlementInfoConfirmField();
+		CThostFtdcSettlementInfoConfirmField *task_data = TaskPool<CThostFtdcSettlementInfoConfirmField>::allocate();
 		*task_data = *pSettlementInfoConfirm;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -325,17 +420,22 @@ void TdApi::OnRspSettlementInfoConfirm(CThostFtdcSettlementInfoConfirmField *pSe
 
 void TdApi::OnRspRemoveParkedOrder(CThostFtdcRemoveParkedOrderField *pRemoveParkedOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPREMOVEPARKEDORDER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRemoveParkedOrder)
 	{
-		CThostFtdcRemoveParkedOrderField *task_data = new CThostFtdcRemoveParkedOrderField();
+		CThostFtdcRemoveParkedOrderField *task_data = TaskPool<CThostFtdcRemoveParkedOrderField>::allocate();
 		*task_data = *pRemoveParkedOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -346,17 +446,22 @@ void TdApi::OnRspRemoveParkedOrder(CThostFtdcRemoveParkedOrderField *pRemovePark
 
 void TdApi::OnRspRemoveParkedOrderAction(CThostFtdcRemoveParkedOrderActionField *pRemoveParkedOrderAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPREMOVEPARKEDORDERACTION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRemoveParkedOrderAction)
 	{
-		CThostFtdcRemoveParkedOrderActionField *task_data = new CThostFtdcRemoveParkedOrderActionField();
+		CThostFtdcRemoveParkedOrderActionField *task_data = TaskPool<CThostFtdcRemoveParkedOrderActionField>::allocate();
 		*task_data = *pRemoveParkedOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -367,17 +472,22 @@ void TdApi::OnRspRemoveParkedOrderAction(CThostFtdcRemoveParkedOrderActionField
 
 void TdApi::OnRspExecOrderInsert(CThostFtdcInputExecOrderField *pInputExecOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPEXECORDERINSERT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputExecOrder)
 	{
-		CThostFtdcInputExecOrderField *task_data = new CThostFtdcInputExecOrderField();
+		CThostFtdcInputExecOrderField *task_data = TaskPool<CThostFtdcInputExecOrderField>::allocate();
 		*task_data = *pInputExecOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -388,17 +498,22 @@ void TdApi::OnRspExecOrderInsert(CThostFtdcInputExecOrderField *pInputExecOrder,
 
 void TdApi::OnRspExecOrderAction(CThostFtdcInputExecOrderActionField *pInputExecOrderAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPEXECORDERACTION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputExecOrderAction)
 	{
-		CThostFtdcInputExecOrderActionField *task_data = new CThostFtdcInputExecOrderActionField();
+		CThostFtdcInputExecOrderActionField *task_data = TaskPool<CThostFtdcInputExecOrderActionField>::allocate();
 		*task_data = *pInputExecOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -409,17 +524,22 @@ void TdApi::OnRspExecOrderAction(CThostFtdcInputExecOrderActionField *pInputExec
 
 void TdApi::OnRspForQuoteInsert(CThostFtdcInputForQuoteField *pInputForQuote, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPFORQUOTEINSERT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputForQuote)
 	{
-		CThostFtdcInputForQuoteField *task_data = new CThostFtdcInputForQuoteField();
+		CThostFtdcInputForQuoteField *task_data = TaskPool<CThostFtdcInputForQuoteField>::allocate();
 		*task_data = *pInputForQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -430,17 +550,22 @@ void TdApi::OnRspForQuoteInsert(CThostFtdcInputForQuoteField *pInputForQuote, CT
 
 void TdApi::OnRspQuoteInsert(CThostFtdcInputQuoteField *pInputQuote, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQUOTEINSERT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputQuote)
 	{
-		CThostFtdcInputQuoteField *task_data = new CThostFtdcInputQuoteField();
+		CThostFtdcInputQuoteField *task_data = TaskPool<CThostFtdcInputQuoteField>::allocate();
 		*task_data = *pInputQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -451,17 +576,22 @@ void TdApi::OnRspQuoteInsert(CThostFtdcInputQuoteField *pInputQuote, CThostFtdcR
 
 void TdApi::OnRspQuoteAction(CThostFtdcInputQuoteActionField *pInputQuoteAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQUOTEACTION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputQuoteAction)
 	{
-		CThostFtdcInputQuoteActionField *task_data = new CThostFtdcInputQuoteActionField();
+		CThostFtdcInputQuoteActionField *task_data = TaskPool<CThostFtdcInputQuoteActionField>::allocate();
 		*task_data = *pInputQuoteAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -472,17 +602,22 @@ void TdApi::OnRspQuoteAction(CThostFtdcInputQuoteActionField *pInputQuoteAction,
 
 void TdApi::OnRspBatchOrderAction(CThostFtdcInputBatchOrderActionField *pInputBatchOrderAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPBATCHORDERACTION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputBatchOrderAction)
 	{
-		CThostFtdcInputBatchOrderActionField *task_data = new CThostFtdcInputBatchOrderActionField();
+		CThostFtdcInputBatchOrderActionField *task_data = TaskPool<CThostFtdcInputBatchOrderActionField>::allocate();
 		*task_data = *pInputBatchOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -493,17 +628,22 @@ void TdApi::OnRspBatchOrderAction(CThostFtdcInputBatchOrderActionField *pInputBa
 
 void TdApi::OnRspOptionSelfCloseInsert(CThostFtdcInputOptionSelfCloseField *pInputOptionSelfClose, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPOPTIONSELFCLOSEINSERT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputOptionSelfClose)
 	{
-		CThostFtdcInputOptionSelfCloseField *task_data = new CThostFtdcInputOptionSelfCloseField();
+		CThostFtdcInputOptionSelfCloseField *task_data = TaskPool<CThostFtdcInputOptionSelfCloseField>::allocate();
 		*task_data = *pInputOptionSelfClose;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -514,17 +654,22 @@ void TdApi::OnRspOptionSelfCloseInsert(CThostFtdcInputOptionSelfCloseField *pInp
 
 void TdApi::OnRspOptionSelfCloseAction(CThostFtdcInputOptionSelfCloseActionField *pInputOptionSelfCloseAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPOPTIONSELFCLOSEACTION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputOptionSelfCloseAction)
 	{
-		CThostFtdcInputOptionSelfCloseActionField *task_data = new CThostFtdcInputOptionSelfCloseActionField();
+		CThostFtdcInputOptionSelfCloseActionField *task_data = TaskPool<CThostFtdcInputOptionSelfCloseActionField>::allocate();
 		*task_data = *pInputOptionSelfCloseAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -535,17 +680,22 @@ void TdApi::OnRspOptionSelfCloseAction(CThostFtdcInputOptionSelfCloseActionField
 
 void TdApi::OnRspCombActionInsert(CThostFtdcInputCombActionField *pInputCombAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPCOMBACTIONINSERT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputCombAction)
 	{
-		CThostFtdcInputCombActionField *task_data = new CThostFtdcInputCombActionField();
+		CThostFtdcInputCombActionField *task_data = TaskPool<CThostFtdcInputCombActionField>::allocate();
 		*task_data = *pInputCombAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -556,17 +706,22 @@ void TdApi::OnRspCombActionInsert(CThostFtdcInputCombActionField *pInputCombActi
 
 void TdApi::OnRspQryOrder(CThostFtdcOrderField *pOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYORDER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pOrder)
 	{
-		CThostFtdcOrderField *task_data = new CThostFtdcOrderField();
+		CThostFtdcOrderField *task_data = TaskPool<CThostFtdcOrderField>::allocate();
 		*task_data = *pOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -577,17 +732,22 @@ void TdApi::OnRspQryOrder(CThostFtdcOrderField *pOrder, CThostFtdcRspInfoField *
 
 void TdApi::OnRspQryTrade(CThostFtdcTradeField *pTrade, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYTRADE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pTrade)
 	{
-		CThostFtdcTradeField *task_data = new CThostFtdcTradeField();
+		CThostFtdcTradeField *task_data = TaskPool<CThostFtdcTradeField>::allocate();
 		*task_data = *pTrade;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -598,17 +758,22 @@ void TdApi::OnRspQryTrade(CThostFtdcTradeField *pTrade, CThostFtdcRspInfoField *
 
 void TdApi::OnRspQryInvestorPosition(CThostFtdcInvestorPositionField *pInvestorPosition, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINVESTORPOSITION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInvestorPosition)
 	{
-		CThostFtdcInvestorPositionField *task_data = new CThostFtdcInvestorPositionField();
+		CThostFtdcInvestorPositionField *task_data = TaskPool<CThostFtdcInvestorPositionField>::allocate();
 		*task_data = *pInvestorPosition;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -619,17 +784,22 @@ void TdApi::OnRspQryInvestorPosition(CThostFtdcInvestorPositionField *pInvestorP
 
 void TdApi::OnRspQryTradingAccount(CThostFtdcTradingAccountField *pTradingAccount, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYTRADINGACCOUNT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pTradingAccount)
 	{
-		CThostFtdcTradingAccountField *task_data = new CThostFtdcTradingAccountField();
+		CThostFtdcTradingAccountField *task_data = TaskPool<CThostFtdcTradingAccountField>::allocate();
 		*task_data = *pTradingAccount;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -640,17 +810,22 @@ void TdApi::OnRspQryTradingAccount(CThostFtdcTradingAccountField *pTradingAccoun
 
 void TdApi::OnRspQryInvestor(CThostFtdcInvestorField *pInvestor, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINVESTOR;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInvestor)
 	{
-		CThostFtdcInvestorField *task_data = new CThostFtdcInvestorField();
+		CThostFtdcInvestorField *task_data = TaskPool<CThostFtdcInvestorField>::allocate();
 		*task_data = *pInvestor;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -661,17 +836,22 @@ void TdApi::OnRspQryInvestor(CThostFtdcInvestorField *pInvestor, CThostFtdcRspIn
 
 void TdApi::OnRspQryTradingCode(CThostFtdcTradingCodeField *pTradingCode, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYTRADINGCODE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pTradingCode)
 	{
-		CThostFtdcTradingCodeField *task_data = new CThostFtdcTradingCodeField();
+		CThostFtdcTradingCodeField *task_data = TaskPool<CThostFtdcTradingCodeField>::allocate();
 		*task_data = *pTradingCode;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -682,17 +862,22 @@ void TdApi::OnRspQryTradingCode(CThostFtdcTradingCodeField *pTradingCode, CThost
 
 void TdApi::OnRspQryInstrumentMarginRate(CThostFtdcInstrumentMarginRateField *pInstrumentMarginRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINSTRUMENTMARGINRATE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInstrumentMarginRate)
 	{
-		CThostFtdcInstrumentMarginRateField *task_data = new CThostFtdcInstrumentMarginRateField();
+		CThostFtdcInstrumentMarginRateField *task_data = TaskPool<CThostFtdcInstrumentMarginRateField>::allocate();
 		*task_data = *pInstrumentMarginRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -703,17 +888,22 @@ void TdApi::OnRspQryInstrumentMarginRate(CThostFtdcInstrumentMarginRateField *pI
 
 void TdApi::OnRspQryInstrumentCommissionRate(CThostFtdcInstrumentCommissionRateField *pInstrumentCommissionRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINSTRUMENTCOMMISSIONRATE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInstrumentCommissionRate)
 	{
-		CThostFtdcInstrumentCommissionRateField *task_data = new CThostFtdcInstrumentCommissionRateField();
+		CThostFtdcInstrumentCommissionRateField *task_data = TaskPool<CThostFtdcInstrumentCommissionRateField>::allocate();
 		*task_data = *pInstrumentCommissionRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -724,17 +914,22 @@ void TdApi::OnRspQryInstrumentCommissionRate(CThostFtdcInstrumentCommissionRateF
 
 void TdApi::OnRspQryUserSession(CThostFtdcUserSessionField *pUserSession, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYUSERSESSION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pUserSession)
 	{
-		CThostFtdcUserSessionField *task_data = new CThostFtdcUserSessionField();
+		CThostFtdcUserSessionField *task_data = TaskPool<CThostFtdcUserSessionField>::allocate();
 		*task_data = *pUserSession;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -745,17 +940,22 @@ void TdApi::OnRspQryUserSession(CThostFtdcUserSessionField *pUserSession, CThost
 
 void TdApi::OnRspQryExchange(CThostFtdcExchangeField *pExchange, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYEXCHANGE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pExchange)
 	{
-		CThostFtdcExchangeField *task_data = new CThostFtdcExchangeField();
+		CThostFtdcExchangeField *task_data = TaskPool<CThostFtdcExchangeField>::allocate();
 		*task_data = *pExchange;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -766,17 +966,22 @@ void TdApi::OnRspQryExchange(CThostFtdcExchangeField *pExchange, CThostFtdcRspIn
 
 void TdApi::OnRspQryProduct(CThostFtdcProductField *pProduct, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYPRODUCT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pProduct)
 	{
-		CThostFtdcProductField *task_data = new CThostFtdcProductField();
+		CThostFtdcProductField *task_data = TaskPool<CThostFtdcProductField>::allocate();
 		*task_data = *pProduct;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -787,17 +992,22 @@ void TdApi::OnRspQryProduct(CThostFtdcProductField *pProduct, CThostFtdcRspInfoF
 
 void TdApi::OnRspQryInstrument(CThostFtdcInstrumentField *pInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINSTRUMENT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInstrument)
 	{
-		CThostFtdcInstrumentField *task_data = new CThostFtdcInstrumentField();
+		CThostFtdcInstrumentField *task_data = TaskPool<CThostFtdcInstrumentField>::allocate();
 		*task_data = *pInstrument;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -808,17 +1018,22 @@ void TdApi::OnRspQryInstrument(CThostFtdcInstrumentField *pInstrument, CThostFtd
 
 void TdApi::OnRspQryDepthMarketData(CThostFtdcDepthMarketDataField *pDepthMarketData, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYDEPTHMARKETDATA;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pDepthMarketData)
 	{
-		CThostFtdcDepthMarketDataField *task_data = new CThostFtdcDepthMarketDataField();
+		CThostFtdcDepthMarketDataField *task_data = TaskPool<CThostFtdcDepthMarketDataField>::allocate();
 		*task_data = *pDepthMarketData;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -829,17 +1044,22 @@ void TdApi::OnRspQryDepthMarketData(CThostFtdcDepthMarketDataField *pDepthMarket
 
 void TdApi::OnRspQryTraderOffer(CThostFtdcTraderOfferField *pTraderOffer, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYTRADEROFFER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pTraderOffer)
 	{
-		CThostFtdcTraderOfferField *task_data = new CThostFtdcTraderOfferField();
+		CThostFtdcTraderOfferField *task_data = TaskPool<CThostFtdcTraderOfferField>::allocate();
 		*task_data = *pTraderOffer;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -850,17 +1070,22 @@ void TdApi::OnRspQryTraderOffer(CThostFtdcTraderOfferField *pTraderOffer, CThost
 
 void TdApi::OnRspQrySettlementInfo(CThostFtdcSettlementInfoField *pSettlementInfo, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYSETTLEMENTINFO;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSettlementInfo)
 	{
-		CThostFtdcSettlementInfoField *task_data = new CThostFtdcSettlementInfoField();
+		CThostFtdcSettlementInfoField *task_data = TaskPool<CThostFtdcSettlementInfoField>::allocate();
 		*task_data = *pSettlementInfo;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -871,17 +1096,22 @@ void TdApi::OnRspQrySettlementInfo(CThostFtdcSettlementInfoField *pSettlementInf
 
 void TdApi::OnRspQryTransferBank(CThostFtdcTransferBankField *pTransferBank, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYTRANSFERBANK;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pTransferBank)
 	{
-		CThostFtdcTransferBankField *task_data = new CThostFtdcTransferBankField();
+		CThostFtdcTransferBankField *task_data = TaskPool<CThostFtdcTransferBankField>::allocate();
 		*task_data = *pTransferBank;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -892,17 +1122,22 @@ void TdApi::OnRspQryTransferBank(CThostFtdcTransferBankField *pTransferBank, CTh
 
 void TdApi::OnRspQryInvestorPositionDetail(CThostFtdcInvestorPositionDetailField *pInvestorPositionDetail, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINVESTORPOSITIONDETAIL;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInvestorPositionDetail)
 	{
-		CThostFtdcInvestorPositionDetailField *task_data = new CThostFtdcInvestorPositionDetailField();
+		CThostFtdcInvestorPositionDetailField *task_data = TaskPool<CThostFtdcInvestorPositionDetailField>::allocate();
 		*task_data = *pInvestorPositionDetail;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -913,17 +1148,22 @@ void TdApi::OnRspQryInvestorPositionDetail(CThostFtdcInvestorPositionDetailField
 
 void TdApi::OnRspQryNotice(CThostFtdcNoticeField *pNotice, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYNOTICE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pNotice)
 	{
-		CThostFtdcNoticeField *task_data = new CThostFtdcNoticeField();
+		CThostFtdcNoticeField *task_data = TaskPool<CThostFtdcNoticeField>::allocate();
 		*task_data = *pNotice;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -934,17 +1174,22 @@ void TdApi::OnRspQryNotice(CThostFtdcNoticeField *pNotice, CThostFtdcRspInfoFiel
 
 void TdApi::OnRspQrySettlementInfoConfirm(CThostFtdcSettlementInfoConfirmField *pSettlementInfoConfirm, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYSETTLEMENTINFOCONFIRM;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSettlementInfoConfirm)
 	{
-		CThostFtdcSettlementInfoConfirmField *task_data = new CThostFtdcSettlementInfoConfirmField();
+		CThostFtdcSettlementInfoConfirmField *task_data = TaskPool<CThostFtdcSettlementInfoConfirmField>::allocate();
 		*task_data = *pSettlementInfoConfirm;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -955,17 +1200,22 @@ void TdApi::OnRspQrySettlementInfoConfirm(CThostFtdcSettlementInfoConfirmField *
 
 void TdApi::OnRspQryInvestorPositionCombineDetail(CThostFtdcInvestorPositionCombineDetailField *pInvestorPositionCombineDetail, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINVESTORPOSITIONCOMBINEDETAIL;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInvestorPositionCombineDetail)
 	{
-		CThostFtdcInvestorPositionCombineDetailField *task_data = new CThostFtdcInvestorPositionCombineDetailField();
+		CThostFtdcInvestorPositionCombineDetailField *task_data = TaskPool<CThostFtdcInvestorPositionCombineDetailField>::allocate();
 		*task_data = *pInvestorPositionCombineDetail;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -976,17 +1226,22 @@ void TdApi::OnRspQryInvestorPositionCombineDetail(CThostFtdcInvestorPositionComb
 
 void TdApi::OnRspQryCFMMCTradingAccountKey(CThostFtdcCFMMCTradingAccountKeyField *pCFMMCTradingAccountKey, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYCFMMCTRADINGACCOUNTKEY;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pCFMMCTradingAccountKey)
 	{
-		CThostFtdcCFMMCTradingAccountKeyField *task_data = new CThostFtdcCFMMCTradingAccountKeyField();
+		CThostFtdcCFMMCTradingAccountKeyField *task_data = TaskPool<CThostFtdcCFMMCTradingAccountKeyField>::allocate();
 		*task_data = *pCFMMCTradingAccountKey;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -997,17 +1252,22 @@ void TdApi::OnRspQryCFMMCTradingAccountKey(CThostFtdcCFMMCTradingAccountKeyField
 
 void TdApi::OnRspQryEWarrantOffset(CThostFtdcEWarrantOffsetField *pEWarrantOffset, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYEWARRANTOFFSET;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pEWarrantOffset)
 	{
-		CThostFtdcEWarrantOffsetField *task_data = new CThostFtdcEWarrantOffsetField();
+		CThostFtdcEWarrantOffsetField *task_data = TaskPool<CThostFtdcEWarrantOffsetField>::allocate();
 		*task_data = *pEWarrantOffset;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1018,17 +1278,22 @@ void TdApi::OnRspQryEWarrantOffset(CThostFtdcEWarrantOffsetField *pEWarrantOffse
 
 void TdApi::OnRspQryInvestorProductGroupMargin(CThostFtdcInvestorProductGroupMarginField *pInvestorProductGroupMargin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINVESTORPRODUCTGROUPMARGIN;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInvestorProductGroupMargin)
 	{
-		CThostFtdcInvestorProductGroupMarginField *task_data = new CThostFtdcInvestorProductGroupMarginField();
+		CThostFtdcInvestorProductGroupMarginField *task_data = TaskPool<CThostFtdcInvestorProductGroupMarginField>::allocate();
 		*task_data = *pInvestorProductGroupMargin;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1039,17 +1304,22 @@ void TdApi::OnRspQryInvestorProductGroupMargin(CThostFtdcInvestorProductGroupMar
 
 void TdApi::OnRspQryExchangeMarginRate(CThostFtdcExchangeMarginRateField *pExchangeMarginRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYEXCHANGEMARGINRATE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pExchangeMarginRate)
 	{
-		CThostFtdcExchangeMarginRateField *task_data = new CThostFtdcExchangeMarginRateField();
+		CThostFtdcExchangeMarginRateField *task_data = TaskPool<CThostFtdcExchangeMarginRateField>::allocate();
 		*task_data = *pExchangeMarginRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1060,17 +1330,22 @@ void TdApi::OnRspQryExchangeMarginRate(CThostFtdcExchangeMarginRateField *pExcha
 
 void TdApi::OnRspQryExchangeMarginRateAdjust(CThostFtdcExchangeMarginRateAdjustField *pExchangeMarginRateAdjust, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYEXCHANGEMARGINRATEADJUST;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pExchangeMarginRateAdjust)
 	{
-		CThostFtdcExchangeMarginRateAdjustField *task_data = new CThostFtdcExchangeMarginRateAdjustField();
+		CThostFtdcExchangeMarginRateAdjustField *task_data = TaskPool<CThostFtdcExchangeMarginRateAdjustField>::allocate();
 		*task_data = *pExchangeMarginRateAdjust;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1081,17 +1356,22 @@ void TdApi::OnRspQryExchangeMarginRateAdjust(CThostFtdcExchangeMarginRateAdjustF
 
 void TdApi::OnRspQryExchangeRate(CThostFtdcExchangeRateField *pExchangeRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYEXCHANGERATE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pExchangeRate)
 	{
-		CThostFtdcExchangeRateField *task_data = new CThostFtdcExchangeRateField();
+		CThostFtdcExchangeRateField *task_data = TaskPool<CThostFtdcExchangeRateField>::allocate();
 		*task_data = *pExchangeRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1102,17 +1382,22 @@ void TdApi::OnRspQryExchangeRate(CThostFtdcExchangeRateField *pExchangeRate, CTh
 
 void TdApi::OnRspQrySecAgentACIDMap(CThostFtdcSecAgentACIDMapField *pSecAgentACIDMap, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYSECAGENTACIDMAP;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSecAgentACIDMap)
 	{
-		CThostFtdcSecAgentACIDMapField *task_data = new CThostFtdcSecAgentACIDMapField();
+		CThostFtdcSecAgentACIDMapField *task_data = TaskPool<CThostFtdcSecAgentACIDMapField>::allocate();
 		*task_data = *pSecAgentACIDMap;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1123,17 +1408,22 @@ void TdApi::OnRspQrySecAgentACIDMap(CThostFtdcSecAgentACIDMapField *pSecAgentACI
 
 void TdApi::OnRspQryProductExchRate(CThostFtdcProductExchRateField *pProductExchRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYPRODUCTEXCHRATE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pProductExchRate)
 	{
-		CThostFtdcProductExchRateField *task_data = new CThostFtdcProductExchRateField();
+		CThostFtdcProductExchRateField *task_data = TaskPool<CThostFtdcProductExchRateField>::allocate();
 		*task_data = *pProductExchRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1144,17 +1434,22 @@ void TdApi::OnRspQryProductExchRate(CThostFtdcProductExchRateField *pProductExch
 
 void TdApi::OnRspQryProductGroup(CThostFtdcProductGroupField *pProductGroup, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYPRODUCTGROUP;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pProductGroup)
 	{
-		CThostFtdcProductGroupField *task_data = new CThostFtdcProductGroupField();
+		CThostFtdcProductGroupField *task_data = TaskPool<CThostFtdcProductGroupField>::allocate();
 		*task_data = *pProductGroup;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1165,17 +1460,22 @@ void TdApi::OnRspQryProductGroup(CThostFtdcProductGroupField *pProductGroup, CTh
 
 void TdApi::OnRspQryMMInstrumentCommissionRate(CThostFtdcMMInstrumentCommissionRateField *pMMInstrumentCommissionRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYMMINSTRUMENTCOMMISSIONRATE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pMMInstrumentCommissionRate)
 	{
-		CThostFtdcMMInstrumentCommissionRateField *task_data = new CThostFtdcMMInstrumentCommissionRateField();
+		CThostFtdcMMInstrumentCommissionRateField *task_data = TaskPool<CThostFtdcMMInstrumentCommissionRateField>::allocate();
 		*task_data = *pMMInstrumentCommissionRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1186,17 +1486,22 @@ void TdApi::OnRspQryMMInstrumentCommissionRate(CThostFtdcMMInstrumentCommissionR
 
 void TdApi::OnRspQryMMOptionInstrCommRate(CThostFtdcMMOptionInstrCommRateField *pMMOptionInstrCommRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYMMOPTIONINSTRCOMMRATE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pMMOptionInstrCommRate)
 	{
-		CThostFtdcMMOptionInstrCommRateField *task_data = new CThostFtdcMMOptionInstrCommRateField();
+		CThostFtdcMMOptionInstrCommRateField *task_data = TaskPool<CThostFtdcMMOptionInstrCommRateField>::allocate();
 		*task_data = *pMMOptionInstrCommRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1207,17 +1512,22 @@ void TdApi::OnRspQryMMOptionInstrCommRate(CThostFtdcMMOptionInstrCommRateField *
 
 void TdApi::OnRspQryInstrumentOrderCommRate(CThostFtdcInstrumentOrderCommRateField *pInstrumentOrderCommRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINSTRUMENTORDERCOMMRATE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInstrumentOrderCommRate)
 	{
-		CThostFtdcInstrumentOrderCommRateField *task_data = new CThostFtdcInstrumentOrderCommRateField();
+		CThostFtdcInstrumentOrderCommRateField *task_data = TaskPool<CThostFtdcInstrumentOrderCommRateField>::allocate();
 		*task_data = *pInstrumentOrderCommRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1228,17 +1538,22 @@ void TdApi::OnRspQryInstrumentOrderCommRate(CThostFtdcInstrumentOrderCommRateFie
 
 void TdApi::OnRspQrySecAgentTradingAccount(CThostFtdcTradingAccountField *pTradingAccount, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYSECAGENTTRADINGACCOUNT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pTradingAccount)
 	{
-		CThostFtdcTradingAccountField *task_data = new CThostFtdcTradingAccountField();
+		CThostFtdcTradingAccountField *task_data = TaskPool<CThostFtdcTradingAccountField>::allocate();
 		*task_data = *pTradingAccount;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1249,17 +1564,22 @@ void TdApi::OnRspQrySecAgentTradingAccount(CThostFtdcTradingAccountField *pTradi
 
 void TdApi::OnRspQrySecAgentCheckMode(CThostFtdcSecAgentCheckModeField *pSecAgentCheckMode, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYSECAGENTCHECKMODE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSecAgentCheckMode)
 	{
-		CThostFtdcSecAgentCheckModeField *task_data = new CThostFtdcSecAgentCheckModeField();
+		CThostFtdcSecAgentCheckModeField *task_data = TaskPool<CThostFtdcSecAgentCheckModeField>::allocate();
 		*task_data = *pSecAgentCheckMode;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1270,17 +1590,22 @@ void TdApi::OnRspQrySecAgentCheckMode(CThostFtdcSecAgentCheckModeField *pSecAgen
 
 void TdApi::OnRspQrySecAgentTradeInfo(CThostFtdcSecAgentTradeInfoField *pSecAgentTradeInfo, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYSECAGENTTRADEINFO;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSecAgentTradeInfo)
 	{
-		CThostFtdcSecAgentTradeInfoField *task_data = new CThostFtdcSecAgentTradeInfoField();
+		CThostFtdcSecAgentTradeInfoField *task_data = TaskPool<CThostFtdcSecAgentTradeInfoField>::allocate();
 		*task_data = *pSecAgentTradeInfo;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1291,17 +1616,22 @@ void TdApi::OnRspQrySecAgentTradeInfo(CThostFtdcSecAgentTradeInfoField *pSecAgen
 
 void TdApi::OnRspQryOptionInstrTradeCost(CThostFtdcOptionInstrTradeCostField *pOptionInstrTradeCost, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYOPTIONINSTRTRADECOST;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pOptionInstrTradeCost)
 	{
-		CThostFtdcOptionInstrTradeCostField *task_data = new CThostFtdcOptionInstrTradeCostField();
+		CThostFtdcOptionInstrTradeCostField *task_data = TaskPool<CThostFtdcOptionInstrTradeCostField>::allocate();
 		*task_data = *pOptionInstrTradeCost;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1312,17 +1642,22 @@ void TdApi::OnRspQryOptionInstrTradeCost(CThostFtdcOptionInstrTradeCostField *pO
 
 void TdApi::OnRspQryOptionInstrCommRate(CThostFtdcOptionInstrCommRateField *pOptionInstrCommRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYOPTIONINSTRCOMMRATE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pOptionInstrCommRate)
 	{
-		CThostFtdcOptionInstrCommRateField *task_data = new CThostFtdcOptionInstrCommRateField();
+		CThostFtdcOptionInstrCommRateField *task_data = TaskPool<CThostFtdcOptionInstrCommRateField>::allocate();
 		*task_data = *pOptionInstrCommRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1333,17 +1668,22 @@ void TdApi::OnRspQryOptionInstrCommRate(CThostFtdcOptionInstrCommRateField *pOpt
 
 void TdApi::OnRspQryExecOrder(CThostFtdcExecOrderField *pExecOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYEXECORDER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pExecOrder)
 	{
-		CThostFtdcExecOrderField *task_data = new CThostFtdcExecOrderField();
+		CThostFtdcExecOrderField *task_data = TaskPool<CThostFtdcExecOrderField>::allocate();
 		*task_data = *pExecOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1354,17 +1694,22 @@ void TdApi::OnRspQryExecOrder(CThostFtdcExecOrderField *pExecOrder, CThostFtdcRs
 
 void TdApi::OnRspQryForQuote(CThostFtdcForQuoteField *pForQuote, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYFORQUOTE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pForQuote)
 	{
-		CThostFtdcForQuoteField *task_data = new CThostFtdcForQuoteField();
+		CThostFtdcForQuoteField *task_data = TaskPool<CThostFtdcForQuoteField>::allocate();
 		*task_data = *pForQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1375,17 +1720,22 @@ void TdApi::OnRspQryForQuote(CThostFtdcForQuoteField *pForQuote, CThostFtdcRspIn
 
 void TdApi::OnRspQryQuote(CThostFtdcQuoteField *pQuote, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYQUOTE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pQuote)
 	{
-		CThostFtdcQuoteField *task_data = new CThostFtdcQuoteField();
+		CThostFtdcQuoteField *task_data = TaskPool<CThostFtdcQuoteField>::allocate();
 		*task_data = *pQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1396,17 +1746,22 @@ void TdApi::OnRspQryQuote(CThostFtdcQuoteField *pQuote, CThostFtdcRspInfoField *
 
 void TdApi::OnRspQryOptionSelfClose(CThostFtdcOptionSelfCloseField *pOptionSelfClose, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYOPTIONSELFCLOSE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pOptionSelfClose)
 	{
-		CThostFtdcOptionSelfCloseField *task_data = new CThostFtdcOptionSelfCloseField();
+		CThostFtdcOptionSelfCloseField *task_data = TaskPool<CThostFtdcOptionSelfCloseField>::allocate();
 		*task_data = *pOptionSelfClose;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1417,17 +1772,22 @@ void TdApi::OnRspQryOptionSelfClose(CThostFtdcOptionSelfCloseField *pOptionSelfC
 
 void TdApi::OnRspQryInvestUnit(CThostFtdcInvestUnitField *pInvestUnit, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINVESTUNIT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInvestUnit)
 	{
-		CThostFtdcInvestUnitField *task_data = new CThostFtdcInvestUnitField();
+		CThostFtdcInvestUnitField *task_data = TaskPool<CThostFtdcInvestUnitField>::allocate();
 		*task_data = *pInvestUnit;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1438,17 +1798,22 @@ void TdApi::OnRspQryInvestUnit(CThostFtdcInvestUnitField *pInvestUnit, CThostFtd
 
 void TdApi::OnRspQryCombInstrumentGuard(CThostFtdcCombInstrumentGuardField *pCombInstrumentGuard, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYCOMBINSTRUMENTGUARD;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pCombInstrumentGuard)
 	{
-		CThostFtdcCombInstrumentGuardField *task_data = new CThostFtdcCombInstrumentGuardField();
+		CThostFtdcCombInstrumentGuardField *task_data = TaskPool<CThostFtdcCombInstrumentGuardField>::allocate();
 		*task_data = *pCombInstrumentGuard;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1459,17 +1824,22 @@ void TdApi::OnRspQryCombInstrumentGuard(CThostFtdcCombInstrumentGuardField *pCom
 
 void TdApi::OnRspQryCombAction(CThostFtdcCombActionField *pCombAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYCOMBACTION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pCombAction)
 	{
-		CThostFtdcCombActionField *task_data = new CThostFtdcCombActionField();
+		CThostFtdcCombActionField *task_data = TaskPool<CThostFtdcCombActionField>::allocate();
 		*task_data = *pCombAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1480,17 +1850,22 @@ void TdApi::OnRspQryCombAction(CThostFtdcCombActionField *pCombAction, CThostFtd
 
 void TdApi::OnRspQryTransferSerial(CThostFtdcTransferSerialField *pTransferSerial, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYTRANSFERSERIAL;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pTransferSerial)
 	{
-		CThostFtdcTransferSerialField *task_data = new CThostFtdcTransferSerialField();
+		CThostFtdcTransferSerialField *task_data = TaskPool<CThostFtdcTransferSerialField>::allocate();
 		*task_data = *pTransferSerial;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1501,17 +1876,22 @@ void TdApi::OnRspQryTransferSerial(CThostFtdcTransferSerialField *pTransferSeria
 
 void TdApi::OnRspQryAccountregister(CThostFtdcAccountregisterField *pAccountregister, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYACCOUNTREGISTER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pAccountregister)
 	{
-		CThostFtdcAccountregisterField *task_data = new CThostFtdcAccountregisterField();
+		CThostFtdcAccountregisterField *task_data = TaskPool<CThostFtdcAccountregisterField>::allocate();
 		*task_data = *pAccountregister;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1522,11 +1902,16 @@ void TdApi::OnRspQryAccountregister(CThostFtdcAccountregisterField *pAccountregi
 
 void TdApi::OnRspError(CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPERROR;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1537,11 +1922,21 @@ void TdApi::OnRspError(CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bI
 
 void TdApi::OnRtnOrder(CThostFtdcOrderField *pOrder) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
+	if (pOrder && !this->storeRtnOrder(pOrder, recv_time, recv_wall_time))
+	{
+		return;
+	}
+
 	Task task = Task();
 	task.task_name = ONRTNORDER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pOrder)
 	{
-		CThostFtdcOrderField *task_data = new CThostFtdcOrderField();
+		CThostFtdcOrderField *task_data = TaskPool<CThostFtdcOrderField>::allocate();
 		*task_data = *pOrder;
 		task.task_data = task_data;
 	}
@@ -1550,11 +1945,21 @@ void TdApi::OnRtnOrder(CThostFtdcOrderField *pOrder)
 
 void TdApi::OnRtnTrade(CThostFtdcTradeField *pTrade) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
+	if (pTrade && !this->storeRtnTrade(pTrade, recv_time, recv_wall_time))
+	{
+		return;
+	}
+
 	Task task = Task();
 	task.task_name = ONRTNTRADE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pTrade)
 	{
-		CThostFtdcTradeField *task_data = new CThostFtdcTradeField();
+		CThostFtdcTradeField *task_data = TaskPool<CThostFtdcTradeField>::allocate();
 		*task_data = *pTrade;
 		task.task_data = task_data;
 	}
@@ -1563,17 +1968,27 @@ void TdApi::OnRtnTrade(CThostFtdcTradeField *pTrade)
 
 void TdApi::OnErrRtnOrderInsert(CThostFtdcInputOrderField *pInputOrder, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
+	if (pInputOrder && !this->storeErrRtnOrderInsert(pInputOrder, pRspInfo, recv_time, recv_wall_time))
+	{
+		return;
+	}
+
 	Task task = Task();
 	task.task_name = ONERRRTNORDERINSERT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputOrder)
 	{
-		CThostFtdcInputOrderField *task_data = new CThostFtdcInputOrderField();
+		CThostFtdcInputOrderField *task_data = TaskPool<CThostFtdcInputOrderField>::allocate();
 		*task_data = *pInputOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1582,17 +1997,22 @@ void TdApi::OnErrRtnOrderInsert(CThostFtdcInputOrderField *pInputOrder, CThostFt
 
 void TdApi::OnErrRtnOrderAction(CThostFtdcOrderActionField *pOrderAction, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNORDERACTION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pOrderAction)
 	{
-		CThostFtdcOrderActionField *task_data = new CThostFtdcOrderActionField();
+		CThostFtdcOrderActionField *task_data = TaskPool<CThostFtdcOrderActionField>::allocate();
 		*task_data = *pOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1601,11 +2021,16 @@ void TdApi::OnErrRtnOrderAction(CThostFtdcOrderActionField *pOrderAction, CThost
 
 void TdApi::OnRtnInstrumentStatus(CThostFtdcInstrumentStatusField *pInstrumentStatus) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNINSTRUMENTSTATUS;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInstrumentStatus)
 	{
-		CThostFtdcInstrumentStatusField *task_data = new CThostFtdcInstrumentStatusField();
+		CThostFtdcInstrumentStatusField *task_data = TaskPool<CThostFtdcInstrumentStatusField>::allocate();
 		*task_data = *pInstrumentStatus;
 		task.task_data = task_data;
 	}
@@ -1614,11 +2039,16 @@ void TdApi::OnRtnInstrumentStatus(CThostFtdcInstrumentStatusField *pInstrumentSt
 
 void TdApi::OnRtnBulletin(CThostFtdcBulletinField *pBulletin) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNBULLETIN;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pBulletin)
 	{
-		CThostFtdcBulletinField *task_data = new CThostFtdcBulletinField();
+		CThostFtdcBulletinField *task_data = TaskPool<CThostFtdcBulletinField>::allocate();
 		*task_data = *pBulletin;
 		task.task_data = task_data;
 	}
@@ -1627,11 +2057,16 @@ void TdApi::OnRtnBulletin(CThostFtdcBulletinField *pBulletin)
 
 void TdApi::OnRtnTradingNotice(CThostFtdcTradingNoticeInfoField *pTradingNoticeInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNTRADINGNOTICE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pTradingNoticeInfo)
 	{
-		CThostFtdcTradingNoticeInfoField *task_data = new CThostFtdcTradingNoticeInfoField();
+		CThostFtdcTradingNoticeInfoField *task_data = TaskPool<CThostFtdcTradingNoticeInfoField>::allocate();
 		*task_data = *pTradingNoticeInfo;
 		task.task_data = task_data;
 	}
@@ -1640,11 +2075,16 @@ void TdApi::OnRtnTradingNotice(CThostFtdcTradingNoticeInfoField *pTradingNoticeI
 
 void TdApi::OnRtnErrorConditionalOrder(CThostFtdcErrorConditionalOrderField *pErrorConditionalOrder) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNERRORCONDITIONALORDER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pErrorConditionalOrder)
 	{
-		CThostFtdcErrorConditionalOrderField *task_data = new CThostFtdcErrorConditionalOrderField();
+		CThostFtdcErrorConditionalOrderField *task_data = TaskPool<CThostFtdcErrorConditionalOrderField>::allocate();
 		*task_data = *pErrorConditionalOrder;
 		task.task_data = task_data;
 	}
@@ -1653,11 +2093,16 @@ void TdApi::OnRtnErrorConditionalOrder(CThostFtdcErrorConditionalOrderField *pEr
 
 void TdApi::OnRtnExecOrder(CThostFtdcExecOrderField *pExecOrder) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNEXECORDER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pExecOrder)
 	{
-		CThostFtdcExecOrderField *task_data = new CThostFtdcExecOrderField();
+		CThostFtdcExecOrderField *task_data = TaskPool<CThostFtdcExecOrderField>::allocate();
 		*task_data = *pExecOrder;
 		task.task_data = task_data;
 	}
@@ -1666,17 +2111,22 @@ void TdApi::OnRtnExecOrder(CThostFtdcExecOrderField *pExecOrder)
 
 void TdApi::OnErrRtnExecOrderInsert(CThostFtdcInputExecOrderField *pInputExecOrder, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNEXECORDERINSERT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputExecOrder)
 	{
-		CThostFtdcInputExecOrderField *task_data = new CThostFtdcInputExecOrderField();
+		CThostFtdcInputExecOrderField *task_data = TaskPool<CThostFtdcInputExecOrderField>::allocate();
 		*task_data = *pInputExecOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1685,17 +2135,22 @@ void TdApi::OnErrRtnExecOrderInsert(CThostFtdcInputExecOrderField *pInputExecOrd
 
 void TdApi::OnErrRtnExecOrderAction(CThostFtdcExecOrderActionField *pExecOrderAction, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNEXECORDERACTION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pExecOrderAction)
 	{
-		CThostFtdcExecOrderActionField *task_data = new CThostFtdcExecOrderActionField();
+		CThostFtdcExecOrderActionField *task_data = TaskPool<CThostFtdcExecOrderActionField>::allocate();
 		*task_data = *pExecOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1704,17 +2159,22 @@ void TdApi::OnErrRtnExecOrderAction(CThostFtdcExecOrderActionField *pExecOrderAc
 
 void TdApi::OnErrRtnForQuoteInsert(CThostFtdcInputForQuoteField *pInputForQuote, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNFORQUOTEINSERT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputForQuote)
 	{
-		CThostFtdcInputForQuoteField *task_data = new CThostFtdcInputForQuoteField();
+		CThostFtdcInputForQuoteField *task_data = TaskPool<CThostFtdcInputForQuoteField>::allocate();
 		*task_data = *pInputForQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1723,11 +2183,16 @@ void TdApi::OnErrRtnForQuoteInsert(CThostFtdcInputForQuoteField *pInputForQuote,
 
 void TdApi::OnRtnQuote(CThostFtdcQuoteField *pQuote) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNQUOTE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pQuote)
 	{
-		CThostFtdcQuoteField *task_data = new CThostFtdcQuoteField();
+		CThostFtdcQuoteField *task_data = TaskPool<CThostFtdcQuoteField>::allocate();
 		*task_data = *pQuote;
 		task.task_data = task_data;
 	}
@@ -1736,17 +2201,22 @@ void TdApi::OnRtnQuote(CThostFtdcQuoteField *pQuote)
 
 void TdApi::OnErrRtnQuoteInsert(CThostFtdcInputQuoteField *pInputQuote, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNQUOTEINSERT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputQuote)
 	{
-		CThostFtdcInputQuoteField *task_data = new CThostFtdcInputQuoteField();
+		CThostFtdcInputQuoteField *task_data = TaskPool<CThostFtdcInputQuoteField>::allocate();
 		*task_data = *pInputQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1755,17 +2225,22 @@ void TdApi::OnErrRtnQuoteInsert(CThostFtdcInputQuoteField *pInputQuote, CThostFt
 
 void TdApi::OnErrRtnQuoteAction(CThostFtdcQuoteActionField *pQuoteAction, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNQUOTEACTION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pQuoteAction)
 	{
-		CThostFtdcQuoteActionField *task_data = new CThostFtdcQuoteActionField();
+		CThostFtdcQuoteActionField *task_data = TaskPool<CThostFtdcQuoteActionField>::allocate();
 		*task_data = *pQuoteAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1774,11 +2249,16 @@ void TdApi::OnErrRtnQuoteAction(CThostFtdcQuoteActionField *pQuoteAction, CThost
 
 void TdApi::OnRtnForQuoteRsp(CThostFtdcForQuoteRspField *pForQuoteRsp) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNFORQUOTERSP;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pForQuoteRsp)
 	{
-		CThostFtdcForQuoteRspField *task_data = new CThostFtdcForQuoteRspField();
+		CThostFtdcForQuoteRspField *task_data = TaskPool<CThostFtdcForQuoteRspField>::allocate();
 		*task_data = *pForQuoteRsp;
 		task.task_data = task_data;
 	}
@@ -1787,11 +2267,16 @@ void TdApi::OnRtnForQuoteRsp(CThostFtdcForQuoteRspField *pForQuoteRsp)
 
 void TdApi::OnRtnCFMMCTradingAccountToken(CThostFtdcCFMMCTradingAccountTokenField *pCFMMCTradingAccountToken) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNCFMMCTRADINGACCOUNTTOKEN;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pCFMMCTradingAccountToken)
 	{
-		CThostFtdcCFMMCTradingAccountTokenField *task_data = new CThostFtdcCFMMCTradingAccountTokenField();
+		CThostFtdcCFMMCTradingAccountTokenField *task_data = TaskPool<CThostFtdcCFMMCTradingAccountTokenField>::allocate();
 		*task_data = *pCFMMCTradingAccountToken;
 		task.task_data = task_data;
 	}
@@ -1800,17 +2285,22 @@ void TdApi::OnRtnCFMMCTradingAccountToken(CThostFtdcCFMMCTradingAccountTokenFiel
 
 void TdApi::OnErrRtnBatchOrderAction(CThostFtdcBatchOrderActionField *pBatchOrderAction, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNBATCHORDERACTION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pBatchOrderAction)
 	{
-		CThostFtdcBatchOrderActionField *task_data = new CThostFtdcBatchOrderActionField();
+		CThostFtdcBatchOrderActionField *task_data = TaskPool<CThostFtdcBatchOrderActionField>::allocate();
 		*task_data = *pBatchOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1819,11 +2309,16 @@ void TdApi::OnErrRtnBatchOrderAction(CThostFtdcBatchOrderActionField *pBatchOrde
 
 void TdApi::OnRtnOptionSelfClose(CThostFtdcOptionSelfCloseField *pOptionSelfClose) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNOPTIONSELFCLOSE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pOptionSelfClose)
 	{
-		CThostFtdcOptionSelfCloseField *task_data = new CThostFtdcOptionSelfCloseField();
+		CThostFtdcOptionSelfCloseField *task_data = TaskPool<CThostFtdcOptionSelfCloseField>::allocate();
 		*task_data = *pOptionSelfClose;
 		task.task_data = task_data;
 	}
@@ -1832,17 +2327,22 @@ void TdApi::OnRtnOptionSelfClose(CThostFtdcOptionSelfCloseField *pOptionSelfClos
 
 void TdApi::OnErrRtnOptionSelfCloseInsert(CThostFtdcInputOptionSelfCloseField *pInputOptionSelfClose, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNOPTIONSELFCLOSEINSERT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputOptionSelfClose)
 	{
-		CThostFtdcInputOptionSelfCloseField *task_data = new CThostFtdcInputOptionSelfCloseField();
+		CThostFtdcInputOptionSelfCloseField *task_data = TaskPool<CThostFtdcInputOptionSelfCloseField>::allocate();
 		*task_data = *pInputOptionSelfClose;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1851,17 +2351,22 @@ void TdApi::OnErrRtnOptionSelfCloseInsert(CThostFtdcInputOptionSelfCloseField *p
 
 void TdApi::OnErrRtnOptionSelfCloseAction(CThostFtdcOptionSelfCloseActionField *pOptionSelfCloseAction, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNOPTIONSELFCLOSEACTION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pOptionSelfCloseAction)
 	{
-		CThostFtdcOptionSelfCloseActionField *task_data = new CThostFtdcOptionSelfCloseActionField();
+		CThostFtdcOptionSelfCloseActionField *task_data = TaskPool<CThostFtdcOptionSelfCloseActionField>::allocate();
 		*task_data = *pOptionSelfCloseAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1870,11 +2375,16 @@ void TdApi::OnErrRtnOptionSelfCloseAction(CThostFtdcOptionSelfCloseActionField *
 
 void TdApi::OnRtnCombAction(CThostFtdcCombActionField *pCombAction) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNCOMBACTION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pCombAction)
 	{
-		CThostFtdcCombActionField *task_data = new CThostFtdcCombActionField();
+		CThostFtdcCombActionField *task_data = TaskPool<CThostFtdcCombActionField>::allocate();
 		*task_data = *pCombAction;
 		task.task_data = task_data;
 	}
@@ -1883,17 +2393,22 @@ void TdApi::OnRtnCombAction(CThostFtdcCombActionField *pCombAction)
 
 void TdApi::OnErrRtnCombActionInsert(CThostFtdcInputCombActionField *pInputCombAction, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNCOMBACTIONINSERT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputCombAction)
 	{
-		CThostFtdcInputCombActionField *task_data = new CThostFtdcInputCombActionField();
+		CThostFtdcInputCombActionField *task_data = TaskPool<CThostFtdcInputCombActionField>::allocate();
 		*task_data = *pInputCombAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1902,17 +2417,22 @@ void TdApi::OnErrRtnCombActionInsert(CThostFtdcInputCombActionField *pInputCombA
 
 void TdApi::OnRspQryContractBank(CThostFtdcContractBankField *pContractBank, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYCONTRACTBANK;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pContractBank)
 	{
-		CThostFtdcContractBankField *task_data = new CThostFtdcContractBankField();
+		CThostFtdcContractBankField *task_data = TaskPool<CThostFtdcContractBankField>::allocate();
 		*task_data = *pContractBank;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1923,17 +2443,22 @@ void TdApi::OnRspQryContractBank(CThostFtdcContractBankField *pContractBank, CTh
 
 void TdApi::OnRspQryParkedOrder(CThostFtdcParkedOrderField *pParkedOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYPARKEDORDER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pParkedOrder)
 	{
-		CThostFtdcParkedOrderField *task_data = new CThostFtdcParkedOrderField();
+		CThostFtdcParkedOrderField *task_data = TaskPool<CThostFtdcParkedOrderField>::allocate();
 		*task_data = *pParkedOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1944,17 +2469,22 @@ void TdApi::OnRspQryParkedOrder(CThostFtdcParkedOrderField *pParkedOrder, CThost
 
 void TdApi::OnRspQryParkedOrderAction(CThostFtdcParkedOrderActionField *pParkedOrderAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYPARKEDORDERACTION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pParkedOrderAction)
 	{
-		CThostFtdcParkedOrderActionField *task_data = new CThostFtdcParkedOrderActionField();
+		CThostFtdcParkedOrderActionField *task_data = TaskPool<CThostFtdcParkedOrderActionField>::allocate();
 		*task_data = *pParkedOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1965,17 +2495,22 @@ void TdApi::OnRspQryParkedOrderAction(CThostFtdcParkedOrderActionField *pParkedO
 
 void TdApi::OnRspQryTradingNotice(CThostFtdcTradingNoticeField *pTradingNotice, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYTRADINGNOTICE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pTradingNotice)
 	{
-		CThostFtdcTradingNoticeField *task_data = new CThostFtdcTradingNoticeField();
+		CThostFtdcTradingNoticeField *task_data = TaskPool<CThostFtdcTradingNoticeField>::allocate();
 		*task_data = *pTradingNotice;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1986,17 +2521,22 @@ void TdApi::OnRspQryTradingNotice(CThostFtdcTradingNoticeField *pTradingNotice,
 
 void TdApi::OnRspQryBrokerTradingParams(CThostFtdcBrokerTradingParamsField *pBrokerTradingParams, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYBROKERTRADINGPARAMS;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pBrokerTradingParams)
 	{
-		CThostFtdcBrokerTradingParamsField *task_data = new CThostFtdcBrokerTradingParamsField();
+		CThostFtdcBrokerTradingParamsField *task_data = TaskPool<CThostFtdcBrokerTradingParamsField>::allocate();
 		*task_data = *pBrokerTradingParams;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2007,17 +2547,22 @@ void TdApi::OnRspQryBrokerTradingParams(CThostFtdcBrokerTradingParamsField *pBro
 
 void TdApi::OnRspQryBrokerTradingAlgos(CThostFtdcBrokerTradingAlgosField *pBrokerTradingAlgos, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYBROKERTRADINGALGOS;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pBrokerTradingAlgos)
 	{
-		CThostFtdcBrokerTradingAlgosField *task_data = new CThostFtdcBrokerTradingAlgosField();
+		CThostFtdcBrokerTradingAlgosField *task_data = TaskPool<CThostFtdcBrokerTradingAlgosField>::allocate();
 		*task_data = *pBrokerTradingAlgos;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2028,17 +2573,22 @@ void TdApi::OnRspQryBrokerTradingAlgos(CThostFtdcBrokerTradingAlgosField *pBroke
 
 void TdApi::OnRspQueryCFMMCTradingAccountToken(CThostFtdcQueryCFMMCTradingAccountTokenField *pQueryCFMMCTradingAccountToken, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQUERYCFMMCTRADINGACCOUNTTOKEN;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pQueryCFMMCTradingAccountToken)
 	{
-		CThostFtdcQueryCFMMCTradingAccountTokenField *task_data = new CThostFtdcQueryCFMMCTradingAccountTokenField();
+		CThostFtdcQueryCFMMCTradingAccountTokenField *task_data = TaskPool<CThostFtdcQueryCFMMCTradingAccountTokenField>::allocate();
 		*task_data = *pQueryCFMMCTradingAccountToken;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2049,11 +2599,16 @@ void TdApi::OnRspQueryCFMMCTradingAccountToken(CThostFtdcQueryCFMMCTradingAccoun
 
 void TdApi::OnRtnFromBankToFutureByBank(CThostFtdcRspTransferField *pRspTransfer) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNFROMBANKTOFUTUREBYBANK;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspTransfer)
 	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
+		CThostFtdcRspTransferField *task_data = TaskPool<CThostFtdcRspTransferField>::allocate();
 		*task_data = *pRspTransfer;
 		task.task_data = task_data;
 	}
@@ -2062,11 +2617,16 @@ void TdApi::OnRtnFromBankToFutureByBank(CThostFtdcRspTransferField *pRspTransfer
 
 void TdApi::OnRtnFromFutureToBankByBank(CThostFtdcRspTransferField *pRspTransfer) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNFROMFUTURETOBANKBYBANK;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspTransfer)
 	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
+		CThostFtdcRspTransferField *task_data = TaskPool<CThostFtdcRspTransferField>::allocate();
 		*task_data = *pRspTransfer;
 		task.task_data = task_data;
 	}
@@ -2075,11 +2635,16 @@ void TdApi::OnRtnFromFutureToBankByBank(CThostFtdcRspTransferField *pRspTransfer
 
 void TdApi::OnRtnRepealFromBankToFutureByBank(CThostFtdcRspRepealField *pRspRepeal) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNREPEALFROMBANKTOFUTUREBYBANK;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = TaskPool<CThostFtdcRspRepealField>::allocate();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -2088,11 +2653,16 @@ void TdApi::OnRtnRepealFromBankToFutureByBank(CThostFtdcRspRepealField *pRspRepe
 
 void TdApi::OnRtnRepealFromFutureToBankByBank(CThostFtdcRspRepealField *pRspRepeal) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNREPEALFROMFUTURETOBANKBYBANK;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = TaskPool<CThostFtdcRspRepealField>::allocate();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -2101,11 +2671,16 @@ void TdApi::OnRtnRepealFromFutureToBankByBank(CThostFtdcRspRepealField *pRspRepe
 
 void TdApi::OnRtnFromBankToFutureByFuture(CThostFtdcRspTransferField *pRspTransfer) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNFROMBANKTOFUTUREBYFUTURE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspTransfer)
 	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
+		CThostFtdcRspTransferField *task_data = TaskPool<CThostFtdcRspTransferField>::allocate();
 		*task_data = *pRspTransfer;
 		task.task_data = task_data;
 	}
@@ -2114,11 +2689,16 @@ void TdApi::OnRtnFromBankToFutureByFuture(CThostFtdcRspTransferField *pRspTransf
 
 void TdApi::OnRtnFromFutureToBankByFuture(CThostFtdcRspTransferField *pRspTransfer) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNFROMFUTURETOBANKBYFUTURE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspTransfer)
 	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
+		CThostFtdcRspTransferField *task_data = TaskPool<CThostFtdcRspTransferField>::allocate();
 		*task_data = *pRspTransfer;
 		task.task_data = task_data;
 	}
@@ -2127,11 +2707,16 @@ void TdApi::OnRtnFromFutureToBankByFuture(CThostFtdcRspTransferField *pRspTransf
 
 void TdApi::OnRtnRepealFromBankToFutureByFutureManual(CThostFtdcRspRepealField *pRspRepeal) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNREPEALFROMBANKTOFUTUREBYFUTUREMANUAL;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = TaskPool<CThostFtdcRspRepealField>::allocate();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -2140,11 +2725,16 @@ void TdApi::OnRtnRepealFromBankToFutureByFutureManual(CThostFtdcRspRepealField *
 
 void TdApi::OnRtnRepealFromFutureToBankByFutureManual(CThostFtdcRspRepealField *pRspRepeal) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNREPEALFROMFUTURETOBANKBYFUTUREMANUAL;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = TaskPool<CThostFtdcRspRepealField>::allocate();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -2153,11 +2743,16 @@ void TdApi::OnRtnRepealFromFutureToBankByFutureManual(CThostFtdcRspRepealField *
 
 void TdApi::OnRtnQueryBankBalanceByFuture(CThostFtdcNotifyQueryAccountField *pNotifyQueryAccount) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNQUERYBANKBALANCEBYFUTURE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pNotifyQueryAccount)
 	{
-		CThostFtdcNotifyQueryAccountField *task_data = new CThostFtdcNotifyQueryAccountField();
+		CThostFtdcNotifyQueryAccountField *task_data = TaskPool<CThostFtdcNotifyQueryAccountField>::allocate();
 		*task_data = *pNotifyQueryAccount;
 		task.task_data = task_data;
 	}
@@ -2166,17 +2761,22 @@ void TdApi::OnRtnQueryBankBalanceByFuture(CThostFtdcNotifyQueryAccountField *pNo
 
 void TdApi::OnErrRtnBankToFutureByFuture(CThostFtdcReqTransferField *pReqTransfer, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNBANKTOFUTUREBYFUTURE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pReqTransfer)
 	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
+		CThostFtdcReqTransferField *task_data = TaskPool<CThostFtdcReqTransferField>::allocate();
 		*task_data = *pReqTransfer;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2185,17 +2785,22 @@ void TdApi::OnErrRtnBankToFutureByFuture(CThostFtdcReqTransferField *pReqTransfe
 
 void TdApi::OnErrRtnFutureToBankByFuture(CThostFtdcReqTransferField *pReqTransfer, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNFUTURETOBANKBYFUTURE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pReqTransfer)
 	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
+		CThostFtdcReqTransferField *task_data = TaskPool<CThostFtdcReqTransferField>::allocate();
 		*task_data = *pReqTransfer;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2204,17 +2809,22 @@ void TdApi::OnErrRtnFutureToBankByFuture(CThostFtdcReqTransferField *pReqTransfe
 
 void TdApi::OnErrRtnRepealBankToFutureByFutureManual(CThostFtdcReqRepealField *pReqRepeal, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNREPEALBANKTOFUTUREBYFUTUREMANUAL;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pReqRepeal)
 	{
-		CThostFtdcReqRepealField *task_data = new CThostFtdcReqRepealField();
+		CThostFtdcReqRepealField *task_data = TaskPool<CThostFtdcReqRepealField>::allocate();
 		*task_data = *pReqRepeal;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2223,17 +2833,22 @@ void TdApi::OnErrRtnRepealBankToFutureByFutureManual(CThostFtdcReqRepealField *p
 
 void TdApi::OnErrRtnRepealFutureToBankByFutureManual(CThostFtdcReqRepealField *pReqRepeal, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNREPEALFUTURETOBANKBYFUTUREMANUAL;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pReqRepeal)
 	{
-		CThostFtdcReqRepealField *task_data = new CThostFtdcReqRepealField();
+		CThostFtdcReqRepealField *task_data = TaskPool<CThostFtdcReqRepealField>::allocate();
 		*task_data = *pReqRepeal;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2242,17 +2857,22 @@ void TdApi::OnErrRtnRepealFutureToBankByFutureManual(CThostFtdcReqRepealField *p
 
 void TdApi::OnErrRtnQueryBankBalanceByFuture(CThostFtdcReqQueryAccountField *pReqQueryAccount, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNQUERYBANKBALANCEBYFUTURE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pReqQueryAccount)
 	{
-		CThostFtdcReqQueryAccountField *task_data = new CThostFtdcReqQueryAccountField();
+		CThostFtdcReqQueryAccountField *task_data = TaskPool<CThostFtdcReqQueryAccountField>::allocate();
 		*task_data = *pReqQueryAccount;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2261,11 +2881,16 @@ void TdApi::OnErrRtnQueryBankBalanceByFuture(CThostFtdcReqQueryAccountField *pRe
 
 void TdApi::OnRtnRepealFromBankToFutureByFuture(CThostFtdcRspRepealField *pRspRepeal) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNREPEALFROMBANKTOFUTUREBYFUTURE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = TaskPool<CThostFtdcRspRepealField>::allocate();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -2274,11 +2899,16 @@ void TdApi::OnRtnRepealFromBankToFutureByFuture(CThostFtdcRspRepealField *pRspRe
 
 void TdApi::OnRtnRepealFromFutureToBankByFuture(CThostFtdcRspRepealField *pRspRepeal) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNREPEALFROMFUTURETOBANKBYFUTURE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = TaskPool<CThostFtdcRspRepealField>::allocate();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -2287,17 +2917,22 @@ void TdApi::OnRtnRepealFromFutureToBankByFuture(CThostFtdcRspRepealField *pRspRe
 
 void TdApi::OnRspFromBankToFutureByFuture(CThostFtdcReqTransferField *pReqTransfer, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPFROMBANKTOFUTUREBYFUTURE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pReqTransfer)
 	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
+		CThostFtdcReqTransferField *task_data = TaskPool<CThostFtdcReqTransferField>::allocate();
 		*task_data = *pReqTransfer;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2308,17 +2943,22 @@ void TdApi::OnRspFromBankToFutureByFuture(CThostFtdcReqTransferField *pReqTransf
 
 void TdApi::OnRspFromFutureToBankByFuture(CThostFtdcReqTransferField *pReqTransfer, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPFROMFUTURETOBANKBYFUTURE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pReqTransfer)
 	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
+		CThostFtdcReqTransferField *task_data = TaskPool<CThostFtdcReqTransferField>::allocate();
 		*task_data = *pReqTransfer;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2329,17 +2969,22 @@ void TdApi::OnRspFromFutureToBankByFuture(CThostFtdcReqTransferField *pReqTransf
 
 void TdApi::OnRspQueryBankAccountMoneyByFuture(CThostFtdcReqQueryAccountField *pReqQueryAccount, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQUERYBANKACCOUNTMONEYBYFUTURE;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pReqQueryAccount)
 	{
-		CThostFtdcReqQueryAccountField *task_data = new CThostFtdcReqQueryAccountField();
+		CThostFtdcReqQueryAccountField *task_data = TaskPool<CThostFtdcReqQueryAccountField>::allocate();
 		*task_data = *pReqQueryAccount;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2350,11 +2995,16 @@ void TdApi::OnRspQueryBankAccountMoneyByFuture(CThostFtdcReqQueryAccountField *p
 
 void TdApi::OnRtnOpenAccountByBank(CThostFtdcOpenAccountField *pOpenAccount) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNOPENACCOUNTBYBANK;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pOpenAccount)
 	{
-		CThostFtdcOpenAccountField *task_data = new CThostFtdcOpenAccountField();
+		CThostFtdcOpenAccountField *task_data = TaskPool<CThostFtdcOpenAccountField>::allocate();
 		*task_data = *pOpenAccount;
 		task.task_data = task_data;
 	}
@@ -2363,11 +3013,16 @@ void TdApi::OnRtnOpenAccountByBank(CThostFtdcOpenAccountField *pOpenAccount)
 
 void TdApi::OnRtnCancelAccountByBank(CThostFtdcCancelAccountField *pCancelAccount) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNCANCELACCOUNTBYBANK;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pCancelAccount)
 	{
-		CThostFtdcCancelAccountField *task_data = new CThostFtdcCancelAccountField();
+		CThostFtdcCancelAccountField *task_data = TaskPool<CThostFtdcCancelAccountField>::allocate();
 		*task_data = *pCancelAccount;
 		task.task_data = task_data;
 	}
@@ -2376,11 +3031,16 @@ void TdApi::OnRtnCancelAccountByBank(CThostFtdcCancelAccountField *pCancelAccoun
 
 void TdApi::OnRtnChangeAccountByBank(CThostFtdcChangeAccountField *pChangeAccount) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNCHANGEACCOUNTBYBANK;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pChangeAccount)
 	{
-		CThostFtdcChangeAccountField *task_data = new CThostFtdcChangeAccountField();
+		CThostFtdcChangeAccountField *task_data = TaskPool<CThostFtdcChangeAccountField>::allocate();
 		*task_data = *pChangeAccount;
 		task.task_data = task_data;
 	}
@@ -2389,17 +3049,22 @@ void TdApi::OnRtnChangeAccountByBank(CThostFtdcChangeAccountField *pChangeAccoun
 
 void TdApi::OnRspQryClassifiedInstrument(CThostFtdcInstrumentField *pInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYCLASSIFIEDINSTRUMENT;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInstrument)
 	{
-		CThostFtdcInstrumentField *task_data = new CThostFtdcInstrumentField();
+		CThostFtdcInstrumentField *task_data = TaskPool<CThostFtdcInstrumentField>::allocate();
 		*task_data = *pInstrument;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2410,17 +3075,22 @@ void TdApi::OnRspQryClassifiedInstrument(CThostFtdcInstrumentField *pInstrument,
 
 void TdApi::OnRspQryCombPromotionParam(CThostFtdcCombPromotionParamField *pCombPromotionParam, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYCOMBPROMOTIONPARAM;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pCombPromotionParam)
 	{
-		CThostFtdcCombPromotionParamField *task_data = new CThostFtdcCombPromotionParamField();
+		CThostFtdcCombPromotionParamField *task_data = TaskPool<CThostFtdcCombPromotionParamField>::allocate();
 		*task_data = *pCombPromotionParam;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2431,17 +3101,22 @@ void TdApi::OnRspQryCombPromotionParam(CThostFtdcCombPromotionParamField *pCombP
 
 void TdApi::OnRspQryRiskSettleInvstPosition(CThostFtdcRiskSettleInvstPositionField *pRiskSettleInvstPosition, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYRISKSETTLEINVSTPOSITION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRiskSettleInvstPosition)
 	{
-		CThostFtdcRiskSettleInvstPositionField *task_data = new CThostFtdcRiskSettleInvstPositionField();
+		CThostFtdcRiskSettleInvstPositionField *task_data = TaskPool<CThostFtdcRiskSettleInvstPositionField>::allocate();
 		*task_data = *pRiskSettleInvstPosition;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2452,17 +3127,22 @@ void TdApi::OnRspQryRiskSettleInvstPosition(CThostFtdcRiskSettleInvstPositionFie
 
 void TdApi::OnRspQryRiskSettleProductStatus(CThostFtdcRiskSettleProductStatusField *pRiskSettleProductStatus, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYRISKSETTLEPRODUCTSTATUS;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRiskSettleProductStatus)
 	{
-		CThostFtdcRiskSettleProductStatusField *task_data = new CThostFtdcRiskSettleProductStatusField();
+		CThostFtdcRiskSettleProductStatusField *task_data = TaskPool<CThostFtdcRiskSettleProductStatusField>::allocate();
 		*task_data = *pRiskSettleProductStatus;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2473,17 +3153,22 @@ void TdApi::OnRspQryRiskSettleProductStatus(CThostFtdcRiskSettleProductStatusFie
 
 void TdApi::OnRspQrySPBMFutureParameter(CThostFtdcSPBMFutureParameterField *pSPBMFutureParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYSPBMFUTUREPARAMETER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSPBMFutureParameter)
 	{
-		CThostFtdcSPBMFutureParameterField *task_data = new CThostFtdcSPBMFutureParameterField();
+		CThostFtdcSPBMFutureParameterField *task_data = TaskPool<CThostFtdcSPBMFutureParameterField>::allocate();
 		*task_data = *pSPBMFutureParameter;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2494,17 +3179,22 @@ void TdApi::OnRspQrySPBMFutureParameter(CThostFtdcSPBMFutureParameterField *pSPB
 
 void TdApi::OnRspQrySPBMOptionParameter(CThostFtdcSPBMOptionParameterField *pSPBMOptionParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYSPBMOPTIONPARAMETER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSPBMOptionParameter)
 	{
-		CThostFtdcSPBMOptionParameterField *task_data = new CThostFtdcSPBMOptionParameterField();
+		CThostFtdcSPBMOptionParameterField *task_data = TaskPool<CThostFtdcSPBMOptionParameterField>::allocate();
 		*task_data = *pSPBMOptionParameter;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2515,17 +3205,22 @@ void TdApi::OnRspQrySPBMOptionParameter(CThostFtdcSPBMOptionParameterField *pSPB
 
 void TdApi::OnRspQrySPBMIntraParameter(CThostFtdcSPBMIntraParameterField *pSPBMIntraParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYSPBMINTRAPARAMETER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSPBMIntraParameter)
 	{
-		CThostFtdcSPBMIntraParameterField *task_data = new CThostFtdcSPBMIntraParameterField();
+		CThostFtdcSPBMIntraParameterField *task_data = TaskPool<CThostFtdcSPBMIntraParameterField>::allocate();
 		*task_data = *pSPBMIntraParameter;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2536,17 +3231,22 @@ void TdApi::OnRspQrySPBMIntraParameter(CThostFtdcSPBMIntraParameterField *pSPBMI
 
 void TdApi::OnRspQrySPBMInterParameter(CThostFtdcSPBMInterParameterField *pSPBMInterParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYSPBMINTERPARAMETER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSPBMInterParameter)
 	{
-		CThostFtdcSPBMInterParameterField *task_data = new CThostFtdcSPBMInterParameterField();
+		CThostFtdcSPBMInterParameterField *task_data = TaskPool<CThostFtdcSPBMInterParameterField>::allocate();
 		*task_data = *pSPBMInterParameter;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2557,17 +3257,22 @@ void TdApi::OnRspQrySPBMInterParameter(CThostFtdcSPBMInterParameterField *pSPBMI
 
 void TdApi::OnRspQrySPBMPortfDefinition(CThostFtdcSPBMPortfDefinitionField *pSPBMPortfDefinition, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYSPBMPORTFDEFINITION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSPBMPortfDefinition)
 	{
-		CThostFtdcSPBMPortfDefinitionField *task_data = new CThostFtdcSPBMPortfDefinitionField();
+		CThostFtdcSPBMPortfDefinitionField *task_data = TaskPool<CThostFtdcSPBMPortfDefinitionField>::allocate();
 		*task_data = *pSPBMPortfDefinition;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2578,17 +3283,22 @@ void TdApi::OnRspQrySPBMPortfDefinition(CThostFtdcSPBMPortfDefinitionField *pSPB
 
 void TdApi::OnRspQrySPBMInvestorPortfDef(CThostFtdcSPBMInvestorPortfDefField *pSPBMInvestorPortfDef, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYSPBMINVESTORPORTFDEF;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSPBMInvestorPortfDef)
 	{
-		CThostFtdcSPBMInvestorPortfDefField *task_data = new CThostFtdcSPBMInvestorPortfDefField();
+		CThostFtdcSPBMInvestorPortfDefField *task_data = TaskPool<CThostFtdcSPBMInvestorPortfDefField>::allocate();
 		*task_data = *pSPBMInvestorPortfDef;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2599,17 +3309,22 @@ void TdApi::OnRspQrySPBMInvestorPortfDef(CThostFtdcSPBMInvestorPortfDefField *pS
 
 void TdApi::OnRspQryInvestorPortfMarginRatio(CThostFtdcInvestorPortfMarginRatioField *pInvestorPortfMarginRatio, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINVESTORPORTFMARGINRATIO;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInvestorPortfMarginRatio)
 	{
-		CThostFtdcInvestorPortfMarginRatioField *task_data = new CThostFtdcInvestorPortfMarginRatioField();
+		CThostFtdcInvestorPortfMarginRatioField *task_data = TaskPool<CThostFtdcInvestorPortfMarginRatioField>::allocate();
 		*task_data = *pInvestorPortfMarginRatio;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2620,17 +3335,22 @@ void TdApi::OnRspQryInvestorPortfMarginRatio(CThostFtdcInvestorPortfMarginRatioF
 
 void TdApi::OnRspQryInvestorProdSPBMDetail(CThostFtdcInvestorProdSPBMDetailField *pInvestorProdSPBMDetail, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINVESTORPRODSPBMDETAIL;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInvestorProdSPBMDetail)
 	{
-		CThostFtdcInvestorProdSPBMDetailField *task_data = new CThostFtdcInvestorProdSPBMDetailField();
+		CThostFtdcInvestorProdSPBMDetailField *task_data = TaskPool<CThostFtdcInvestorProdSPBMDetailField>::allocate();
 		*task_data = *pInvestorProdSPBMDetail;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2641,17 +3361,22 @@ void TdApi::OnRspQryInvestorProdSPBMDetail(CThostFtdcInvestorProdSPBMDetailField
 
 void TdApi::OnRspQryInvestorCommoditySPMMMargin(CThostFtdcInvestorCommoditySPMMMarginField *pInvestorCommoditySPMMMargin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINVESTORCOMMODITYSPMMMARGIN;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInvestorCommoditySPMMMargin)
 	{
-		CThostFtdcInvestorCommoditySPMMMarginField *task_data = new CThostFtdcInvestorCommoditySPMMMarginField();
+		CThostFtdcInvestorCommoditySPMMMarginField *task_data = TaskPool<CThostFtdcInvestorCommoditySPMMMarginField>::allocate();
 		*task_data = *pInvestorCommoditySPMMMargin;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2662,17 +3387,22 @@ void TdApi::OnRspQryInvestorCommoditySPMMMargin(CThostFtdcInvestorCommoditySPMMM
 
 void TdApi::OnRspQryInvestorCommodityGroupSPMMMargin(CThostFtdcInvestorCommodityGroupSPMMMarginField *pInvestorCommodityGroupSPMMMargin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINVESTORCOMMODITYGROUPSPMMMARGIN;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInvestorCommodityGroupSPMMMargin)
 	{
-		CThostFtdcInvestorCommodityGroupSPMMMarginField *task_data = new CThostFtdcInvestorCommodityGroupSPMMMarginField();
+		CThostFtdcInvestorCommodityGroupSPMMMarginField *task_data = TaskPool<CThostFtdcInvestorCommodityGroupSPMMMarginField>::allocate();
 		*task_data = *pInvestorCommodityGroupSPMMMargin;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2683,17 +3413,22 @@ void TdApi::OnRspQryInvestorCommodityGroupSPMMMargin(CThostFtdcInvestorCommodity
 
 void TdApi::OnRspQrySPMMInstParam(CThostFtdcSPMMInstParamField *pSPMMInstParam, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYSPMMINSTPARAM;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSPMMInstParam)
 	{
-		CThostFtdcSPMMInstParamField *task_data = new CThostFtdcSPMMInstParamField();
+		CThostFtdcSPMMInstParamField *task_data = TaskPool<CThostFtdcSPMMInstParamField>::allocate();
 		*task_data = *pSPMMInstParam;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2704,17 +3439,22 @@ void TdApi::OnRspQrySPMMInstParam(CThostFtdcSPMMInstParamField *pSPMMInstParam,
 
 void TdApi::OnRspQrySPMMProductParam(CThostFtdcSPMMProductParamField *pSPMMProductParam, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYSPMMPRODUCTPARAM;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSPMMProductParam)
 	{
-		CThostFtdcSPMMProductParamField *task_data = new CThostFtdcSPMMProductParamField();
+		CThostFtdcSPMMProductParamField *task_data = TaskPool<CThostFtdcSPMMProductParamField>::allocate();
 		*task_data = *pSPMMProductParam;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2725,17 +3465,22 @@ void TdApi::OnRspQrySPMMProductParam(CThostFtdcSPMMProductParamField *pSPMMProdu
 
 void TdApi::OnRspQrySPBMAddOnInterParameter(CThostFtdcSPBMAddOnInterParameterField *pSPBMAddOnInterParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYSPBMADDONINTERPARAMETER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pSPBMAddOnInterParameter)
 	{
-		CThostFtdcSPBMAddOnInterParameterField *task_data = new CThostFtdcSPBMAddOnInterParameterField();
+		CThostFtdcSPBMAddOnInterParameterField *task_data = TaskPool<CThostFtdcSPBMAddOnInterParameterField>::allocate();
 		*task_data = *pSPBMAddOnInterParameter;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2746,17 +3491,22 @@ void TdApi::OnRspQrySPBMAddOnInterParameter(CThostFtdcSPBMAddOnInterParameterFie
 
 void TdApi::OnRspQryRCAMSCombProductInfo(CThostFtdcRCAMSCombProductInfoField *pRCAMSCombProductInfo, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYRCAMSCOMBPRODUCTINFO;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRCAMSCombProductInfo)
 	{
-		CThostFtdcRCAMSCombProductInfoField *task_data = new CThostFtdcRCAMSCombProductInfoField();
+		CThostFtdcRCAMSCombProductInfoField *task_data = TaskPool<CThostFtdcRCAMSCombProductInfoField>::allocate();
 		*task_data = *pRCAMSCombProductInfo;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2767,17 +3517,22 @@ void TdApi::OnRspQryRCAMSCombProductInfo(CThostFtdcRCAMSCombProductInfoField *pR
 
 void TdApi::OnRspQryRCAMSInstrParameter(CThostFtdcRCAMSInstrParameterField *pRCAMSInstrParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYRCAMSINSTRPARAMETER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRCAMSInstrParameter)
 	{
-		CThostFtdcRCAMSInstrParameterField *task_data = new CThostFtdcRCAMSInstrParameterField();
+		CThostFtdcRCAMSInstrParameterField *task_data = TaskPool<CThostFtdcRCAMSInstrParameterField>::allocate();
 		*task_data = *pRCAMSInstrParameter;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2788,17 +3543,22 @@ void TdApi::OnRspQryRCAMSInstrParameter(CThostFtdcRCAMSInstrParameterField *pRCA
 
 void TdApi::OnRspQryRCAMSIntraParameter(CThostFtdcRCAMSIntraParameterField *pRCAMSIntraParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYRCAMSINTRAPARAMETER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRCAMSIntraParameter)
 	{
-		CThostFtdcRCAMSIntraParameterField *task_data = new CThostFtdcRCAMSIntraParameterField();
+		CThostFtdcRCAMSIntraParameterField *task_data = TaskPool<CThostFtdcRCAMSIntraParameterField>::allocate();
 		*task_data = *pRCAMSIntraParameter;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2809,17 +3569,22 @@ void TdApi::OnRspQryRCAMSIntraParameter(CThostFtdcRCAMSIntraParameterField *pRCA
 
 void TdApi::OnRspQryRCAMSInterParameter(CThostFtdcRCAMSInterParameterField *pRCAMSInterParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYRCAMSINTERPARAMETER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRCAMSInterParameter)
 	{
-		CThostFtdcRCAMSInterParameterField *task_data = new CThostFtdcRCAMSInterParameterField();
+		CThostFtdcRCAMSInterParameterField *task_data = TaskPool<CThostFtdcRCAMSInterParameterField>::allocate();
 		*task_data = *pRCAMSInterParameter;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2830,17 +3595,22 @@ void TdApi::OnRspQryRCAMSInterParameter(CThostFtdcRCAMSInterParameterField *pRCA
 
 void TdApi::OnRspQryRCAMSShortOptAdjustParam(CThostFtdcRCAMSShortOptAdjustParamField *pRCAMSShortOptAdjustParam, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYRCAMSSHORTOPTADJUSTPARAM;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRCAMSShortOptAdjustParam)
 	{
-		CThostFtdcRCAMSShortOptAdjustParamField *task_data = new CThostFtdcRCAMSShortOptAdjustParamField();
+		CThostFtdcRCAMSShortOptAdjustParamField *task_data = TaskPool<CThostFtdcRCAMSShortOptAdjustParamField>::allocate();
 		*task_data = *pRCAMSShortOptAdjustParam;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2851,17 +3621,22 @@ void TdApi::OnRspQryRCAMSShortOptAdjustParam(CThostFtdcRCAMSShortOptAdjustParamF
 
 void TdApi::OnRspQryRCAMSInvestorCombPosition(CThostFtdcRCAMSInvestorCombPositionField *pRCAMSInvestorCombPosition, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYRCAMSINVESTORCOMBPOSITION;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRCAMSInvestorCombPosition)
 	{
-		CThostFtdcRCAMSInvestorCombPositionField *task_data = new CThostFtdcRCAMSInvestorCombPositionField();
+		CThostFtdcRCAMSInvestorCombPositionField *task_data = TaskPool<CThostFtdcRCAMSInvestorCombPositionField>::allocate();
 		*task_data = *pRCAMSInvestorCombPosition;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2872,17 +3647,22 @@ void TdApi::OnRspQryRCAMSInvestorCombPosition(CThostFtdcRCAMSInvestorCombPositio
 
 void TdApi::OnRspQryInvestorProdRCAMSMargin(CThostFtdcInvestorProdRCAMSMarginField *pInvestorProdRCAMSMargin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINVESTORPRODRCAMSMARGIN;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInvestorProdRCAMSMargin)
 	{
-		CThostFtdcInvestorProdRCAMSMarginField *task_data = new CThostFtdcInvestorProdRCAMSMarginField();
+		CThostFtdcInvestorProdRCAMSMarginField *task_data = TaskPool<CThostFtdcInvestorProdRCAMSMarginField>::allocate();
 		*task_data = *pInvestorProdRCAMSMargin;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2893,17 +3673,22 @@ void TdApi::OnRspQryInvestorProdRCAMSMargin(CThostFtdcInvestorProdRCAMSMarginFie
 
 void TdApi::OnRspQryRULEInstrParameter(CThostFtdcRULEInstrParameterField *pRULEInstrParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYRULEINSTRPARAMETER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRULEInstrParameter)
 	{
-		CThostFtdcRULEInstrParameterField *task_data = new CThostFtdcRULEInstrParameterField();
+		CThostFtdcRULEInstrParameterField *task_data = TaskPool<CThostFtdcRULEInstrParameterField>::allocate();
 		*task_data = *pRULEInstrParameter;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2914,17 +3699,22 @@ void TdApi::OnRspQryRULEInstrParameter(CThostFtdcRULEInstrParameterField *pRULEI
 
 void TdApi::OnRspQryRULEIntraParameter(CThostFtdcRULEIntraParameterField *pRULEIntraParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYRULEINTRAPARAMETER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRULEIntraParameter)
 	{
-		CThostFtdcRULEIntraParameterField *task_data = new CThostFtdcRULEIntraParameterField();
+		CThostFtdcRULEIntraParameterField *task_data = TaskPool<CThostFtdcRULEIntraParameterField>::allocate();
 		*task_data = *pRULEIntraParameter;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2935,17 +3725,22 @@ void TdApi::OnRspQryRULEIntraParameter(CThostFtdcRULEIntraParameterField *pRULEI
 
 void TdApi::OnRspQryRULEInterParameter(CThostFtdcRULEInterParameterField *pRULEInterParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYRULEINTERPARAMETER;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pRULEInterParameter)
 	{
-		CThostFtdcRULEInterParameterField *task_data = new CThostFtdcRULEInterParameterField();
+		CThostFtdcRULEInterParameterField *task_data = TaskPool<CThostFtdcRULEInterParameterField>::allocate();
 		*task_data = *pRULEInterParameter;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2956,17 +3751,22 @@ void TdApi::OnRspQryRULEInterParameter(CThostFtdcRULEInterParameterField *pRULEI
 
 void TdApi::OnRspQryInvestorProdRULEMargin(CThostFtdcInvestorProdRULEMarginField *pInvestorProdRULEMargin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINVESTORPRODRULEMARGIN;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInvestorProdRULEMargin)
 	{
-		CThostFtdcInvestorProdRULEMarginField *task_data = new CThostFtdcInvestorProdRULEMarginField();
+		CThostFtdcInvestorProdRULEMarginField *task_data = TaskPool<CThostFtdcInvestorProdRULEMarginField>::allocate();
 		*task_data = *pInvestorProdRULEMargin;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2977,17 +3777,22 @@ void TdApi::OnRspQryInvestorProdRULEMargin(CThostFtdcInvestorProdRULEMarginField
 
 void TdApi::OnRspQryInvestorPortfSetting(CThostFtdcInvestorPortfSettingField *pInvestorPortfSetting, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINVESTORPORTFSETTING;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInvestorPortfSetting)
 	{
-		CThostFtdcInvestorPortfSettingField *task_data = new CThostFtdcInvestorPortfSettingField();
+		CThostFtdcInvestorPortfSettingField *task_data = TaskPool<CThostFtdcInvestorPortfSettingField>::allocate();
 		*task_data = *pInvestorPortfSetting;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2998,17 +3803,22 @@ void TdApi::OnRspQryInvestorPortfSetting(CThostFtdcInvestorPortfSettingField *pI
 
 void TdApi::OnRspQryInvestorInfoCommRec(CThostFtdcInvestorInfoCommRecField *pInvestorInfoCommRec, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYINVESTORINFOCOMMREC;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInvestorInfoCommRec)
 	{
-		CThostFtdcInvestorInfoCommRecField *task_data = new CThostFtdcInvestorInfoCommRecField();
+		CThostFtdcInvestorInfoCommRecField *task_data = TaskPool<CThostFtdcInvestorInfoCommRecField>::allocate();
 		*task_data = *pInvestorInfoCommRec;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -3019,17 +3829,22 @@ void TdApi::OnRspQryInvestorInfoCommRec(CThostFtdcInvestorInfoCommRecField *pInv
 
 void TdApi::OnRspQryCombLeg(CThostFtdcCombLegField *pCombLeg, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYCOMBLEG;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pCombLeg)
 	{
-		CThostFtdcCombLegField *task_data = new CThostFtdcCombLegField();
+		CThostFtdcCombLegField *task_data = TaskPool<CThostFtdcCombLegField>::allocate();
 		*task_data = *pCombLeg;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -3040,17 +3855,22 @@ void TdApi::OnRspQryCombLeg(CThostFtdcCombLegField *pCombLeg, CThostFtdcRspInfoF
 
 void TdApi::OnRspOffsetSetting(CThostFtdcInputOffsetSettingField *pInputOffsetSetting, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPOFFSETSETTING;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputOffsetSetting)
 	{
-		CThostFtdcInputOffsetSettingField *task_data = new CThostFtdcInputOffsetSettingField();
+		CThostFtdcInputOffsetSettingField *task_data = TaskPool<CThostFtdcInputOffsetSettingField>::allocate();
 		*task_data = *pInputOffsetSetting;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -3061,17 +3881,22 @@ void TdApi::OnRspOffsetSetting(CThostFtdcInputOffsetSettingField *pInputOffsetSe
 
 void TdApi::OnRspCancelOffsetSetting(CThostFtdcInputOffsetSettingField *pInputOffsetSetting, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPCANCELOFFSETSETTING;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputOffsetSetting)
 	{
-		CThostFtdcInputOffsetSettingField *task_data = new CThostFtdcInputOffsetSettingField();
+		CThostFtdcInputOffsetSettingField *task_data = TaskPool<CThostFtdcInputOffsetSettingField>::allocate();
 		*task_data = *pInputOffsetSetting;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -3082,11 +3907,16 @@ void TdApi::OnRspCancelOffsetSetting(CThostFtdcInputOffsetSettingField *pInputOf
 
 void TdApi::OnRtnOffsetSetting(CThostFtdcOffsetSettingField *pOffsetSetting) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRTNOFFSETSETTING;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pOffsetSetting)
 	{
-		CThostFtdcOffsetSettingField *task_data = new CThostFtdcOffsetSettingField();
+		CThostFtdcOffsetSettingField *task_data = TaskPool<CThostFtdcOffsetSettingField>::allocate();
 		*task_data = *pOffsetSetting;
 		task.task_data = task_data;
 	}
@@ -3095,17 +3925,22 @@ void TdApi::OnRtnOffsetSetting(CThostFtdcOffsetSettingField *pOffsetSetting)
 
 void TdApi::OnErrRtnOffsetSetting(CThostFtdcInputOffsetSettingField *pInputOffsetSetting, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNOFFSETSETTING;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pInputOffsetSetting)
 	{
-		CThostFtdcInputOffsetSettingField *task_data = new CThostFtdcInputOffsetSettingField();
+		CThostFtdcInputOffsetSettingField *task_data = TaskPool<CThostFtdcInputOffsetSettingField>::allocate();
 		*task_data = *pInputOffsetSetting;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -3114,17 +3949,22 @@ void TdApi::OnErrRtnOffsetSetting(CThostFtdcInputOffsetSettingField *pInputOffse
 
 void TdApi::OnErrRtnCancelOffsetSetting(CThostFtdcCancelOffsetSettingField *pCancelOffsetSetting, CThostFtdcRspInfoField *pRspInfo) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONERRRTNCANCELOFFSETSETTING;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pCancelOffsetSetting)
 	{
-		CThostFtdcCancelOffsetSettingField *task_data = new CThostFtdcCancelOffsetSettingField();
+		CThostFtdcCancelOffsetSettingField *task_data = TaskPool<CThostFtdcCancelOffsetSettingField>::allocate();
 		*task_data = *pCancelOffsetSetting;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -3133,17 +3973,22 @@ void TdApi::OnErrRtnCancelOffsetSetting(CThostFtdcCancelOffsetSettingField *pCan
 
 void TdApi::OnRspQryOffsetSetting(CThostFtdcOffsetSettingField *pOffsetSetting, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
+	int64_t recv_time = steadyNs();
+	int64_t recv_wall_time = wallNs();
+
 	Task task = Task();
 	task.task_name = ONRSPQRYOFFSETSETTING;
+	task.task_time = recv_time;
+	task.task_wall_time = recv_wall_time;
 	if (pOffsetSetting)
 	{
-		CThostFtdcOffsetSettingField *task_data = new CThostFtdcOffsetSettingField();
+		CThostFtdcOffsetSettingField *task_data = TaskPool<CThostFtdcOffsetSettingField>::allocate();
 		*task_data = *pOffsetSetting;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = TaskPool<CThostFtdcRspInfoField>::allocate();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -4188,15 +5033,18 @@ void TdApi::processRspAuthenticate(Task *task)
 		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
 		data["AppID"] = toUtf(task_data->AppID);
 		data["AppType"] = task_data->AppType;
-		delete task_data;
+		TaskPool<CThostFtdcRspAuthenticateField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspAuthenticate(data, error, task->task_id, task->task_last);
 };
@@ -4227,15 +5075,18 @@ void TdApi::processRspUserLogin(Task *task)
 		data["UserDRIdentityID"] = task_data->UserDRIdentityID;
 		data["LastLoginTime"] = toUtf(task_data->LastLoginTime);
 		data["ReserveInfo"] = toUtf(task_data->ReserveInfo);
-		delete task_data;
+		TaskPool<CThostFtdcRspUserLoginField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspUserLogin(data, error, task->task_id, task->task_last);
 };
@@ -4249,15 +5100,18 @@ void TdApi::processRspUserLogout(Task *task)
 		CThostFtdcUserLogoutField *task_data = (CThostFtdcUserLogoutField*)task->task_data;
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["UserID"] = toUtf(task_data->UserID);
-		delete task_data;
+		TaskPool<CThostFtdcUserLogoutField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspUserLogout(data, error, task->task_id, task->task_last);
 };
@@ -4273,15 +5127,18 @@ void TdApi::processRspUserPasswordUpdate(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["OldPassword"] = toUtf(task_data->OldPassword);
 		data["NewPassword"] = toUtf(task_data->NewPassword);
-		delete task_data;
+		TaskPool<CThostFtdcUserPasswordUpdateField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspUserPasswordUpdate(data, error, task->task_id, task->task_last);
 };
@@ -4298,15 +5155,18 @@ void TdApi::processRspTradingAccountPasswordUpdate(Task *task)
 		data["OldPassword"] = toUtf(task_data->OldPassword);
 		data["NewPassword"] = toUtf(task_data->NewPassword);
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		delete task_data;
+		TaskPool<CThostFtdcTradingAccountPasswordUpdateField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspTradingAccountPasswordUpdate(data, error, task->task_id, task->task_last);
 };
@@ -4319,15 +5179,18 @@ void TdApi::processRspUserAuthMethod(Task *task)
 	{
 		CThostFtdcRspUserAuthMethodField *task_data = (CThostFtdcRspUserAuthMethodField*)task->task_data;
 		data["UsableAuthMethod"] = task_data->UsableAuthMethod;
-		delete task_data;
+		TaskPool<CThostFtdcRspUserAuthMethodField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspUserAuthMethod(data, error, task->task_id, task->task_last);
 };
@@ -4343,15 +5206,18 @@ void TdApi::processRspGenUserCaptcha(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["CaptchaInfoLen"] = task_data->CaptchaInfoLen;
 		data["CaptchaInfo"] = toUtf(task_data->CaptchaInfo);
-		delete task_data;
+		TaskPool<CThostFtdcRspGenUserCaptchaField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspGenUserCaptcha(data, error, task->task_id, task->task_last);
 };
@@ -4364,15 +5230,18 @@ void TdApi::processRspGenUserText(Task *task)
 	{
 		CThostFtdcRspGenUserTextField *task_data = (CThostFtdcRspGenUserTextField*)task->task_data;
 		data["UserTextSeq"] = task_data->UserTextSeq;
-		delete task_data;
+		TaskPool<CThostFtdcRspGenUserTextField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspGenUserText(data, error, task->task_id, task->task_last);
 };
@@ -4393,14 +5262,14 @@ void TdApi::processRspOrderInsert(Task *task)
 		data["Direction"] = task_data->Direction;
 		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
 		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
+		data["LimitPrice"] = validDouble(task_data->LimitPrice, this->invalid_as_nan);
 		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
 		data["TimeCondition"] = task_data->TimeCondition;
 		data["GTDDate"] = toUtf(task_data->GTDDate);
 		data["VolumeCondition"] = task_data->VolumeCondition;
 		data["MinVolume"] = task_data->MinVolume;
 		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
+		data["StopPrice"] = validDouble(task_data->StopPrice, this->invalid_as_nan);
 		data["ForceCloseReason"] = task_data->ForceCloseReason;
 		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
 		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
@@ -4418,15 +5287,18 @@ void TdApi::processRspOrderInsert(Task *task)
 		data["IPAddress"] = toUtf(task_data->IPAddress);
 		data["OrderMemo"] = toUtf(task_data->OrderMemo);
 		data["SessionReqSeq"] = task_data->SessionReqSeq;
-		delete task_data;
+		TaskPool<CThostFtdcInputOrderField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspOrderInsert(data, error, task->task_id, task->task_last);
 };
@@ -4447,14 +5319,14 @@ void TdApi::processRspParkedOrderInsert(Task *task)
 		data["Direction"] = task_data->Direction;
 		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
 		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
+		data["LimitPrice"] = validDouble(task_data->LimitPrice, this->invalid_as_nan);
 		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
 		data["TimeCondition"] = task_data->TimeCondition;
 		data["GTDDate"] = toUtf(task_data->GTDDate);
 		data["VolumeCondition"] = task_data->VolumeCondition;
 		data["MinVolume"] = task_data->MinVolume;
 		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
+		data["StopPrice"] = validDouble(task_data->StopPrice, this->invalid_as_nan);
 		data["ForceCloseReason"] = task_data->ForceCloseReason;
 		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
 		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
@@ -4475,15 +5347,18 @@ void TdApi::processRspParkedOrderInsert(Task *task)
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcParkedOrderField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspParkedOrderInsert(data, error, task->task_id, task->task_last);
 };
@@ -4505,7 +5380,7 @@ void TdApi::processRspParkedOrderAction(Task *task)
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["OrderSysID"] = toUtf(task_data->OrderSysID);
 		data["ActionFlag"] = task_data->ActionFlag;
-		data["LimitPrice"] = task_data->LimitPrice;
+		data["LimitPrice"] = validDouble(task_data->LimitPrice, this->invalid_as_nan);
 		data["VolumeChange"] = task_data->VolumeChange;
 		data["UserID"] = toUtf(task_data->UserID);
 		data["reserve1"] = toUtf(task_data->reserve1);
@@ -4519,15 +5394,18 @@ void TdApi::processRspParkedOrderAction(Task *task)
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcParkedOrderActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspParkedOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -4549,7 +5427,7 @@ void TdApi::processRspOrderAction(Task *task)
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["OrderSysID"] = toUtf(task_data->OrderSysID);
 		data["ActionFlag"] = task_data->ActionFlag;
-		data["LimitPrice"] = task_data->LimitPrice;
+		data["LimitPrice"] = validDouble(task_data->LimitPrice, this->invalid_as_nan);
 		data["VolumeChange"] = task_data->VolumeChange;
 		data["UserID"] = toUtf(task_data->UserID);
 		data["reserve1"] = toUtf(task_data->reserve1);
@@ -4560,15 +5438,18 @@ void TdApi::processRspOrderAction(Task *task)
 		data["IPAddress"] = toUtf(task_data->IPAddress);
 		data["OrderMemo"] = toUtf(task_data->OrderMemo);
 		data["SessionReqSeq"] = task_data->SessionReqSeq;
-		delete task_data;
+		TaskPool<CThostFtdcInputOrderActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -4590,15 +5471,18 @@ void TdApi::processRspQryMaxOrderVolume(Task *task)
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcQryMaxOrderVolumeField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryMaxOrderVolume(data, error, task->task_id, task->task_last);
 };
@@ -4617,15 +5501,18 @@ void TdApi::processRspSettlementInfoConfirm(Task *task)
 		data["SettlementID"] = task_data->SettlementID;
 		data["AccountID"] = toUtf(task_data->AccountID);
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		delete task_data;
+		TaskPool<CThostFtdcSettlementInfoConfirmField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspSettlementInfoConfirm(data, error, task->task_id, task->task_last);
 };
@@ -4641,15 +5528,18 @@ void TdApi::processRspRemoveParkedOrder(Task *task)
 		data["InvestorID"] = toUtf(task_data->InvestorID);
 		data["ParkedOrderID"] = toUtf(task_data->ParkedOrderID);
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		TaskPool<CThostFtdcRemoveParkedOrderField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspRemoveParkedOrder(data, error, task->task_id, task->task_last);
 };
@@ -4665,15 +5555,18 @@ void TdApi::processRspRemoveParkedOrderAction(Task *task)
 		data["InvestorID"] = toUtf(task_data->InvestorID);
 		data["ParkedOrderActionID"] = toUtf(task_data->ParkedOrderActionID);
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		TaskPool<CThostFtdcRemoveParkedOrderActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspRemoveParkedOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -4708,15 +5601,18 @@ void TdApi::processRspExecOrderInsert(Task *task)
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcInputExecOrderField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspExecOrderInsert(data, error, task->task_id, task->task_last);
 };
@@ -4745,15 +5641,18 @@ void TdApi::processRspExecOrderAction(Task *task)
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcInputExecOrderActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspExecOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -4776,15 +5675,18 @@ void TdApi::processRspForQuoteInsert(Task *task)
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcInputForQuoteField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspForQuoteInsert(data, error, task->task_id, task->task_last);
 };
@@ -4801,8 +5703,8 @@ void TdApi::processRspQuoteInsert(Task *task)
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["QuoteRef"] = toUtf(task_data->QuoteRef);
 		data["UserID"] = toUtf(task_data->UserID);
-		data["AskPrice"] = task_data->AskPrice;
-		data["BidPrice"] = task_data->BidPrice;
+		data["AskPrice"] = validDouble(task_data->AskPrice, this->invalid_as_nan);
+		data["BidPrice"] = validDouble(task_data->BidPrice, this->invalid_as_nan);
 		data["AskVolume"] = task_data->AskVolume;
 		data["BidVolume"] = task_data->BidVolume;
 		data["RequestID"] = task_data->RequestID;
@@ -4825,15 +5727,18 @@ void TdApi::processRspQuoteInsert(Task *task)
 		data["TimeCondition"] = task_data->TimeCondition;
 		data["OrderMemo"] = toUtf(task_data->OrderMemo);
 		data["SessionReqSeq"] = task_data->SessionReqSeq;
-		delete task_data;
+		TaskPool<CThostFtdcInputQuoteField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQuoteInsert(data, error, task->task_id, task->task_last);
 };
@@ -4865,15 +5770,18 @@ void TdApi::processRspQuoteAction(Task *task)
 		data["IPAddress"] = toUtf(task_data->IPAddress);
 		data["OrderMemo"] = toUtf(task_data->OrderMemo);
 		data["SessionReqSeq"] = task_data->SessionReqSeq;
-		delete task_data;
+		TaskPool<CThostFtdcInputQuoteActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQuoteAction(data, error, task->task_id, task->task_last);
 };
@@ -4897,15 +5805,18 @@ void TdApi::processRspBatchOrderAction(Task *task)
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcInputBatchOrderActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspBatchOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -4936,15 +5847,18 @@ void TdApi::processRspOptionSelfCloseInsert(Task *task)
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcInputOptionSelfCloseField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspOptionSelfCloseInsert(data, error, task->task_id, task->task_last);
 };
@@ -4973,15 +5887,18 @@ void TdApi::processRspOptionSelfCloseAction(Task *task)
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcInputOptionSelfCloseActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspOptionSelfCloseAction(data, error, task->task_id, task->task_last);
 };
@@ -5010,15 +5927,18 @@ void TdApi::processRspCombActionInsert(Task *task)
 		data["SessionID"] = task_data->SessionID;
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcInputCombActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspCombActionInsert(data, error, task->task_id, task->task_last);
 };
@@ -5030,83 +5950,168 @@ void TdApi::processRspQryOrder(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOrderField *task_data = (CThostFtdcOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["reserve2"] = toUtf(task_data->reserve2);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["OrderSource"] = task_data->OrderSource;
-		data["OrderStatus"] = task_data->OrderStatus;
-		data["OrderType"] = task_data->OrderType;
-		data["VolumeTraded"] = task_data->VolumeTraded;
-		data["VolumeTotal"] = task_data->VolumeTotal;
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ActiveTime"] = toUtf(task_data->ActiveTime);
-		data["SuspendTime"] = toUtf(task_data->SuspendTime);
-		data["UpdateTime"] = toUtf(task_data->UpdateTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ActiveTraderID"] = toUtf(task_data->ActiveTraderID);
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
-		data["RelativeOrderSysID"] = toUtf(task_data->RelativeOrderSysID);
-		data["ZCETotalTradedVolume"] = task_data->ZCETotalTradedVolume;
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["reserve3"] = toUtf(task_data->reserve3);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["OrderMemo"] = toUtf(task_data->OrderMemo);
-		data["SessionReqSeq"] = task_data->SessionReqSeq;
-		delete task_data;
-	}
+		const vector<int> *fields = this->field_selection.get(FIELDS_ORDER);
+		if (fields)
+		{
+			for (int field : *fields)
+			{
+				switch (field)
+				{
+				case 0: data["BrokerID"] = toUtf(task_data->BrokerID); break;
+				case 1: data["InvestorID"] = toUtf(task_data->InvestorID); break;
+				case 2: data["reserve1"] = toUtf(task_data->reserve1); break;
+				case 3: data["OrderRef"] = toUtf(task_data->OrderRef); break;
+				case 4: data["UserID"] = toUtf(task_data->UserID); break;
+				case 5: data["OrderPriceType"] = task_data->OrderPriceType; break;
+				case 6: data["Direction"] = task_data->Direction; break;
+				case 7: data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag); break;
+				case 8: data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag); break;
+				case 9: data["LimitPrice"] = validDouble(task_data->LimitPrice, this->invalid_as_nan); break;
+				case 10: data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal; break;
+				case 11: data["TimeCondition"] = task_data->TimeCondition; break;
+				case 12: data["GTDDate"] = toUtf(task_data->GTDDate); break;
+				case 13: data["VolumeCondition"] = task_data->VolumeCondition; break;
+				case 14: data["MinVolume"] = task_data->MinVolume; break;
+				case 15: data["ContingentCondition"] = task_data->ContingentCondition; break;
+				case 16: data["StopPrice"] = validDouble(task_data->StopPrice, this->invalid_as_nan); break;
+				case 17: data["ForceCloseReason"] = task_data->ForceCloseReason; break;
+				case 18: data["IsAutoSuspend"] = task_data->IsAutoSuspend; break;
+				case 19: data["BusinessUnit"] = toUtf(task_data->BusinessUnit); break;
+				case 20: data["RequestID"] = task_data->RequestID; break;
+				case 21: data["OrderLocalID"] = toUtf(task_data->OrderLocalID); break;
+				case 22: data["ExchangeID"] = toUtf(task_data->ExchangeID); break;
+				case 23: data["ParticipantID"] = toUtf(task_data->ParticipantID); break;
+				case 24: data["ClientID"] = toUtf(task_data->ClientID); break;
+				case 25: data["reserve2"] = toUtf(task_data->reserve2); break;
+				case 26: data["TraderID"] = toUtf(task_data->TraderID); break;
+				case 27: data["InstallID"] = task_data->InstallID; break;
+				case 28: data["OrderSubmitStatus"] = task_data->OrderSubmitStatus; break;
+				case 29: data["NotifySequence"] = task_data->NotifySequence; break;
+				case 30: data["TradingDay"] = toUtf(task_data->TradingDay); break;
+				case 31: data["SettlementID"] = task_data->SettlementID; break;
+				case 32: data["OrderSysID"] = toUtf(task_data->OrderSysID); break;
+				case 33: data["OrderSource"] = task_data->OrderSource; break;
+				case 34: data["OrderStatus"] = task_data->OrderStatus; break;
+				case 35: data["OrderType"] = task_data->OrderType; break;
+				case 36: data["VolumeTraded"] = task_data->VolumeTraded; break;
+				case 37: data["VolumeTotal"] = task_data->VolumeTotal; break;
+				case 38: data["InsertDate"] = toUtf(task_data->InsertDate); break;
+				case 39: data["InsertTime"] = toUtf(task_data->InsertTime); break;
+				case 40: data["ActiveTime"] = toUtf(task_data->ActiveTime); break;
+				case 41: data["SuspendTime"] = toUtf(task_data->SuspendTime); break;
+				case 42: data["UpdateTime"] = toUtf(task_data->UpdateTime); break;
+				case 43: data["CancelTime"] = toUtf(task_data->CancelTime); break;
+				case 44: data["ActiveTraderID"] = toUtf(task_data->ActiveTraderID); break;
+				case 45: data["ClearingPartID"] = toUtf(task_data->ClearingPartID); break;
+				case 46: data["SequenceNo"] = task_data->SequenceNo; break;
+				case 47: data["FrontID"] = task_data->FrontID; break;
+				case 48: data["SessionID"] = task_data->SessionID; break;
+				case 49: data["UserProductInfo"] = toUtf(task_data->UserProductInfo); break;
+				case 50: data["StatusMsg"] = toUtf(task_data->StatusMsg); break;
+				case 51: data["UserForceClose"] = task_data->UserForceClose; break;
+				case 52: data["ActiveUserID"] = toUtf(task_data->ActiveUserID); break;
+				case 53: data["BrokerOrderSeq"] = task_data->BrokerOrderSeq; break;
+				case 54: data["RelativeOrderSysID"] = toUtf(task_data->RelativeOrderSysID); break;
+				case 55: data["ZCETotalTradedVolume"] = task_data->ZCETotalTradedVolume; break;
+				case 56: data["IsSwapOrder"] = task_data->IsSwapOrder; break;
+				case 57: data["BranchID"] = toUtf(task_data->BranchID); break;
+				case 58: data["InvestUnitID"] = toUtf(task_data->InvestUnitID); break;
+				case 59: data["AccountID"] = toUtf(task_data->AccountID); break;
+				case 60: data["CurrencyID"] = toUtf(task_data->CurrencyID); break;
+				case 61: data["reserve3"] = toUtf(task_data->reserve3); break;
+				case 62: data["MacAddress"] = toUtf(task_data->MacAddress); break;
+				case 63: data["InstrumentID"] = toUtf(task_data->InstrumentID); break;
+				case 64: data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID); break;
+				case 65: data["IPAddress"] = toUtf(task_data->IPAddress); break;
+				case 66: data["OrderMemo"] = toUtf(task_data->OrderMemo); break;
+				case 67: data["SessionReqSeq"] = task_data->SessionReqSeq; break;
+				}
+			}
+		}
+		else
+		{
+			data["BrokerID"] = toUtf(task_data->BrokerID);
+			data["InvestorID"] = toUtf(task_data->InvestorID);
+			data["reserve1"] = toUtf(task_data->reserve1);
+			data["OrderRef"] = toUtf(task_data->OrderRef);
+			data["UserID"] = toUtf(task_data->UserID);
+			data["OrderPriceType"] = task_data->OrderPriceType;
+			data["Direction"] = task_data->Direction;
+			data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
+			data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
+			data["LimitPrice"] = validDouble(task_data->LimitPrice, this->invalid_as_nan);
+			data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
+			data["TimeCondition"] = task_data->TimeCondition;
+			data["GTDDate"] = toUtf(task_data->GTDDate);
+			data["VolumeCondition"] = task_data->VolumeCondition;
+			data["MinVolume"] = task_data->MinVolume;
+			data["ContingentCondition"] = task_data->ContingentCondition;
+			data["StopPrice"] = validDouble(task_data->StopPrice, this->invalid_as_nan);
+			data["ForceCloseReason"] = task_data->ForceCloseReason;
+			data["IsAutoSuspend"] = task_data->IsAutoSuspend;
+			data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
+			data["RequestID"] = task_data->RequestID;
+			data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
+			data["ExchangeID"] = toUtf(task_data->ExchangeID);
+			data["ParticipantID"] = toUtf(task_data->ParticipantID);
+			data["ClientID"] = toUtf(task_data->ClientID);
+			data["reserve2"] = toUtf(task_data->reserve2);
+			data["TraderID"] = toUtf(task_data->TraderID);
+			data["InstallID"] = task_data->InstallID;
+			data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
+			data["NotifySequence"] = task_data->NotifySequence;
+			data["TradingDay"] = toUtf(task_data->TradingDay);
+			data["SettlementID"] = task_data->SettlementID;
+			data["OrderSysID"] = toUtf(task_data->OrderSysID);
+			data["OrderSource"] = task_data->OrderSource;
+			data["OrderStatus"] = task_data->OrderStatus;
+			data["OrderType"] = task_data->OrderType;
+			data["VolumeTraded"] = task_data->VolumeTraded;
+			data["VolumeTotal"] = task_data->VolumeTotal;
+			data["InsertDate"] = toUtf(task_data->InsertDate);
+			data["InsertTime"] = toUtf(task_data->InsertTime);
+			data["ActiveTime"] = toUtf(task_data->ActiveTime);
+			data["SuspendTime"] = toUtf(task_data->SuspendTime);
+			data["UpdateTime"] = toUtf(task_data->UpdateTime);
+			data["CancelTime"] = toUtf(task_data->CancelTime);
+			data["ActiveTraderID"] = toUtf(task_data->ActiveTraderID);
+			data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
+			data["SequenceNo"] = task_data->SequenceNo;
+			data["FrontID"] = task_data->FrontID;
+			data["SessionID"] = task_data->SessionID;
+			data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
+			data["StatusMsg"] = toUtf(task_data->StatusMsg);
+			data["UserForceClose"] = task_data->UserForceClose;
+			data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
+			data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
+			data["RelativeOrderSysID"] = toUtf(task_data->RelativeOrderSysID);
+			data["ZCETotalTradedVolume"] = task_data->ZCETotalTradedVolume;
+			data["IsSwapOrder"] = task_data->IsSwapOrder;
+			data["BranchID"] = toUtf(task_data->BranchID);
+			data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
+			data["AccountID"] = toUtf(task_data->AccountID);
+			data["CurrencyID"] = toUtf(task_data->CurrencyID);
+			data["reserve3"] = toUtf(task_data->reserve3);
+			data["MacAddress"] = toUtf(task_data->MacAddress);
+			data["InstrumentID"] = toUtf(task_data->InstrumentID);
+			data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
+			data["IPAddress"] = toUtf(task_data->IPAddress);
+			data["OrderMemo"] = toUtf(task_data->OrderMemo);
+			data["SessionReqSeq"] = task_data->SessionReqSeq;
+		}
+		data["_exchange_ns"] = exchangeEpochNs(parseDate(task_data->InsertDate), parseDate(task_data->TradingDay), parseTimeMs(task_data->InsertTime, 0), 0);
+		TaskPool<CThostFtdcOrderField>::release(task_data);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryOrder(data, error, task->task_id, task->task_last);
 };
@@ -5115,51 +6120,101 @@ void TdApi::processRspQryTrade(Task *task)
 {
 	gil_scoped_acquire acquire;
 	dict data;
-	if (task->task_data)
-	{
-		CThostFtdcTradeField *task_data = (CThostFtdcTradeField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["TradeID"] = toUtf(task_data->TradeID);
-		data["Direction"] = task_data->Direction;
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["TradingRole"] = task_data->TradingRole;
-		data["reserve2"] = toUtf(task_data->reserve2);
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["Price"] = task_data->Price;
-		data["Volume"] = task_data->Volume;
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["TradeType"] = task_data->TradeType;
-		data["PriceSource"] = task_data->PriceSource;
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
-		data["TradeSource"] = task_data->TradeSource;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		delete task_data;
-	}
+	if (task->task_data)
+	{
+		CThostFtdcTradeField *task_data = (CThostFtdcTradeField*)task->task_data;
+		const vector<int> *fields = this->field_selection.get(FIELDS_TRADE);
+		if (fields)
+		{
+			for (int field : *fields)
+			{
+				switch (field)
+				{
+				case 0: data["BrokerID"] = toUtf(task_data->BrokerID); break;
+				case 1: data["InvestorID"] = toUtf(task_data->InvestorID); break;
+				case 2: data["reserve1"] = toUtf(task_data->reserve1); break;
+				case 3: data["OrderRef"] = toUtf(task_data->OrderRef); break;
+				case 4: data["UserID"] = toUtf(task_data->UserID); break;
+				case 5: data["ExchangeID"] = toUtf(task_data->ExchangeID); break;
+				case 6: data["TradeID"] = toUtf(task_data->TradeID); break;
+				case 7: data["Direction"] = task_data->Direction; break;
+				case 8: data["OrderSysID"] = toUtf(task_data->OrderSysID); break;
+				case 9: data["ParticipantID"] = toUtf(task_data->ParticipantID); break;
+				case 10: data["ClientID"] = toUtf(task_data->ClientID); break;
+				case 11: data["TradingRole"] = task_data->TradingRole; break;
+				case 12: data["reserve2"] = toUtf(task_data->reserve2); break;
+				case 13: data["OffsetFlag"] = task_data->OffsetFlag; break;
+				case 14: data["HedgeFlag"] = task_data->HedgeFlag; break;
+				case 15: data["Price"] = validDouble(task_data->Price, this->invalid_as_nan); break;
+				case 16: data["Volume"] = task_data->Volume; break;
+				case 17: data["TradeDate"] = toUtf(task_data->TradeDate); break;
+				case 18: data["TradeTime"] = toUtf(task_data->TradeTime); break;
+				case 19: data["TradeType"] = task_data->TradeType; break;
+				case 20: data["PriceSource"] = task_data->PriceSource; break;
+				case 21: data["TraderID"] = toUtf(task_data->TraderID); break;
+				case 22: data["OrderLocalID"] = toUtf(task_data->OrderLocalID); break;
+				case 23: data["ClearingPartID"] = toUtf(task_data->ClearingPartID); break;
+				case 24: data["BusinessUnit"] = toUtf(task_data->BusinessUnit); break;
+				case 25: data["SequenceNo"] = task_data->SequenceNo; break;
+				case 26: data["TradingDay"] = toUtf(task_data->TradingDay); break;
+				case 27: data["SettlementID"] = task_data->SettlementID; break;
+				case 28: data["BrokerOrderSeq"] = task_data->BrokerOrderSeq; break;
+				case 29: data["TradeSource"] = task_data->TradeSource; break;
+				case 30: data["InvestUnitID"] = toUtf(task_data->InvestUnitID); break;
+				case 31: data["InstrumentID"] = toUtf(task_data->InstrumentID); break;
+				case 32: data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID); break;
+				}
+			}
+		}
+		else
+		{
+			data["BrokerID"] = toUtf(task_data->BrokerID);
+			data["InvestorID"] = toUtf(task_data->InvestorID);
+			data["reserve1"] = toUtf(task_data->reserve1);
+			data["OrderRef"] = toUtf(task_data->OrderRef);
+			data["UserID"] = toUtf(task_data->UserID);
+			data["ExchangeID"] = toUtf(task_data->ExchangeID);
+			data["TradeID"] = toUtf(task_data->TradeID);
+			data["Direction"] = task_data->Direction;
+			data["OrderSysID"] = toUtf(task_data->OrderSysID);
+			data["ParticipantID"] = toUtf(task_data->ParticipantID);
+			data["ClientID"] = toUtf(task_data->ClientID);
+			data["TradingRole"] = task_data->TradingRole;
+			data["reserve2"] = toUtf(task_data->reserve2);
+			data["OffsetFlag"] = task_data->OffsetFlag;
+			data["HedgeFlag"] = task_data->HedgeFlag;
+			data["Price"] = validDouble(task_data->Price, this->invalid_as_nan);
+			data["Volume"] = task_data->Volume;
+			data["TradeDate"] = toUtf(task_data->TradeDate);
+			data["TradeTime"] = toUtf(task_data->TradeTime);
+			data["TradeType"] = task_data->TradeType;
+			data["PriceSource"] = task_data->PriceSource;
+			data["TraderID"] = toUtf(task_data->TraderID);
+			data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
+			data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
+			data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
+			data["SequenceNo"] = task_data->SequenceNo;
+			data["TradingDay"] = toUtf(task_data->TradingDay);
+			data["SettlementID"] = task_data->SettlementID;
+			data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
+			data["TradeSource"] = task_data->TradeSource;
+			data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
+			data["InstrumentID"] = toUtf(task_data->InstrumentID);
+			data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
+		}
+		data["_exchange_ns"] = exchangeEpochNs(parseDate(task_data->TradeDate), parseDate(task_data->TradingDay), parseTimeMs(task_data->TradeTime, 0), 0);
+		TaskPool<CThostFtdcTradeField>::release(task_data);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryTrade(data, error, task->task_id, task->task_last);
 };
@@ -5181,56 +6236,59 @@ void TdApi::processRspQryInvestorPosition(Task *task)
 		data["Position"] = task_data->Position;
 		data["LongFrozen"] = task_data->LongFrozen;
 		data["ShortFrozen"] = task_data->ShortFrozen;
-		data["LongFrozenAmount"] = task_data->LongFrozenAmount;
-		data["ShortFrozenAmount"] = task_data->ShortFrozenAmount;
+		data["LongFrozenAmount"] = validDouble(task_data->LongFrozenAmount, this->invalid_as_nan);
+		data["ShortFrozenAmount"] = validDouble(task_data->ShortFrozenAmount, this->invalid_as_nan);
 		data["OpenVolume"] = task_data->OpenVolume;
 		data["CloseVolume"] = task_data->CloseVolume;
-		data["OpenAmount"] = task_data->OpenAmount;
-		data["CloseAmount"] = task_data->CloseAmount;
-		data["PositionCost"] = task_data->PositionCost;
-		data["PreMargin"] = task_data->PreMargin;
-		data["UseMargin"] = task_data->UseMargin;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		data["FrozenCash"] = task_data->FrozenCash;
-		data["FrozenCommission"] = task_data->FrozenCommission;
-		data["CashIn"] = task_data->CashIn;
-		data["Commission"] = task_data->Commission;
-		data["CloseProfit"] = task_data->CloseProfit;
-		data["PositionProfit"] = task_data->PositionProfit;
-		data["PreSettlementPrice"] = task_data->PreSettlementPrice;
-		data["SettlementPrice"] = task_data->SettlementPrice;
+		data["OpenAmount"] = validDouble(task_data->OpenAmount, this->invalid_as_nan);
+		data["CloseAmount"] = validDouble(task_data->CloseAmount, this->invalid_as_nan);
+		data["PositionCost"] = validDouble(task_data->PositionCost, this->invalid_as_nan);
+		data["PreMargin"] = validDouble(task_data->PreMargin, this->invalid_as_nan);
+		data["UseMargin"] = validDouble(task_data->UseMargin, this->invalid_as_nan);
+		data["FrozenMargin"] = validDouble(task_data->FrozenMargin, this->invalid_as_nan);
+		data["FrozenCash"] = validDouble(task_data->FrozenCash, this->invalid_as_nan);
+		data["FrozenCommission"] = validDouble(task_data->FrozenCommission, this->invalid_as_nan);
+		data["CashIn"] = validDouble(task_data->CashIn, this->invalid_as_nan);
+		data["Commission"] = validDouble(task_data->Commission, this->invalid_as_nan);
+		data["CloseProfit"] = validDouble(task_data->CloseProfit, this->invalid_as_nan);
+		data["PositionProfit"] = validDouble(task_data->PositionProfit, this->invalid_as_nan);
+		data["PreSettlementPrice"] = validDouble(task_data->PreSettlementPrice, this->invalid_as_nan);
+		data["SettlementPrice"] = validDouble(task_data->SettlementPrice, this->invalid_as_nan);
 		data["TradingDay"] = toUtf(task_data->TradingDay);
 		data["SettlementID"] = task_data->SettlementID;
-		data["OpenCost"] = task_data->OpenCost;
-		data["ExchangeMargin"] = task_data->ExchangeMargin;
+		data["OpenCost"] = validDouble(task_data->OpenCost, this->invalid_as_nan);
+		data["ExchangeMargin"] = validDouble(task_data->ExchangeMargin, this->invalid_as_nan);
 		data["CombPosition"] = task_data->CombPosition;
 		data["CombLongFrozen"] = task_data->CombLongFrozen;
 		data["CombShortFrozen"] = task_data->CombShortFrozen;
-		data["CloseProfitByDate"] = task_data->CloseProfitByDate;
-		data["CloseProfitByTrade"] = task_data->CloseProfitByTrade;
+		data["CloseProfitByDate"] = validDouble(task_data->CloseProfitByDate, this->invalid_as_nan);
+		data["CloseProfitByTrade"] = validDouble(task_data->CloseProfitByTrade, this->invalid_as_nan);
 		data["TodayPosition"] = task_data->TodayPosition;
-		data["MarginRateByMoney"] = task_data->MarginRateByMoney;
-		data["MarginRateByVolume"] = task_data->MarginRateByVolume;
+		data["MarginRateByMoney"] = validDouble(task_data->MarginRateByMoney, this->invalid_as_nan);
+		data["MarginRateByVolume"] = validDouble(task_data->MarginRateByVolume, this->invalid_as_nan);
 		data["StrikeFrozen"] = task_data->StrikeFrozen;
-		data["StrikeFrozenAmount"] = task_data->StrikeFrozenAmount;
+		data["StrikeFrozenAmount"] = validDouble(task_data->StrikeFrozenAmount, this->invalid_as_nan);
 		data["AbandonFrozen"] = task_data->AbandonFrozen;
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["YdStrikeFrozen"] = task_data->YdStrikeFrozen;
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["PositionCostOffset"] = task_data->PositionCostOffset;
+		data["PositionCostOffset"] = validDouble(task_data->PositionCostOffset, this->invalid_as_nan);
 		data["TasPosition"] = task_data->TasPosition;
-		data["TasPositionCost"] = task_data->TasPositionCost;
+		data["TasPositionCost"] = validDouble(task_data->TasPositionCost, this->invalid_as_nan);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OptionValue"] = task_data->OptionValue;
-		delete task_data;
+		data["OptionValue"] = validDouble(task_data->OptionValue, this->invalid_as_nan);
+		TaskPool<CThostFtdcInvestorPositionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInvestorPosition(data, error, task->task_id, task->task_last);
 };
@@ -5244,63 +6302,66 @@ void TdApi::processRspQryTradingAccount(Task *task)
 		CThostFtdcTradingAccountField *task_data = (CThostFtdcTradingAccountField*)task->task_data;
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["AccountID"] = toUtf(task_data->AccountID);
-		data["PreMortgage"] = task_data->PreMortgage;
-		data["PreCredit"] = task_data->PreCredit;
-		data["PreDeposit"] = task_data->PreDeposit;
-		data["PreBalance"] = task_data->PreBalance;
-		data["PreMargin"] = task_data->PreMargin;
-		data["InterestBase"] = task_data->InterestBase;
-		data["Interest"] = task_data->Interest;
-		data["Deposit"] = task_data->Deposit;
-		data["Withdraw"] = task_data->Withdraw;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		data["FrozenCash"] = task_data->FrozenCash;
-		data["FrozenCommission"] = task_data->FrozenCommission;
-		data["CurrMargin"] = task_data->CurrMargin;
-		data["CashIn"] = task_data->CashIn;
-		data["Commission"] = task_data->Commission;
-		data["CloseProfit"] = task_data->CloseProfit;
-		data["PositionProfit"] = task_data->PositionProfit;
-		data["Balance"] = task_data->Balance;
-		data["Available"] = task_data->Available;
-		data["WithdrawQuota"] = task_data->WithdrawQuota;
-		data["Reserve"] = task_data->Reserve;
+		data["PreMortgage"] = validDouble(task_data->PreMortgage, this->invalid_as_nan);
+		data["PreCredit"] = validDouble(task_data->PreCredit, this->invalid_as_nan);
+		data["PreDeposit"] = validDouble(task_data->PreDeposit, this->invalid_as_nan);
+		data["PreBalance"] = validDouble(task_data->PreBalance, this->invalid_as_nan);
+		data["PreMargin"] = validDouble(task_data->PreMargin, this->invalid_as_nan);
+		data["InterestBase"] = validDouble(task_data->InterestBase, this->invalid_as_nan);
+		data["Interest"] = validDouble(task_data->Interest, this->invalid_as_nan);
+		data["Deposit"] = validDouble(task_data->Deposit, this->invalid_as_nan);
+		data["Withdraw"] = validDouble(task_data->Withdraw, this->invalid_as_nan);
+		data["FrozenMargin"] = validDouble(task_data->FrozenMargin, this->invalid_as_nan);
+		data["FrozenCash"] = validDouble(task_data->FrozenCash, this->invalid_as_nan);
+		data["FrozenCommission"] = validDouble(task_data->FrozenCommission, this->invalid_as_nan);
+		data["CurrMargin"] = validDouble(task_data->CurrMargin, this->invalid_as_nan);
+		data["CashIn"] = validDouble(task_data->CashIn, this->invalid_as_nan);
+		data["Commission"] = validDouble(task_data->Commission, this->invalid_as_nan);
+		data["CloseProfit"] = validDouble(task_data->CloseProfit, this->invalid_as_nan);
+		data["PositionProfit"] = validDouble(task_data->PositionProfit, this->invalid_as_nan);
+		data["Balance"] = validDouble(task_data->Balance, this->invalid_as_nan);
+		data["Available"] = validDouble(task_data->Available, this->invalid_as_nan);
+		data["WithdrawQuota"] = validDouble(task_data->WithdrawQuota, this->invalid_as_nan);
+		data["Reserve"] = validDouble(task_data->Reserve, this->invalid_as_nan);
 		data["TradingDay"] = toUtf(task_data->TradingDay);
 		data["SettlementID"] = task_data->SettlementID;
-		data["Credit"] = task_data->Credit;
-		data["Mortgage"] = task_data->Mortgage;
-		data["ExchangeMargin"] = task_data->ExchangeMargin;
-		data["DeliveryMargin"] = task_data->DeliveryMargin;
-		data["ExchangeDeliveryMargin"] = task_data->ExchangeDeliveryMargin;
-		data["ReserveBalance"] = task_data->ReserveBalance;
+		data["Credit"] = validDouble(task_data->Credit, this->invalid_as_nan);
+		data["Mortgage"] = validDouble(task_data->Mortgage, this->invalid_as_nan);
+		data["ExchangeMargin"] = validDouble(task_data->ExchangeMargin, this->invalid_as_nan);
+		data["DeliveryMargin"] = validDouble(task_data->DeliveryMargin, this->invalid_as_nan);
+		data["ExchangeDeliveryMargin"] = validDouble(task_data->ExchangeDeliveryMargin, this->invalid_as_nan);
+		data["ReserveBalance"] = validDouble(task_data->ReserveBalance, this->invalid_as_nan);
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["PreFundMortgageIn"] = task_data->PreFundMortgageIn;
-		data["PreFundMortgageOut"] = task_data->PreFundMortgageOut;
-		data["FundMortgageIn"] = task_data->FundMortgageIn;
-		data["FundMortgageOut"] = task_data->FundMortgageOut;
-		data["FundMortgageAvailable"] = task_data->FundMortgageAvailable;
-		data["MortgageableFund"] = task_data->MortgageableFund;
-		data["SpecProductMargin"] = task_data->SpecProductMargin;
-		data["SpecProductFrozenMargin"] = task_data->SpecProductFrozenMargin;
-		data["SpecProductCommission"] = task_data->SpecProductCommission;
-		data["SpecProductFrozenCommission"] = task_data->SpecProductFrozenCommission;
-		data["SpecProductPositionProfit"] = task_data->SpecProductPositionProfit;
-		data["SpecProductCloseProfit"] = task_data->SpecProductCloseProfit;
-		data["SpecProductPositionProfitByAlg"] = task_data->SpecProductPositionProfitByAlg;
-		data["SpecProductExchangeMargin"] = task_data->SpecProductExchangeMargin;
+		data["PreFundMortgageIn"] = validDouble(task_data->PreFundMortgageIn, this->invalid_as_nan);
+		data["PreFundMortgageOut"] = validDouble(task_data->PreFundMortgageOut, this->invalid_as_nan);
+		data["FundMortgageIn"] = validDouble(task_data->FundMortgageIn, this->invalid_as_nan);
+		data["FundMortgageOut"] = validDouble(task_data->FundMortgageOut, this->invalid_as_nan);
+		data["FundMortgageAvailable"] = validDouble(task_data->FundMortgageAvailable, this->invalid_as_nan);
+		data["MortgageableFund"] = validDouble(task_data->MortgageableFund, this->invalid_as_nan);
+		data["SpecProductMargin"] = validDouble(task_data->SpecProductMargin, this->invalid_as_nan);
+		data["SpecProductFrozenMargin"] = validDouble(task_data->SpecProductFrozenMargin, this->invalid_as_nan);
+		data["SpecProductCommission"] = validDouble(task_data->SpecProductCommission, this->invalid_as_nan);
+		data["SpecProductFrozenCommission"] = validDouble(task_data->SpecProductFrozenCommission, this->invalid_as_nan);
+		data["SpecProductPositionProfit"] = validDouble(task_data->SpecProductPositionProfit, this->invalid_as_nan);
+		data["SpecProductCloseProfit"] = validDouble(task_data->SpecProductCloseProfit, this->invalid_as_nan);
+		data["SpecProductPositionProfitByAlg"] = validDouble(task_data->SpecProductPositionProfitByAlg, this->invalid_as_nan);
+		data["SpecProductExchangeMargin"] = validDouble(task_data->SpecProductExchangeMargin, this->invalid_as_nan);
 		data["BizType"] = task_data->BizType;
-		data["FrozenSwap"] = task_data->FrozenSwap;
-		data["RemainSwap"] = task_data->RemainSwap;
-		data["OptionValue"] = task_data->OptionValue;
-		delete task_data;
-	}
+		data["FrozenSwap"] = validDouble(task_data->FrozenSwap, this->invalid_as_nan);
+		data["RemainSwap"] = validDouble(task_data->RemainSwap, this->invalid_as_nan);
+		data["OptionValue"] = validDouble(task_data->OptionValue, this->invalid_as_nan);
+		TaskPool<CThostFtdcTradingAccountField>::release(task_data);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryTradingAccount(data, error, task->task_id, task->task_last);
 };
@@ -5327,15 +6388,18 @@ void TdApi::processRspQryInvestor(Task *task)
 		data["MarginModelID"] = toUtf(task_data->MarginModelID);
 		data["IsOrderFreq"] = task_data->IsOrderFreq;
 		data["IsOpenVolLimit"] = task_data->IsOpenVolLimit;
-		delete task_data;
+		TaskPool<CThostFtdcInvestorField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInvestor(data, error, task->task_id, task->task_last);
 };
@@ -5356,15 +6420,18 @@ void TdApi::processRspQryTradingCode(Task *task)
 		data["BranchID"] = toUtf(task_data->BranchID);
 		data["BizType"] = task_data->BizType;
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		TaskPool<CThostFtdcTradingCodeField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryTradingCode(data, error, task->task_id, task->task_last);
 };
@@ -5381,23 +6448,26 @@ void TdApi::processRspQryInstrumentMarginRate(Task *task)
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["InvestorID"] = toUtf(task_data->InvestorID);
 		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["LongMarginRatioByMoney"] = task_data->LongMarginRatioByMoney;
-		data["LongMarginRatioByVolume"] = task_data->LongMarginRatioByVolume;
-		data["ShortMarginRatioByMoney"] = task_data->ShortMarginRatioByMoney;
-		data["ShortMarginRatioByVolume"] = task_data->ShortMarginRatioByVolume;
+		data["LongMarginRatioByMoney"] = validDouble(task_data->LongMarginRatioByMoney, this->invalid_as_nan);
+		data["LongMarginRatioByVolume"] = validDouble(task_data->LongMarginRatioByVolume, this->invalid_as_nan);
+		data["ShortMarginRatioByMoney"] = validDouble(task_data->ShortMarginRatioByMoney, this->invalid_as_nan);
+		data["ShortMarginRatioByVolume"] = validDouble(task_data->ShortMarginRatioByVolume, this->invalid_as_nan);
 		data["IsRelative"] = task_data->IsRelative;
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcInstrumentMarginRateField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInstrumentMarginRate(data, error, task->task_id, task->task_last);
 };
@@ -5413,25 +6483,28 @@ void TdApi::processRspQryInstrumentCommissionRate(Task *task)
 		data["InvestorRange"] = task_data->InvestorRange;
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OpenRatioByMoney"] = task_data->OpenRatioByMoney;
-		data["OpenRatioByVolume"] = task_data->OpenRatioByVolume;
-		data["CloseRatioByMoney"] = task_data->CloseRatioByMoney;
-		data["CloseRatioByVolume"] = task_data->CloseRatioByVolume;
-		data["CloseTodayRatioByMoney"] = task_data->CloseTodayRatioByMoney;
-		data["CloseTodayRatioByVolume"] = task_data->CloseTodayRatioByVolume;
+		data["OpenRatioByMoney"] = validDouble(task_data->OpenRatioByMoney, this->invalid_as_nan);
+		data["OpenRatioByVolume"] = validDouble(task_data->OpenRatioByVolume, this->invalid_as_nan);
+		data["CloseRatioByMoney"] = validDouble(task_data->CloseRatioByMoney, this->invalid_as_nan);
+		data["CloseRatioByVolume"] = validDouble(task_data->CloseRatioByVolume, this->invalid_as_nan);
+		data["CloseTodayRatioByMoney"] = validDouble(task_data->CloseTodayRatioByMoney, this->invalid_as_nan);
+		data["CloseTodayRatioByVolume"] = validDouble(task_data->CloseTodayRatioByVolume, this->invalid_as_nan);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["BizType"] = task_data->BizType;
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcInstrumentCommissionRateField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInstrumentCommissionRate(data, error, task->task_id, task->task_last);
 };
@@ -5456,15 +6529,18 @@ void TdApi::processRspQryUserSession(Task *task)
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["LoginRemark"] = toUtf(task_data->LoginRemark);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcUserSessionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryUserSession(data, error, task->task_id, task->task_last);
 };
@@ -5479,15 +6555,18 @@ void TdApi::processRspQryExchange(Task *task)
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["ExchangeName"] = toUtf(task_data->ExchangeName);
 		data["ExchangeProperty"] = task_data->ExchangeProperty;
-		delete task_data;
+		TaskPool<CThostFtdcExchangeField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryExchange(data, error, task->task_id, task->task_last);
 };
@@ -5504,7 +6583,7 @@ void TdApi::processRspQryProduct(Task *task)
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["ProductClass"] = task_data->ProductClass;
 		data["VolumeMultiple"] = task_data->VolumeMultiple;
-		data["PriceTick"] = task_data->PriceTick;
+		data["PriceTick"] = validDouble(task_data->PriceTick, this->invalid_as_nan);
 		data["MaxMarketOrderVolume"] = task_data->MaxMarketOrderVolume;
 		data["MinMarketOrderVolume"] = task_data->MinMarketOrderVolume;
 		data["MaxLimitOrderVolume"] = task_data->MaxLimitOrderVolume;
@@ -5515,20 +6594,23 @@ void TdApi::processRspQryProduct(Task *task)
 		data["TradeCurrencyID"] = toUtf(task_data->TradeCurrencyID);
 		data["MortgageFundUseRange"] = task_data->MortgageFundUseRange;
 		data["reserve2"] = toUtf(task_data->reserve2);
-		data["UnderlyingMultiple"] = task_data->UnderlyingMultiple;
+		data["UnderlyingMultiple"] = validDouble(task_data->UnderlyingMultiple, this->invalid_as_nan);
 		data["ProductID"] = toUtf(task_data->ProductID);
 		data["ExchangeProductID"] = toUtf(task_data->ExchangeProductID);
 		data["OpenLimitControlLevel"] = task_data->OpenLimitControlLevel;
 		data["OrderFreqControlLevel"] = task_data->OrderFreqControlLevel;
-		delete task_data;
+		TaskPool<CThostFtdcProductField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryProduct(data, error, task->task_id, task->task_last);
 };
@@ -5553,7 +6635,7 @@ void TdApi::processRspQryInstrument(Task *task)
 		data["MaxLimitOrderVolume"] = task_data->MaxLimitOrderVolume;
 		data["MinLimitOrderVolume"] = task_data->MinLimitOrderVolume;
 		data["VolumeMultiple"] = task_data->VolumeMultiple;
-		data["PriceTick"] = task_data->PriceTick;
+		data["PriceTick"] = validDouble(task_data->PriceTick, this->invalid_as_nan);
 		data["CreateDate"] = toUtf(task_data->CreateDate);
 		data["OpenDate"] = toUtf(task_data->OpenDate);
 		data["ExpireDate"] = toUtf(task_data->ExpireDate);
@@ -5563,27 +6645,30 @@ void TdApi::processRspQryInstrument(Task *task)
 		data["IsTrading"] = task_data->IsTrading;
 		data["PositionType"] = task_data->PositionType;
 		data["PositionDateType"] = task_data->PositionDateType;
-		data["LongMarginRatio"] = task_data->LongMarginRatio;
-		data["ShortMarginRatio"] = task_data->ShortMarginRatio;
+		data["LongMarginRatio"] = validDouble(task_data->LongMarginRatio, this->invalid_as_nan);
+		data["ShortMarginRatio"] = validDouble(task_data->ShortMarginRatio, this->invalid_as_nan);
 		data["MaxMarginSideAlgorithm"] = task_data->MaxMarginSideAlgorithm;
 		data["reserve4"] = toUtf(task_data->reserve4);
-		data["StrikePrice"] = task_data->StrikePrice;
+		data["StrikePrice"] = validDouble(task_data->StrikePrice, this->invalid_as_nan);
 		data["OptionsType"] = task_data->OptionsType;
-		data["UnderlyingMultiple"] = task_data->UnderlyingMultiple;
+		data["UnderlyingMultiple"] = validDouble(task_data->UnderlyingMultiple, this->invalid_as_nan);
 		data["CombinationType"] = task_data->CombinationType;
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
 		data["ProductID"] = toUtf(task_data->ProductID);
 		data["UnderlyingInstrID"] = toUtf(task_data->UnderlyingInstrID);
-		delete task_data;
+		TaskPool<CThostFtdcInstrumentField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInstrument(data, error, task->task_id, task->task_last);
 };
@@ -5599,59 +6684,63 @@ void TdApi::processRspQryDepthMarketData(Task *task)
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["reserve2"] = toUtf(task_data->reserve2);
-		data["LastPrice"] = task_data->LastPrice;
-		data["PreSettlementPrice"] = task_data->PreSettlementPrice;
-		data["PreClosePrice"] = task_data->PreClosePrice;
-		data["PreOpenInterest"] = task_data->PreOpenInterest;
-		data["OpenPrice"] = task_data->OpenPrice;
-		data["HighestPrice"] = task_data->HighestPrice;
-		data["LowestPrice"] = task_data->LowestPrice;
+		data["LastPrice"] = validDouble(task_data->LastPrice, this->invalid_as_nan);
+		data["PreSettlementPrice"] = validDouble(task_data->PreSettlementPrice, this->invalid_as_nan);
+		data["PreClosePrice"] = validDouble(task_data->PreClosePrice, this->invalid_as_nan);
+		data["PreOpenInterest"] = validDouble(task_data->PreOpenInterest, this->invalid_as_nan);
+		data["OpenPrice"] = validDouble(task_data->OpenPrice, this->invalid_as_nan);
+		data["HighestPrice"] = validDouble(task_data->HighestPrice, this->invalid_as_nan);
+		data["LowestPrice"] = validDouble(task_data->LowestPrice, this->invalid_as_nan);
 		data["Volume"] = task_data->Volume;
-		data["Turnover"] = task_data->Turnover;
-		data["OpenInterest"] = task_data->OpenInterest;
-		data["ClosePrice"] = task_data->ClosePrice;
-		data["SettlementPrice"] = task_data->SettlementPrice;
-		data["UpperLimitPrice"] = task_data->UpperLimitPrice;
-		data["LowerLimitPrice"] = task_data->LowerLimitPrice;
-		data["PreDelta"] = task_data->PreDelta;
-		data["CurrDelta"] = task_data->CurrDelta;
+		data["Turnover"] = validDouble(task_data->Turnover, this->invalid_as_nan);
+		data["OpenInterest"] = validDouble(task_data->OpenInterest, this->invalid_as_nan);
+		data["ClosePrice"] = validDouble(task_data->ClosePrice, this->invalid_as_nan);
+		data["SettlementPrice"] = validDouble(task_data->SettlementPrice, this->invalid_as_nan);
+		data["UpperLimitPrice"] = validDouble(task_data->UpperLimitPrice, this->invalid_as_nan);
+		data["LowerLimitPrice"] = validDouble(task_data->LowerLimitPrice, this->invalid_as_nan);
+		data["PreDelta"] = validDouble(task_data->PreDelta, this->invalid_as_nan);
+		data["CurrDelta"] = validDouble(task_data->CurrDelta, this->invalid_as_nan);
 		data["UpdateTime"] = toUtf(task_data->UpdateTime);
 		data["UpdateMillisec"] = task_data->UpdateMillisec;
-		data["BidPrice1"] = task_data->BidPrice1;
+		data["BidPrice1"] = validDouble(task_data->BidPrice1, this->invalid_as_nan);
 		data["BidVolume1"] = task_data->BidVolume1;
-		data["AskPrice1"] = task_data->AskPrice1;
+		data["AskPrice1"] = validDouble(task_data->AskPrice1, this->invalid_as_nan);
 		data["AskVolume1"] = task_data->AskVolume1;
-		data["BidPrice2"] = task_data->BidPrice2;
+		data["BidPrice2"] = validDouble(task_data->BidPrice2, this->invalid_as_nan);
 		data["BidVolume2"] = task_data->BidVolume2;
-		data["AskPrice2"] = task_data->AskPrice2;
+		data["AskPrice2"] = validDouble(task_data->AskPrice2, this->invalid_as_nan);
 		data["AskVolume2"] = task_data->AskVolume2;
-		data["BidPrice3"] = task_data->BidPrice3;
+		data["BidPrice3"] = validDouble(task_data->BidPrice3, this->invalid_as_nan);
 		data["BidVolume3"] = task_data->BidVolume3;
-		data["AskPrice3"] = task_data->AskPrice3;
+		data["AskPrice3"] = validDouble(task_data->AskPrice3, this->invalid_as_nan);
 		data["AskVolume3"] = task_data->AskVolume3;
-		data["BidPrice4"] = task_data->BidPrice4;
+		data["BidPrice4"] = validDouble(task_data->BidPrice4, this->invalid_as_nan);
 		data["BidVolume4"] = task_data->BidVolume4;
-		data["AskPrice4"] = task_data->AskPrice4;
+		data["AskPrice4"] = validDouble(task_data->AskPrice4, this->invalid_as_nan);
 		data["AskVolume4"] = task_data->AskVolume4;
-		data["BidPrice5"] = task_data->BidPrice5;
+		data["BidPrice5"] = validDouble(task_data->BidPrice5, this->invalid_as_nan);
 		data["BidVolume5"] = task_data->BidVolume5;
-		data["AskPrice5"] = task_data->AskPrice5;
+		data["AskPrice5"] = validDouble(task_data->AskPrice5, this->invalid_as_nan);
 		data["AskVolume5"] = task_data->AskVolume5;
-		data["AveragePrice"] = task_data->AveragePrice;
+		data["AveragePrice"] = validDouble(task_data->AveragePrice, this->invalid_as_nan);
 		data["ActionDay"] = toUtf(task_data->ActionDay);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["BandingUpperPrice"] = task_data->BandingUpperPrice;
-		data["BandingLowerPrice"] = task_data->BandingLowerPrice;
-		delete task_data;
-	}
+		data["BandingUpperPrice"] = validDouble(task_data->BandingUpperPrice, this->invalid_as_nan);
+		data["BandingLowerPrice"] = validDouble(task_data->BandingLowerPrice, this->invalid_as_nan);
+		data["_exchange_ns"] = exchangeEpochNs(parseDate(task_data->ActionDay), parseDate(task_data->TradingDay), parseTimeMs(task_data->UpdateTime, task_data->UpdateMillisec), 0);
+		TaskPool<CThostFtdcDepthMarketDataField>::release(task_data);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryDepthMarketData(data, error, task->task_id, task->task_last);
 };
@@ -5683,15 +6772,18 @@ void TdApi::processRspQryTraderOffer(Task *task)
 		data["MaxTradeID"] = toUtf(task_data->MaxTradeID);
 		data["MaxOrderMessageReference"] = toUtf(task_data->MaxOrderMessageReference);
 		data["OrderCancelAlg"] = task_data->OrderCancelAlg;
-		delete task_data;
+		TaskPool<CThostFtdcTraderOfferField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryTraderOffer(data, error, task->task_id, task->task_last);
 };
@@ -5711,15 +6803,18 @@ void TdApi::processRspQrySettlementInfo(Task *task)
 		data["Content"] = toUtf(task_data->Content);
 		data["AccountID"] = toUtf(task_data->AccountID);
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		delete task_data;
+		TaskPool<CThostFtdcSettlementInfoField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQrySettlementInfo(data, error, task->task_id, task->task_last);
 };
@@ -5735,15 +6830,18 @@ void TdApi::processRspQryTransferBank(Task *task)
 		data["BankBrchID"] = toUtf(task_data->BankBrchID);
 		data["BankName"] = toUtf(task_data->BankName);
 		data["IsActive"] = task_data->IsActive;
-		delete task_data;
+		TaskPool<CThostFtdcTransferBankField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryTransferBank(data, error, task->task_id, task->task_last);
 };
@@ -5763,38 +6861,41 @@ void TdApi::processRspQryInvestorPositionDetail(Task *task)
 		data["OpenDate"] = toUtf(task_data->OpenDate);
 		data["TradeID"] = toUtf(task_data->TradeID);
 		data["Volume"] = task_data->Volume;
-		data["OpenPrice"] = task_data->OpenPrice;
+		data["OpenPrice"] = validDouble(task_data->OpenPrice, this->invalid_as_nan);
 		data["TradingDay"] = toUtf(task_data->TradingDay);
 		data["SettlementID"] = task_data->SettlementID;
 		data["TradeType"] = task_data->TradeType;
 		data["reserve2"] = toUtf(task_data->reserve2);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["CloseProfitByDate"] = task_data->CloseProfitByDate;
-		data["CloseProfitByTrade"] = task_data->CloseProfitByTrade;
-		data["PositionProfitByDate"] = task_data->PositionProfitByDate;
-		data["PositionProfitByTrade"] = task_data->PositionProfitByTrade;
-		data["Margin"] = task_data->Margin;
-		data["ExchMargin"] = task_data->ExchMargin;
-		data["MarginRateByMoney"] = task_data->MarginRateByMoney;
-		data["MarginRateByVolume"] = task_data->MarginRateByVolume;
-		data["LastSettlementPrice"] = task_data->LastSettlementPrice;
-		data["SettlementPrice"] = task_data->SettlementPrice;
+		data["CloseProfitByDate"] = validDouble(task_data->CloseProfitByDate, this->invalid_as_nan);
+		data["CloseProfitByTrade"] = validDouble(task_data->CloseProfitByTrade, this->invalid_as_nan);
+		data["PositionProfitByDate"] = validDouble(task_data->PositionProfitByDate, this->invalid_as_nan);
+		data["PositionProfitByTrade"] = validDouble(task_data->PositionProfitByTrade, this->invalid_as_nan);
+		data["Margin"] = validDouble(task_data->Margin, this->invalid_as_nan);
+		data["ExchMargin"] = validDouble(task_data->ExchMargin, this->invalid_as_nan);
+		data["MarginRateByMoney"] = validDouble(task_data->MarginRateByMoney, this->invalid_as_nan);
+		data["MarginRateByVolume"] = validDouble(task_data->MarginRateByVolume, this->invalid_as_nan);
+		data["LastSettlementPrice"] = validDouble(task_data->LastSettlementPrice, this->invalid_as_nan);
+		data["SettlementPrice"] = validDouble(task_data->SettlementPrice, this->invalid_as_nan);
 		data["CloseVolume"] = task_data->CloseVolume;
-		data["CloseAmount"] = task_data->CloseAmount;
+		data["CloseAmount"] = validDouble(task_data->CloseAmount, this->invalid_as_nan);
 		data["TimeFirstVolume"] = task_data->TimeFirstVolume;
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
 		data["SpecPosiType"] = task_data->SpecPosiType;
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["CombInstrumentID"] = toUtf(task_data->CombInstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcInvestorPositionDetailField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInvestorPositionDetail(data, error, task->task_id, task->task_last);
 };
@@ -5809,15 +6910,18 @@ void TdApi::processRspQryNotice(Task *task)
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["Content"] = toUtf(task_data->Content);
 		data["SequenceLabel"] = toUtf(task_data->SequenceLabel);
-		delete task_data;
+		TaskPool<CThostFtdcNoticeField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryNotice(data, error, task->task_id, task->task_last);
 };
@@ -5836,15 +6940,18 @@ void TdApi::processRspQrySettlementInfoConfirm(Task *task)
 		data["SettlementID"] = task_data->SettlementID;
 		data["AccountID"] = toUtf(task_data->AccountID);
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		delete task_data;
+		TaskPool<CThostFtdcSettlementInfoConfirmField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQrySettlementInfoConfirm(data, error, task->task_id, task->task_last);
 };
@@ -5868,10 +6975,10 @@ void TdApi::processRspQryInvestorPositionCombineDetail(Task *task)
 		data["HedgeFlag"] = task_data->HedgeFlag;
 		data["Direction"] = task_data->Direction;
 		data["TotalAmt"] = task_data->TotalAmt;
-		data["Margin"] = task_data->Margin;
-		data["ExchMargin"] = task_data->ExchMargin;
-		data["MarginRateByMoney"] = task_data->MarginRateByMoney;
-		data["MarginRateByVolume"] = task_data->MarginRateByVolume;
+		data["Margin"] = validDouble(task_data->Margin, this->invalid_as_nan);
+		data["ExchMargin"] = validDouble(task_data->ExchMargin, this->invalid_as_nan);
+		data["MarginRateByMoney"] = validDouble(task_data->MarginRateByMoney, this->invalid_as_nan);
+		data["MarginRateByVolume"] = validDouble(task_data->MarginRateByVolume, this->invalid_as_nan);
 		data["LegID"] = task_data->LegID;
 		data["LegMultiple"] = task_data->LegMultiple;
 		data["reserve2"] = toUtf(task_data->reserve2);
@@ -5879,15 +6986,18 @@ void TdApi::processRspQryInvestorPositionCombineDetail(Task *task)
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["CombInstrumentID"] = toUtf(task_data->CombInstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcInvestorPositionCombineDetailField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInvestorPositionCombineDetail(data, error, task->task_id, task->task_last);
 };
@@ -5904,15 +7014,18 @@ void TdApi::processRspQryCFMMCTradingAccountKey(Task *task)
 		data["AccountID"] = toUtf(task_data->AccountID);
 		data["KeyID"] = task_data->KeyID;
 		data["CurrentKey"] = toUtf(task_data->CurrentKey);
-		delete task_data;
+		TaskPool<CThostFtdcCFMMCTradingAccountKeyField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryCFMMCTradingAccountKey(data, error, task->task_id, task->task_last);
 };
@@ -5934,15 +7047,18 @@ void TdApi::processRspQryEWarrantOffset(Task *task)
 		data["Volume"] = task_data->Volume;
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcEWarrantOffsetField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryEWarrantOffset(data, error, task->task_id, task->task_last);
 };
@@ -5959,40 +7075,43 @@ void TdApi::processRspQryInvestorProductGroupMargin(Task *task)
 		data["InvestorID"] = toUtf(task_data->InvestorID);
 		data["TradingDay"] = toUtf(task_data->TradingDay);
 		data["SettlementID"] = task_data->SettlementID;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		data["LongFrozenMargin"] = task_data->LongFrozenMargin;
-		data["ShortFrozenMargin"] = task_data->ShortFrozenMargin;
-		data["UseMargin"] = task_data->UseMargin;
-		data["LongUseMargin"] = task_data->LongUseMargin;
-		data["ShortUseMargin"] = task_data->ShortUseMargin;
-		data["ExchMargin"] = task_data->ExchMargin;
-		data["LongExchMargin"] = task_data->LongExchMargin;
-		data["ShortExchMargin"] = task_data->ShortExchMargin;
-		data["CloseProfit"] = task_data->CloseProfit;
-		data["FrozenCommission"] = task_data->FrozenCommission;
-		data["Commission"] = task_data->Commission;
-		data["FrozenCash"] = task_data->FrozenCash;
-		data["CashIn"] = task_data->CashIn;
-		data["PositionProfit"] = task_data->PositionProfit;
-		data["OffsetAmount"] = task_data->OffsetAmount;
-		data["LongOffsetAmount"] = task_data->LongOffsetAmount;
-		data["ShortOffsetAmount"] = task_data->ShortOffsetAmount;
-		data["ExchOffsetAmount"] = task_data->ExchOffsetAmount;
-		data["LongExchOffsetAmount"] = task_data->LongExchOffsetAmount;
-		data["ShortExchOffsetAmount"] = task_data->ShortExchOffsetAmount;
+		data["FrozenMargin"] = validDouble(task_data->FrozenMargin, this->invalid_as_nan);
+		data["LongFrozenMargin"] = validDouble(task_data->LongFrozenMargin, this->invalid_as_nan);
+		data["ShortFrozenMargin"] = validDouble(task_data->ShortFrozenMargin, this->invalid_as_nan);
+		data["UseMargin"] = validDouble(task_data->UseMargin, this->invalid_as_nan);
+		data["LongUseMargin"] = validDouble(task_data->LongUseMargin, this->invalid_as_nan);
+		data["ShortUseMargin"] = validDouble(task_data->ShortUseMargin, this->invalid_as_nan);
+		data["ExchMargin"] = validDouble(task_data->ExchMargin, this->invalid_as_nan);
+		data["LongExchMargin"] = validDouble(task_data->LongExchMargin, this->invalid_as_nan);
+		data["ShortExchMargin"] = validDouble(task_data->ShortExchMargin, this->invalid_as_nan);
+		data["CloseProfit"] = validDouble(task_data->CloseProfit, this->invalid_as_nan);
+		data["FrozenCommission"] = validDouble(task_data->FrozenCommission, this->invalid_as_nan);
+		data["Commission"] = validDouble(task_data->Commission, this->invalid_as_nan);
+		data["FrozenCash"] = validDouble(task_data->FrozenCash, this->invalid_as_nan);
+		data["CashIn"] = validDouble(task_data->CashIn, this->invalid_as_nan);
+		data["PositionProfit"] = validDouble(task_data->PositionProfit, this->invalid_as_nan);
+		data["OffsetAmount"] = validDouble(task_data->OffsetAmount, this->invalid_as_nan);
+		data["LongOffsetAmount"] = validDouble(task_data->LongOffsetAmount, this->invalid_as_nan);
+		data["ShortOffsetAmount"] = validDouble(task_data->ShortOffsetAmount, this->invalid_as_nan);
+		data["ExchOffsetAmount"] = validDouble(task_data->ExchOffsetAmount, this->invalid_as_nan);
+		data["LongExchOffsetAmount"] = validDouble(task_data->LongExchOffsetAmount, this->invalid_as_nan);
+		data["ShortExchOffsetAmount"] = validDouble(task_data->ShortExchOffsetAmount, this->invalid_as_nan);
 		data["HedgeFlag"] = task_data->HedgeFlag;
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
 		data["ProductGroupID"] = toUtf(task_data->ProductGroupID);
-		delete task_data;
+		TaskPool<CThostFtdcInvestorProductGroupMarginField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInvestorProductGroupMargin(data, error, task->task_id, task->task_last);
 };
@@ -6007,21 +7126,24 @@ void TdApi::processRspQryExchangeMarginRate(Task *task)
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["LongMarginRatioByMoney"] = task_data->LongMarginRatioByMoney;
-		data["LongMarginRatioByVolume"] = task_data->LongMarginRatioByVolume;
-		data["ShortMarginRatioByMoney"] = task_data->ShortMarginRatioByMoney;
-		data["ShortMarginRatioByVolume"] = task_data->ShortMarginRatioByVolume;
+		data["LongMarginRatioByMoney"] = validDouble(task_data->LongMarginRatioByMoney, this->invalid_as_nan);
+		data["LongMarginRatioByVolume"] = validDouble(task_data->LongMarginRatioByVolume, this->invalid_as_nan);
+		data["ShortMarginRatioByMoney"] = validDouble(task_data->ShortMarginRatioByMoney, this->invalid_as_nan);
+		data["ShortMarginRatioByVolume"] = validDouble(task_data->ShortMarginRatioByVolume, this->invalid_as_nan);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcExchangeMarginRateField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryExchangeMarginRate(data, error, task->task_id, task->task_last);
 };
@@ -6036,28 +7158,31 @@ void TdApi::processRspQryExchangeMarginRateAdjust(Task *task)
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["LongMarginRatioByMoney"] = task_data->LongMarginRatioByMoney;
-		data["LongMarginRatioByVolume"] = task_data->LongMarginRatioByVolume;
-		data["ShortMarginRatioByMoney"] = task_data->ShortMarginRatioByMoney;
-		data["ShortMarginRatioByVolume"] = task_data->ShortMarginRatioByVolume;
-		data["ExchLongMarginRatioByMoney"] = task_data->ExchLongMarginRatioByMoney;
-		data["ExchLongMarginRatioByVolume"] = task_data->ExchLongMarginRatioByVolume;
-		data["ExchShortMarginRatioByMoney"] = task_data->ExchShortMarginRatioByMoney;
-		data["ExchShortMarginRatioByVolume"] = task_data->ExchShortMarginRatioByVolume;
-		data["NoLongMarginRatioByMoney"] = task_data->NoLongMarginRatioByMoney;
-		data["NoLongMarginRatioByVolume"] = task_data->NoLongMarginRatioByVolume;
-		data["NoShortMarginRatioByMoney"] = task_data->NoShortMarginRatioByMoney;
-		data["NoShortMarginRatioByVolume"] = task_data->NoShortMarginRatioByVolume;
+		data["LongMarginRatioByMoney"] = validDouble(task_data->LongMarginRatioByMoney, this->invalid_as_nan);
+		data["LongMarginRatioByVolume"] = validDouble(task_data->LongMarginRatioByVolume, this->invalid_as_nan);
+		data["ShortMarginRatioByMoney"] = validDouble(task_data->ShortMarginRatioByMoney, this->invalid_as_nan);
+		data["ShortMarginRatioByVolume"] = validDouble(task_data->ShortMarginRatioByVolume, this->invalid_as_nan);
+		data["ExchLongMarginRatioByMoney"] = validDouble(task_data->ExchLongMarginRatioByMoney, this->invalid_as_nan);
+		data["ExchLongMarginRatioByVolume"] = validDouble(task_data->ExchLongMarginRatioByVolume, this->invalid_as_nan);
+		data["ExchShortMarginRatioByMoney"] = validDouble(task_data->ExchShortMarginRatioByMoney, this->invalid_as_nan);
+		data["ExchShortMarginRatioByVolume"] = validDouble(task_data->ExchShortMarginRatioByVolume, this->invalid_as_nan);
+		data["NoLongMarginRatioByMoney"] = validDouble(task_data->NoLongMarginRatioByMoney, this->invalid_as_nan);
+		data["NoLongMarginRatioByVolume"] = validDouble(task_data->NoLongMarginRatioByVolume, this->invalid_as_nan);
+		data["NoShortMarginRatioByMoney"] = validDouble(task_data->NoShortMarginRatioByMoney, this->invalid_as_nan);
+		data["NoShortMarginRatioByVolume"] = validDouble(task_data->NoShortMarginRatioByVolume, this->invalid_as_nan);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcExchangeMarginRateAdjustField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryExchangeMarginRateAdjust(data, error, task->task_id, task->task_last);
 };
@@ -6071,18 +7196,21 @@ void TdApi::processRspQryExchangeRate(Task *task)
 		CThostFtdcExchangeRateField *task_data = (CThostFtdcExchangeRateField*)task->task_data;
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["FromCurrencyID"] = toUtf(task_data->FromCurrencyID);
-		data["FromCurrencyUnit"] = task_data->FromCurrencyUnit;
+		data["FromCurrencyUnit"] = validDouble(task_data->FromCurrencyUnit, this->invalid_as_nan);
 		data["ToCurrencyID"] = toUtf(task_data->ToCurrencyID);
-		data["ExchangeRate"] = task_data->ExchangeRate;
-		delete task_data;
+		data["ExchangeRate"] = validDouble(task_data->ExchangeRate, this->invalid_as_nan);
+		TaskPool<CThostFtdcExchangeRateField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryExchangeRate(data, error, task->task_id, task->task_last);
 };
@@ -6099,15 +7227,18 @@ void TdApi::processRspQrySecAgentACIDMap(Task *task)
 		data["AccountID"] = toUtf(task_data->AccountID);
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
 		data["BrokerSecAgentID"] = toUtf(task_data->BrokerSecAgentID);
-		delete task_data;
+		TaskPool<CThostFtdcSecAgentACIDMapField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQrySecAgentACIDMap(data, error, task->task_id, task->task_last);
 };
@@ -6121,18 +7252,21 @@ void TdApi::processRspQryProductExchRate(Task *task)
 		CThostFtdcProductExchRateField *task_data = (CThostFtdcProductExchRateField*)task->task_data;
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["QuoteCurrencyID"] = toUtf(task_data->QuoteCurrencyID);
-		data["ExchangeRate"] = task_data->ExchangeRate;
+		data["ExchangeRate"] = validDouble(task_data->ExchangeRate, this->invalid_as_nan);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["ProductID"] = toUtf(task_data->ProductID);
-		delete task_data;
+		TaskPool<CThostFtdcProductExchRateField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryProductExchRate(data, error, task->task_id, task->task_last);
 };
@@ -6149,15 +7283,18 @@ void TdApi::processRspQryProductGroup(Task *task)
 		data["reserve2"] = toUtf(task_data->reserve2);
 		data["ProductID"] = toUtf(task_data->ProductID);
 		data["ProductGroupID"] = toUtf(task_data->ProductGroupID);
-		delete task_data;
+		TaskPool<CThostFtdcProductGroupField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryProductGroup(data, error, task->task_id, task->task_last);
 };
@@ -6173,22 +7310,25 @@ void TdApi::processRspQryMMInstrumentCommissionRate(Task *task)
 		data["InvestorRange"] = task_data->InvestorRange;
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OpenRatioByMoney"] = task_data->OpenRatioByMoney;
-		data["OpenRatioByVolume"] = task_data->OpenRatioByVolume;
-		data["CloseRatioByMoney"] = task_data->CloseRatioByMoney;
-		data["CloseRatioByVolume"] = task_data->CloseRatioByVolume;
-		data["CloseTodayRatioByMoney"] = task_data->CloseTodayRatioByMoney;
-		data["CloseTodayRatioByVolume"] = task_data->CloseTodayRatioByVolume;
+		data["OpenRatioByMoney"] = validDouble(task_data->OpenRatioByMoney, this->invalid_as_nan);
+		data["OpenRatioByVolume"] = validDouble(task_data->OpenRatioByVolume, this->invalid_as_nan);
+		data["CloseRatioByMoney"] = validDouble(task_data->CloseRatioByMoney, this->invalid_as_nan);
+		data["CloseRatioByVolume"] = validDouble(task_data->CloseRatioByVolume, this->invalid_as_nan);
+		data["CloseTodayRatioByMoney"] = validDouble(task_data->CloseTodayRatioByMoney, this->invalid_as_nan);
+		data["CloseTodayRatioByVolume"] = validDouble(task_data->CloseTodayRatioByVolume, this->invalid_as_nan);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcMMInstrumentCommissionRateField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryMMInstrumentCommissionRate(data, error, task->task_id, task->task_last);
 };
@@ -6204,24 +7344,27 @@ void TdApi::processRspQryMMOptionInstrCommRate(Task *task)
 		data["InvestorRange"] = task_data->InvestorRange;
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OpenRatioByMoney"] = task_data->OpenRatioByMoney;
-		data["OpenRatioByVolume"] = task_data->OpenRatioByVolume;
-		data["CloseRatioByMoney"] = task_data->CloseRatioByMoney;
-		data["CloseRatioByVolume"] = task_data->CloseRatioByVolume;
-		data["CloseTodayRatioByMoney"] = task_data->CloseTodayRatioByMoney;
-		data["CloseTodayRatioByVolume"] = task_data->CloseTodayRatioByVolume;
-		data["StrikeRatioByMoney"] = task_data->StrikeRatioByMoney;
-		data["StrikeRatioByVolume"] = task_data->StrikeRatioByVolume;
+		data["OpenRatioByMoney"] = validDouble(task_data->OpenRatioByMoney, this->invalid_as_nan);
+		data["OpenRatioByVolume"] = validDouble(task_data->OpenRatioByVolume, this->invalid_as_nan);
+		data["CloseRatioByMoney"] = validDouble(task_data->CloseRatioByMoney, this->invalid_as_nan);
+		data["CloseRatioByVolume"] = validDouble(task_data->CloseRatioByVolume, this->invalid_as_nan);
+		data["CloseTodayRatioByMoney"] = validDouble(task_data->CloseTodayRatioByMoney, this->invalid_as_nan);
+		data["CloseTodayRatioByVolume"] = validDouble(task_data->CloseTodayRatioByVolume, this->invalid_as_nan);
+		data["StrikeRatioByMoney"] = validDouble(task_data->StrikeRatioByMoney, this->invalid_as_nan);
+		data["StrikeRatioByVolume"] = validDouble(task_data->StrikeRatioByVolume, this->invalid_as_nan);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcMMOptionInstrCommRateField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryMMOptionInstrCommRate(data, error, task->task_id, task->task_last);
 };
@@ -6238,22 +7381,25 @@ void TdApi::processRspQryInstrumentOrderCommRate(Task *task)
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["InvestorID"] = toUtf(task_data->InvestorID);
 		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["OrderCommByVolume"] = task_data->OrderCommByVolume;
-		data["OrderActionCommByVolume"] = task_data->OrderActionCommByVolume;
+		data["OrderCommByVolume"] = validDouble(task_data->OrderCommByVolume, this->invalid_as_nan);
+		data["OrderActionCommByVolume"] = validDouble(task_data->OrderActionCommByVolume, this->invalid_as_nan);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderCommByTrade"] = task_data->OrderCommByTrade;
-		data["OrderActionCommByTrade"] = task_data->OrderActionCommByTrade;
-		delete task_data;
+		data["OrderCommByTrade"] = validDouble(task_data->OrderCommByTrade, this->invalid_as_nan);
+		data["OrderActionCommByTrade"] = validDouble(task_data->OrderActionCommByTrade, this->invalid_as_nan);
+		TaskPool<CThostFtdcInstrumentOrderCommRateField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInstrumentOrderCommRate(data, error, task->task_id, task->task_last);
 };
@@ -6267,63 +7413,66 @@ void TdApi::processRspQrySecAgentTradingAccount(Task *task)
 		CThostFtdcTradingAccountField *task_data = (CThostFtdcTradingAccountField*)task->task_data;
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["AccountID"] = toUtf(task_data->AccountID);
-		data["PreMortgage"] = task_data->PreMortgage;
-		data["PreCredit"] = task_data->PreCredit;
-		data["PreDeposit"] = task_data->PreDeposit;
-		data["PreBalance"] = task_data->PreBalance;
-		data["PreMargin"] = task_data->PreMargin;
-		data["InterestBase"] = task_data->InterestBase;
-		data["Interest"] = task_data->Interest;
-		data["Deposit"] = task_data->Deposit;
-		data["Withdraw"] = task_data->Withdraw;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		data["FrozenCash"] = task_data->FrozenCash;
-		data["FrozenCommission"] = task_data->FrozenCommission;
-		data["CurrMargin"] = task_data->CurrMargin;
-		data["CashIn"] = task_data->CashIn;
-		data["Commission"] = task_data->Commission;
-		data["CloseProfit"] = task_data->CloseProfit;
-		data["PositionProfit"] = task_data->PositionProfit;
-		data["Balance"] = task_data->Balance;
-		data["Available"] = task_data->Available;
-		data["WithdrawQuota"] = task_data->WithdrawQuota;
-		data["Reserve"] = task_data->Reserve;
+		data["PreMortgage"] = validDouble(task_data->PreMortgage, this->invalid_as_nan);
+		data["PreCredit"] = validDouble(task_data->PreCredit, this->invalid_as_nan);
+		data["PreDeposit"] = validDouble(task_data->PreDeposit, this->invalid_as_nan);
+		data["PreBalance"] = validDouble(task_data->PreBalance, this->invalid_as_nan);
+		data["PreMargin"] = validDouble(task_data->PreMargin, this->invalid_as_nan);
+		data["InterestBase"] = validDouble(task_data->InterestBase, this->invalid_as_nan);
+		data["Interest"] = validDouble(task_data->Interest, this->invalid_as_nan);
+		data["Deposit"] = validDouble(task_data->Deposit, this->invalid_as_nan);
+		data["Withdraw"] = validDouble(task_data->Withdraw, this->invalid_as_nan);
+		data["FrozenMargin"] = validDouble(task_data->FrozenMargin, this->invalid_as_nan);
+		data["FrozenCash"] = validDouble(task_data->FrozenCash, this->invalid_as_nan);
+		data["FrozenCommission"] = validDouble(task_data->FrozenCommission, this->invalid_as_nan);
+		data["CurrMargin"] = validDouble(task_data->CurrMargin, this->invalid_as_nan);
+		data["CashIn"] = validDouble(task_data->CashIn, this->invalid_as_nan);
+		data["Commission"] = validDouble(task_data->Commission, this->invalid_as_nan);
+		data["CloseProfit"] = validDouble(task_data->CloseProfit, this->invalid_as_nan);
+		data["PositionProfit"] = validDouble(task_data->PositionProfit, this->invalid_as_nan);
+		data["Balance"] = validDouble(task_data->Balance, this->invalid_as_nan);
+		data["Available"] = validDouble(task_data->Available, this->invalid_as_nan);
+		data["WithdrawQuota"] = validDouble(task_data->WithdrawQuota, this->invalid_as_nan);
+		data["Reserve"] = validDouble(task_data->Reserve, this->invalid_as_nan);
 		data["TradingDay"] = toUtf(task_data->TradingDay);
 		data["SettlementID"] = task_data->SettlementID;
-		data["Credit"] = task_data->Credit;
-		data["Mortgage"] = task_data->Mortgage;
-		data["ExchangeMargin"] = task_data->ExchangeMargin;
-		data["DeliveryMargin"] = task_data->DeliveryMargin;
-		data["ExchangeDeliveryMargin"] = task_data->ExchangeDeliveryMargin;
-		data["ReserveBalance"] = task_data->ReserveBalance;
+		data["Credit"] = validDouble(task_data->Credit, this->invalid_as_nan);
+		data["Mortgage"] = validDouble(task_data->Mortgage, this->invalid_as_nan);
+		data["ExchangeMargin"] = validDouble(task_data->ExchangeMargin, this->invalid_as_nan);
+		data["DeliveryMargin"] = validDouble(task_data->DeliveryMargin, this->invalid_as_nan);
+		data["ExchangeDeliveryMargin"] = validDouble(task_data->ExchangeDeliveryMargin, this->invalid_as_nan);
+		data["ReserveBalance"] = validDouble(task_data->ReserveBalance, this->invalid_as_nan);
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["PreFundMortgageIn"] = task_data->PreFundMortgageIn;
-		data["PreFundMortgageOut"] = task_data->PreFundMortgageOut;
-		data["FundMortgageIn"] = task_data->FundMortgageIn;
-		data["FundMortgageOut"] = task_data->FundMortgageOut;
-		data["FundMortgageAvailable"] = task_data->FundMortgageAvailable;
-		data["MortgageableFund"] = task_data->MortgageableFund;
-		data["SpecProductMargin"] = task_data->SpecProductMargin;
-		data["SpecProductFrozenMargin"] = task_data->SpecProductFrozenMargin;
-		data["SpecProductCommission"] = task_data->SpecProductCommission;
-		data["SpecProductFrozenCommission"] = task_data->SpecProductFrozenCommission;
-		data["SpecProductPositionProfit"] = task_data->SpecProductPositionProfit;
-		data["SpecProductCloseProfit"] = task_data->SpecProductCloseProfit;
-		data["SpecProductPositionProfitByAlg"] = task_data->SpecProductPositionProfitByAlg;
-		data["SpecProductExchangeMargin"] = task_data->SpecProductExchangeMargin;
+		data["PreFundMortgageIn"] = validDouble(task_data->PreFundMortgageIn, this->invalid_as_nan);
+		data["PreFundMortgageOut"] = validDouble(task_data->PreFundMortgageOut, this->invalid_as_nan);
+		data["FundMortgageIn"] = validDouble(task_data->FundMortgageIn, this->invalid_as_nan);
+		data["FundMortgageOut"] = validDouble(task_data->FundMortgageOut, this->invalid_as_nan);
+		data["FundMortgageAvailable"] = validDouble(task_data->FundMortgageAvailable, this->invalid_as_nan);
+		data["MortgageableFund"] = validDouble(task_data->MortgageableFund, this->invalid_as_nan);
+		data["SpecProductMargin"] = validDouble(task_data->SpecProductMargin, this->invalid_as_nan);
+		data["SpecProductFrozenMargin"] = validDouble(task_data->SpecProductFrozenMargin, this->invalid_as_nan);
+		data["SpecProductCommission"] = validDouble(task_data->SpecProductCommission, this->invalid_as_nan);
+		data["SpecProductFrozenCommission"] = validDouble(task_data->SpecProductFrozenCommission, this->invalid_as_nan);
+		data["SpecProductPositionProfit"] = validDouble(task_data->SpecProductPositionProfit, this->invalid_as_nan);
+		data["SpecProductCloseProfit"] = validDouble(task_data->SpecProductCloseProfit, this->invalid_as_nan);
+		data["SpecProductPositionProfitByAlg"] = validDouble(task_data->SpecProductPositionProfitByAlg, this->invalid_as_nan);
+		data["SpecProductExchangeMargin"] = validDouble(task_data->SpecProductExchangeMargin, this->invalid_as_nan);
 		data["BizType"] = task_data->BizType;
-		data["FrozenSwap"] = task_data->FrozenSwap;
-		data["RemainSwap"] = task_data->RemainSwap;
-		data["OptionValue"] = task_data->OptionValue;
-		delete task_data;
-	}
+		data["FrozenSwap"] = validDouble(task_data->FrozenSwap, this->invalid_as_nan);
+		data["RemainSwap"] = validDouble(task_data->RemainSwap, this->invalid_as_nan);
+		data["OptionValue"] = validDouble(task_data->OptionValue, this->invalid_as_nan);
+		TaskPool<CThostFtdcTradingAccountField>::release(task_data);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQrySecAgentTradingAccount(data, error, task->task_id, task->task_last);
 };
@@ -6340,15 +7489,18 @@ void TdApi::processRspQrySecAgentCheckMode(Task *task)
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
 		data["BrokerSecAgentID"] = toUtf(task_data->BrokerSecAgentID);
 		data["CheckSelfAccount"] = task_data->CheckSelfAccount;
-		delete task_data;
+		TaskPool<CThostFtdcSecAgentCheckModeField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQrySecAgentCheckMode(data, error, task->task_id, task->task_last);
 };
@@ -6364,15 +7516,18 @@ void TdApi::processRspQrySecAgentTradeInfo(Task *task)
 		data["BrokerSecAgentID"] = toUtf(task_data->BrokerSecAgentID);
 		data["InvestorID"] = toUtf(task_data->InvestorID);
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcSecAgentTradeInfoField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQrySecAgentTradeInfo(data, error, task->task_id, task->task_last);
 };
@@ -6388,23 +7543,26 @@ void TdApi::processRspQryOptionInstrTradeCost(Task *task)
 		data["InvestorID"] = toUtf(task_data->InvestorID);
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["FixedMargin"] = task_data->FixedMargin;
-		data["MiniMargin"] = task_data->MiniMargin;
-		data["Royalty"] = task_data->Royalty;
-		data["ExchFixedMargin"] = task_data->ExchFixedMargin;
-		data["ExchMiniMargin"] = task_data->ExchMiniMargin;
+		data["FixedMargin"] = validDouble(task_data->FixedMargin, this->invalid_as_nan);
+		data["MiniMargin"] = validDouble(task_data->MiniMargin, this->invalid_as_nan);
+		data["Royalty"] = validDouble(task_data->Royalty, this->invalid_as_nan);
+		data["ExchFixedMargin"] = validDouble(task_data->ExchFixedMargin, this->invalid_as_nan);
+		data["ExchMiniMargin"] = validDouble(task_data->ExchMiniMargin, this->invalid_as_nan);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcOptionInstrTradeCostField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryOptionInstrTradeCost(data, error, task->task_id, task->task_last);
 };
@@ -6420,26 +7578,29 @@ void TdApi::processRspQryOptionInstrCommRate(Task *task)
 		data["InvestorRange"] = task_data->InvestorRange;
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OpenRatioByMoney"] = task_data->OpenRatioByMoney;
-		data["OpenRatioByVolume"] = task_data->OpenRatioByVolume;
-		data["CloseRatioByMoney"] = task_data->CloseRatioByMoney;
-		data["CloseRatioByVolume"] = task_data->CloseRatioByVolume;
-		data["CloseTodayRatioByMoney"] = task_data->CloseTodayRatioByMoney;
-		data["CloseTodayRatioByVolume"] = task_data->CloseTodayRatioByVolume;
-		data["StrikeRatioByMoney"] = task_data->StrikeRatioByMoney;
-		data["StrikeRatioByVolume"] = task_data->StrikeRatioByVolume;
+		data["OpenRatioByMoney"] = validDouble(task_data->OpenRatioByMoney, this->invalid_as_nan);
+		data["OpenRatioByVolume"] = validDouble(task_data->OpenRatioByVolume, this->invalid_as_nan);
+		data["CloseRatioByMoney"] = validDouble(task_data->CloseRatioByMoney, this->invalid_as_nan);
+		data["CloseRatioByVolume"] = validDouble(task_data->CloseRatioByVolume, this->invalid_as_nan);
+		data["CloseTodayRatioByMoney"] = validDouble(task_data->CloseTodayRatioByMoney, this->invalid_as_nan);
+		data["CloseTodayRatioByVolume"] = validDouble(task_data->CloseTodayRatioByVolume, this->invalid_as_nan);
+		data["StrikeRatioByMoney"] = validDouble(task_data->StrikeRatioByMoney, this->invalid_as_nan);
+		data["StrikeRatioByVolume"] = validDouble(task_data->StrikeRatioByVolume, this->invalid_as_nan);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcOptionInstrCommRateField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryOptionInstrCommRate(data, error, task->task_id, task->task_last);
 };
@@ -6498,15 +7659,18 @@ void TdApi::processRspQryExecOrder(Task *task)
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcExecOrderField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryExecOrder(data, error, task->task_id, task->task_last);
 };
@@ -6544,15 +7708,18 @@ void TdApi::processRspQryForQuote(Task *task)
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcForQuoteField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryForQuote(data, error, task->task_id, task->task_last);
 };
@@ -6569,8 +7736,8 @@ void TdApi::processRspQryQuote(Task *task)
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["QuoteRef"] = toUtf(task_data->QuoteRef);
 		data["UserID"] = toUtf(task_data->UserID);
-		data["AskPrice"] = task_data->AskPrice;
-		data["BidPrice"] = task_data->BidPrice;
+		data["AskPrice"] = validDouble(task_data->AskPrice, this->invalid_as_nan);
+		data["BidPrice"] = validDouble(task_data->BidPrice, this->invalid_as_nan);
 		data["AskVolume"] = task_data->AskVolume;
 		data["BidVolume"] = task_data->BidVolume;
 		data["RequestID"] = task_data->RequestID;
@@ -6621,15 +7788,18 @@ void TdApi::processRspQryQuote(Task *task)
 		data["TimeCondition"] = task_data->TimeCondition;
 		data["OrderMemo"] = toUtf(task_data->OrderMemo);
 		data["SessionReqSeq"] = task_data->SessionReqSeq;
-		delete task_data;
+		TaskPool<CThostFtdcQuoteField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryQuote(data, error, task->task_id, task->task_last);
 };
@@ -6684,15 +7854,18 @@ void TdApi::processRspQryOptionSelfClose(Task *task)
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcOptionSelfCloseField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryOptionSelfClose(data, error, task->task_id, task->task_last);
 };
@@ -6713,15 +7886,18 @@ void TdApi::processRspQryInvestUnit(Task *task)
 		data["MarginModelID"] = toUtf(task_data->MarginModelID);
 		data["AccountID"] = toUtf(task_data->AccountID);
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		delete task_data;
+		TaskPool<CThostFtdcInvestUnitField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInvestUnit(data, error, task->task_id, task->task_last);
 };
@@ -6735,18 +7911,21 @@ void TdApi::processRspQryCombInstrumentGuard(Task *task)
 		CThostFtdcCombInstrumentGuardField *task_data = (CThostFtdcCombInstrumentGuardField*)task->task_data;
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["reserve1"] = toUtf(task_data->reserve1);
-		data["GuarantRatio"] = task_data->GuarantRatio;
+		data["GuarantRatio"] = validDouble(task_data->GuarantRatio, this->invalid_as_nan);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcCombInstrumentGuardField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryCombInstrumentGuard(data, error, task->task_id, task->task_last);
 };
@@ -6791,15 +7970,18 @@ void TdApi::processRspQryCombAction(Task *task)
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcCombActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryCombAction(data, error, task->task_id, task->task_last);
 };
@@ -6831,23 +8013,26 @@ void TdApi::processRspQryTransferSerial(Task *task)
 		data["IdCardType"] = task_data->IdCardType;
 		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["AvailabilityFlag"] = task_data->AvailabilityFlag;
 		data["OperatorCode"] = toUtf(task_data->OperatorCode);
 		data["BankNewAccount"] = toUtf(task_data->BankNewAccount);
 		data["ErrorID"] = task_data->ErrorID;
 		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		delete task_data;
+		TaskPool<CThostFtdcTransferSerialField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryTransferSerial(data, error, task->task_id, task->task_last);
 };
@@ -6877,15 +8062,18 @@ void TdApi::processRspQryAccountregister(Task *task)
 		data["CustType"] = task_data->CustType;
 		data["BankAccType"] = task_data->BankAccType;
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcAccountregisterField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryAccountregister(data, error, task->task_id, task->task_last);
 };
@@ -6899,87 +8087,181 @@ void TdApi::processRspError(Task *task)
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspError(error, task->task_id, task->task_last);
 };
 
-void TdApi::processRtnOrder(Task *task)
+dict TdApi::convertRtnOrder(Task *task)
 {
-	gil_scoped_acquire acquire;
 	dict data;
 	if (task->task_data)
 	{
 		CThostFtdcOrderField *task_data = (CThostFtdcOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["reserve2"] = toUtf(task_data->reserve2);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["OrderSource"] = task_data->OrderSource;
-		data["OrderStatus"] = task_data->OrderStatus;
-		data["OrderType"] = task_data->OrderType;
-		data["VolumeTraded"] = task_data->VolumeTraded;
-		data["VolumeTotal"] = task_data->VolumeTotal;
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ActiveTime"] = toUtf(task_data->ActiveTime);
-		data["SuspendTime"] = toUtf(task_data->SuspendTime);
-		data["UpdateTime"] = toUtf(task_data->UpdateTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ActiveTraderID"] = toUtf(task_data->ActiveTraderID);
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
-		data["RelativeOrderSysID"] = toUtf(task_data->RelativeOrderSysID);
-		data["ZCETotalTradedVolume"] = task_data->ZCETotalTradedVolume;
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["reserve3"] = toUtf(task_data->reserve3);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["OrderMemo"] = toUtf(task_data->OrderMemo);
-		data["SessionReqSeq"] = task_data->SessionReqSeq;
-		delete task_data;
+		const vector<int> *fields = this->field_selection.get(FIELDS_ORDER);
+		if (fields)
+		{
+			for (int field : *fields)
+			{
+				switch (field)
+				{
+				case 0: data["BrokerID"] = this->string_cache.get(task_data->BrokerID); break;
+				case 1: data["InvestorID"] = this->string_cache.get(task_data->InvestorID); break;
+				case 2: data["reserve1"] = toUtf(task_data->reserve1); break;
+				case 3: data["OrderRef"] = toUtf(task_data->OrderRef); break;
+				case 4: data["UserID"] = this->string_cache.get(task_data->UserID); break;
+				case 5: data["OrderPriceType"] = task_data->OrderPriceType; break;
+				case 6: data["Direction"] = task_data->Direction; break;
+				case 7: data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag); break;
+				case 8: data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag); break;
+				case 9: data["LimitPrice"] = validDouble(task_data->LimitPrice, this->invalid_as_nan); break;
+				case 10: data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal; break;
+				case 11: data["TimeCondition"] = task_data->TimeCondition; break;
+				case 12: data["GTDDate"] = toUtf(task_data->GTDDate); break;
+				case 13: data["VolumeCondition"] = task_data->VolumeCondition; break;
+				case 14: data["MinVolume"] = task_data->MinVolume; break;
+				case 15: data["ContingentCondition"] = task_data->ContingentCondition; break;
+				case 16: data["StopPrice"] = validDouble(task_data->StopPrice, this->invalid_as_nan); break;
+				case 17: data["ForceCloseReason"] = task_data->ForceCloseReason; break;
+				case 18: data["IsAutoSuspend"] = task_data->IsAutoSuspend; break;
+				case 19: data["BusinessUnit"] = toUtf(task_data->BusinessUnit); break;
+				case 20: data["RequestID"] = task_data->RequestID; break;
+				case 21: data["OrderLocalID"] = toUtf(task_data->OrderLocalID); break;
+				case 22: data["ExchangeID"] = this->string_cache.get(task_data->ExchangeID); break;
+				case 23: data["ParticipantID"] = toUtf(task_data->ParticipantID); break;
+				case 24: data["ClientID"] = toUtf(task_data->ClientID); break;
+				case 25: data["reserve2"] = toUtf(task_data->reserve2); break;
+				case 26: data["TraderID"] = toUtf(task_data->TraderID); break;
+				case 27: data["InstallID"] = task_data->InstallID; break;
+				case 28: data["OrderSubmitStatus"] = task_data->OrderSubmitStatus; break;
+				case 29: data["NotifySequence"] = task_data->NotifySequence; break;
+				case 30: data["TradingDay"] = this->string_cache.get(task_data->TradingDay); break;
+				case 31: data["SettlementID"] = task_data->SettlementID; break;
+				case 32: data["OrderSysID"] = toUtf(task_data->OrderSysID); break;
+				case 33: data["OrderSource"] = task_data->OrderSource; break;
+				case 34: data["OrderStatus"] = task_data->OrderStatus; break;
+				case 35: data["OrderType"] = task_data->OrderType; break;
+				case 36: data["VolumeTraded"] = task_data->VolumeTraded; break;
+				case 37: data["VolumeTotal"] = task_data->VolumeTotal; break;
+				case 38: data["InsertDate"] = this->string_cache.get(task_data->InsertDate); break;
+				case 39: data["InsertTime"] = toUtf(task_data->InsertTime); break;
+				case 40: data["ActiveTime"] = toUtf(task_data->ActiveTime); break;
+				case 41: data["SuspendTime"] = toUtf(task_data->SuspendTime); break;
+				case 42: data["UpdateTime"] = toUtf(task_data->UpdateTime); break;
+				case 43: data["CancelTime"] = toUtf(task_data->CancelTime); break;
+				case 44: data["ActiveTraderID"] = toUtf(task_data->ActiveTraderID); break;
+				case 45: data["ClearingPartID"] = toUtf(task_data->ClearingPartID); break;
+				case 46: data["SequenceNo"] = task_data->SequenceNo; break;
+				case 47: data["FrontID"] = task_data->FrontID; break;
+				case 48: data["SessionID"] = task_data->SessionID; break;
+				case 49: data["UserProductInfo"] = toUtf(task_data->UserProductInfo); break;
+				case 50: data["StatusMsg"] = toUtf(task_data->StatusMsg); break;
+				case 51: data["UserForceClose"] = task_data->UserForceClose; break;
+				case 52: data["ActiveUserID"] = toUtf(task_data->ActiveUserID); break;
+				case 53: data["BrokerOrderSeq"] = task_data->BrokerOrderSeq; break;
+				case 54: data["RelativeOrderSysID"] = toUtf(task_data->RelativeOrderSysID); break;
+				case 55: data["ZCETotalTradedVolume"] = task_data->ZCETotalTradedVolume; break;
+				case 56: data["IsSwapOrder"] = task_data->IsSwapOrder; break;
+				case 57: data["BranchID"] = toUtf(task_data->BranchID); break;
+				case 58: data["InvestUnitID"] = toUtf(task_data->InvestUnitID); break;
+				case 59: data["AccountID"] = toUtf(task_data->AccountID); break;
+				case 60: data["CurrencyID"] = toUtf(task_data->CurrencyID); break;
+				case 61: data["reserve3"] = toUtf(task_data->reserve3); break;
+				case 62: data["MacAddress"] = toUtf(task_data->MacAddress); break;
+				case 63: data["InstrumentID"] = this->string_cache.get(task_data->InstrumentID); break;
+				case 64: data["ExchangeInstID"] = this->string_cache.get(task_data->ExchangeInstID); break;
+				case 65: data["IPAddress"] = toUtf(task_data->IPAddress); break;
+				case 66: data["OrderMemo"] = toUtf(task_data->OrderMemo); break;
+				case 67: data["SessionReqSeq"] = task_data->SessionReqSeq; break;
+				}
+			}
+		}
+		else
+		{
+			data["BrokerID"] = this->string_cache.get(task_data->BrokerID);
+			data["InvestorID"] = this->string_cache.get(task_data->InvestorID);
+			data["reserve1"] = toUtf(task_data->reserve1);
+			data["OrderRef"] = toUtf(task_data->OrderRef);
+			data["UserID"] = this->string_cache.get(task_data->UserID);
+			data["OrderPriceType"] = task_data->OrderPriceType;
+			data["Direction"] = task_data->Direction;
+			data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
+			data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
+			data["LimitPrice"] = validDouble(task_data->LimitPrice, this->invalid_as_nan);
+			data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
+			data["TimeCondition"] = task_data->TimeCondition;
+			data["GTDDate"] = toUtf(task_data->GTDDate);
+			data["VolumeCondition"] = task_data->VolumeCondition;
+			data["MinVolume"] = task_data->MinVolume;
+			data["ContingentCondition"] = task_data->ContingentCondition;
+			data["StopPrice"] = validDouble(task_data->StopPrice, this->invalid_as_nan);
+			data["ForceCloseReason"] = task_data->ForceCloseReason;
+			data["IsAutoSuspend"] = task_data->IsAutoSuspend;
+			data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
+			data["RequestID"] = task_data->RequestID;
+			data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
+			data["ExchangeID"] = this->string_cache.get(task_data->ExchangeID);
+			data["ParticipantID"] = toUtf(task_data->ParticipantID);
+			data["ClientID"] = toUtf(task_data->ClientID);
+			data["reserve2"] = toUtf(task_data->reserve2);
+			data["TraderID"] = toUtf(task_data->TraderID);
+			data["InstallID"] = task_data->InstallID;
+			data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
+			data["NotifySequence"] = task_data->NotifySequence;
+			data["TradingDay"] = this->string_cache.get(task_data->TradingDay);
+			data["SettlementID"] = task_data->SettlementID;
+			data["OrderSysID"] = toUtf(task_data->OrderSysID);
+			data["OrderSource"] = task_data->OrderSource;
+			data["OrderStatus"] = task_data->OrderStatus;
+			data["OrderType"] = task_data->OrderType;
+			data["VolumeTraded"] = task_data->VolumeTraded;
+			data["VolumeTotal"] = task_data->VolumeTotal;
+			data["InsertDate"] = this->string_cache.get(task_data->InsertDate);
+			data["InsertTime"] = toUtf(task_data->InsertTime);
+			data["ActiveTime"] = toUtf(task_data->ActiveTime);
+			data["SuspendTime"] = toUtf(task_data->SuspendTime);
+			data["UpdateTime"] = toUtf(task_data->UpdateTime);
+			data["CancelTime"] = toUtf(task_data->CancelTime);
+			data["ActiveTraderID"] = toUtf(task_data->ActiveTraderID);
+			data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
+			data["SequenceNo"] = task_data->SequenceNo;
+			data["FrontID"] = task_data->FrontID;
+			data["SessionID"] = task_data->SessionID;
+			data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
+			data["StatusMsg"] = toUtf(task_data->StatusMsg);
+			data["UserForceClose"] = task_data->UserForceClose;
+			data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
+			data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
+			data["RelativeOrderSysID"] = toUtf(task_data->RelativeOrderSysID);
+			data["ZCETotalTradedVolume"] = task_data->ZCETotalTradedVolume;
+			data["IsSwapOrder"] = task_data->IsSwapOrder;
+			data["BranchID"] = toUtf(task_data->BranchID);
+			data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
+			data["AccountID"] = toUtf(task_data->AccountID);
+			data["CurrencyID"] = toUtf(task_data->CurrencyID);
+			data["reserve3"] = toUtf(task_data->reserve3);
+			data["MacAddress"] = toUtf(task_data->MacAddress);
+			data["InstrumentID"] = this->string_cache.get(task_data->InstrumentID);
+			data["ExchangeInstID"] = this->string_cache.get(task_data->ExchangeInstID);
+			data["IPAddress"] = toUtf(task_data->IPAddress);
+			data["OrderMemo"] = toUtf(task_data->OrderMemo);
+			data["SessionReqSeq"] = task_data->SessionReqSeq;
+		}
+		data["_exchange_ns"] = exchangeEpochNs(parseDate(task_data->InsertDate), parseDate(task_data->TradingDay), parseTimeMs(task_data->InsertTime, 0), task->task_wall_time);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
+	return data;
+};
+
+void TdApi::processRtnOrder(Task *task)
+{
+	gil_scoped_acquire acquire;
+	dict data = this->convertRtnOrder(task);
+	if (task->task_data)
+	{
+		TaskPool<CThostFtdcOrderField>::release((CThostFtdcOrderField*)task->task_data);
 	}
 	this->onRtnOrder(data);
 };
@@ -6991,41 +8273,91 @@ void TdApi::processRtnTrade(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradeField *task_data = (CThostFtdcTradeField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["TradeID"] = toUtf(task_data->TradeID);
-		data["Direction"] = task_data->Direction;
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["TradingRole"] = task_data->TradingRole;
-		data["reserve2"] = toUtf(task_data->reserve2);
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["Price"] = task_data->Price;
-		data["Volume"] = task_data->Volume;
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["TradeType"] = task_data->TradeType;
-		data["PriceSource"] = task_data->PriceSource;
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
-		data["TradeSource"] = task_data->TradeSource;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		delete task_data;
-	}
+		const vector<int> *fields = this->field_selection.get(FIELDS_TRADE);
+		if (fields)
+		{
+			for (int field : *fields)
+			{
+				switch (field)
+				{
+				case 0: data["BrokerID"] = this->string_cache.get(task_data->BrokerID); break;
+				case 1: data["InvestorID"] = this->string_cache.get(task_data->InvestorID); break;
+				case 2: data["reserve1"] = toUtf(task_data->reserve1); break;
+				case 3: data["OrderRef"] = toUtf(task_data->OrderRef); break;
+				case 4: data["UserID"] = this->string_cache.get(task_data->UserID); break;
+				case 5: data["ExchangeID"] = this->string_cache.get(task_data->ExchangeID); break;
+				case 6: data["TradeID"] = toUtf(task_data->TradeID); break;
+				case 7: data["Direction"] = task_data->Direction; break;
+				case 8: data["OrderSysID"] = toUtf(task_data->OrderSysID); break;
+				case 9: data["ParticipantID"] = toUtf(task_data->ParticipantID); break;
+				case 10: data["ClientID"] = toUtf(task_data->ClientID); break;
+				case 11: data["TradingRole"] = task_data->TradingRole; break;
+				case 12: data["reserve2"] = toUtf(task_data->reserve2); break;
+				case 13: data["OffsetFlag"] = task_data->OffsetFlag; break;
+				case 14: data["HedgeFlag"] = task_data->HedgeFlag; break;
+				case 15: data["Price"] = validDouble(task_data->Price, this->invalid_as_nan); break;
+				case 16: data["Volume"] = task_data->Volume; break;
+				case 17: data["TradeDate"] = this->string_cache.get(task_data->TradeDate); break;
+				case 18: data["TradeTime"] = toUtf(task_data->TradeTime); break;
+				case 19: data["TradeType"] = task_data->TradeType; break;
+				case 20: data["PriceSource"] = task_data->PriceSource; break;
+				case 21: data["TraderID"] = toUtf(task_data->TraderID); break;
+				case 22: data["OrderLocalID"] = toUtf(task_data->OrderLocalID); break;
+				case 23: data["ClearingPartID"] = toUtf(task_data->ClearingPartID); break;
+				case 24: data["BusinessUnit"] = toUtf(task_data->BusinessUnit); break;
+				case 25: data["SequenceNo"] = task_data->SequenceNo; break;
+				case 26: data["TradingDay"] = this->string_cache.get(task_data->TradingDay); break;
+				case 27: data["SettlementID"] = task_data->SettlementID; break;
+				case 28: data["BrokerOrderSeq"] = task_data->BrokerOrderSeq; break;
+				case 29: data["TradeSource"] = task_data->TradeSource; break;
+				case 30: data["InvestUnitID"] = toUtf(task_data->InvestUnitID); break;
+				case 31: data["InstrumentID"] = this->string_cache.get(task_data->InstrumentID); break;
+				case 32: data["ExchangeInstID"] = this->string_cache.get(task_data->ExchangeInstID); break;
+				}
+			}
+		}
+		else
+		{
+			data["BrokerID"] = this->string_cache.get(task_data->BrokerID);
+			data["InvestorID"] = this->string_cache.get(task_data->InvestorID);
+			data["reserve1"] = toUtf(task_data->reserve1);
+			data["OrderRef"] = toUtf(task_data->OrderRef);
+			data["UserID"] = this->string_cache.get(task_data->UserID);
+			data["ExchangeID"] = this->string_cache.get(task_data->ExchangeID);
+			data["TradeID"] = toUtf(task_data->TradeID);
+			data["Direction"] = task_data->Direction;
+			data["OrderSysID"] = toUtf(task_data->OrderSysID);
+			data["ParticipantID"] = toUtf(task_data->ParticipantID);
+			data["ClientID"] = toUtf(task_data->ClientID);
+			data["TradingRole"] = task_data->TradingRole;
+			data["reserve2"] = toUtf(task_data->reserve2);
+			data["OffsetFlag"] = task_data->OffsetFlag;
+			data["HedgeFlag"] = task_data->HedgeFlag;
+			data["Price"] = validDouble(task_data->Price, this->invalid_as_nan);
+			data["Volume"] = task_data->Volume;
+			data["TradeDate"] = this->string_cache.get(task_data->TradeDate);
+			data["TradeTime"] = toUtf(task_data->TradeTime);
+			data["TradeType"] = task_data->TradeType;
+			data["PriceSource"] = task_data->PriceSource;
+			data["TraderID"] = toUtf(task_data->TraderID);
+			data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
+			data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
+			data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
+			data["SequenceNo"] = task_data->SequenceNo;
+			data["TradingDay"] = this->string_cache.get(task_data->TradingDay);
+			data["SettlementID"] = task_data->SettlementID;
+			data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
+			data["TradeSource"] = task_data->TradeSource;
+			data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
+			data["InstrumentID"] = this->string_cache.get(task_data->InstrumentID);
+			data["ExchangeInstID"] = this->string_cache.get(task_data->ExchangeInstID);
+		}
+		data["_exchange_ns"] = exchangeEpochNs(parseDate(task_data->TradeDate), parseDate(task_data->TradingDay), parseTimeMs(task_data->TradeTime, 0), task->task_wall_time);
+		TaskPool<CThostFtdcTradeField>::release(task_data);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnTrade(data);
 };
 
@@ -7045,14 +8377,14 @@ void TdApi::processErrRtnOrderInsert(Task *task)
 		data["Direction"] = task_data->Direction;
 		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
 		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
+		data["LimitPrice"] = validDouble(task_data->LimitPrice, this->invalid_as_nan);
 		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
 		data["TimeCondition"] = task_data->TimeCondition;
 		data["GTDDate"] = toUtf(task_data->GTDDate);
 		data["VolumeCondition"] = task_data->VolumeCondition;
 		data["MinVolume"] = task_data->MinVolume;
 		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
+		data["StopPrice"] = validDouble(task_data->StopPrice, this->invalid_as_nan);
 		data["ForceCloseReason"] = task_data->ForceCloseReason;
 		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
 		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
@@ -7070,15 +8402,18 @@ void TdApi::processErrRtnOrderInsert(Task *task)
 		data["IPAddress"] = toUtf(task_data->IPAddress);
 		data["OrderMemo"] = toUtf(task_data->OrderMemo);
 		data["SessionReqSeq"] = task_data->SessionReqSeq;
-		delete task_data;
+		TaskPool<CThostFtdcInputOrderField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnOrderInsert(data, error);
 };
@@ -7100,7 +8435,7 @@ void TdApi::processErrRtnOrderAction(Task *task)
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["OrderSysID"] = toUtf(task_data->OrderSysID);
 		data["ActionFlag"] = task_data->ActionFlag;
-		data["LimitPrice"] = task_data->LimitPrice;
+		data["LimitPrice"] = validDouble(task_data->LimitPrice, this->invalid_as_nan);
 		data["VolumeChange"] = task_data->VolumeChange;
 		data["ActionDate"] = toUtf(task_data->ActionDate);
 		data["ActionTime"] = toUtf(task_data->ActionTime);
@@ -7123,15 +8458,18 @@ void TdApi::processErrRtnOrderAction(Task *task)
 		data["IPAddress"] = toUtf(task_data->IPAddress);
 		data["OrderMemo"] = toUtf(task_data->OrderMemo);
 		data["SessionReqSeq"] = task_data->SessionReqSeq;
-		delete task_data;
+		TaskPool<CThostFtdcOrderActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnOrderAction(data, error);
 };
@@ -7153,8 +8491,11 @@ void TdApi::processRtnInstrumentStatus(Task *task)
 		data["EnterReason"] = task_data->EnterReason;
 		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcInstrumentStatusField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnInstrumentStatus(data);
 };
 
@@ -7177,8 +8518,11 @@ void TdApi::processRtnBulletin(Task *task)
 		data["Content"] = toUtf(task_data->Content);
 		data["URLLink"] = toUtf(task_data->URLLink);
 		data["MarketID"] = toUtf(task_data->MarketID);
-		delete task_data;
+		TaskPool<CThostFtdcBulletinField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnBulletin(data);
 };
 
@@ -7196,8 +8540,11 @@ void TdApi::processRtnTradingNotice(Task *task)
 		data["SequenceSeries"] = task_data->SequenceSeries;
 		data["SequenceNo"] = task_data->SequenceNo;
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		TaskPool<CThostFtdcTradingNoticeInfoField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnTradingNotice(data);
 };
 
@@ -7217,14 +8564,14 @@ void TdApi::processRtnErrorConditionalOrder(Task *task)
 		data["Direction"] = task_data->Direction;
 		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
 		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
+		data["LimitPrice"] = validDouble(task_data->LimitPrice, this->invalid_as_nan);
 		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
 		data["TimeCondition"] = task_data->TimeCondition;
 		data["GTDDate"] = toUtf(task_data->GTDDate);
 		data["VolumeCondition"] = task_data->VolumeCondition;
 		data["MinVolume"] = task_data->MinVolume;
 		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
+		data["StopPrice"] = validDouble(task_data->StopPrice, this->invalid_as_nan);
 		data["ForceCloseReason"] = task_data->ForceCloseReason;
 		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
 		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
@@ -7276,8 +8623,11 @@ void TdApi::processRtnErrorConditionalOrder(Task *task)
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcErrorConditionalOrderField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnErrorConditionalOrder(data);
 };
 
@@ -7335,8 +8685,11 @@ void TdApi::processRtnExecOrder(Task *task)
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcExecOrderField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnExecOrder(data);
 };
 
@@ -7370,15 +8723,18 @@ void TdApi::processErrRtnExecOrderInsert(Task *task)
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcInputExecOrderField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnExecOrderInsert(data, error);
 };
@@ -7420,15 +8776,18 @@ void TdApi::processErrRtnExecOrderAction(Task *task)
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcExecOrderActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnExecOrderAction(data, error);
 };
@@ -7451,15 +8810,18 @@ void TdApi::processErrRtnForQuoteInsert(Task *task)
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcInputForQuoteField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnForQuoteInsert(data, error);
 };
@@ -7476,8 +8838,8 @@ void TdApi::processRtnQuote(Task *task)
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["QuoteRef"] = toUtf(task_data->QuoteRef);
 		data["UserID"] = toUtf(task_data->UserID);
-		data["AskPrice"] = task_data->AskPrice;
-		data["BidPrice"] = task_data->BidPrice;
+		data["AskPrice"] = validDouble(task_data->AskPrice, this->invalid_as_nan);
+		data["BidPrice"] = validDouble(task_data->BidPrice, this->invalid_as_nan);
 		data["AskVolume"] = task_data->AskVolume;
 		data["BidVolume"] = task_data->BidVolume;
 		data["RequestID"] = task_data->RequestID;
@@ -7528,8 +8890,11 @@ void TdApi::processRtnQuote(Task *task)
 		data["TimeCondition"] = task_data->TimeCondition;
 		data["OrderMemo"] = toUtf(task_data->OrderMemo);
 		data["SessionReqSeq"] = task_data->SessionReqSeq;
-		delete task_data;
+		TaskPool<CThostFtdcQuoteField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnQuote(data);
 };
 
@@ -7545,8 +8910,8 @@ void TdApi::processErrRtnQuoteInsert(Task *task)
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["QuoteRef"] = toUtf(task_data->QuoteRef);
 		data["UserID"] = toUtf(task_data->UserID);
-		data["AskPrice"] = task_data->AskPrice;
-		data["BidPrice"] = task_data->BidPrice;
+		data["AskPrice"] = validDouble(task_data->AskPrice, this->invalid_as_nan);
+		data["BidPrice"] = validDouble(task_data->BidPrice, this->invalid_as_nan);
 		data["AskVolume"] = task_data->AskVolume;
 		data["BidVolume"] = task_data->BidVolume;
 		data["RequestID"] = task_data->RequestID;
@@ -7569,15 +8934,18 @@ void TdApi::processErrRtnQuoteInsert(Task *task)
 		data["TimeCondition"] = task_data->TimeCondition;
 		data["OrderMemo"] = toUtf(task_data->OrderMemo);
 		data["SessionReqSeq"] = task_data->SessionReqSeq;
-		delete task_data;
+		TaskPool<CThostFtdcInputQuoteField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnQuoteInsert(data, error);
 };
@@ -7620,15 +8988,18 @@ void TdApi::processErrRtnQuoteAction(Task *task)
 		data["IPAddress"] = toUtf(task_data->IPAddress);
 		data["OrderMemo"] = toUtf(task_data->OrderMemo);
 		data["SessionReqSeq"] = task_data->SessionReqSeq;
-		delete task_data;
+		TaskPool<CThostFtdcQuoteActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnQuoteAction(data, error);
 };
@@ -7647,8 +9018,11 @@ void TdApi::processRtnForQuoteRsp(Task *task)
 		data["ActionDay"] = toUtf(task_data->ActionDay);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcForQuoteRspField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnForQuoteRsp(data);
 };
 
@@ -7664,8 +9038,11 @@ void TdApi::processRtnCFMMCTradingAccountToken(Task *task)
 		data["AccountID"] = toUtf(task_data->AccountID);
 		data["KeyID"] = task_data->KeyID;
 		data["Token"] = toUtf(task_data->Token);
-		delete task_data;
+		TaskPool<CThostFtdcCFMMCTradingAccountTokenField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnCFMMCTradingAccountToken(data);
 };
 
@@ -7698,15 +9075,18 @@ void TdApi::processErrRtnBatchOrderAction(Task *task)
 		data["reserve1"] = toUtf(task_data->reserve1);
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcBatchOrderActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnBatchOrderAction(data, error);
 };
@@ -7761,8 +9141,11 @@ void TdApi::processRtnOptionSelfClose(Task *task)
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcOptionSelfCloseField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnOptionSelfClose(data);
 };
 
@@ -7792,15 +9175,18 @@ void TdApi::processErrRtnOptionSelfCloseInsert(Task *task)
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcInputOptionSelfCloseField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnOptionSelfCloseInsert(data, error);
 };
@@ -7841,15 +9227,18 @@ void TdApi::processErrRtnOptionSelfCloseAction(Task *task)
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcOptionSelfCloseActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnOptionSelfCloseAction(data, error);
 };
@@ -7894,8 +9283,11 @@ void TdApi::processRtnCombAction(Task *task)
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcCombActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnCombAction(data);
 };
 
@@ -7923,15 +9315,18 @@ void TdApi::processErrRtnCombActionInsert(Task *task)
 		data["SessionID"] = task_data->SessionID;
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcInputCombActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnCombActionInsert(data, error);
 };
@@ -7947,15 +9342,18 @@ void TdApi::processRspQryContractBank(Task *task)
 		data["BankID"] = toUtf(task_data->BankID);
 		data["BankBrchID"] = toUtf(task_data->BankBrchID);
 		data["BankName"] = toUtf(task_data->BankName);
-		delete task_data;
+		TaskPool<CThostFtdcContractBankField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryContractBank(data, error, task->task_id, task->task_last);
 };
@@ -7976,14 +9374,14 @@ void TdApi::processRspQryParkedOrder(Task *task)
 		data["Direction"] = task_data->Direction;
 		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
 		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
+		data["LimitPrice"] = validDouble(task_data->LimitPrice, this->invalid_as_nan);
 		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
 		data["TimeCondition"] = task_data->TimeCondition;
 		data["GTDDate"] = toUtf(task_data->GTDDate);
 		data["VolumeCondition"] = task_data->VolumeCondition;
 		data["MinVolume"] = task_data->MinVolume;
 		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
+		data["StopPrice"] = validDouble(task_data->StopPrice, this->invalid_as_nan);
 		data["ForceCloseReason"] = task_data->ForceCloseReason;
 		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
 		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
@@ -8004,15 +9402,18 @@ void TdApi::processRspQryParkedOrder(Task *task)
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcParkedOrderField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryParkedOrder(data, error, task->task_id, task->task_last);
 };
@@ -8034,7 +9435,7 @@ void TdApi::processRspQryParkedOrderAction(Task *task)
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["OrderSysID"] = toUtf(task_data->OrderSysID);
 		data["ActionFlag"] = task_data->ActionFlag;
-		data["LimitPrice"] = task_data->LimitPrice;
+		data["LimitPrice"] = validDouble(task_data->LimitPrice, this->invalid_as_nan);
 		data["VolumeChange"] = task_data->VolumeChange;
 		data["UserID"] = toUtf(task_data->UserID);
 		data["reserve1"] = toUtf(task_data->reserve1);
@@ -8048,15 +9449,18 @@ void TdApi::processRspQryParkedOrderAction(Task *task)
 		data["MacAddress"] = toUtf(task_data->MacAddress);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
-		delete task_data;
+		TaskPool<CThostFtdcParkedOrderActionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryParkedOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -8077,15 +9481,18 @@ void TdApi::processRspQryTradingNotice(Task *task)
 		data["SequenceNo"] = task_data->SequenceNo;
 		data["FieldContent"] = toUtf(task_data->FieldContent);
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		TaskPool<CThostFtdcTradingNoticeField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryTradingNotice(data, error, task->task_id, task->task_last);
 };
@@ -8105,15 +9512,18 @@ void TdApi::processRspQryBrokerTradingParams(Task *task)
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
 		data["OptionRoyaltyPriceType"] = task_data->OptionRoyaltyPriceType;
 		data["AccountID"] = toUtf(task_data->AccountID);
-		delete task_data;
+		TaskPool<CThostFtdcBrokerTradingParamsField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryBrokerTradingParams(data, error, task->task_id, task->task_last);
 };
@@ -8132,15 +9542,18 @@ void TdApi::processRspQryBrokerTradingAlgos(Task *task)
 		data["FindMarginRateAlgoID"] = task_data->FindMarginRateAlgoID;
 		data["HandleTradingAccountAlgoID"] = task_data->HandleTradingAccountAlgoID;
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		TaskPool<CThostFtdcBrokerTradingAlgosField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryBrokerTradingAlgos(data, error, task->task_id, task->task_last);
 };
@@ -8155,15 +9568,18 @@ void TdApi::processRspQueryCFMMCTradingAccountToken(Task *task)
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["InvestorID"] = toUtf(task_data->InvestorID);
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		TaskPool<CThostFtdcQueryCFMMCTradingAccountTokenField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQueryCFMMCTradingAccountToken(data, error, task->task_id, task->task_last);
 };
@@ -8200,11 +9616,11 @@ void TdApi::processRtnFromBankToFutureByBank(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -8221,8 +9637,11 @@ void TdApi::processRtnFromBankToFutureByBank(Task *task)
 		data["ErrorID"] = task_data->ErrorID;
 		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcRspTransferField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnFromBankToFutureByBank(data);
 };
 
@@ -8258,11 +9677,11 @@ void TdApi::processRtnFromFutureToBankByBank(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -8279,8 +9698,11 @@ void TdApi::processRtnFromFutureToBankByBank(Task *task)
 		data["ErrorID"] = task_data->ErrorID;
 		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcRspTransferField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnFromFutureToBankByBank(data);
 };
 
@@ -8323,11 +9745,11 @@ void TdApi::processRtnRepealFromBankToFutureByBank(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -8344,8 +9766,11 @@ void TdApi::processRtnRepealFromBankToFutureByBank(Task *task)
 		data["ErrorID"] = task_data->ErrorID;
 		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcRspRepealField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnRepealFromBankToFutureByBank(data);
 };
 
@@ -8388,11 +9813,11 @@ void TdApi::processRtnRepealFromFutureToBankByBank(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -8409,8 +9834,11 @@ void TdApi::processRtnRepealFromFutureToBankByBank(Task *task)
 		data["ErrorID"] = task_data->ErrorID;
 		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcRspRepealField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnRepealFromFutureToBankByBank(data);
 };
 
@@ -8446,11 +9874,11 @@ void TdApi::processRtnFromBankToFutureByFuture(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -8467,8 +9895,11 @@ void TdApi::processRtnFromBankToFutureByFuture(Task *task)
 		data["ErrorID"] = task_data->ErrorID;
 		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcRspTransferField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnFromBankToFutureByFuture(data);
 };
 
@@ -8504,11 +9935,11 @@ void TdApi::processRtnFromFutureToBankByFuture(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -8525,8 +9956,11 @@ void TdApi::processRtnFromFutureToBankByFuture(Task *task)
 		data["ErrorID"] = task_data->ErrorID;
 		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcRspTransferField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnFromFutureToBankByFuture(data);
 };
 
@@ -8569,11 +10003,11 @@ void TdApi::processRtnRepealFromBankToFutureByFutureManual(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -8590,8 +10024,11 @@ void TdApi::processRtnRepealFromBankToFutureByFutureManual(Task *task)
 		data["ErrorID"] = task_data->ErrorID;
 		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcRspRepealField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnRepealFromBankToFutureByFutureManual(data);
 };
 
@@ -8634,11 +10071,11 @@ void TdApi::processRtnRepealFromFutureToBankByFutureManual(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -8655,8 +10092,11 @@ void TdApi::processRtnRepealFromFutureToBankByFutureManual(Task *task)
 		data["ErrorID"] = task_data->ErrorID;
 		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcRspRepealField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnRepealFromFutureToBankByFutureManual(data);
 };
 
@@ -8703,13 +10143,16 @@ void TdApi::processRtnQueryBankBalanceByFuture(Task *task)
 		data["OperNo"] = toUtf(task_data->OperNo);
 		data["RequestID"] = task_data->RequestID;
 		data["TID"] = task_data->TID;
-		data["BankUseAmount"] = task_data->BankUseAmount;
-		data["BankFetchAmount"] = task_data->BankFetchAmount;
+		data["BankUseAmount"] = validDouble(task_data->BankUseAmount, this->invalid_as_nan);
+		data["BankFetchAmount"] = validDouble(task_data->BankFetchAmount, this->invalid_as_nan);
 		data["ErrorID"] = task_data->ErrorID;
 		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcNotifyQueryAccountField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnQueryBankBalanceByFuture(data);
 };
 
@@ -8745,11 +10188,11 @@ void TdApi::processErrRtnBankToFutureByFuture(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -8764,15 +10207,18 @@ void TdApi::processErrRtnBankToFutureByFuture(Task *task)
 		data["TID"] = task_data->TID;
 		data["TransferStatus"] = task_data->TransferStatus;
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcReqTransferField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnBankToFutureByFuture(data, error);
 };
@@ -8809,11 +10255,11 @@ void TdApi::processErrRtnFutureToBankByFuture(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -8828,15 +10274,18 @@ void TdApi::processErrRtnFutureToBankByFuture(Task *task)
 		data["TID"] = task_data->TID;
 		data["TransferStatus"] = task_data->TransferStatus;
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcReqTransferField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnFutureToBankByFuture(data, error);
 };
@@ -8880,11 +10329,11 @@ void TdApi::processErrRtnRepealBankToFutureByFutureManual(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -8899,15 +10348,18 @@ void TdApi::processErrRtnRepealBankToFutureByFutureManual(Task *task)
 		data["TID"] = task_data->TID;
 		data["TransferStatus"] = task_data->TransferStatus;
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcReqRepealField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnRepealBankToFutureByFutureManual(data, error);
 };
@@ -8951,11 +10403,11 @@ void TdApi::processErrRtnRepealFutureToBankByFutureManual(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -8970,15 +10422,18 @@ void TdApi::processErrRtnRepealFutureToBankByFutureManual(Task *task)
 		data["TID"] = task_data->TID;
 		data["TransferStatus"] = task_data->TransferStatus;
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcReqRepealField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnRepealFutureToBankByFutureManual(data, error);
 };
@@ -9027,15 +10482,18 @@ void TdApi::processErrRtnQueryBankBalanceByFuture(Task *task)
 		data["RequestID"] = task_data->RequestID;
 		data["TID"] = task_data->TID;
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcReqQueryAccountField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnQueryBankBalanceByFuture(data, error);
 };
@@ -9079,11 +10537,11 @@ void TdApi::processRtnRepealFromBankToFutureByFuture(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -9100,8 +10558,11 @@ void TdApi::processRtnRepealFromBankToFutureByFuture(Task *task)
 		data["ErrorID"] = task_data->ErrorID;
 		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcRspRepealField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnRepealFromBankToFutureByFuture(data);
 };
 
@@ -9144,11 +10605,11 @@ void TdApi::processRtnRepealFromFutureToBankByFuture(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -9165,8 +10626,11 @@ void TdApi::processRtnRepealFromFutureToBankByFuture(Task *task)
 		data["ErrorID"] = task_data->ErrorID;
 		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcRspRepealField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnRepealFromFutureToBankByFuture(data);
 };
 
@@ -9202,11 +10666,11 @@ void TdApi::processRspFromBankToFutureByFuture(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -9221,15 +10685,18 @@ void TdApi::processRspFromBankToFutureByFuture(Task *task)
 		data["TID"] = task_data->TID;
 		data["TransferStatus"] = task_data->TransferStatus;
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcReqTransferField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspFromBankToFutureByFuture(data, error, task->task_id, task->task_last);
 };
@@ -9266,11 +10733,11 @@ void TdApi::processRspFromFutureToBankByFuture(Task *task)
 		data["UserID"] = toUtf(task_data->UserID);
 		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
 		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
+		data["TradeAmount"] = validDouble(task_data->TradeAmount, this->invalid_as_nan);
+		data["FutureFetchAmount"] = validDouble(task_data->FutureFetchAmount, this->invalid_as_nan);
 		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
+		data["CustFee"] = validDouble(task_data->CustFee, this->invalid_as_nan);
+		data["BrokerFee"] = validDouble(task_data->BrokerFee, this->invalid_as_nan);
 		data["Message"] = toUtf(task_data->Message);
 		data["Digest"] = toUtf(task_data->Digest);
 		data["BankAccType"] = task_data->BankAccType;
@@ -9285,15 +10752,18 @@ void TdApi::processRspFromFutureToBankByFuture(Task *task)
 		data["TID"] = task_data->TID;
 		data["TransferStatus"] = task_data->TransferStatus;
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcReqTransferField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspFromFutureToBankByFuture(data, error, task->task_id, task->task_last);
 };
@@ -9342,15 +10812,18 @@ void TdApi::processRspQueryBankAccountMoneyByFuture(Task *task)
 		data["RequestID"] = task_data->RequestID;
 		data["TID"] = task_data->TID;
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcReqQueryAccountField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQueryBankAccountMoneyByFuture(data, error, task->task_id, task->task_last);
 };
@@ -9409,8 +10882,11 @@ void TdApi::processRtnOpenAccountByBank(Task *task)
 		data["ErrorID"] = task_data->ErrorID;
 		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcOpenAccountField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnOpenAccountByBank(data);
 };
 
@@ -9468,8 +10944,11 @@ void TdApi::processRtnCancelAccountByBank(Task *task)
 		data["ErrorID"] = task_data->ErrorID;
 		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcCancelAccountField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnCancelAccountByBank(data);
 };
 
@@ -9523,8 +11002,11 @@ void TdApi::processRtnChangeAccountByBank(Task *task)
 		data["ErrorID"] = task_data->ErrorID;
 		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
 		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		TaskPool<CThostFtdcChangeAccountField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnChangeAccountByBank(data);
 };
 
@@ -9548,7 +11030,7 @@ void TdApi::processRspQryClassifiedInstrument(Task *task)
 		data["MaxLimitOrderVolume"] = task_data->MaxLimitOrderVolume;
 		data["MinLimitOrderVolume"] = task_data->MinLimitOrderVolume;
 		data["VolumeMultiple"] = task_data->VolumeMultiple;
-		data["PriceTick"] = task_data->PriceTick;
+		data["PriceTick"] = validDouble(task_data->PriceTick, this->invalid_as_nan);
 		data["CreateDate"] = toUtf(task_data->CreateDate);
 		data["OpenDate"] = toUtf(task_data->OpenDate);
 		data["ExpireDate"] = toUtf(task_data->ExpireDate);
@@ -9558,27 +11040,30 @@ void TdApi::processRspQryClassifiedInstrument(Task *task)
 		data["IsTrading"] = task_data->IsTrading;
 		data["PositionType"] = task_data->PositionType;
 		data["PositionDateType"] = task_data->PositionDateType;
-		data["LongMarginRatio"] = task_data->LongMarginRatio;
-		data["ShortMarginRatio"] = task_data->ShortMarginRatio;
+		data["LongMarginRatio"] = validDouble(task_data->LongMarginRatio, this->invalid_as_nan);
+		data["ShortMarginRatio"] = validDouble(task_data->ShortMarginRatio, this->invalid_as_nan);
 		data["MaxMarginSideAlgorithm"] = task_data->MaxMarginSideAlgorithm;
 		data["reserve4"] = toUtf(task_data->reserve4);
-		data["StrikePrice"] = task_data->StrikePrice;
+		data["StrikePrice"] = validDouble(task_data->StrikePrice, this->invalid_as_nan);
 		data["OptionsType"] = task_data->OptionsType;
-		data["UnderlyingMultiple"] = task_data->UnderlyingMultiple;
+		data["UnderlyingMultiple"] = validDouble(task_data->UnderlyingMultiple, this->invalid_as_nan);
 		data["CombinationType"] = task_data->CombinationType;
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
 		data["ProductID"] = toUtf(task_data->ProductID);
 		data["UnderlyingInstrID"] = toUtf(task_data->UnderlyingInstrID);
-		delete task_data;
+		TaskPool<CThostFtdcInstrumentField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryClassifiedInstrument(data, error, task->task_id, task->task_last);
 };
@@ -9593,16 +11078,19 @@ void TdApi::processRspQryCombPromotionParam(Task *task)
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["Xparameter"] = task_data->Xparameter;
-		delete task_data;
+		data["Xparameter"] = validDouble(task_data->Xparameter, this->invalid_as_nan);
+		TaskPool<CThostFtdcCombPromotionParamField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryCombPromotionParam(data, error, task->task_id, task->task_last);
 };
@@ -9624,54 +11112,57 @@ void TdApi::processRspQryRiskSettleInvstPosition(Task *task)
 		data["Position"] = task_data->Position;
 		data["LongFrozen"] = task_data->LongFrozen;
 		data["ShortFrozen"] = task_data->ShortFrozen;
-		data["LongFrozenAmount"] = task_data->LongFrozenAmount;
-		data["ShortFrozenAmount"] = task_data->ShortFrozenAmount;
+		data["LongFrozenAmount"] = validDouble(task_data->LongFrozenAmount, this->invalid_as_nan);
+		data["ShortFrozenAmount"] = validDouble(task_data->ShortFrozenAmount, this->invalid_as_nan);
 		data["OpenVolume"] = task_data->OpenVolume;
 		data["CloseVolume"] = task_data->CloseVolume;
-		data["OpenAmount"] = task_data->OpenAmount;
-		data["CloseAmount"] = task_data->CloseAmount;
-		data["PositionCost"] = task_data->PositionCost;
-		data["PreMargin"] = task_data->PreMargin;
-		data["UseMargin"] = task_data->UseMargin;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		data["FrozenCash"] = task_data->FrozenCash;
-		data["FrozenCommission"] = task_data->FrozenCommission;
-		data["CashIn"] = task_data->CashIn;
-		data["Commission"] = task_data->Commission;
-		data["CloseProfit"] = task_data->CloseProfit;
-		data["PositionProfit"] = task_data->PositionProfit;
-		data["PreSettlementPrice"] = task_data->PreSettlementPrice;
-		data["SettlementPrice"] = task_data->SettlementPrice;
+		data["OpenAmount"] = validDouble(task_data->OpenAmount, this->invalid_as_nan);
+		data["CloseAmount"] = validDouble(task_data->CloseAmount, this->invalid_as_nan);
+		data["PositionCost"] = validDouble(task_data->PositionCost, this->invalid_as_nan);
+		data["PreMargin"] = validDouble(task_data->PreMargin, this->invalid_as_nan);
+		data["UseMargin"] = validDouble(task_data->UseMargin, this->invalid_as_nan);
+		data["FrozenMargin"] = validDouble(task_data->FrozenMargin, this->invalid_as_nan);
+		data["FrozenCash"] = validDouble(task_data->FrozenCash, this->invalid_as_nan);
+		data["FrozenCommission"] = validDouble(task_data->FrozenCommission, this->invalid_as_nan);
+		data["CashIn"] = validDouble(task_data->CashIn, this->invalid_as_nan);
+		data["Commission"] = validDouble(task_data->Commission, this->invalid_as_nan);
+		data["CloseProfit"] = validDouble(task_data->CloseProfit, this->invalid_as_nan);
+		data["PositionProfit"] = validDouble(task_data->PositionProfit, this->invalid_as_nan);
+		data["PreSettlementPrice"] = validDouble(task_data->PreSettlementPrice, this->invalid_as_nan);
+		data["SettlementPrice"] = validDouble(task_data->SettlementPrice, this->invalid_as_nan);
 		data["TradingDay"] = toUtf(task_data->TradingDay);
 		data["SettlementID"] = task_data->SettlementID;
-		data["OpenCost"] = task_data->OpenCost;
-		data["ExchangeMargin"] = task_data->ExchangeMargin;
+		data["OpenCost"] = validDouble(task_data->OpenCost, this->invalid_as_nan);
+		data["ExchangeMargin"] = validDouble(task_data->ExchangeMargin, this->invalid_as_nan);
 		data["CombPosition"] = task_data->CombPosition;
 		data["CombLongFrozen"] = task_data->CombLongFrozen;
 		data["CombShortFrozen"] = task_data->CombShortFrozen;
-		data["CloseProfitByDate"] = task_data->CloseProfitByDate;
-		data["CloseProfitByTrade"] = task_data->CloseProfitByTrade;
+		data["CloseProfitByDate"] = validDouble(task_data->CloseProfitByDate, this->invalid_as_nan);
+		data["CloseProfitByTrade"] = validDouble(task_data->CloseProfitByTrade, this->invalid_as_nan);
 		data["TodayPosition"] = task_data->TodayPosition;
-		data["MarginRateByMoney"] = task_data->MarginRateByMoney;
-		data["MarginRateByVolume"] = task_data->MarginRateByVolume;
+		data["MarginRateByMoney"] = validDouble(task_data->MarginRateByMoney, this->invalid_as_nan);
+		data["MarginRateByVolume"] = validDouble(task_data->MarginRateByVolume, this->invalid_as_nan);
 		data["StrikeFrozen"] = task_data->StrikeFrozen;
-		data["StrikeFrozenAmount"] = task_data->StrikeFrozenAmount;
+		data["StrikeFrozenAmount"] = validDouble(task_data->StrikeFrozenAmount, this->invalid_as_nan);
 		data["AbandonFrozen"] = task_data->AbandonFrozen;
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["YdStrikeFrozen"] = task_data->YdStrikeFrozen;
 		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["PositionCostOffset"] = task_data->PositionCostOffset;
+		data["PositionCostOffset"] = validDouble(task_data->PositionCostOffset, this->invalid_as_nan);
 		data["TasPosition"] = task_data->TasPosition;
-		data["TasPositionCost"] = task_data->TasPositionCost;
-		delete task_data;
+		data["TasPositionCost"] = validDouble(task_data->TasPositionCost, this->invalid_as_nan);
+		TaskPool<CThostFtdcRiskSettleInvstPositionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryRiskSettleInvstPosition(data, error, task->task_id, task->task_last);
 };
@@ -9686,15 +11177,18 @@ void TdApi::processRspQryRiskSettleProductStatus(Task *task)
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["ProductID"] = toUtf(task_data->ProductID);
 		data["ProductStatus"] = task_data->ProductStatus;
-		delete task_data;
+		TaskPool<CThostFtdcRiskSettleProductStatusField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryRiskSettleProductStatus(data, error, task->task_id, task->task_last);
 };
@@ -9712,20 +11206,23 @@ void TdApi::processRspQrySPBMFutureParameter(Task *task)
 		data["ProdFamilyCode"] = toUtf(task_data->ProdFamilyCode);
 		data["Cvf"] = task_data->Cvf;
 		data["TimeRange"] = task_data->TimeRange;
-		data["MarginRate"] = task_data->MarginRate;
-		data["LockRateX"] = task_data->LockRateX;
-		data["AddOnRate"] = task_data->AddOnRate;
-		data["PreSettlementPrice"] = task_data->PreSettlementPrice;
-		data["AddOnLockRateX2"] = task_data->AddOnLockRateX2;
-		delete task_data;
-	}
+		data["MarginRate"] = validDouble(task_data->MarginRate, this->invalid_as_nan);
+		data["LockRateX"] = validDouble(task_data->LockRateX, this->invalid_as_nan);
+		data["AddOnRate"] = validDouble(task_data->AddOnRate, this->invalid_as_nan);
+		data["PreSettlementPrice"] = validDouble(task_data->PreSettlementPrice, this->invalid_as_nan);
+		data["AddOnLockRateX2"] = validDouble(task_data->AddOnLockRateX2, this->invalid_as_nan);
+		TaskPool<CThostFtdcSPBMFutureParameterField>::release(task_data);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQrySPBMFutureParameter(data, error, task->task_id, task->task_last);
 };
@@ -9742,19 +11239,22 @@ void TdApi::processRspQrySPBMOptionParameter(Task *task)
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["ProdFamilyCode"] = toUtf(task_data->ProdFamilyCode);
 		data["Cvf"] = task_data->Cvf;
-		data["DownPrice"] = task_data->DownPrice;
-		data["Delta"] = task_data->Delta;
-		data["SlimiDelta"] = task_data->SlimiDelta;
-		data["PreSettlementPrice"] = task_data->PreSettlementPrice;
-		delete task_data;
-	}
+		data["DownPrice"] = validDouble(task_data->DownPrice, this->invalid_as_nan);
+		data["Delta"] = validDouble(task_data->Delta, this->invalid_as_nan);
+		data["SlimiDelta"] = validDouble(task_data->SlimiDelta, this->invalid_as_nan);
+		data["PreSettlementPrice"] = validDouble(task_data->PreSettlementPrice, this->invalid_as_nan);
+		TaskPool<CThostFtdcSPBMOptionParameterField>::release(task_data);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQrySPBMOptionParameter(data, error, task->task_id, task->task_last);
 };
@@ -9769,17 +11269,20 @@ void TdApi::processRspQrySPBMIntraParameter(Task *task)
 		data["TradingDay"] = toUtf(task_data->TradingDay);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["ProdFamilyCode"] = toUtf(task_data->ProdFamilyCode);
-		data["IntraRateY"] = task_data->IntraRateY;
-		data["AddOnIntraRateY2"] = task_data->AddOnIntraRateY2;
-		delete task_data;
+		data["IntraRateY"] = validDouble(task_data->IntraRateY, this->invalid_as_nan);
+		data["AddOnIntraRateY2"] = validDouble(task_data->AddOnIntraRateY2, this->invalid_as_nan);
+		TaskPool<CThostFtdcSPBMIntraParameterField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQrySPBMIntraParameter(data, error, task->task_id, task->task_last);
 };
@@ -9794,18 +11297,21 @@ void TdApi::processRspQrySPBMInterParameter(Task *task)
 		data["TradingDay"] = toUtf(task_data->TradingDay);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["SpreadId"] = task_data->SpreadId;
-		data["InterRateZ"] = task_data->InterRateZ;
+		data["InterRateZ"] = validDouble(task_data->InterRateZ, this->invalid_as_nan);
 		data["Leg1ProdFamilyCode"] = toUtf(task_data->Leg1ProdFamilyCode);
 		data["Leg2ProdFamilyCode"] = toUtf(task_data->Leg2ProdFamilyCode);
-		delete task_data;
+		TaskPool<CThostFtdcSPBMInterParameterField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQrySPBMInterParameter(data, error, task->task_id, task->task_last);
 };
@@ -9821,15 +11327,18 @@ void TdApi::processRspQrySPBMPortfDefinition(Task *task)
 		data["PortfolioDefID"] = task_data->PortfolioDefID;
 		data["ProdFamilyCode"] = toUtf(task_data->ProdFamilyCode);
 		data["IsSPBM"] = task_data->IsSPBM;
-		delete task_data;
+		TaskPool<CThostFtdcSPBMPortfDefinitionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQrySPBMPortfDefinition(data, error, task->task_id, task->task_last);
 };
@@ -9845,15 +11354,18 @@ void TdApi::processRspQrySPBMInvestorPortfDef(Task *task)
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["InvestorID"] = toUtf(task_data->InvestorID);
 		data["PortfolioDefID"] = task_data->PortfolioDefID;
-		delete task_data;
+		TaskPool<CThostFtdcSPBMInvestorPortfDefField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQrySPBMInvestorPortfDef(data, error, task->task_id, task->task_last);
 };
@@ -9869,17 +11381,20 @@ void TdApi::processRspQryInvestorPortfMarginRatio(Task *task)
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["InvestorID"] = toUtf(task_data->InvestorID);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["MarginRatio"] = task_data->MarginRatio;
+		data["MarginRatio"] = validDouble(task_data->MarginRatio, this->invalid_as_nan);
 		data["ProductGroupID"] = toUtf(task_data->ProductGroupID);
-		delete task_data;
+		TaskPool<CThostFtdcInvestorPortfMarginRatioField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInvestorPortfMarginRatio(data, error, task->task_id, task->task_last);
 };
@@ -9895,32 +11410,35 @@ void TdApi::processRspQryInvestorProdSPBMDetail(Task *task)
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["InvestorID"] = toUtf(task_data->InvestorID);
 		data["ProdFamilyCode"] = toUtf(task_data->ProdFamilyCode);
-		data["IntraInstrMargin"] = task_data->IntraInstrMargin;
-		data["BCollectingMargin"] = task_data->BCollectingMargin;
-		data["SCollectingMargin"] = task_data->SCollectingMargin;
-		data["IntraProdMargin"] = task_data->IntraProdMargin;
-		data["NetMargin"] = task_data->NetMargin;
-		data["InterProdMargin"] = task_data->InterProdMargin;
-		data["SingleMargin"] = task_data->SingleMargin;
-		data["AddOnMargin"] = task_data->AddOnMargin;
-		data["DeliveryMargin"] = task_data->DeliveryMargin;
-		data["CallOptionMinRisk"] = task_data->CallOptionMinRisk;
-		data["PutOptionMinRisk"] = task_data->PutOptionMinRisk;
-		data["OptionMinRisk"] = task_data->OptionMinRisk;
-		data["OptionValueOffset"] = task_data->OptionValueOffset;
-		data["OptionRoyalty"] = task_data->OptionRoyalty;
-		data["RealOptionValueOffset"] = task_data->RealOptionValueOffset;
-		data["Margin"] = task_data->Margin;
-		data["ExchMargin"] = task_data->ExchMargin;
-		delete task_data;
-	}
+		data["IntraInstrMargin"] = validDouble(task_data->IntraInstrMargin, this->invalid_as_nan);
+		data["BCollectingMargin"] = validDouble(task_data->BCollectingMargin, this->invalid_as_nan);
+		data["SCollectingMargin"] = validDouble(task_data->SCollectingMargin, this->invalid_as_nan);
+		data["IntraProdMargin"] = validDouble(task_data->IntraProdMargin, this->invalid_as_nan);
+		data["NetMargin"] = validDouble(task_data->NetMargin, this->invalid_as_nan);
+		data["InterProdMargin"] = validDouble(task_data->InterProdMargin, this->invalid_as_nan);
+		data["SingleMargin"] = validDouble(task_data->SingleMargin, this->invalid_as_nan);
+		data["AddOnMargin"] = validDouble(task_data->AddOnMargin, this->invalid_as_nan);
+		data["DeliveryMargin"] = validDouble(task_data->DeliveryMargin, this->invalid_as_nan);
+		data["CallOptionMinRisk"] = validDouble(task_data->CallOptionMinRisk, this->invalid_as_nan);
+		data["PutOptionMinRisk"] = validDouble(task_data->PutOptionMinRisk, this->invalid_as_nan);
+		data["OptionMinRisk"] = validDouble(task_data->OptionMinRisk, this->invalid_as_nan);
+		data["OptionValueOffset"] = validDouble(task_data->OptionValueOffset, this->invalid_as_nan);
+		data["OptionRoyalty"] = validDouble(task_data->OptionRoyalty, this->invalid_as_nan);
+		data["RealOptionValueOffset"] = validDouble(task_data->RealOptionValueOffset, this->invalid_as_nan);
+		data["Margin"] = validDouble(task_data->Margin, this->invalid_as_nan);
+		data["ExchMargin"] = validDouble(task_data->ExchMargin, this->invalid_as_nan);
+		TaskPool<CThostFtdcInvestorProdSPBMDetailField>::release(task_data);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInvestorProdSPBMDetail(data, error, task->task_id, task->task_last);
 };
@@ -9936,34 +11454,37 @@ void TdApi::processRspQryInvestorCommoditySPMMMargin(Task *task)
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["InvestorID"] = toUtf(task_data->InvestorID);
 		data["CommodityID"] = toUtf(task_data->CommodityID);
-		data["MarginBeforeDiscount"] = task_data->MarginBeforeDiscount;
-		data["MarginNoDiscount"] = task_data->MarginNoDiscount;
-		data["LongPosRisk"] = task_data->LongPosRisk;
-		data["LongOpenFrozenRisk"] = task_data->LongOpenFrozenRisk;
-		data["LongCloseFrozenRisk"] = task_data->LongCloseFrozenRisk;
-		data["ShortPosRisk"] = task_data->ShortPosRisk;
-		data["ShortOpenFrozenRisk"] = task_data->ShortOpenFrozenRisk;
-		data["ShortCloseFrozenRisk"] = task_data->ShortCloseFrozenRisk;
-		data["IntraCommodityRate"] = task_data->IntraCommodityRate;
-		data["OptionDiscountRate"] = task_data->OptionDiscountRate;
-		data["PosDiscount"] = task_data->PosDiscount;
-		data["OpenFrozenDiscount"] = task_data->OpenFrozenDiscount;
-		data["NetRisk"] = task_data->NetRisk;
-		data["CloseFrozenMargin"] = task_data->CloseFrozenMargin;
-		data["FrozenCommission"] = task_data->FrozenCommission;
-		data["Commission"] = task_data->Commission;
-		data["FrozenCash"] = task_data->FrozenCash;
-		data["CashIn"] = task_data->CashIn;
-		data["StrikeFrozenMargin"] = task_data->StrikeFrozenMargin;
-		delete task_data;
-	}
+		data["MarginBeforeDiscount"] = validDouble(task_data->MarginBeforeDiscount, this->invalid_as_nan);
+		data["MarginNoDiscount"] = validDouble(task_data->MarginNoDiscount, this->invalid_as_nan);
+		data["LongPosRisk"] = validDouble(task_data->LongPosRisk, this->invalid_as_nan);
+		data["LongOpenFrozenRisk"] = validDouble(task_data->LongOpenFrozenRisk, this->invalid_as_nan);
+		data["LongCloseFrozenRisk"] = validDouble(task_data->LongCloseFrozenRisk, this->invalid_as_nan);
+		data["ShortPosRisk"] = validDouble(task_data->ShortPosRisk, this->invalid_as_nan);
+		data["ShortOpenFrozenRisk"] = validDouble(task_data->ShortOpenFrozenRisk, this->invalid_as_nan);
+		data["ShortCloseFrozenRisk"] = validDouble(task_data->ShortCloseFrozenRisk, this->invalid_as_nan);
+		data["IntraCommodityRate"] = validDouble(task_data->IntraCommodityRate, this->invalid_as_nan);
+		data["OptionDiscountRate"] = validDouble(task_data->OptionDiscountRate, this->invalid_as_nan);
+		data["PosDiscount"] = validDouble(task_data->PosDiscount, this->invalid_as_nan);
+		data["OpenFrozenDiscount"] = validDouble(task_data->OpenFrozenDiscount, this->invalid_as_nan);
+		data["NetRisk"] = validDouble(task_data->NetRisk, this->invalid_as_nan);
+		data["CloseFrozenMargin"] = validDouble(task_data->CloseFrozenMargin, this->invalid_as_nan);
+		data["FrozenCommission"] = validDouble(task_data->FrozenCommission, this->invalid_as_nan);
+		data["Commission"] = validDouble(task_data->Commission, this->invalid_as_nan);
+		data["FrozenCash"] = validDouble(task_data->FrozenCash, this->invalid_as_nan);
+		data["CashIn"] = validDouble(task_data->CashIn, this->invalid_as_nan);
+		data["StrikeFrozenMargin"] = validDouble(task_data->StrikeFrozenMargin, this->invalid_as_nan);
+		TaskPool<CThostFtdcInvestorCommoditySPMMMarginField>::release(task_data);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInvestorCommoditySPMMMargin(data, error, task->task_id, task->task_last);
 };
@@ -9979,32 +11500,35 @@ void TdApi::processRspQryInvestorCommodityGroupSPMMMargin(Task *task)
 		data["BrokerID"] = toUtf(task_data->BrokerID);
 		data["InvestorID"] = toUtf(task_data->InvestorID);
 		data["CommodityGroupID"] = toUtf(task_data->CommodityGroupID);
-		data["MarginBeforeDiscount"] = task_data->MarginBeforeDiscount;
-		data["MarginNoDiscount"] = task_data->MarginNoDiscount;
-		data["LongRisk"] = task_data->LongRisk;
-		data["ShortRisk"] = task_data->ShortRisk;
-		data["CloseFrozenMargin"] = task_data->CloseFrozenMargin;
-		data["InterCommodityRate"] = task_data->InterCommodityRate;
-		data["MiniMarginRatio"] = task_data->MiniMarginRatio;
-		data["AdjustRatio"] = task_data->AdjustRatio;
-		data["IntraCommodityDiscount"] = task_data->IntraCommodityDiscount;
-		data["InterCommodityDiscount"] = task_data->InterCommodityDiscount;
-		data["ExchMargin"] = task_data->ExchMargin;
-		data["InvestorMargin"] = task_data->InvestorMargin;
-		data["FrozenCommission"] = task_data->FrozenCommission;
-		data["Commission"] = task_data->Commission;
-		data["FrozenCash"] = task_data->FrozenCash;
-		data["CashIn"] = task_data->CashIn;
-		data["StrikeFrozenMargin"] = task_data->StrikeFrozenMargin;
-		delete task_data;
-	}
+		data["MarginBeforeDiscount"] = validDouble(task_data->MarginBeforeDiscount, this->invalid_as_nan);
+		data["MarginNoDiscount"] = validDouble(task_data->MarginNoDiscount, this->invalid_as_nan);
+		data["LongRisk"] = validDouble(task_data->LongRisk, this->invalid_as_nan);
+		data["ShortRisk"] = validDouble(task_data->ShortRisk, this->invalid_as_nan);
+		data["CloseFrozenMargin"] = validDouble(task_data->CloseFrozenMargin, this->invalid_as_nan);
+		data["InterCommodityRate"] = validDouble(task_data->InterCommodityRate, this->invalid_as_nan);
+		data["MiniMarginRatio"] = validDouble(task_data->MiniMarginRatio, this->invalid_as_nan);
+		data["AdjustRatio"] = validDouble(task_data->AdjustRatio, this->invalid_as_nan);
+		data["IntraCommodityDiscount"] = validDouble(task_data->IntraCommodityDiscount, this->invalid_as_nan);
+		data["InterCommodityDiscount"] = validDouble(task_data->InterCommodityDiscount, this->invalid_as_nan);
+		data["ExchMargin"] = validDouble(task_data->ExchMargin, this->invalid_as_nan);
+		data["InvestorMargin"] = validDouble(task_data->InvestorMargin, this->invalid_as_nan);
+		data["FrozenCommission"] = validDouble(task_data->FrozenCommission, this->invalid_as_nan);
+		data["Commission"] = validDouble(task_data->Commission, this->invalid_as_nan);
+		data["FrozenCash"] = validDouble(task_data->FrozenCash, this->invalid_as_nan);
+		data["CashIn"] = validDouble(task_data->CashIn, this->invalid_as_nan);
+		data["StrikeFrozenMargin"] = validDouble(task_data->StrikeFrozenMargin, this->invalid_as_nan);
+		TaskPool<CThostFtdcInvestorCommodityGroupSPMMMarginField>::release(task_data);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInvestorCommodityGroupSPMMMargin(data, error, task->task_id, task->task_last);
 };
@@ -10021,15 +11545,18 @@ void TdApi::processRspQrySPMMInstParam(Task *task)
 		data["InstMarginCalID"] = task_data->InstMarginCalID;
 		data["CommodityID"] = toUtf(task_data->CommodityID);
 		data["CommodityGroupID"] = toUtf(task_data->CommodityGroupID);
-		delete task_data;
+		TaskPool<CThostFtdcSPMMInstParamField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQrySPMMInstParam(data, error, task->task_id, task->task_last);
 };
@@ -10045,15 +11572,18 @@ void TdApi::processRspQrySPMMProductParam(Task *task)
 		data["ProductID"] = toUtf(task_data->ProductID);
 		data["CommodityID"] = toUtf(task_data->CommodityID);
 		data["CommodityGroupID"] = toUtf(task_data->CommodityGroupID);
-		delete task_data;
+		TaskPool<CThostFtdcSPMMProductParamField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQrySPMMProductParam(data, error, task->task_id, task->task_last);
 };
@@ -10068,18 +11598,21 @@ void TdApi::processRspQrySPBMAddOnInterParameter(Task *task)
 		data["TradingDay"] = toUtf(task_data->TradingDay);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["SpreadId"] = task_data->SpreadId;
-		data["AddOnInterRateZ2"] = task_data->AddOnInterRateZ2;
+		data["AddOnInterRateZ2"] = validDouble(task_data->AddOnInterRateZ2, this->invalid_as_nan);
 		data["Leg1ProdFamilyCode"] = toUtf(task_data->Leg1ProdFamilyCode);
 		data["Leg2ProdFamilyCode"] = toUtf(task_data->Leg2ProdFamilyCode);
-		delete task_data;
+		TaskPool<CThostFtdcSPBMAddOnInterParameterField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQrySPBMAddOnInterParameter(data, error, task->task_id, task->task_last);
 };
@@ -10096,15 +11629,18 @@ void TdApi::processRspQryRCAMSCombProductInfo(Task *task)
 		data["ProductID"] = toUtf(task_data->ProductID);
 		data["CombProductID"] = toUtf(task_data->CombProductID);
 		data["ProductGroupID"] = toUtf(task_data->ProductGroupID);
-		delete task_data;
+		TaskPool<CThostFtdcRCAMSCombProductInfoField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryRCAMSCombProductInfo(data, error, task->task_id, task->task_last);
 };
@@ -10119,16 +11655,19 @@ void TdApi::processRspQryRCAMSInstrParameter(Task *task)
 		data["TradingDay"] = toUtf(task_data->TradingDay);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["ProductID"] = toUtf(task_data->ProductID);
-		data["HedgeRate"] = task_data->HedgeRate;
-		delete task_data;
+		data["HedgeRate"] = validDouble(task_data->HedgeRate, this->invalid_as_nan);
+		TaskPool<CThostFtdcRCAMSInstrParameterField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryRCAMSInstrParameter(data, error, task->task_id, task->task_last);
 };
@@ -10143,16 +11682,19 @@ void TdApi::processRspQryRCAMSIntraParameter(Task *task)
 		data["TradingDay"] = toUtf(task_data->TradingDay);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["CombProductID"] = toUtf(task_data->CombProductID);
-		data["HedgeRate"] = task_data->HedgeRate;
-		delete task_data;
+		data["HedgeRate"] = validDouble(task_data->HedgeRate, this->invalid_as_nan);
+		TaskPool<CThostFtdcRCAMSIntraParameterField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryRCAMSIntraParameter(data, error, task->task_id, task->task_last);
 };
@@ -10168,18 +11710,21 @@ void TdApi::processRspQryRCAMSInterParameter(Task *task)
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["ProductGroupID"] = toUtf(task_data->ProductGroupID);
 		data["Priority"] = task_data->Priority;
-		data["CreditRate"] = task_data->CreditRate;
+		data["CreditRate"] = validDouble(task_data->CreditRate, this->invalid_as_nan);
 		data["CombProduct1"] = toUtf(task_data->CombProduct1);
 		data["CombProduct2"] = toUtf(task_data->CombProduct2);
-		delete task_data;
+		TaskPool<CThostFtdcRCAMSInterParameterField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryRCAMSInterParameter(data, error, task->task_id, task->task_last);
 };
@@ -10195,16 +11740,19 @@ void TdApi::processRspQryRCAMSShortOptAdjustParam(Task *task)
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["CombProductID"] = toUtf(task_data->CombProductID);
 		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["AdjustValue"] = task_data->AdjustValue;
-		delete task_data;
+		data["AdjustValue"] = validDouble(task_data->AdjustValue, this->invalid_as_nan);
+		TaskPool<CThostFtdcRCAMSShortOptAdjustParamField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryRCAMSShortOptAdjustParam(data, error, task->task_id, task->task_last);
 };
@@ -10226,17 +11774,20 @@ void TdApi::processRspQryRCAMSInvestorCombPosition(Task *task)
 		data["LegID"] = task_data->LegID;
 		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
 		data["TotalAmt"] = task_data->TotalAmt;
-		data["ExchMargin"] = task_data->ExchMargin;
-		data["Margin"] = task_data->Margin;
-		delete task_data;
+		data["ExchMargin"] = validDouble(task_data->ExchMargin, this->invalid_as_nan);
+		data["Margin"] = validDouble(task_data->Margin, this->invalid_as_nan);
+		TaskPool<CThostFtdcRCAMSInvestorCombPositionField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryRCAMSInvestorCombPosition(data, error, task->task_id, task->task_last);
 };
@@ -10254,36 +11805,39 @@ void TdApi::processRspQryInvestorProdRCAMSMargin(Task *task)
 		data["CombProductID"] = toUtf(task_data->CombProductID);
 		data["HedgeFlag"] = task_data->HedgeFlag;
 		data["ProductGroupID"] = toUtf(task_data->ProductGroupID);
-		data["RiskBeforeDiscount"] = task_data->RiskBeforeDiscount;
-		data["IntraInstrRisk"] = task_data->IntraInstrRisk;
-		data["BPosRisk"] = task_data->BPosRisk;
-		data["SPosRisk"] = task_data->SPosRisk;
-		data["IntraProdRisk"] = task_data->IntraProdRisk;
-		data["NetRisk"] = task_data->NetRisk;
-		data["InterProdRisk"] = task_data->InterProdRisk;
-		data["ShortOptRiskAdj"] = task_data->ShortOptRiskAdj;
-		data["OptionRoyalty"] = task_data->OptionRoyalty;
-		data["MMSACloseFrozenMargin"] = task_data->MMSACloseFrozenMargin;
-		data["CloseCombFrozenMargin"] = task_data->CloseCombFrozenMargin;
-		data["CloseFrozenMargin"] = task_data->CloseFrozenMargin;
-		data["MMSAOpenFrozenMargin"] = task_data->MMSAOpenFrozenMargin;
-		data["DeliveryOpenFrozenMargin"] = task_data->DeliveryOpenFrozenMargin;
-		data["OpenFrozenMargin"] = task_data->OpenFrozenMargin;
-		data["UseFrozenMargin"] = task_data->UseFrozenMargin;
-		data["MMSAExchMargin"] = task_data->MMSAExchMargin;
-		data["DeliveryExchMargin"] = task_data->DeliveryExchMargin;
-		data["CombExchMargin"] = task_data->CombExchMargin;
-		data["ExchMargin"] = task_data->ExchMargin;
-		data["UseMargin"] = task_data->UseMargin;
-		delete task_data;
-	}
+		data["RiskBeforeDiscount"] = validDouble(task_data->RiskBeforeDiscount, this->invalid_as_nan);
+		data["IntraInstrRisk"] = validDouble(task_data->IntraInstrRisk, this->invalid_as_nan);
+		data["BPosRisk"] = validDouble(task_data->BPosRisk, this->invalid_as_nan);
+		data["SPosRisk"] = validDouble(task_data->SPosRisk, this->invalid_as_nan);
+		data["IntraProdRisk"] = validDouble(task_data->IntraProdRisk, this->invalid_as_nan);
+		data["NetRisk"] = validDouble(task_data->NetRisk, this->invalid_as_nan);
+		data["InterProdRisk"] = validDouble(task_data->InterProdRisk, this->invalid_as_nan);
+		data["ShortOptRiskAdj"] = validDouble(task_data->ShortOptRiskAdj, this->invalid_as_nan);
+		data["OptionRoyalty"] = validDouble(task_data->OptionRoyalty, this->invalid_as_nan);
+		data["MMSACloseFrozenMargin"] = validDouble(task_data->MMSACloseFrozenMargin, this->invalid_as_nan);
+		data["CloseCombFrozenMargin"] = validDouble(task_data->CloseCombFrozenMargin, this->invalid_as_nan);
+		data["CloseFrozenMargin"] = validDouble(task_data->CloseFrozenMargin, this->invalid_as_nan);
+		data["MMSAOpenFrozenMargin"] = validDouble(task_data->MMSAOpenFrozenMargin, this->invalid_as_nan);
+		data["DeliveryOpenFrozenMargin"] = validDouble(task_data->DeliveryOpenFrozenMargin, this->invalid_as_nan);
+		data["OpenFrozenMargin"] = validDouble(task_data->OpenFrozenMargin, this->invalid_as_nan);
+		data["UseFrozenMargin"] = validDouble(task_data->UseFrozenMargin, this->invalid_as_nan);
+		data["MMSAExchMargin"] = validDouble(task_data->MMSAExchMargin, this->invalid_as_nan);
+		data["DeliveryExchMargin"] = validDouble(task_data->DeliveryExchMargin, this->invalid_as_nan);
+		data["CombExchMargin"] = validDouble(task_data->CombExchMargin, this->invalid_as_nan);
+		data["ExchMargin"] = validDouble(task_data->ExchMargin, this->invalid_as_nan);
+		data["UseMargin"] = validDouble(task_data->UseMargin, this->invalid_as_nan);
+		TaskPool<CThostFtdcInvestorProdRCAMSMarginField>::release(task_data);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInvestorProdRCAMSMargin(data, error, task->task_id, task->task_last);
 };
@@ -10300,22 +11854,25 @@ void TdApi::processRspQryRULEInstrParameter(Task *task)
 		data["InstrumentID"] = toUtf(task_data->InstrumentID);
 		data["InstrumentClass"] = task_data->InstrumentClass;
 		data["StdInstrumentID"] = toUtf(task_data->StdInstrumentID);
-		data["BSpecRatio"] = task_data->BSpecRatio;
-		data["SSpecRatio"] = task_data->SSpecRatio;
-		data["BHedgeRatio"] = task_data->BHedgeRatio;
-		data["SHedgeRatio"] = task_data->SHedgeRatio;
-		data["BAddOnMargin"] = task_data->BAddOnMargin;
-		data["SAddOnMargin"] = task_data->SAddOnMargin;
+		data["BSpecRatio"] = validDouble(task_data->BSpecRatio, this->invalid_as_nan);
+		data["SSpecRatio"] = validDouble(task_data->SSpecRatio, this->invalid_as_nan);
+		data["BHedgeRatio"] = validDouble(task_data->BHedgeRatio, this->invalid_as_nan);
+		data["SHedgeRatio"] = validDouble(task_data->SHedgeRatio, this->invalid_as_nan);
+		data["BAddOnMargin"] = validDouble(task_data->BAddOnMargin, this->invalid_as_nan);
+		data["SAddOnMargin"] = validDouble(task_data->SAddOnMargin, this->invalid_as_nan);
 		data["CommodityGroupID"] = task_data->CommodityGroupID;
-		delete task_data;
+		TaskPool<CThostFtdcRULEInstrParameterField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryRULEInstrParameter(data, error, task->task_id, task->task_last);
 };
@@ -10331,18 +11888,21 @@ void TdApi::processRspQryRULEIntraParameter(Task *task)
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["ProdFamilyCode"] = toUtf(task_data->ProdFamilyCode);
 		data["StdInstrumentID"] = toUtf(task_data->StdInstrumentID);
-		data["StdInstrMargin"] = task_data->StdInstrMargin;
-		data["UsualIntraRate"] = task_data->UsualIntraRate;
-		data["DeliveryIntraRate"] = task_data->DeliveryIntraRate;
-		delete task_data;
-	}
+		data["StdInstrMargin"] = validDouble(task_data->StdInstrMargin, this->invalid_as_nan);
+		data["UsualIntraRate"] = validDouble(task_data->UsualIntraRate, this->invalid_as_nan);
+		data["DeliveryIntraRate"] = validDouble(task_data->DeliveryIntraRate, this->invalid_as_nan);
+		TaskPool<CThostFtdcRULEIntraParameterField>::release(task_data);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryRULEIntraParameter(data, error, task->task_id, task->task_last);
 };
@@ -10357,22 +11917,25 @@ void TdApi::processRspQryRULEInterParameter(Task *task)
 		data["TradingDay"] = toUtf(task_data->TradingDay);
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["SpreadId"] = task_data->SpreadId;
-		data["InterRate"] = task_data->InterRate;
+		data["InterRate"] = validDouble(task_data->InterRate, this->invalid_as_nan);
 		data["Leg1ProdFamilyCode"] = toUtf(task_data->Leg1ProdFamilyCode);
 		data["Leg2ProdFamilyCode"] = toUtf(task_data->Leg2ProdFamilyCode);
 		data["Leg1PropFactor"] = task_data->Leg1PropFactor;
 		data["Leg2PropFactor"] = task_data->Leg2PropFactor;
 		data["CommodityGroupID"] = task_data->CommodityGroupID;
 		data["CommodityGroupName"] = toUtf(task_data->CommodityGroupName);
-		delete task_data;
+		TaskPool<CThostFtdcRULEInterParameterField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryRULEInterParameter(data, error, task->task_id, task->task_last);
 };
@@ -10390,36 +11953,39 @@ void TdApi::processRspQryInvestorProdRULEMargin(Task *task)
 		data["ProdFamilyCode"] = toUtf(task_data->ProdFamilyCode);
 		data["InstrumentClass"] = task_data->InstrumentClass;
 		data["CommodityGroupID"] = task_data->CommodityGroupID;
-		data["BStdPosition"] = task_data->BStdPosition;
-		data["SStdPosition"] = task_data->SStdPosition;
-		data["BStdOpenFrozen"] = task_data->BStdOpenFrozen;
-		data["SStdOpenFrozen"] = task_data->SStdOpenFrozen;
-		data["BStdCloseFrozen"] = task_data->BStdCloseFrozen;
-		data["SStdCloseFrozen"] = task_data->SStdCloseFrozen;
-		data["IntraProdStdPosition"] = task_data->IntraProdStdPosition;
-		data["NetStdPosition"] = task_data->NetStdPosition;
-		data["InterProdStdPosition"] = task_data->InterProdStdPosition;
-		data["SingleStdPosition"] = task_data->SingleStdPosition;
-		data["IntraProdMargin"] = task_data->IntraProdMargin;
-		data["InterProdMargin"] = task_data->InterProdMargin;
-		data["SingleMargin"] = task_data->SingleMargin;
-		data["NonCombMargin"] = task_data->NonCombMargin;
-		data["AddOnMargin"] = task_data->AddOnMargin;
-		data["ExchMargin"] = task_data->ExchMargin;
-		data["AddOnFrozenMargin"] = task_data->AddOnFrozenMargin;
-		data["OpenFrozenMargin"] = task_data->OpenFrozenMargin;
-		data["CloseFrozenMargin"] = task_data->CloseFrozenMargin;
-		data["Margin"] = task_data->Margin;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		delete task_data;
-	}
+		data["BStdPosition"] = validDouble(task_data->BStdPosition, this->invalid_as_nan);
+		data["SStdPosition"] = validDouble(task_data->SStdPosition, this->invalid_as_nan);
+		data["BStdOpenFrozen"] = validDouble(task_data->BStdOpenFrozen, this->invalid_as_nan);
+		data["SStdOpenFrozen"] = validDouble(task_data->SStdOpenFrozen, this->invalid_as_nan);
+		data["BStdCloseFrozen"] = validDouble(task_data->BStdCloseFrozen, this->invalid_as_nan);
+		data["SStdCloseFrozen"] = validDouble(task_data->SStdCloseFrozen, this->invalid_as_nan);
+		data["IntraProdStdPosition"] = validDouble(task_data->IntraProdStdPosition, this->invalid_as_nan);
+		data["NetStdPosition"] = validDouble(task_data->NetStdPosition, this->invalid_as_nan);
+		data["InterProdStdPosition"] = validDouble(task_data->InterProdStdPosition, this->invalid_as_nan);
+		data["SingleStdPosition"] = validDouble(task_data->SingleStdPosition, this->invalid_as_nan);
+		data["IntraProdMargin"] = validDouble(task_data->IntraProdMargin, this->invalid_as_nan);
+		data["InterProdMargin"] = validDouble(task_data->InterProdMargin, this->invalid_as_nan);
+		data["SingleMargin"] = validDouble(task_data->SingleMargin, this->invalid_as_nan);
+		data["NonCombMargin"] = validDouble(task_data->NonCombMargin, this->invalid_as_nan);
+		data["AddOnMargin"] = validDouble(task_data->AddOnMargin, this->invalid_as_nan);
+		data["ExchMargin"] = validDouble(task_data->ExchMargin, this->invalid_as_nan);
+		data["AddOnFrozenMargin"] = validDouble(task_data->AddOnFrozenMargin, this->invalid_as_nan);
+		data["OpenFrozenMargin"] = validDouble(task_data->OpenFrozenMargin, this->invalid_as_nan);
+		data["CloseFrozenMargin"] = validDouble(task_data->CloseFrozenMargin, this->invalid_as_nan);
+		data["Margin"] = validDouble(task_data->Margin, this->invalid_as_nan);
+		data["FrozenMargin"] = validDouble(task_data->FrozenMargin, this->invalid_as_nan);
+		TaskPool<CThostFtdcInvestorProdRULEMarginField>::release(task_data);
+	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInvestorProdRULEMargin(data, error, task->task_id, task->task_last);
 };
@@ -10436,15 +12002,18 @@ void TdApi::processRspQryInvestorPortfSetting(Task *task)
 		data["InvestorID"] = toUtf(task_data->InvestorID);
 		data["HedgeFlag"] = task_data->HedgeFlag;
 		data["UsePortf"] = task_data->UsePortf;
-		delete task_data;
+		TaskPool<CThostFtdcInvestorPortfSettingField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInvestorPortfSetting(data, error, task->task_id, task->task_last);
 };
@@ -10463,19 +12032,22 @@ void TdApi::processRspQryInvestorInfoCommRec(Task *task)
 		data["OrderCount"] = task_data->OrderCount;
 		data["OrderActionCount"] = task_data->OrderActionCount;
 		data["ForQuoteCnt"] = task_data->ForQuoteCnt;
-		data["InfoComm"] = task_data->InfoComm;
+		data["InfoComm"] = validDouble(task_data->InfoComm, this->invalid_as_nan);
 		data["IsOptSeries"] = task_data->IsOptSeries;
 		data["ProductID"] = toUtf(task_data->ProductID);
 		data["InfoCnt"] = task_data->InfoCnt;
-		delete task_data;
+		TaskPool<CThostFtdcInvestorInfoCommRecField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryInvestorInfoCommRec(data, error, task->task_id, task->task_last);
 };
@@ -10493,15 +12065,18 @@ void TdApi::processRspQryCombLeg(Task *task)
 		data["Direction"] = task_data->Direction;
 		data["LegMultiple"] = task_data->LegMultiple;
 		data["ImplyLevel"] = task_data->ImplyLevel;
-		delete task_data;
+		TaskPool<CThostFtdcCombLegField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryCombLeg(data, error, task->task_id, task->task_last);
 };
@@ -10526,15 +12101,18 @@ void TdApi::processRspOffsetSetting(Task *task)
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
 		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		TaskPool<CThostFtdcInputOffsetSettingField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspOffsetSetting(data, error, task->task_id, task->task_last);
 };
@@ -10559,15 +12137,18 @@ void TdApi::processRspCancelOffsetSetting(Task *task)
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
 		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		TaskPool<CThostFtdcInputOffsetSettingField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspCancelOffsetSetting(data, error, task->task_id, task->task_last);
 };
@@ -10613,8 +12194,11 @@ void TdApi::processRtnOffsetSetting(Task *task)
 		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
 		data["BrokerOffsetSettingSeq"] = task_data->BrokerOffsetSettingSeq;
 		data["ApplySrc"] = task_data->ApplySrc;
-		delete task_data;
+		TaskPool<CThostFtdcOffsetSettingField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	this->onRtnOffsetSetting(data);
 };
 
@@ -10638,15 +12222,18 @@ void TdApi::processErrRtnOffsetSetting(Task *task)
 		data["ExchangeID"] = toUtf(task_data->ExchangeID);
 		data["IPAddress"] = toUtf(task_data->IPAddress);
 		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		TaskPool<CThostFtdcInputOffsetSettingField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnOffsetSetting(data, error);
 };
@@ -10683,15 +12270,18 @@ void TdApi::processErrRtnCancelOffsetSetting(Task *task)
 		data["ActionLocalID"] = toUtf(task_data->ActionLocalID);
 		data["ActionDate"] = toUtf(task_data->ActionDate);
 		data["ActionTime"] = toUtf(task_data->ActionTime);
-		delete task_data;
+		TaskPool<CThostFtdcCancelOffsetSettingField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onErrRtnCancelOffsetSetting(data, error);
 };
@@ -10737,15 +12327,18 @@ void TdApi::processRspQryOffsetSetting(Task *task)
 		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
 		data["BrokerOffsetSettingSeq"] = task_data->BrokerOffsetSettingSeq;
 		data["ApplySrc"] = task_data->ApplySrc;
-		delete task_data;
+		TaskPool<CThostFtdcOffsetSettingField>::release(task_data);
 	}
+	data["_recv_ns"] = task->task_wall_time;
+	data["_recv_mono_ns"] = task->task_time;
+	data["_dispatch_mono_ns"] = steadyNs();
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
 		error["ErrorID"] = task_error->ErrorID;
 		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		TaskPool<CThostFtdcRspInfoField>::release(task_error);
 	}
 	this->onRspQryOffsetSetting(data, error, task->task_id, task->task_last);
 };
@@ -10768,6 +12361,7 @@ string TdApi::getApiVersion()
 
 void TdApi::release()
 {
+	gil_scoped_release release;
 	this->api->Release();
 };
 
@@ -10776,11 +12370,13 @@ void TdApi::init()
 	this->active = true;
 	this->task_thread = thread(&TdApi::processTask, this);
 
+	gil_scoped_release release;
 	this->api->Init();
 };
 
 int TdApi::join()
 {
+	gil_scoped_release release;
 	int i = this->api->Join();
 	return i;
 };
@@ -10798,16 +12394,19 @@ void TdApi::getFrontInfo(const dict &req)
 	getString(req, "FrontAddr", myreq.FrontAddr);
 	getInt(req, "QryFreq", &myreq.QryFreq);
 	getInt(req, "FTDPkgFreq", &myreq.FTDPkgFreq);
+	gil_scoped_release release;
 	this->api->GetFrontInfo(&myreq);
 };
 
 void TdApi::registerFront(string pszFrontAddress)
 {
+	gil_scoped_release release;
 	this->api->RegisterFront((char*)pszFrontAddress.c_str());
 };
 
 void TdApi::registerNameServer(string pszNsAddress)
 {
+	gil_scoped_release release;
 	this->api->RegisterNameServer((char*)pszNsAddress.c_str());
 };
 
@@ -10818,11 +12417,13 @@ void TdApi::registerFensUserInfo(const dict &req)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "UserID", myreq.UserID);
 	getChar(req, "LoginMode", &myreq.LoginMode);
+	gil_scoped_release release;
 	this->api->RegisterFensUserInfo(&myreq);
 };
 
 int TdApi::exit()
 {
+	gil_scoped_release release;
 	this->active = false;
 	this->task_queue.terminate();
 	this->task_thread.join();
@@ -10835,11 +12436,13 @@ int TdApi::exit()
 
 void TdApi::subscribePrivateTopic(int nType)
 {
+	gil_scoped_release release;
 	this->api->SubscribePrivateTopic((THOST_TE_RESUME_TYPE)nType);
 };
 
 void TdApi::subscribePublicTopic(int nType)
 {
+	gil_scoped_release release;
 	this->api->SubscribePublicTopic((THOST_TE_RESUME_TYPE)nType);
 };
 
@@ -10852,6 +12455,7 @@ int TdApi::reqAuthenticate(const dict &req, int reqid)
 	getString(req, "UserProductInfo", myreq.UserProductInfo);
 	getString(req, "AuthCode", myreq.AuthCode);
 	getString(req, "AppID", myreq.AppID);
+	gil_scoped_release release;
 	int i = this->api->ReqAuthenticate(&myreq, reqid);
 	return i;
 };
@@ -10870,6 +12474,7 @@ int TdApi::registerUserSystemInfo(const dict &req)
 	getString(req, "ClientAppID", myreq.ClientAppID);
 	getString(req, "ClientPublicIP", myreq.ClientPublicIP);
 	getString(req, "ClientLoginRemark", myreq.ClientLoginRemark);
+	gil_scoped_release release;
 	int i = this->api->RegisterUserSystemInfo(&myreq);
 	return i;
 };
@@ -10888,6 +12493,7 @@ int TdApi::submitUserSystemInfo(const dict &req)
 	getString(req, "ClientAppID", myreq.ClientAppID);
 	getString(req, "ClientPublicIP", myreq.ClientPublicIP);
 	getString(req, "ClientLoginRemark", myreq.ClientLoginRemark);
+	gil_scoped_release release;
 	int i = this->api->SubmitUserSystemInfo(&myreq);
 	return i;
 };
@@ -10905,6 +12511,7 @@ int TdApi::registerWechatUserSystemInfo(const dict &req)
 	getString(req, "ClientAppID", myreq.ClientAppID);
 	getString(req, "ClientPublicIP", myreq.ClientPublicIP);
 	getString(req, "ClientLoginRemark", myreq.ClientLoginRemark);
+	gil_scoped_release release;
 	int i = this->api->RegisterWechatUserSystemInfo(&myreq);
 	return i;
 };
@@ -10922,6 +12529,7 @@ int TdApi::submitWechatUserSystemInfo(const dict &req)
 	getString(req, "ClientAppID", myreq.ClientAppID);
 	getString(req, "ClientPublicIP", myreq.ClientPublicIP);
 	getString(req, "ClientLoginRemark", myreq.ClientLoginRemark);
+	gil_scoped_release release;
 	int i = this->api->SubmitWechatUserSystemInfo(&myreq);
 	return i;
 };
@@ -10943,6 +12551,7 @@ int TdApi::reqUserLogin(const dict &req, int reqid)
 	getString(req, "LoginRemark", myreq.LoginRemark);
 	getInt(req, "ClientIPPort", &myreq.ClientIPPort);
 	getString(req, "ClientIPAddress", myreq.ClientIPAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLogin(&myreq, reqid);
 	return i;
 };
@@ -10953,6 +12562,7 @@ int TdApi::reqUserLogout(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "UserID", myreq.UserID);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLogout(&myreq, reqid);
 	return i;
 };
@@ -10965,6 +12575,7 @@ int TdApi::reqUserPasswordUpdate(const dict &req, int reqid)
 	getString(req, "UserID", myreq.UserID);
 	getString(req, "OldPassword", myreq.OldPassword);
 	getString(req, "NewPassword", myreq.NewPassword);
+	gil_scoped_release release;
 	int i = this->api->ReqUserPasswordUpdate(&myreq, reqid);
 	return i;
 };
@@ -10978,6 +12589,7 @@ int TdApi::reqTradingAccountPasswordUpdate(const dict &req, int reqid)
 	getString(req, "OldPassword", myreq.OldPassword);
 	getString(req, "NewPassword", myreq.NewPassword);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	gil_scoped_release release;
 	int i = this->api->ReqTradingAccountPasswordUpdate(&myreq, reqid);
 	return i;
 };
@@ -10989,6 +12601,7 @@ int TdApi::reqUserAuthMethod(const dict &req, int reqid)
 	getString(req, "TradingDay", myreq.TradingDay);
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "UserID", myreq.UserID);
+	gil_scoped_release release;
 	int i = this->api->ReqUserAuthMethod(&myreq, reqid);
 	return i;
 };
@@ -11000,6 +12613,7 @@ int TdApi::reqGenUserCaptcha(const dict &req, int reqid)
 	getString(req, "TradingDay", myreq.TradingDay);
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "UserID", myreq.UserID);
+	gil_scoped_release release;
 	int i = this->api->ReqGenUserCaptcha(&myreq, reqid);
 	return i;
 };
@@ -11011,6 +12625,7 @@ int TdApi::reqGenUserText(const dict &req, int reqid)
 	getString(req, "TradingDay", myreq.TradingDay);
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "UserID", myreq.UserID);
+	gil_scoped_release release;
 	int i = this->api->ReqGenUserText(&myreq, reqid);
 	return i;
 };
@@ -11032,6 +12647,7 @@ int TdApi::reqUserLoginWithCaptcha(const dict &req, int reqid)
 	getString(req, "Captcha", myreq.Captcha);
 	getInt(req, "ClientIPPort", &myreq.ClientIPPort);
 	getString(req, "ClientIPAddress", myreq.ClientIPAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLoginWithCaptcha(&myreq, reqid);
 	return i;
 };
@@ -11053,6 +12669,7 @@ int TdApi::reqUserLoginWithText(const dict &req, int reqid)
 	getString(req, "Text", myreq.Text);
 	getInt(req, "ClientIPPort", &myreq.ClientIPPort);
 	getString(req, "ClientIPAddress", myreq.ClientIPAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLoginWithText(&myreq, reqid);
 	return i;
 };
@@ -11074,6 +12691,7 @@ int TdApi::reqUserLoginWithOTP(const dict &req, int reqid)
 	getString(req, "OTPPassword", myreq.OTPPassword);
 	getInt(req, "ClientIPPort", &myreq.ClientIPPort);
 	getString(req, "ClientIPAddress", myreq.ClientIPAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLoginWithOTP(&myreq, reqid);
 	return i;
 };
@@ -11116,6 +12734,7 @@ int TdApi::reqOrderInsert(const dict &req, int reqid)
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "OrderMemo", myreq.OrderMemo);
 	getInt(req, "SessionReqSeq", &myreq.SessionReqSeq);
+	gil_scoped_release release;
 	int i = this->api->ReqOrderInsert(&myreq, reqid);
 	return i;
 };
@@ -11161,6 +12780,7 @@ int TdApi::reqParkedOrderInsert(const dict &req, int reqid)
 	getString(req, "MacAddress", myreq.MacAddress);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "IPAddress", myreq.IPAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqParkedOrderInsert(&myreq, reqid);
 	return i;
 };
@@ -11193,6 +12813,7 @@ int TdApi::reqParkedOrderAction(const dict &req, int reqid)
 	getString(req, "MacAddress", myreq.MacAddress);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "IPAddress", myreq.IPAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqParkedOrderAction(&myreq, reqid);
 	return i;
 };
@@ -11222,6 +12843,7 @@ int TdApi::reqOrderAction(const dict &req, int reqid)
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "OrderMemo", myreq.OrderMemo);
 	getInt(req, "SessionReqSeq", &myreq.SessionReqSeq);
+	gil_scoped_release release;
 	int i = this->api->ReqOrderAction(&myreq, reqid);
 	return i;
 };
@@ -11240,6 +12862,7 @@ int TdApi::reqQryMaxOrderVolume(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryMaxOrderVolume(&myreq, reqid);
 	return i;
 };
@@ -11255,6 +12878,7 @@ int TdApi::reqSettlementInfoConfirm(const dict &req, int reqid)
 	getInt(req, "SettlementID", &myreq.SettlementID);
 	getString(req, "AccountID", myreq.AccountID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	gil_scoped_release release;
 	int i = this->api->ReqSettlementInfoConfirm(&myreq, reqid);
 	return i;
 };
@@ -11267,6 +12891,7 @@ int TdApi::reqRemoveParkedOrder(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "ParkedOrderID", myreq.ParkedOrderID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	gil_scoped_release release;
 	int i = this->api->ReqRemoveParkedOrder(&myreq, reqid);
 	return i;
 };
@@ -11279,6 +12904,7 @@ int TdApi::reqRemoveParkedOrderAction(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "ParkedOrderActionID", myreq.ParkedOrderActionID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	gil_scoped_release release;
 	int i = this->api->ReqRemoveParkedOrderAction(&myreq, reqid);
 	return i;
 };
@@ -11310,6 +12936,7 @@ int TdApi::reqExecOrderInsert(const dict &req, int reqid)
 	getString(req, "MacAddress", myreq.MacAddress);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "IPAddress", myreq.IPAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqExecOrderInsert(&myreq, reqid);
 	return i;
 };
@@ -11335,6 +12962,7 @@ int TdApi::reqExecOrderAction(const dict &req, int reqid)
 	getString(req, "MacAddress", myreq.MacAddress);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "IPAddress", myreq.IPAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqExecOrderAction(&myreq, reqid);
 	return i;
 };
@@ -11354,6 +12982,7 @@ int TdApi::reqForQuoteInsert(const dict &req, int reqid)
 	getString(req, "MacAddress", myreq.MacAddress);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "IPAddress", myreq.IPAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqForQuoteInsert(&myreq, reqid);
 	return i;
 };
@@ -11391,6 +13020,7 @@ int TdApi::reqQuoteInsert(const dict &req, int reqid)
 	getChar(req, "TimeCondition", &myreq.TimeCondition);
 	getString(req, "OrderMemo", myreq.OrderMemo);
 	getInt(req, "SessionReqSeq", &myreq.SessionReqSeq);
+	gil_scoped_release release;
 	int i = this->api->ReqQuoteInsert(&myreq, reqid);
 	return i;
 };
@@ -11419,6 +13049,7 @@ int TdApi::reqQuoteAction(const dict &req, int reqid)
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "OrderMemo", myreq.OrderMemo);
 	getInt(req, "SessionReqSeq", &myreq.SessionReqSeq);
+	gil_scoped_release release;
 	int i = this->api->ReqQuoteAction(&myreq, reqid);
 	return i;
 };
@@ -11439,6 +13070,7 @@ int TdApi::reqBatchOrderAction(const dict &req, int reqid)
 	getString(req, "reserve1", myreq.reserve1);
 	getString(req, "MacAddress", myreq.MacAddress);
 	getString(req, "IPAddress", myreq.IPAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqBatchOrderAction(&myreq, reqid);
 	return i;
 };
@@ -11466,6 +13098,7 @@ int TdApi::reqOptionSelfCloseInsert(const dict &req, int reqid)
 	getString(req, "MacAddress", myreq.MacAddress);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "IPAddress", myreq.IPAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqOptionSelfCloseInsert(&myreq, reqid);
 	return i;
 };
@@ -11491,6 +13124,7 @@ int TdApi::reqOptionSelfCloseAction(const dict &req, int reqid)
 	getString(req, "MacAddress", myreq.MacAddress);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "IPAddress", myreq.IPAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqOptionSelfCloseAction(&myreq, reqid);
 	return i;
 };
@@ -11516,6 +13150,7 @@ int TdApi::reqCombActionInsert(const dict &req, int reqid)
 	getInt(req, "SessionID", &myreq.SessionID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "IPAddress", myreq.IPAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqCombActionInsert(&myreq, reqid);
 	return i;
 };
@@ -11533,6 +13168,7 @@ int TdApi::reqQryOrder(const dict &req, int reqid)
 	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryOrder(&myreq, reqid);
 	return i;
 };
@@ -11550,6 +13186,7 @@ int TdApi::reqQryTrade(const dict &req, int reqid)
 	getString(req, "TradeTimeEnd", myreq.TradeTimeEnd);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryTrade(&myreq, reqid);
 	return i;
 };
@@ -11564,6 +13201,7 @@ int TdApi::reqQryInvestorPosition(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorPosition(&myreq, reqid);
 	return i;
 };
@@ -11577,6 +13215,7 @@ int TdApi::reqQryTradingAccount(const dict &req, int reqid)
 	getString(req, "CurrencyID", myreq.CurrencyID);
 	getChar(req, "BizType", &myreq.BizType);
 	getString(req, "AccountID", myreq.AccountID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryTradingAccount(&myreq, reqid);
 	return i;
 };
@@ -11587,6 +13226,7 @@ int TdApi::reqQryInvestor(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestor(&myreq, reqid);
 	return i;
 };
@@ -11601,6 +13241,7 @@ int TdApi::reqQryTradingCode(const dict &req, int reqid)
 	getString(req, "ClientID", myreq.ClientID);
 	getChar(req, "ClientIDType", &myreq.ClientIDType);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryTradingCode(&myreq, reqid);
 	return i;
 };
@@ -11616,6 +13257,7 @@ int TdApi::reqQryInstrumentMarginRate(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInstrumentMarginRate(&myreq, reqid);
 	return i;
 };
@@ -11630,6 +13272,7 @@ int TdApi::reqQryInstrumentCommissionRate(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInstrumentCommissionRate(&myreq, reqid);
 	return i;
 };
@@ -11642,6 +13285,7 @@ int TdApi::reqQryUserSession(const dict &req, int reqid)
 	getInt(req, "SessionID", &myreq.SessionID);
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "UserID", myreq.UserID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryUserSession(&myreq, reqid);
 	return i;
 };
@@ -11651,6 +13295,7 @@ int TdApi::reqQryExchange(const dict &req, int reqid)
 	CThostFtdcQryExchangeField myreq = CThostFtdcQryExchangeField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "ExchangeID", myreq.ExchangeID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryExchange(&myreq, reqid);
 	return i;
 };
@@ -11663,6 +13308,7 @@ int TdApi::reqQryProduct(const dict &req, int reqid)
 	getChar(req, "ProductClass", &myreq.ProductClass);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "ProductID", myreq.ProductID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryProduct(&myreq, reqid);
 	return i;
 };
@@ -11678,6 +13324,7 @@ int TdApi::reqQryInstrument(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeInstID", myreq.ExchangeInstID);
 	getString(req, "ProductID", myreq.ProductID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInstrument(&myreq, reqid);
 	return i;
 };
@@ -11690,6 +13337,7 @@ int TdApi::reqQryDepthMarketData(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getChar(req, "ProductClass", &myreq.ProductClass);
+	gil_scoped_release release;
 	int i = this->api->ReqQryDepthMarketData(&myreq, reqid);
 	return i;
 };
@@ -11701,6 +13349,7 @@ int TdApi::reqQryTraderOffer(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "ParticipantID", myreq.ParticipantID);
 	getString(req, "TraderID", myreq.TraderID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryTraderOffer(&myreq, reqid);
 	return i;
 };
@@ -11714,6 +13363,7 @@ int TdApi::reqQrySettlementInfo(const dict &req, int reqid)
 	getString(req, "TradingDay", myreq.TradingDay);
 	getString(req, "AccountID", myreq.AccountID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySettlementInfo(&myreq, reqid);
 	return i;
 };
@@ -11724,6 +13374,7 @@ int TdApi::reqQryTransferBank(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BankID", myreq.BankID);
 	getString(req, "BankBrchID", myreq.BankBrchID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryTransferBank(&myreq, reqid);
 	return i;
 };
@@ -11738,6 +13389,7 @@ int TdApi::reqQryInvestorPositionDetail(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorPositionDetail(&myreq, reqid);
 	return i;
 };
@@ -11747,6 +13399,7 @@ int TdApi::reqQryNotice(const dict &req, int reqid)
 	CThostFtdcQryNoticeField myreq = CThostFtdcQryNoticeField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BrokerID", myreq.BrokerID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryNotice(&myreq, reqid);
 	return i;
 };
@@ -11759,6 +13412,7 @@ int TdApi::reqQrySettlementInfoConfirm(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "AccountID", myreq.AccountID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySettlementInfoConfirm(&myreq, reqid);
 	return i;
 };
@@ -11773,6 +13427,7 @@ int TdApi::reqQryInvestorPositionCombineDetail(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "CombInstrumentID", myreq.CombInstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorPositionCombineDetail(&myreq, reqid);
 	return i;
 };
@@ -11783,6 +13438,7 @@ int TdApi::reqQryCFMMCTradingAccountKey(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryCFMMCTradingAccountKey(&myreq, reqid);
 	return i;
 };
@@ -11797,6 +13453,7 @@ int TdApi::reqQryEWarrantOffset(const dict &req, int reqid)
 	getString(req, "reserve1", myreq.reserve1);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryEWarrantOffset(&myreq, reqid);
 	return i;
 };
@@ -11812,6 +13469,7 @@ int TdApi::reqQryInvestorProductGroupMargin(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "ProductGroupID", myreq.ProductGroupID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorProductGroupMargin(&myreq, reqid);
 	return i;
 };
@@ -11825,6 +13483,7 @@ int TdApi::reqQryExchangeMarginRate(const dict &req, int reqid)
 	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryExchangeMarginRate(&myreq, reqid);
 	return i;
 };
@@ -11837,6 +13496,7 @@ int TdApi::reqQryExchangeMarginRateAdjust(const dict &req, int reqid)
 	getString(req, "reserve1", myreq.reserve1);
 	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryExchangeMarginRateAdjust(&myreq, reqid);
 	return i;
 };
@@ -11848,6 +13508,7 @@ int TdApi::reqQryExchangeRate(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "FromCurrencyID", myreq.FromCurrencyID);
 	getString(req, "ToCurrencyID", myreq.ToCurrencyID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryExchangeRate(&myreq, reqid);
 	return i;
 };
@@ -11860,6 +13521,7 @@ int TdApi::reqQrySecAgentACIDMap(const dict &req, int reqid)
 	getString(req, "UserID", myreq.UserID);
 	getString(req, "AccountID", myreq.AccountID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySecAgentACIDMap(&myreq, reqid);
 	return i;
 };
@@ -11871,6 +13533,7 @@ int TdApi::reqQryProductExchRate(const dict &req, int reqid)
 	getString(req, "reserve1", myreq.reserve1);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "ProductID", myreq.ProductID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryProductExchRate(&myreq, reqid);
 	return i;
 };
@@ -11882,6 +13545,7 @@ int TdApi::reqQryProductGroup(const dict &req, int reqid)
 	getString(req, "reserve1", myreq.reserve1);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "ProductID", myreq.ProductID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryProductGroup(&myreq, reqid);
 	return i;
 };
@@ -11894,6 +13558,7 @@ int TdApi::reqQryMMInstrumentCommissionRate(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "reserve1", myreq.reserve1);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryMMInstrumentCommissionRate(&myreq, reqid);
 	return i;
 };
@@ -11906,6 +13571,7 @@ int TdApi::reqQryMMOptionInstrCommRate(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "reserve1", myreq.reserve1);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryMMOptionInstrCommRate(&myreq, reqid);
 	return i;
 };
@@ -11918,6 +13584,7 @@ int TdApi::reqQryInstrumentOrderCommRate(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "reserve1", myreq.reserve1);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInstrumentOrderCommRate(&myreq, reqid);
 	return i;
 };
@@ -11931,6 +13598,7 @@ int TdApi::reqQrySecAgentTradingAccount(const dict &req, int reqid)
 	getString(req, "CurrencyID", myreq.CurrencyID);
 	getChar(req, "BizType", &myreq.BizType);
 	getString(req, "AccountID", myreq.AccountID);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySecAgentTradingAccount(&myreq, reqid);
 	return i;
 };
@@ -11941,6 +13609,7 @@ int TdApi::reqQrySecAgentCheckMode(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySecAgentCheckMode(&myreq, reqid);
 	return i;
 };
@@ -11951,6 +13620,7 @@ int TdApi::reqQrySecAgentTradeInfo(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "BrokerSecAgentID", myreq.BrokerSecAgentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySecAgentTradeInfo(&myreq, reqid);
 	return i;
 };
@@ -11968,6 +13638,7 @@ int TdApi::reqQryOptionInstrTradeCost(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryOptionInstrTradeCost(&myreq, reqid);
 	return i;
 };
@@ -11982,6 +13653,7 @@ int TdApi::reqQryOptionInstrCommRate(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryOptionInstrCommRate(&myreq, reqid);
 	return i;
 };
@@ -11998,6 +13670,7 @@ int TdApi::reqQryExecOrder(const dict &req, int reqid)
 	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
 	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryExecOrder(&myreq, reqid);
 	return i;
 };
@@ -12014,6 +13687,7 @@ int TdApi::reqQryForQuote(const dict &req, int reqid)
 	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryForQuote(&myreq, reqid);
 	return i;
 };
@@ -12031,6 +13705,7 @@ int TdApi::reqQryQuote(const dict &req, int reqid)
 	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryQuote(&myreq, reqid);
 	return i;
 };
@@ -12047,6 +13722,7 @@ int TdApi::reqQryOptionSelfClose(const dict &req, int reqid)
 	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
 	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryOptionSelfClose(&myreq, reqid);
 	return i;
 };
@@ -12058,6 +13734,7 @@ int TdApi::reqQryInvestUnit(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestUnit(&myreq, reqid);
 	return i;
 };
@@ -12070,6 +13747,7 @@ int TdApi::reqQryCombInstrumentGuard(const dict &req, int reqid)
 	getString(req, "reserve1", myreq.reserve1);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryCombInstrumentGuard(&myreq, reqid);
 	return i;
 };
@@ -12084,6 +13762,7 @@ int TdApi::reqQryCombAction(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryCombAction(&myreq, reqid);
 	return i;
 };
@@ -12096,6 +13775,7 @@ int TdApi::reqQryTransferSerial(const dict &req, int reqid)
 	getString(req, "AccountID", myreq.AccountID);
 	getString(req, "BankID", myreq.BankID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryTransferSerial(&myreq, reqid);
 	return i;
 };
@@ -12109,6 +13789,7 @@ int TdApi::reqQryAccountregister(const dict &req, int reqid)
 	getString(req, "BankID", myreq.BankID);
 	getString(req, "BankBranchID", myreq.BankBranchID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryAccountregister(&myreq, reqid);
 	return i;
 };
@@ -12120,6 +13801,7 @@ int TdApi::reqQryContractBank(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "BankID", myreq.BankID);
 	getString(req, "BankBrchID", myreq.BankBrchID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryContractBank(&myreq, reqid);
 	return i;
 };
@@ -12134,6 +13816,7 @@ int TdApi::reqQryParkedOrder(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryParkedOrder(&myreq, reqid);
 	return i;
 };
@@ -12148,6 +13831,7 @@ int TdApi::reqQryParkedOrderAction(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryParkedOrderAction(&myreq, reqid);
 	return i;
 };
@@ -12159,6 +13843,7 @@ int TdApi::reqQryTradingNotice(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryTradingNotice(&myreq, reqid);
 	return i;
 };
@@ -12171,6 +13856,7 @@ int TdApi::reqQryBrokerTradingParams(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
 	getString(req, "AccountID", myreq.AccountID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryBrokerTradingParams(&myreq, reqid);
 	return i;
 };
@@ -12183,6 +13869,7 @@ int TdApi::reqQryBrokerTradingAlgos(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "reserve1", myreq.reserve1);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryBrokerTradingAlgos(&myreq, reqid);
 	return i;
 };
@@ -12194,6 +13881,7 @@ int TdApi::reqQueryCFMMCTradingAccountToken(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	gil_scoped_release release;
 	int i = this->api->ReqQueryCFMMCTradingAccountToken(&myreq, reqid);
 	return i;
 };
@@ -12246,6 +13934,7 @@ int TdApi::reqFromBankToFutureByFuture(const dict &req, int reqid)
 	getInt(req, "TID", &myreq.TID);
 	getChar(req, "TransferStatus", &myreq.TransferStatus);
 	getString(req, "LongCustomerName", myreq.LongCustomerName);
+	gil_scoped_release release;
 	int i = this->api->ReqFromBankToFutureByFuture(&myreq, reqid);
 	return i;
 };
@@ -12298,6 +13987,7 @@ int TdApi::reqFromFutureToBankByFuture(const dict &req, int reqid)
 	getInt(req, "TID", &myreq.TID);
 	getChar(req, "TransferStatus", &myreq.TransferStatus);
 	getString(req, "LongCustomerName", myreq.LongCustomerName);
+	gil_scoped_release release;
 	int i = this->api->ReqFromFutureToBankByFuture(&myreq, reqid);
 	return i;
 };
@@ -12343,6 +14033,7 @@ int TdApi::reqQueryBankAccountMoneyByFuture(const dict &req, int reqid)
 	getInt(req, "RequestID", &myreq.RequestID);
 	getInt(req, "TID", &myreq.TID);
 	getString(req, "LongCustomerName", myreq.LongCustomerName);
+	gil_scoped_release release;
 	int i = this->api->ReqQueryBankAccountMoneyByFuture(&myreq, reqid);
 	return i;
 };
@@ -12357,6 +14048,7 @@ int TdApi::reqQryClassifiedInstrument(const dict &req, int reqid)
 	getString(req, "ProductID", myreq.ProductID);
 	getChar(req, "TradingType", &myreq.TradingType);
 	getChar(req, "ClassType", &myreq.ClassType);
+	gil_scoped_release release;
 	int i = this->api->ReqQryClassifiedInstrument(&myreq, reqid);
 	return i;
 };
@@ -12367,6 +14059,7 @@ int TdApi::reqQryCombPromotionParam(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryCombPromotionParam(&myreq, reqid);
 	return i;
 };
@@ -12378,6 +14071,7 @@ int TdApi::reqQryRiskSettleInvstPosition(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRiskSettleInvstPosition(&myreq, reqid);
 	return i;
 };
@@ -12387,6 +14081,7 @@ int TdApi::reqQryRiskSettleProductStatus(const dict &req, int reqid)
 	CThostFtdcQryRiskSettleProductStatusField myreq = CThostFtdcQryRiskSettleProductStatusField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "ProductID", myreq.ProductID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRiskSettleProductStatus(&myreq, reqid);
 	return i;
 };
@@ -12398,6 +14093,7 @@ int TdApi::reqQrySPBMFutureParameter(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ProdFamilyCode", myreq.ProdFamilyCode);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPBMFutureParameter(&myreq, reqid);
 	return i;
 };
@@ -12409,6 +14105,7 @@ int TdApi::reqQrySPBMOptionParameter(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ProdFamilyCode", myreq.ProdFamilyCode);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPBMOptionParameter(&myreq, reqid);
 	return i;
 };
@@ -12419,6 +14116,7 @@ int TdApi::reqQrySPBMIntraParameter(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "ProdFamilyCode", myreq.ProdFamilyCode);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPBMIntraParameter(&myreq, reqid);
 	return i;
 };
@@ -12430,6 +14128,7 @@ int TdApi::reqQrySPBMInterParameter(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "Leg1ProdFamilyCode", myreq.Leg1ProdFamilyCode);
 	getString(req, "Leg2ProdFamilyCode", myreq.Leg2ProdFamilyCode);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPBMInterParameter(&myreq, reqid);
 	return i;
 };
@@ -12441,6 +14140,7 @@ int TdApi::reqQrySPBMPortfDefinition(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getInt(req, "PortfolioDefID", &myreq.PortfolioDefID);
 	getString(req, "ProdFamilyCode", myreq.ProdFamilyCode);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPBMPortfDefinition(&myreq, reqid);
 	return i;
 };
@@ -12452,6 +14152,7 @@ int TdApi::reqQrySPBMInvestorPortfDef(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPBMInvestorPortfDef(&myreq, reqid);
 	return i;
 };
@@ -12464,6 +14165,7 @@ int TdApi::reqQryInvestorPortfMarginRatio(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "ProductGroupID", myreq.ProductGroupID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorPortfMarginRatio(&myreq, reqid);
 	return i;
 };
@@ -12476,6 +14178,7 @@ int TdApi::reqQryInvestorProdSPBMDetail(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "ProdFamilyCode", myreq.ProdFamilyCode);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorProdSPBMDetail(&myreq, reqid);
 	return i;
 };
@@ -12487,6 +14190,7 @@ int TdApi::reqQryInvestorCommoditySPMMMargin(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "CommodityID", myreq.CommodityID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorCommoditySPMMMargin(&myreq, reqid);
 	return i;
 };
@@ -12498,6 +14202,7 @@ int TdApi::reqQryInvestorCommodityGroupSPMMMargin(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "CommodityGroupID", myreq.CommodityGroupID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorCommodityGroupSPMMMargin(&myreq, reqid);
 	return i;
 };
@@ -12507,6 +14212,7 @@ int TdApi::reqQrySPMMInstParam(const dict &req, int reqid)
 	CThostFtdcQrySPMMInstParamField myreq = CThostFtdcQrySPMMInstParamField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPMMInstParam(&myreq, reqid);
 	return i;
 };
@@ -12516,6 +14222,7 @@ int TdApi::reqQrySPMMProductParam(const dict &req, int reqid)
 	CThostFtdcQrySPMMProductParamField myreq = CThostFtdcQrySPMMProductParamField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "ProductID", myreq.ProductID);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPMMProductParam(&myreq, reqid);
 	return i;
 };
@@ -12527,6 +14234,7 @@ int TdApi::reqQrySPBMAddOnInterParameter(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "Leg1ProdFamilyCode", myreq.Leg1ProdFamilyCode);
 	getString(req, "Leg2ProdFamilyCode", myreq.Leg2ProdFamilyCode);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPBMAddOnInterParameter(&myreq, reqid);
 	return i;
 };
@@ -12538,6 +14246,7 @@ int TdApi::reqQryRCAMSCombProductInfo(const dict &req, int reqid)
 	getString(req, "ProductID", myreq.ProductID);
 	getString(req, "CombProductID", myreq.CombProductID);
 	getString(req, "ProductGroupID", myreq.ProductGroupID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRCAMSCombProductInfo(&myreq, reqid);
 	return i;
 };
@@ -12547,6 +14256,7 @@ int TdApi::reqQryRCAMSInstrParameter(const dict &req, int reqid)
 	CThostFtdcQryRCAMSInstrParameterField myreq = CThostFtdcQryRCAMSInstrParameterField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "ProductID", myreq.ProductID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRCAMSInstrParameter(&myreq, reqid);
 	return i;
 };
@@ -12556,6 +14266,7 @@ int TdApi::reqQryRCAMSIntraParameter(const dict &req, int reqid)
 	CThostFtdcQryRCAMSIntraParameterField myreq = CThostFtdcQryRCAMSIntraParameterField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "CombProductID", myreq.CombProductID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRCAMSIntraParameter(&myreq, reqid);
 	return i;
 };
@@ -12567,6 +14278,7 @@ int TdApi::reqQryRCAMSInterParameter(const dict &req, int reqid)
 	getString(req, "ProductGroupID", myreq.ProductGroupID);
 	getString(req, "CombProduct1", myreq.CombProduct1);
 	getString(req, "CombProduct2", myreq.CombProduct2);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRCAMSInterParameter(&myreq, reqid);
 	return i;
 };
@@ -12576,6 +14288,7 @@ int TdApi::reqQryRCAMSShortOptAdjustParam(const dict &req, int reqid)
 	CThostFtdcQryRCAMSShortOptAdjustParamField myreq = CThostFtdcQryRCAMSShortOptAdjustParamField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "CombProductID", myreq.CombProductID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRCAMSShortOptAdjustParam(&myreq, reqid);
 	return i;
 };
@@ -12588,6 +14301,7 @@ int TdApi::reqQryRCAMSInvestorCombPosition(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "CombInstrumentID", myreq.CombInstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRCAMSInvestorCombPosition(&myreq, reqid);
 	return i;
 };
@@ -12600,6 +14314,7 @@ int TdApi::reqQryInvestorProdRCAMSMargin(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "CombProductID", myreq.CombProductID);
 	getString(req, "ProductGroupID", myreq.ProductGroupID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorProdRCAMSMargin(&myreq, reqid);
 	return i;
 };
@@ -12610,6 +14325,7 @@ int TdApi::reqQryRULEInstrParameter(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRULEInstrParameter(&myreq, reqid);
 	return i;
 };
@@ -12620,6 +14336,7 @@ int TdApi::reqQryRULEIntraParameter(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "ProdFamilyCode", myreq.ProdFamilyCode);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRULEIntraParameter(&myreq, reqid);
 	return i;
 };
@@ -12632,6 +14349,7 @@ int TdApi::reqQryRULEInterParameter(const dict &req, int reqid)
 	getString(req, "Leg1ProdFamilyCode", myreq.Leg1ProdFamilyCode);
 	getString(req, "Leg2ProdFamilyCode", myreq.Leg2ProdFamilyCode);
 	getInt(req, "CommodityGroupID", &myreq.CommodityGroupID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRULEInterParameter(&myreq, reqid);
 	return i;
 };
@@ -12645,6 +14363,7 @@ int TdApi::reqQryInvestorProdRULEMargin(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "ProdFamilyCode", myreq.ProdFamilyCode);
 	getInt(req, "CommodityGroupID", &myreq.CommodityGroupID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorProdRULEMargin(&myreq, reqid);
 	return i;
 };
@@ -12656,6 +14375,7 @@ int TdApi::reqQryInvestorPortfSetting(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorPortfSetting(&myreq, reqid);
 	return i;
 };
@@ -12667,6 +14387,7 @@ int TdApi::reqQryInvestorInfoCommRec(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "BrokerID", myreq.BrokerID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorInfoCommRec(&myreq, reqid);
 	return i;
 };
@@ -12676,6 +14397,7 @@ int TdApi::reqQryCombLeg(const dict &req, int reqid)
 	CThostFtdcQryCombLegField myreq = CThostFtdcQryCombLegField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "LegInstrumentID", myreq.LegInstrumentID);
+	gil_scoped_release release;
 	int i = this->api->ReqQryCombLeg(&myreq, reqid);
 	return i;
 };
@@ -12697,6 +14419,7 @@ int TdApi::reqOffsetSetting(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqOffsetSetting(&myreq, reqid);
 	return i;
 };
@@ -12718,6 +14441,7 @@ int TdApi::reqCancelOffsetSetting(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	gil_scoped_release release;
 	int i = this->api->ReqCancelOffsetSetting(&myreq, reqid);
 	return i;
 };
@@ -12730,10 +14454,332 @@ int TdApi::reqQryOffsetSetting(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "ProductID", myreq.ProductID);
 	getChar(req, "OffsetType", &myreq.OffsetType);
+	gil_scoped_release release;
 	int i = this->api->ReqQryOffsetSetting(&myreq, reqid);
 	return i;
 };
 
+///-------------------------------------------------------------------------------------
+///չ
+///-------------------------------------------------------------------------------------
+
+int TdApi::setRingQueue(int capacity)
+{
+	if (capacity < 0 || capacity > RING_QUEUE_MAX_CAPACITY)
+	{
+		throw value_error("capacity must be between 0 and " + to_string(RING_QUEUE_MAX_CAPACITY));
+	}
+	if (this->active)
+	{
+		return -1;
+	}
+	this->task_queue.set_ring(capacity);
+	return 0;
+};
+
+void TdApi::setInvalidAsNan(bool enabled)
+{
+	this->invalid_as_nan = enabled;
+};
+
+void TdApi::setFieldSelection(string structName, const list &fields)
+{
+	//ֶʱתΪţʱֻתѡеֶΣֶΪʱָתȫֶ
+	for (int n = 0; n < SELECTABLE_STRUCT_COUNT; n++)
+	{
+		const FieldTable &table = SELECTABLE_STRUCTS[n];
+		if (structName != table.name)
+		{
+			continue;
+		}
+
+		vector<int> selected;
+		for (const handle &item : fields)
+		{
+			string field = item.cast<string>();
+			int index = 0;
+			while (index < table.count && field != table.fields[index])
+			{
+				index++;
+			}
+			if (index == table.count)
+			{
+				throw value_error("unknown field: " + field);
+			}
+			selected.push_back(index);
+		}
+		this->field_selection.set(n, selected);
+		return;
+	}
+	throw value_error("unsupported struct: " + structName);
+};
+
+dict TdApi::getQueueStats()
+{
+	const QueueStats &stats = this->task_queue.stats();
+	uint64_t pushed = stats.pushed.load(memory_order_relaxed);
+	uint64_t popped = stats.popped.load(memory_order_relaxed);
+
+	//صͳƣֻ
+	dict enqueued;
+	dict dispatched;
+	dict dropped;
+	for (int n = 0; n < TASK_NAME_COUNT && n < QUEUE_STATS_TYPES; n++)
+	{
+		if (uint64_t count = stats.enqueued[n].load(memory_order_relaxed))
+			enqueued[TASK_NAMES[n]] = count;
+		if (uint64_t count = stats.dispatched[n].load(memory_order_relaxed))
+			dispatched[TASK_NAMES[n]] = count;
+		if (uint64_t count = stats.dropped[n].load(memory_order_relaxed))
+			dropped[TASK_NAMES[n]] = count;
+	}
+
+	//ͣʱֱͼ0ΪС1΢룬iΪ[2^(i-1), 2^i)΢
+	list dwell;
+	for (int n = 0; n < QUEUE_STATS_BUCKETS; n++)
+	{
+		dwell.append(stats.dwell[n].load(memory_order_relaxed));
+	}
+
+	dict data;
+	data["depth"] = pushed > popped ? pushed - popped : 0;
+	data["high_water"] = stats.high_water.load(memory_order_relaxed);
+	data["enqueued"] = enqueued;
+	data["dispatched"] = dispatched;
+	data["dropped"] = dropped;
+	data["dwell_us"] = dwell;
+	return data;
+};
+
+int TdApi::reqOrderInsertFast(const OrderTemplate &order, const string &instrumentId, char direction, char offset, double price, int volume, const string &orderRef, int reqid)
+{
+	//ģΪֻǱ仯ֶΣȡֵ䣬ʱͷGIL
+	CThostFtdcInputOrderField myreq = order.data;
+	copyString(myreq.InstrumentID, instrumentId);
+	myreq.Direction = direction;
+	myreq.CombOffsetFlag[0] = offset;
+	myreq.CombOffsetFlag[1] = '\0';
+	myreq.LimitPrice = price;
+	myreq.VolumeTotalOriginal = volume;
+	copyString(myreq.OrderRef, orderRef);
+	int i = this->api->ReqOrderInsert(&myreq, reqid);
+	return i;
+};
+
+list TdApi::reqOrderInsertBatch(const list &orders, int start_reqid)
+{
+	//GILʱתȫίУֵ֧OrderTemplateתʧ
+	vector<CThostFtdcInputOrderField> reqs;
+	reqs.reserve(orders.size());
+	for (const auto &item : orders)
+	{
+		if (isinstance<OrderTemplate>(item))
+		{
+			reqs.push_back(item.cast<const OrderTemplate &>().data);
+		}
+		else
+		{
+			reqs.push_back(OrderTemplate(item.cast<dict>()).data);
+		}
+	}
+
+	//ͷGILͣŴstart_reqidʼεÿίеķֵ
+	vector<int> codes(reqs.size());
+	{
+		gil_scoped_release release;
+		for (size_t n = 0; n < reqs.size(); n++)
+		{
+			codes[n] = this->api->ReqOrderInsert(&reqs[n], start_reqid + (int)n);
+		}
+	}
+
+	list result;
+	for (int code : codes)
+	{
+		result.append(code);
+	}
+	return result;
+};
+
+bool TdApi::storeRspUserLogin(CThostFtdcRspUserLoginField *pRspUserLogin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast, int64_t recv_time, int64_t recv_wall_time)
+{
+	//¼ỰǰñźͻỰţܾı¼Դ˵Ǽǵίб
+	if (!pRspInfo || pRspInfo->ErrorID == 0)
+	{
+		this->front_id = pRspUserLogin->FrontID;
+		this->session_id = pRspUserLogin->SessionID;
+	}
+	return true;
+};
+
+bool TdApi::storeRspOrderInsert(CThostFtdcInputOrderField *pInputOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast, int64_t recv_time, int64_t recv_wall_time)
+{
+	//ӦֻĻỰ԰Ự¼
+	if (pRspInfo && pRspInfo->ErrorID != 0)
+	{
+		this->order_book.updateInputError(*pInputOrder, this->front_id, this->session_id, *pRspInfo, recv_time, recv_wall_time, true);
+	}
+	return true;
+};
+
+bool TdApi::storeErrRtnOrderInsert(CThostFtdcInputOrderField *pInputOrder, CThostFtdcRspInfoField *pRspInfo, int64_t recv_time, int64_t recv_wall_time)
+{
+	//˽شʱյ֮ǰỰĴر޷ȷỰֻ±ỰѼ¼ί
+	if (pRspInfo && pRspInfo->ErrorID != 0)
+	{
+		this->order_book.updateInputError(*pInputOrder, this->front_id, this->session_id, *pRspInfo, recv_time, recv_wall_time, false);
+	}
+	return true;
+};
+
+bool TdApi::storeRtnOrder(CThostFtdcOrderField *pOrder, int64_t recv_time, int64_t recv_wall_time)
+{
+	this->order_book.updateOrder(*pOrder, recv_time, recv_wall_time);
+	return true;
+};
+
+bool TdApi::storeRtnTrade(CThostFtdcTradeField *pTrade, int64_t recv_time, int64_t recv_wall_time)
+{
+	this->order_book.updateTrade(*pTrade);
+	return true;
+};
+
+dict TdApi::convertOrderEntry(const OrderEntry &item)
+{
+	//ί͵ĸʽתӳɽرۼƵͱ¼Ĵ
+	Task task = Task();
+	task.task_name = ONRTNORDER;
+	task.task_time = item.time;
+	task.task_wall_time = item.wall_time;
+	CThostFtdcOrderField order = item.order;
+	task.task_data = &order;
+
+	dict data = this->convertRtnOrder(&task);
+	data["_traded_volume"] = item.traded_volume;
+	data["_traded_turnover"] = item.traded_turnover;
+	data["_error_id"] = item.error_id;
+	return data;
+};
+
+object TdApi::getOrder(int frontId, int sessionId, string orderRef)
+{
+	OrderEntry item;
+	if (!this->order_book.findSession(frontId, sessionId, orderRef, item))
+	{
+		return none();
+	}
+	return this->convertOrderEntry(item);
+};
+
+object TdApi::getOrderBySysId(string exchangeId, string orderSysId)
+{
+	OrderEntry item;
+	if (!this->order_book.findExchange(exchangeId, orderSysId, item))
+	{
+		return none();
+	}
+	return this->convertOrderEntry(item);
+};
+
+list TdApi::getOrders(string instrumentId, bool activeOnly)
+{
+	vector<OrderEntry> items;
+	this->order_book.select(instrumentId, activeOnly, items);
+
+	list data;
+	for (const OrderEntry &item : items)
+	{
+		data.append(this->convertOrderEntry(item));
+	}
+	return data;
+};
+
+dict TdApi::getTradeSummary(string instrumentId)
+{
+	TradeSummary summary = this->order_book.summary(instrumentId);
+
+	dict data;
+	data["BuyVolume"] = summary.buy_volume;
+	data["BuyTurnover"] = summary.buy_turnover;
+	data["SellVolume"] = summary.sell_volume;
+	data["SellTurnover"] = summary.sell_turnover;
+	data["TradeCount"] = summary.trade_count;
+	return data;
+};
+
+void TdApi::clearOrders()
+{
+	this->order_book.clear();
+};
+
+list TdApi::cancelAll(const dict &filter, int start_reqid)
+{
+	//GILʱȡɸѡΪίֶδֶβɸѡ
+	string instrument_id;
+	string exchange_id;
+	string business_unit;
+	char direction = 0;
+	for (const auto &item : filter)
+	{
+		string key = item.first.cast<string>();
+		string value = item.second.cast<string>();
+		if (key == "InstrumentID")
+			instrument_id = value;
+		else if (key == "ExchangeID")
+			exchange_id = value;
+		else if (key == "BusinessUnit")
+			business_unit = value;
+		else if (key == "Direction")
+			direction = value.empty() ? 0 : value[0];
+		else
+			throw value_error("unsupported filter: " + key);
+	}
+
+	//ͷGILίбȡɳίУֱдͣŴstart_reqidʼε
+	vector<OrderEntry> items;
+	vector<pair<const CThostFtdcOrderField*, int>> results;
+	{
+		gil_scoped_release release;
+		this->order_book.select(instrument_id, true, items);
+
+		int reqid = start_reqid;
+		for (const OrderEntry &item : items)
+		{
+			const CThostFtdcOrderField &order = item.order;
+			if (!exchange_id.empty() && exchange_id != string_view(order.ExchangeID, strnlen(order.ExchangeID, sizeof(order.ExchangeID))))
+				continue;
+			if (!business_unit.empty() && business_unit != string_view(order.BusinessUnit, strnlen(order.BusinessUnit, sizeof(order.BusinessUnit))))
+				continue;
+			if (direction && direction != order.Direction)
+				continue;
+
+			CThostFtdcInputOrderActionField myreq = CThostFtdcInputOrderActionField();
+			memset(&myreq, 0, sizeof(myreq));
+			memcpy(myreq.BrokerID, order.BrokerID, sizeof(myreq.BrokerID));
+			memcpy(myreq.InvestorID, order.InvestorID, sizeof(myreq.InvestorID));
+			memcpy(myreq.UserID, order.UserID, sizeof(myreq.UserID));
+			memcpy(myreq.InvestUnitID, order.InvestUnitID, sizeof(myreq.InvestUnitID));
+			memcpy(myreq.InstrumentID, order.InstrumentID, sizeof(myreq.InstrumentID));
+			memcpy(myreq.ExchangeID, order.ExchangeID, sizeof(myreq.ExchangeID));
+			memcpy(myreq.OrderSysID, order.OrderSysID, sizeof(myreq.OrderSysID));
+			memcpy(myreq.OrderRef, order.OrderRef, sizeof(myreq.OrderRef));
+			myreq.FrontID = order.FrontID;
+			myreq.SessionID = order.SessionID;
+			myreq.ActionFlag = THOST_FTDC_AF_Delete;
+			results.emplace_back(&order, this->api->ReqOrderAction(&myreq, reqid++));
+		}
+	}
+
+	//˳򷵻(FrontID, SessionID, OrderRef, ֵ)ֵΪ0ĳ·
+	list data;
+	for (const auto &result : results)
+	{
+		const CThostFtdcOrderField &order = *result.first;
+		data.append(pybind11::make_tuple(order.FrontID, order.SessionID, toUtf(order.OrderRef), result.second));
+	}
+	return data;
+};
+
 
 ///-------------------------------------------------------------------------------------
 ///pybind11װ
@@ -14854,6 +16900,18 @@ PYBIND11_MODULE(ctptd, m)
 		.def("reqOffsetSetting", &TdApi::reqOffsetSetting)
 		.def("reqCancelOffsetSetting", &TdApi::reqCancelOffsetSetting)
 		.def("reqQryOffsetSetting", &TdApi::reqQryOffsetSetting)
+		.def("setRingQueue", &TdApi::setRingQueue)
+		.def("setInvalidAsNan", &TdApi::setInvalidAsNan)
+		.def("setFieldSelection", &TdApi::setFieldSelection)
+		.def("getQueueStats", &TdApi::getQueueStats)
+		.def("reqOrderInsertFast", &TdApi::reqOrderInsertFast, call_guard<gil_scoped_release>())
+		.def("reqOrderInsertBatch", &TdApi::reqOrderInsertBatch)
+		.def("getOrder", &TdApi::getOrder)
+		.def("getOrderBySysId", &TdApi::getOrderBySysId)
+		.def("getOrders", &TdApi::getOrders)
+		.def("getTradeSummary", &TdApi::getTradeSummary)
+		.def("clearOrders", &TdApi::clearOrders)
+		.def("cancelAll", &TdApi::cancelAll)
 
 		.def("onFrontConnected", &TdApi::onFrontConnected)
 		.def("onFrontDisconnected", &TdApi::onFrontDisconnected)
@@ -15020,4 +17078,42 @@ PYBIND11_MODULE(ctptd, m)
 		.def("onErrRtnCancelOffsetSetting", &TdApi::onErrRtnCancelOffsetSetting)
 		.def("onRspQryOffsetSetting", &TdApi::onRspQryOffsetSetting)
 		;
+
+	class_<OrderTemplate>(m, "OrderTemplate", module_local())
+		.def(init<const dict &>())
+		.def_property_readonly("BrokerID", [](const OrderTemplate &self) { return toUtf(self.data.BrokerID); })
+		.def_property_readonly("InvestorID", [](const OrderTemplate &self) { return toUtf(self.data.InvestorID); })
+		.def_property_readonly("reserve1", [](const OrderTemplate &self) { return toUtf(self.data.reserve1); })
+		.def_property_readonly("OrderRef", [](const OrderTemplate &self) { return toUtf(self.data.OrderRef); })
+		.def_property_readonly("UserID", [](const OrderTemplate &self) { return toUtf(self.data.UserID); })
+		.def_property_readonly("OrderPriceType", [](const OrderTemplate &self) { return self.data.OrderPriceType; })
+		.def_property_readonly("Direction", [](const OrderTemplate &self) { return self.data.Direction; })
+		.def_property_readonly("CombOffsetFlag", [](const OrderTemplate &self) { return toUtf(self.data.CombOffsetFlag); })
+		.def_property_readonly("CombHedgeFlag", [](const OrderTemplate &self) { return toUtf(self.data.CombHedgeFlag); })
+		.def_property_readonly("LimitPrice", [](const OrderTemplate &self) { return self.data.LimitPrice; })
+		.def_property_readonly("VolumeTotalOriginal", [](const OrderTemplate &self) { return self.data.VolumeTotalOriginal; })
+		.def_property_readonly("TimeCondition", [](const OrderTemplate &self) { return self.data.TimeCondition; })
+		.def_property_readonly("GTDDate", [](const OrderTemplate &self) { return toUtf(self.data.GTDDate); })
+		.def_property_readonly("VolumeCondition", [](const OrderTemplate &self) { return self.data.VolumeCondition; })
+		.def_property_readonly("MinVolume", [](const OrderTemplate &self) { return self.data.MinVolume; })
+		.def_property_readonly("ContingentCondition", [](const OrderTemplate &self) { return self.data.ContingentCondition; })
+		.def_property_readonly("StopPrice", [](const OrderTemplate &self) { return self.data.StopPrice; })
+		.def_property_readonly("ForceCloseReason", [](const OrderTemplate &self) { return self.data.ForceCloseReason; })
+		.def_property_readonly("IsAutoSuspend", [](const OrderTemplate &self) { return self.data.IsAutoSuspend; })
+		.def_property_readonly("BusinessUnit", [](const OrderTemplate &self) { return toUtf(self.data.BusinessUnit); })
+		.def_property_readonly("RequestID", [](const OrderTemplate &self) { return self.data.RequestID; })
+		.def_property_readonly("UserForceClose", [](const OrderTemplate &self) { return self.data.UserForceClose; })
+		.def_property_readonly("IsSwapOrder", [](const OrderTemplate &self) { return self.data.IsSwapOrder; })
+		.def_property_readonly("ExchangeID", [](const OrderTemplate &self) { return toUtf(self.data.ExchangeID); })
+		.def_property_readonly("InvestUnitID", [](const OrderTemplate &self) { return toUtf(self.data.InvestUnitID); })
+		.def_property_readonly("AccountID", [](const OrderTemplate &self) { return toUtf(self.data.AccountID); })
+		.def_property_readonly("CurrencyID", [](const OrderTemplate &self) { return toUtf(self.data.CurrencyID); })
+		.def_property_readonly("ClientID", [](const OrderTemplate &self) { return toUtf(self.data.ClientID); })
+		.def_property_readonly("reserve2", [](const OrderTemplate &self) { return toUtf(self.data.reserve2); })
+		.def_property_readonly("MacAddress", [](const OrderTemplate &self) { return toUtf(self.data.MacAddress); })
+		.def_property_readonly("InstrumentID", [](const OrderTemplate &self) { return toUtf(self.data.InstrumentID); })
+		.def_property_readonly("IPAddress", [](const OrderTemplate &self) { return toUtf(self.data.IPAddress); })
+		.def_property_readonly("OrderMemo", [](const OrderTemplate &self) { return toUtf(self.data.OrderMemo); })
+		.def_property_readonly("SessionReqSeq", [](const OrderTemplate &self) { return self.data.SessionReqSeq; })
+		;
 }
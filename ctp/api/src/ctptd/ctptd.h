@@ -175,6 +175,609 @@ using namespace pybind11;
 #define ONERRRTNCANCELOFFSETSETTING 162
 #define ONRSPQRYOFFSETSETTING 163
 
+#define TASK_NAME_COUNT 164
+
+static const char *TASK_NAMES[TASK_NAME_COUNT] = {
+	"onFrontConnected",
+	"onFrontDisconnected",
+	"onHeartBeatWarning",
+	"onRspAuthenticate",
+	"onRspUserLogin",
+	"onRspUserLogout",
+	"onRspUserPasswordUpdate",
+	"onRspTradingAccountPasswordUpdate",
+	"onRspUserAuthMethod",
+	"onRspGenUserCaptcha",
+	"onRspGenUserText",
+	"onRspOrderInsert",
+	"onRspParkedOrderInsert",
+	"onRspParkedOrderAction",
+	"onRspOrderAction",
+	"onRspQryMaxOrderVolume",
+	"onRspSettlementInfoConfirm",
+	"onRspRemoveParkedOrder",
+	"onRspRemoveParkedOrderAction",
+	"onRspExecOrderInsert",
+	"onRspExecOrderAction",
+	"onRspForQuoteInsert",
+	"onRspQuoteInsert",
+	"onRspQuoteAction",
+	"onRspBatchOrderAction",
+	"onRspOptionSelfCloseInsert",
+	"onRspOptionSelfCloseAction",
+	"onRspCombActionInsert",
+	"onRspQryOrder",
+	"onRspQryTrade",
+	"onRspQryInvestorPosition",
+	"onRspQryTradingAccount",
+	"onRspQryInvestor",
+	"onRspQryTradingCode",
+	"onRspQryInstrumentMarginRate",
+	"onRspQryInstrumentCommissionRate",
+	"onRspQryUserSession",
+	"onRspQryExchange",
+	"onRspQryProduct",
+	"onRspQryInstrument",
+	"onRspQryDepthMarketData",
+	"onRspQryTraderOffer",
+	"onRspQrySettlementInfo",
+	"onRspQryTransferBank",
+	"onRspQryInvestorPositionDetail",
+	"onRspQryNotice",
+	"onRspQrySettlementInfoConfirm",
+	"onRspQryInvestorPositionCombineDetail",
+	"onRspQryCFMMCTradingAccountKey",
+	"onRspQryEWarrantOffset",
+	"onRspQryInvestorProductGroupMargin",
+	"onRspQryExchangeMarginRate",
+	"onRspQryExchangeMarginRateAdjust",
+	"onRspQryExchangeRate",
+	"onRspQrySecAgentACIDMap",
+	"onRspQryProductExchRate",
+	"onRspQryProductGroup",
+	"onRspQryMMInstrumentCommissionRate",
+	"onRspQryMMOptionInstrCommRate",
+	"onRspQryInstrumentOrderCommRate",
+	"onRspQrySecAgentTradingAccount",
+	"onRspQrySecAgentCheckMode",
+	"onRspQrySecAgentTradeInfo",
+	"onRspQryOptionInstrTradeCost",
+	"onRspQryOptionInstrCommRate",
+	"onRspQryExecOrder",
+	"onRspQryForQuote",
+	"onRspQryQuote",
+	"onRspQryOptionSelfClose",
+	"onRspQryInvestUnit",
+	"onRspQryCombInstrumentGuard",
+	"onRspQryCombAction",
+	"onRspQryTransferSerial",
+	"onRspQryAccountregister",
+	"onRspError",
+	"onRtnOrder",
+	"onRtnTrade",
+	"onErrRtnOrderInsert",
+	"onErrRtnOrderAction",
+	"onRtnInstrumentStatus",
+	"onRtnBulletin",
+	"onRtnTradingNotice",
+	"onRtnErrorConditionalOrder",
+	"onRtnExecOrder",
+	"onErrRtnExecOrderInsert",
+	"onErrRtnExecOrderAction",
+	"onErrRtnForQuoteInsert",
+	"onRtnQuote",
+	"onErrRtnQuoteInsert",
+	"onErrRtnQuoteAction",
+	"onRtnForQuoteRsp",
+	"onRtnCFMMCTradingAccountToken",
+	"onErrRtnBatchOrderAction",
+	"onRtnOptionSelfClose",
+	"onErrRtnOptionSelfCloseInsert",
+	"onErrRtnOptionSelfCloseAction",
+	"onRtnCombAction",
+	"onErrRtnCombActionInsert",
+	"onRspQryContractBank",
+	"onRspQryParkedOrder",
+	"onRspQryParkedOrderAction",
+	"onRspQryTradingNotice",
+	"onRspQryBrokerTradingParams",
+	"onRspQryBrokerTradingAlgos",
+	"onRspQueryCFMMCTradingAccountToken",
+	"onRtnFromBankToFutureByBank",
+	"onRtnFromFutureToBankByBank",
+	"onRtnRepealFromBankToFutureByBank",
+	"onRtnRepealFromFutureToBankByBank",
+	"onRtnFromBankToFutureByFuture",
+	"onRtnFromFutureToBankByFuture",
+	"onRtnRepealFromBankToFutureByFutureManual",
+	"onRtnRepealFromFutureToBankByFutureManual",
+	"onRtnQueryBankBalanceByFuture",
+	"onErrRtnBankToFutureByFuture",
+	"onErrRtnFutureToBankByFuture",
+	"onErrRtnRepealBankToFutureByFutureManual",
+	"onErrRtnRepealFutureToBankByFutureManual",
+	"onErrRtnQueryBankBalanceByFuture",
+	"onRtnRepealFromBankToFutureByFuture",
+	"onRtnRepealFromFutureToBankByFuture",
+	"onRspFromBankToFutureByFuture",
+	"onRspFromFutureToBankByFuture",
+	"onRspQueryBankAccountMoneyByFuture",
+	"onRtnOpenAccountByBank",
+	"onRtnCancelAccountByBank",
+	"onRtnChangeAccountByBank",
+	"onRspQryClassifiedInstrument",
+	"onRspQryCombPromotionParam",
+	"onRspQryRiskSettleInvstPosition",
+	"onRspQryRiskSettleProductStatus",
+	"onRspQrySPBMFutureParameter",
+	"onRspQrySPBMOptionParameter",
+	"onRspQrySPBMIntraParameter",
+	"onRspQrySPBMInterParameter",
+	"onRspQrySPBMPortfDefinition",
+	"onRspQrySPBMInvestorPortfDef",
+	"onRspQryInvestorPortfMarginRatio",
+	"onRspQryInvestorProdSPBMDetail",
+	"onRspQryInvestorCommoditySPMMMargin",
+	"onRspQryInvestorCommodityGroupSPMMMargin",
+	"onRspQrySPMMInstParam",
+	"onRspQrySPMMProductParam",
+	"onRspQrySPBMAddOnInterParameter",
+	"onRspQryRCAMSCombProductInfo",
+	"onRspQryRCAMSInstrParameter",
+	"onRspQryRCAMSIntraParameter",
+	"onRspQryRCAMSInterParameter",
+	"onRspQryRCAMSShortOptAdjustParam",
+	"onRspQryRCAMSInvestorCombPosition",
+	"onRspQryInvestorProdRCAMSMargin",
+	"onRspQryRULEInstrParameter",
+	"onRspQryRULEIntraParameter",
+	"onRspQryRULEInterParameter",
+	"onRspQryInvestorProdRULEMargin",
+	"onRspQryInvestorPortfSetting",
+	"onRspQryInvestorInfoCommRec",
+	"onRspQryCombLeg",
+	"onRspOffsetSetting",
+	"onRspCancelOffsetSetting",
+	"onRtnOffsetSetting",
+	"onErrRtnOffsetSetting",
+	"onErrRtnCancelOffsetSetting",
+	"onRspQryOffsetSetting",
+};
+
+#define SELECTABLE_STRUCT_COUNT 2
+#define FIELDS_ORDER 0
+#define FIELDS_TRADE 1
+
+static const char *const ORDER_FIELD_NAMES[] = {
+	"BrokerID",
+	"InvestorID",
+	"reserve1",
+	"OrderRef",
+	"UserID",
+	"OrderPriceType",
+	"Direction",
+	"CombOffsetFlag",
+	"CombHedgeFlag",
+	"LimitPrice",
+	"VolumeTotalOriginal",
+	"TimeCondition",
+	"GTDDate",
+	"VolumeCondition",
+	"MinVolume",
+	"ContingentCondition",
+	"StopPrice",
+	"ForceCloseReason",
+	"IsAutoSuspend",
+	"BusinessUnit",
+	"RequestID",
+	"OrderLocalID",
+	"ExchangeID",
+	"ParticipantID",
+	"ClientID",
+	"reserve2",
+	"TraderID",
+	"InstallID",
+	"OrderSubmitStatus",
+	"NotifySequence",
+	"TradingDay",
+	"SettlementID",
+	"OrderSysID",
+	"OrderSource",
+	"OrderStatus",
+	"OrderType",
+	"VolumeTraded",
+	"VolumeTotal",
+	"InsertDate",
+	"InsertTime",
+	"ActiveTime",
+	"SuspendTime",
+	"UpdateTime",
+	"CancelTime",
+	"ActiveTraderID",
+	"ClearingPartID",
+	"SequenceNo",
+	"FrontID",
+	"SessionID",
+	"UserProductInfo",
+	"StatusMsg",
+	"UserForceClose",
+	"ActiveUserID",
+	"BrokerOrderSeq",
+	"RelativeOrderSysID",
+	"ZCETotalTradedVolume",
+	"IsSwapOrder",
+	"BranchID",
+	"InvestUnitID",
+	"AccountID",
+	"CurrencyID",
+	"reserve3",
+	"MacAddress",
+	"InstrumentID",
+	"ExchangeInstID",
+	"IPAddress",
+	"OrderMemo",
+	"SessionReqSeq",
+};
+
+static const char *const TRADE_FIELD_NAMES[] = {
+	"BrokerID",
+	"InvestorID",
+	"reserve1",
+	"OrderRef",
+	"UserID",
+	"ExchangeID",
+	"TradeID",
+	"Direction",
+	"OrderSysID",
+	"ParticipantID",
+	"ClientID",
+	"TradingRole",
+	"reserve2",
+	"OffsetFlag",
+	"HedgeFlag",
+	"Price",
+	"Volume",
+	"TradeDate",
+	"TradeTime",
+	"TradeType",
+	"PriceSource",
+	"TraderID",
+	"OrderLocalID",
+	"ClearingPartID",
+	"BusinessUnit",
+	"SequenceNo",
+	"TradingDay",
+	"SettlementID",
+	"BrokerOrderSeq",
+	"TradeSource",
+	"InvestUnitID",
+	"InstrumentID",
+	"ExchangeInstID",
+};
+
+static const FieldTable SELECTABLE_STRUCTS[SELECTABLE_STRUCT_COUNT] = {
+	{"Order", ORDER_FIELD_NAMES, 68},
+	{"Trade", TRADE_FIELD_NAMES, 33},
+};
+
+//OrderTemplateCThostFtdcInputOrderFieldģ壬ʱֵȡȫֶΣʱƺֻǱ仯ֶ
+class OrderTemplate
+{
+public:
+	CThostFtdcInputOrderField data;
+
+	OrderTemplate(const dict &req)
+	{
+		memset(&this->data, 0, sizeof(this->data));
+		getString(req, "BrokerID", this->data.BrokerID);
+		getString(req, "InvestorID", this->data.InvestorID);
+		getString(req, "reserve1", this->data.reserve1);
+		getString(req, "OrderRef", this->data.OrderRef);
+		getString(req, "UserID", this->data.UserID);
+		getChar(req, "OrderPriceType", &this->data.OrderPriceType);
+		getChar(req, "Direction", &this->data.Direction);
+		getString(req, "CombOffsetFlag", this->data.CombOffsetFlag);
+		getString(req, "CombHedgeFlag", this->data.CombHedgeFlag);
+		getDouble(req, "LimitPrice", &this->data.LimitPrice);
+		getInt(req, "VolumeTotalOriginal", &this->data.VolumeTotalOriginal);
+		getChar(req, "TimeCondition", &this->data.TimeCondition);
+		getString(req, "GTDDate", this->data.GTDDate);
+		getChar(req, "VolumeCondition", &this->data.VolumeCondition);
+		getInt(req, "MinVolume", &this->data.MinVolume);
+		getChar(req, "ContingentCondition", &this->data.ContingentCondition);
+		getDouble(req, "StopPrice", &this->data.StopPrice);
+		getChar(req, "ForceCloseReason", &this->data.ForceCloseReason);
+		getInt(req, "IsAutoSuspend", &this->data.IsAutoSuspend);
+		getString(req, "BusinessUnit", this->data.BusinessUnit);
+		getInt(req, "RequestID", &this->data.RequestID);
+		getInt(req, "UserForceClose", &this->data.UserForceClose);
+		getInt(req, "IsSwapOrder", &this->data.IsSwapOrder);
+		getString(req, "ExchangeID", this->data.ExchangeID);
+		getString(req, "InvestUnitID", this->data.InvestUnitID);
+		getString(req, "AccountID", this->data.AccountID);
+		getString(req, "CurrencyID", this->data.CurrencyID);
+		getString(req, "ClientID", this->data.ClientID);
+		getString(req, "reserve2", this->data.reserve2);
+		getString(req, "MacAddress", this->data.MacAddress);
+		getString(req, "InstrumentID", this->data.InstrumentID);
+		getString(req, "IPAddress", this->data.IPAddress);
+		getString(req, "OrderMemo", this->data.OrderMemo);
+		getInt(req, "SessionReqSeq", &this->data.SessionReqSeq);
+	};
+};
+
+
+//ίбеһίУɽͽɳɽرۼ
+struct OrderEntry
+{
+	CThostFtdcOrderField order;		//µίлر¼뱻ܾʱ¼
+	int64_t time = 0;				//ʱ䣬steady_clock
+	int64_t wall_time = 0;			//ʱ䣬ϵͳʱ
+	int traded_volume = 0;			//ɽرۼƵĳɽ
+	double traded_turnover = 0;		//ɽرۼƵĳɽ۸*
+	int error_id = 0;				//¼Ĵ
+};
+
+
+//Լĳɽ
+struct TradeSummary
+{
+	int buy_volume = 0;				//ɽ
+	double buy_turnover = 0;		//ɽ۸*
+	int sell_volume = 0;			//ɽ
+	double sell_turnover = 0;		//ɽ۸*
+	int trade_count = 0;			//ɽ
+};
+
+
+//ίбڻص߳ίСɽͱ¼ر£ɰỰŲѯ
+class OrderBook
+{
+private:
+	mutex mutex_;
+	deque<OrderEntry> entries_;								//ίд洢
+	unordered_map<string, size_t> session_index_;			//FrontID|SessionID|OrderRefίλõӳ
+	unordered_map<string, size_t> exchange_index_;			//ExchangeID|OrderSysIDίλõӳ
+	unordered_map<string, pair<int, double>> pending_trades_;	//ίлرĳɽͽݴ
+	unordered_set<string> trade_ids_;						//ۼƵĳɽظʱ
+	unordered_map<string, TradeSummary> summaries_;			//Լĳɽ
+
+	//ȥβոOrderRefOrderSysIDͨΪҶĶַ
+	static string_view trim(string_view view)
+	{
+		size_t begin = view.find_first_not_of(' ');
+		if (begin == string_view::npos)
+			return string_view();
+		size_t end = view.find_last_not_of(' ');
+		return view.substr(begin, end - begin + 1);
+	}
+
+	template <size_t size>
+	static string_view trim(const char (&value)[size])
+	{
+		return trim(string_view(value, strnlen(value, size)));
+	}
+
+	static string sessionKey(int front_id, int session_id, string_view order_ref)
+	{
+		return to_string(front_id) + "|" + to_string(session_id) + "|" + string(order_ref);
+	}
+
+	static string exchangeKey(string_view exchange_id, string_view order_sys_id)
+	{
+		return string(exchange_id) + "|" + string(order_sys_id);
+	}
+
+	//ỰŲίУʱ½
+	OrderEntry &entry(const string &key)
+	{
+		auto it = session_index_.find(key);
+		if (it != session_index_.end())
+		{
+			return entries_[it->second];
+		}
+		entries_.emplace_back();
+		memset(&entries_.back().order, 0, sizeof(CThostFtdcOrderField));
+		session_index_.emplace(key, entries_.size() - 1);
+		return entries_.back();
+	}
+
+	static bool isActive(const CThostFtdcOrderField &order)
+	{
+		switch (order.OrderStatus)
+		{
+		case THOST_FTDC_OST_PartTradedQueueing:
+		case THOST_FTDC_OST_NoTradeQueueing:
+		case THOST_FTDC_OST_Unknown:
+		case THOST_FTDC_OST_NotTouched:
+		case THOST_FTDC_OST_Touched:
+			return true;
+		default:
+			return false;
+		}
+	}
+
+public:
+	//ίлرнźϲݴĳɽ
+	void updateOrder(const CThostFtdcOrderField &order, int64_t time, int64_t wall_time)
+	{
+		string key = sessionKey(order.FrontID, order.SessionID, trim(order.OrderRef));
+		string_view order_sys_id = trim(order.OrderSysID);
+
+		lock_guard<mutex> mlock(mutex_);
+		OrderEntry &item = this->entry(key);
+		item.order = order;
+		item.time = time;
+		item.wall_time = wall_time;
+
+		if (!order_sys_id.empty())
+		{
+			string exchange_key = exchangeKey(trim(order.ExchangeID), order_sys_id);
+			exchange_index_[exchange_key] = session_index_[key];
+
+			auto it = pending_trades_.find(exchange_key);
+			if (it != pending_trades_.end())
+			{
+				item.traded_volume += it->second.first;
+				item.traded_turnover += it->second.second;
+				pending_trades_.erase(it);
+			}
+		}
+	}
+
+	//ɽرۼƵίкͺԼ
+	void updateTrade(const CThostFtdcTradeField &trade)
+	{
+		string exchange_key = exchangeKey(trim(trade.ExchangeID), trim(trade.OrderSysID));
+		string trade_key = exchange_key + "|" + string(trim(trade.TradeID)) + "|" + trade.Direction;
+		double turnover = trade.Price * trade.Volume;
+
+		lock_guard<mutex> mlock(mutex_);
+		if (!trade_ids_.insert(trade_key).second)
+		{
+			return;
+		}
+
+		TradeSummary &summary = summaries_[string(trim(trade.InstrumentID))];
+		if (trade.Direction == THOST_FTDC_D_Buy)
+		{
+			summary.buy_volume += trade.Volume;
+			summary.buy_turnover += turnover;
+		}
+		else
+		{
+			summary.sell_volume += trade.Volume;
+			summary.sell_turnover += turnover;
+		}
+		summary.trade_count += 1;
+
+		auto it = exchange_index_.find(exchange_key);
+		if (it != exchange_index_.end())
+		{
+			OrderEntry &item = entries_[it->second];
+			item.traded_volume += trade.Volume;
+			item.traded_turnover += turnover;
+		}
+		else
+		{
+			pair<int, double> &pending = pending_trades_[exchange_key];
+			pending.first += trade.Volume;
+			pending.second += turnover;
+		}
+	}
+
+	//¼뱻ܾίδｻյίлر¼ֶμ¼Ϊѳ
+	//¼ûǰñźͻỰţcreateΪFalseʱֻ±ỰеίУ½¼
+	void updateInputError(const CThostFtdcInputOrderField &req, int front_id, int session_id, const CThostFtdcRspInfoField &error, int64_t time, int64_t wall_time, bool create)
+	{
+		string key = sessionKey(front_id, session_id, trim(req.OrderRef));
+
+		lock_guard<mutex> mlock(mutex_);
+		if (!create && session_index_.find(key) == session_index_.end())
+		{
+			return;
+		}
+		OrderEntry &item = this->entry(key);
+		CThostFtdcOrderField &order = item.order;
+		if (!item.time)
+		{
+			memcpy(order.BrokerID, req.BrokerID, sizeof(order.BrokerID));
+			memcpy(order.InvestorID, req.InvestorID, sizeof(order.InvestorID));
+			memcpy(order.InstrumentID, req.InstrumentID, sizeof(order.InstrumentID));
+			memcpy(order.ExchangeID, req.ExchangeID, sizeof(order.ExchangeID));
+			memcpy(order.OrderRef, req.OrderRef, sizeof(order.OrderRef));
+			memcpy(order.UserID, req.UserID, sizeof(order.UserID));
+			memcpy(order.CombOffsetFlag, req.CombOffsetFlag, sizeof(order.CombOffsetFlag));
+			memcpy(order.CombHedgeFlag, req.CombHedgeFlag, sizeof(order.CombHedgeFlag));
+			memcpy(order.InvestUnitID, req.InvestUnitID, sizeof(order.InvestUnitID));
+			order.OrderPriceType = req.OrderPriceType;
+			order.Direction = req.Direction;
+			order.LimitPrice = req.LimitPrice;
+			order.VolumeTotalOriginal = req.VolumeTotalOriginal;
+			order.TimeCondition = req.TimeCondition;
+			order.VolumeCondition = req.VolumeCondition;
+			order.RequestID = req.RequestID;
+			order.FrontID = front_id;
+			order.SessionID = session_id;
+			order.OrderSubmitStatus = THOST_FTDC_OSS_InsertRejected;
+			order.OrderStatus = THOST_FTDC_OST_Canceled;
+		}
+		memcpy(order.StatusMsg, error.ErrorMsg, sizeof(order.StatusMsg));
+		item.error_id = error.ErrorID;
+		item.time = time;
+		item.wall_time = wall_time;
+	}
+
+	bool findSession(int front_id, int session_id, const string &order_ref, OrderEntry &item)
+	{
+		string key = sessionKey(front_id, session_id, trim(order_ref));
+		lock_guard<mutex> mlock(mutex_);
+		auto it = session_index_.find(key);
+		if (it == session_index_.end())
+			return false;
+		item = entries_[it->second];
+		return true;
+	}
+
+	bool findExchange(const string &exchange_id, const string &order_sys_id, OrderEntry &item)
+	{
+		string key = exchangeKey(trim(exchange_id), trim(order_sys_id));
+		lock_guard<mutex> mlock(mutex_);
+		auto it = exchange_index_.find(key);
+		if (it == exchange_index_.end())
+			return false;
+		item = entries_[it->second];
+		return true;
+	}
+
+	//ԼɸѡίУԼΪʱɸѡactive_onlyΪtrueʱֻؿɳί
+	void select(const string &instrument_id, bool active_only, vector<OrderEntry> &items)
+	{
+		lock_guard<mutex> mlock(mutex_);
+		for (const OrderEntry &item : entries_)
+		{
+			if (active_only && !isActive(item.order))
+				continue;
+			if (!instrument_id.empty() && instrument_id != trim(item.order.InstrumentID))
+				continue;
+			items.push_back(item);
+		}
+	}
+
+	//ԼĳɽܣԼΪʱȫԼ
+	TradeSummary summary(const string &instrument_id)
+	{
+		lock_guard<mutex> mlock(mutex_);
+		if (!instrument_id.empty())
+		{
+			auto it = summaries_.find(instrument_id);
+			return it != summaries_.end() ? it->second : TradeSummary();
+		}
+
+		TradeSummary total;
+		for (const auto &item : summaries_)
+		{
+			total.buy_volume += item.second.buy_volume;
+			total.buy_turnover += item.second.buy_turnover;
+			total.sell_volume += item.second.sell_volume;
+			total.sell_turnover += item.second.sell_turnover;
+			total.trade_count += item.second.trade_count;
+		}
+		return total;
+	}
+
+	void clear()
+	{
+		lock_guard<mutex> mlock(mutex_);
+		entries_.clear();
+		session_index_.clear();
+		exchange_index_.clear();
+		pending_trades_.clear();
+		trade_ids_.clear();
+		summaries_.clear();
+	}
+};
+
 
 ///-------------------------------------------------------------------------------------
 ///C++ SPIĻصļ̳ʵ
@@ -188,6 +791,12 @@ private:
 	thread task_thread;					//ָ߳루pythonݣ
 	TaskQueue task_queue;				//
 	bool active = false;				//״̬
+	StringCache string_cache;			//ͻֶַεפ
+	bool invalid_as_nan = false;		//ǷЧļֵתΪNaN
+	FieldSelection field_selection;		//ṹõҪתֶ
+	OrderBook order_book;				//ίб
+	int front_id = 0;					//¼ɹǰñ
+	int session_id = 0;					//¼ɹĻỰ
 
 public:
 	TdApi()
@@ -691,6 +1300,8 @@ public:
 
 	void processRspError(Task *task);
 
+	dict convertRtnOrder(Task *task);
+
 	void processRtnOrder(Task *task);
 
 	void processRtnTrade(Task *task);
@@ -1480,4 +2091,44 @@ public:
 	int reqCancelOffsetSetting(const dict &req, int reqid);
 
 	int reqQryOffsetSetting(const dict &req, int reqid);
+
+	//-------------------------------------------------------------------------------------
+	//չ
+	//-------------------------------------------------------------------------------------
+
+	int setRingQueue(int capacity);
+
+	void setInvalidAsNan(bool enabled);
+
+	void setFieldSelection(string structName, const list &fields);
+
+	dict getQueueStats();
+
+	int reqOrderInsertFast(const OrderTemplate &order, const string &instrumentId, char direction, char offset, double price, int volume, const string &orderRef, int reqid);
+
+	list reqOrderInsertBatch(const list &orders, int start_reqid);
+
+	bool storeRspUserLogin(CThostFtdcRspUserLoginField *pRspUserLogin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast, int64_t recv_time, int64_t recv_wall_time);
+
+	bool storeRspOrderInsert(CThostFtdcInputOrderField *pInputOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast, int64_t recv_time, int64_t recv_wall_time);
+
+	bool storeErrRtnOrderInsert(CThostFtdcInputOrderField *pInputOrder, CThostFtdcRspInfoField *pRspInfo, int64_t recv_time, int64_t recv_wall_time);
+
+	bool storeRtnOrder(CThostFtdcOrderField *pOrder, int64_t recv_time, int64_t recv_wall_time);
+
+	bool storeRtnTrade(CThostFtdcTradeField *pTrade, int64_t recv_time, int64_t recv_wall_time);
+
+	dict convertOrderEntry(const OrderEntry &item);
+
+	object getOrder(int frontId, int sessionId, string orderRef);
+
+	object getOrderBySysId(string exchangeId, string orderSysId);
+
+	list getOrders(string instrumentId, bool activeOnly);
+
+	dict getTradeSummary(string instrumentId);
+
+	void clearOrders();
+
+	list cancelAll(const dict &filter, int start_reqid);
 };